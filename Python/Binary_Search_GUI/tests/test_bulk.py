@@ -0,0 +1,78 @@
+"""
+Unit tests for the bulk binary search variants
+"""
+import os
+import tempfile
+import unittest
+from variants import bulk
+from variants.core import (
+    first_occurrence,
+    last_occurrence,
+    lower_bound,
+    upper_bound,
+    count_occurrences,
+    search_rotated_array
+)
+
+class TestBulkBinarySearch(unittest.TestCase):
+    """Bulk answers must match the scalar functions query for query"""
+
+    ARR = [1, 2, 2, 2, 3, 4, 4, 5, 8]
+    TARGETS = [0, 1, 2, 3, 4, 5, 6, 8, 9]
+
+    def check_against_scalar(self, arr, targets):
+        pairs = [
+            (bulk.bulk_first_occurrence, first_occurrence),
+            (bulk.bulk_last_occurrence, last_occurrence),
+            (bulk.bulk_lower_bound, lower_bound),
+            (bulk.bulk_upper_bound, upper_bound),
+            (bulk.bulk_count_occurrences, count_occurrences),
+        ]
+        for bulk_fn, scalar_fn in pairs:
+            with self.subTest(variant=scalar_fn.__name__):
+                expected = [scalar_fn(arr, t) for t in targets]
+                self.assertEqual(list(bulk_fn(arr, targets)), expected)
+
+    def test_matches_scalar(self):
+        """Test every variant against its scalar function"""
+        self.check_against_scalar(self.ARR, self.TARGETS)
+
+    def test_empty_array(self):
+        """Test the -1 / 0 conventions on an empty array"""
+        self.check_against_scalar([], [1, 2])
+        self.assertEqual(list(bulk.bulk_search_rotated([], [1, 2])), [-1, -1])
+
+    def test_search_rotated(self):
+        """Test rotated search for present and missing targets"""
+        arr = [4, 5, 6, 7, 0, 1, 2]
+        targets = [4, 5, 6, 7, 0, 1, 2, 3, 8, -1]
+        expected = [search_rotated_array(arr, t) for t in targets]
+        self.assertEqual(list(bulk.bulk_search_rotated(arr, targets)), expected)
+        self.assertEqual(list(bulk.bulk_search_rotated([0, 1, 2], [2, 3])), [2, -1])
+
+    def test_bisect_fallback(self):
+        """Test that the pure-Python fallback gives the same answers"""
+        saved = bulk.NUMPY_AVAILABLE
+        bulk.NUMPY_AVAILABLE = False
+        try:
+            self.check_against_scalar(self.ARR, self.TARGETS)
+            self.assertEqual(bulk.bulk_search_rotated([4, 5, 6, 7, 0, 1, 2], [6, 1, 3]), [2, 5, -1])
+        finally:
+            bulk.NUMPY_AVAILABLE = saved
+
+    @unittest.skipUnless(bulk.NUMPY_AVAILABLE, "NumPy not installed")
+    def test_memory_mapped_file(self):
+        """Test searching a sorted binary file through a memory map"""
+        import numpy as np
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        try:
+            np.array(self.ARR, dtype="<i8").tofile(path)
+            keys = bulk.open_sorted_file(path)
+            self.check_against_scalar(keys, self.TARGETS)
+            del keys
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""
+Unit tests for searching sorted files on disk
+"""
+import os
+import random
+import struct
+import tempfile
+import unittest
+from variants import ondisk
+from variants.ondisk import SortedKeyFile, VARIANTS, fence_cache_path, main
+from variants.core import (
+    first_occurrence,
+    last_occurrence,
+    lower_bound,
+    upper_bound,
+    count_occurrences,
+    search_rotated_array
+)
+
+SCALAR = {
+    "first": first_occurrence,
+    "last": last_occurrence,
+    "lower": lower_bound,
+    "upper": upper_bound,
+    "count": count_occurrences,
+    "rotated": search_rotated_array,
+}
+
+class TestSortedKeyFile(unittest.TestCase):
+    """Answers from a file must match the in-memory functions"""
+
+    def setUp(self):
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            os.remove(path)
+            if os.path.exists(fence_cache_path(path)):
+                os.remove(fence_cache_path(path))
+
+    def write_binary(self, keys, fmt="<q"):
+        fd, path = tempfile.mkstemp(suffix=".bin")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(b"".join(struct.pack(fmt, k) for k in keys))
+        self.paths.append(path)
+        return path
+
+    def write_text(self, keys, width=8):
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w", newline="") as fh:
+            fh.writelines(f"{k:>{width}}\n" for k in keys)
+        self.paths.append(path)
+        return path
+
+    def check(self, keys, path, key_format="<q", fence=None):
+        targets = sorted(set(keys)) + [min(keys) - 1, max(keys) + 1, max(keys) // 2 + 1]
+        with SortedKeyFile(path, key_format) as on_disk:
+            if fence is not None:
+                on_disk.build_fences(fence)
+            self.assertEqual(len(on_disk), len(keys))
+            for variant in VARIANTS[:-1]:
+                for t in targets:
+                    with self.subTest(variant=variant, target=t, fence=fence):
+                        self.assertEqual(on_disk.query(variant, t).result, SCALAR[variant](keys, t))
+
+    def test_binary_without_fences(self):
+        """Test every sorted variant straight over the mapping"""
+        keys = [1, 2, 2, 2, 3, 4, 4, 5, 8]
+        self.check(keys, self.write_binary(keys))
+
+    def test_fences_give_same_answers(self):
+        """Test fence windows, including runs of duplicates across fences"""
+        rng = random.Random(1)
+        keys = sorted(rng.randrange(300) for _ in range(1000))
+        path = self.write_binary(keys)
+        for fence in (1, 2, 7, 64, 1000, 5000):
+            self.check(keys, path, fence=fence)
+
+    def test_fixed_width_text(self):
+        """Test fixed-width text lines, with and without fences"""
+        keys = [-5, 0, 3, 3, 10, 99, 1000]
+        path = self.write_text(keys)
+        self.check(keys, path, key_format=None)
+        self.check(keys, path, key_format=None, fence=3)
+
+    def test_rotated_search(self):
+        """Test rotated search, which ignores the fences"""
+        keys = [40, 50, 60, 70, 0, 10, 20]
+        with SortedKeyFile(self.write_binary(keys)) as on_disk:
+            for t in keys + [35, 80]:
+                self.assertEqual(on_disk.query("rotated", t).result, search_rotated_array(keys, t))
+
+    def test_fences_reduce_pages(self):
+        """Test that a fenced query reads fewer pages than a full binary search"""
+        keys = list(range(0, 2_000_000, 2))
+        with SortedKeyFile(self.write_binary(keys)) as on_disk:
+            plain = on_disk.query("first", 1_234_566)
+            on_disk.build_fences()
+            fenced = on_disk.query("first", 1_234_566)
+        self.assertEqual(plain.result, fenced.result)
+        self.assertEqual(fenced.result, 617_283)
+        self.assertLessEqual(fenced.pages, 2)
+        self.assertGreater(plain.pages, fenced.pages)
+
+    def test_fence_budget(self):
+        """Test that the default spacing caps the fence count and the build reads no counted pages"""
+        keys = list(range(0, 20_000, 2))
+        budget = ondisk.MAX_FENCES
+        ondisk.MAX_FENCES = 4
+        try:
+            with SortedKeyFile(self.write_binary(keys)) as on_disk:
+                self.assertLessEqual(on_disk.build_fences(), 4)
+                self.assertEqual(on_disk.pages_touched, set())
+                self.assertEqual(on_disk.query("first", 1234).result, 617)
+        finally:
+            ondisk.MAX_FENCES = budget
+
+    def test_unsigned_keys(self):
+        """Test '<Q' keys at and above 2**63, which a signed fence array cannot hold"""
+        keys = [1, 2**63 - 1, 2**63, 2**63, 2**64 - 1]
+        self.check(keys, self.write_binary(keys, fmt="<Q"), key_format="<Q", fence=2)
+
+    def test_cached_fences(self):
+        """Test that fences are saved next to the file and reused until it changes"""
+        keys = list(range(0, 100_000, 3))
+        path = self.write_binary(keys)
+        with SortedKeyFile(path) as on_disk:
+            built = on_disk.cached_fences(64)
+            fences = on_disk.fences
+        self.assertTrue(os.path.exists(fence_cache_path(path)))
+        with SortedKeyFile(path) as on_disk:
+            self.assertEqual(on_disk.load_fences(fence_cache_path(path), 64), built)
+            self.assertEqual(on_disk.fences, fences)
+            with self.assertRaises(ValueError):
+                on_disk.load_fences(fence_cache_path(path), 32)  # Saved with another spacing
+            self.assertEqual(on_disk.cached_fences(32), len(range(0, len(keys), 32)))
+            self.assertEqual(on_disk.query("last", 300).result, 100)
+
+    def test_rejects_bad_files(self):
+        """Test unsorted fences and sizes that are not whole records"""
+        with self.assertRaises(ValueError):
+            SortedKeyFile(self.write_binary([1, 2, 3], fmt="<i"))  # 12 bytes is not int64s
+        with self.assertRaises(ValueError):
+            with SortedKeyFile(self.write_binary([5, 1, 3, 2])) as on_disk:
+                on_disk.build_fences(1)
+
+    def test_empty_file(self):
+        """Test the -1 / 0 conventions on an empty file"""
+        with SortedKeyFile(self.write_binary([])) as on_disk:
+            on_disk.build_fences()
+            self.assertEqual(len(on_disk), 0)
+            self.assertEqual(on_disk.query("first", 1).result, -1)
+            self.assertEqual(on_disk.query("count", 1).result, 0)
+
+    def test_command_line(self):
+        """Test the python -m variants.ondisk entry point"""
+        path = self.write_binary([1, 3, 5])
+        self.assertEqual(main([path, "3", "4", "--variant", "lower", "--fence", "2"]), 0)
+
+if __name__ == "__main__":
+    unittest.main()
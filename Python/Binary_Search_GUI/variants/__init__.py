@@ -8,6 +8,15 @@ from .core import (
     find_rotation_point,
     search_rotated_array
 )
+from .bulk import (
+    bulk_first_occurrence,
+    bulk_last_occurrence,
+    bulk_lower_bound,
+    bulk_upper_bound,
+    bulk_count_occurrences,
+    bulk_search_rotated
+)
+from .ondisk import SortedKeyFile
 
 from .cli import run_cli
 from .gui import run_gui
@@ -23,6 +32,13 @@ __all__ = [
     'count_occurrences',
     'find_rotation_point',
     'search_rotated_array',
+    'bulk_first_occurrence',
+    'bulk_last_occurrence',
+    'bulk_lower_bound',
+    'bulk_upper_bound',
+    'bulk_count_occurrences',
+    'bulk_search_rotated',
+    'SortedKeyFile',
     'run_cli',
     'run_gui'
 ]
\ No newline at end of file
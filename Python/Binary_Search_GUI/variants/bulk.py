@@ -0,0 +1,238 @@
+"""
+Bulk (vectorized) versions of the binary search variants
+
+Each function takes a sorted array and an array of targets and answers
+every query at once, with the same -1 conventions as the scalar functions
+in core.py. With NumPy installed the queries run through searchsorted, and
+the sorted array may be a list, a NumPy array or a memory-mapped file
+(see ``open_sorted_file``); without NumPy they fall back to ``bisect``.
+
+Usage:
+    python -m variants.bulk --size 1000000 --queries 100000
+"""
+import argparse
+import random
+import sys
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Sequence
+
+from .core import (
+    first_occurrence,
+    last_occurrence,
+    lower_bound,
+    upper_bound,
+    count_occurrences,
+    find_rotation_point,
+    search_rotated_array
+)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+def _prepare(arr, targets):
+    """Both inputs as NumPy arrays; memory maps are left on disk."""
+    if not isinstance(arr, np.ndarray):
+        arr = np.asarray(arr)
+    return arr, np.asarray(targets)
+
+def _search(arr, targets, side: str):
+    """
+    searchsorted, visiting the targets in sorted order when the array is on disk.
+
+    Sorted targets walk a memory-mapped file front to back, so each page
+    is faulted in at most once instead of once per query.
+    """
+    if isinstance(arr, np.memmap) and targets.size > 1:
+        order = np.argsort(targets, kind="stable")
+        found = np.empty(targets.shape, dtype=np.int64)
+        found[order] = np.searchsorted(arr, targets[order], side=side)
+        return found
+    return np.searchsorted(arr, targets, side=side).astype(np.int64, copy=False)
+
+def bulk_lower_bound(arr, targets):
+    """
+    Index of the first element >= each target, or -1 if there is none.
+    Returns a NumPy int64 array (a list without NumPy).
+    """
+    if not NUMPY_AVAILABLE:
+        n = len(arr)
+        return [i if i < n else -1 for i in (bisect_left(arr, t) for t in targets)]
+    arr, targets = _prepare(arr, targets)
+    found = _search(arr, targets, "left")
+    found[found >= len(arr)] = -1
+    return found
+
+def bulk_upper_bound(arr, targets):
+    """
+    Index of the first element > each target, or -1 if there is none.
+    Returns a NumPy int64 array (a list without NumPy).
+    """
+    if not NUMPY_AVAILABLE:
+        n = len(arr)
+        return [i if i < n else -1 for i in (bisect_right(arr, t) for t in targets)]
+    arr, targets = _prepare(arr, targets)
+    found = _search(arr, targets, "right")
+    found[found >= len(arr)] = -1
+    return found
+
+def bulk_first_occurrence(arr, targets):
+    """
+    Index of the first occurrence of each target, or -1 if it is absent.
+    Returns a NumPy int64 array (a list without NumPy).
+    """
+    if not NUMPY_AVAILABLE:
+        n = len(arr)
+        found = []
+        for t in targets:
+            i = bisect_left(arr, t)
+            found.append(i if i < n and arr[i] == t else -1)
+        return found
+    arr, targets = _prepare(arr, targets)
+    found = _search(arr, targets, "left")
+    hit = found < len(arr)
+    hit[hit] = arr[found[hit]] == targets[hit]
+    found[~hit] = -1
+    return found
+
+def bulk_last_occurrence(arr, targets):
+    """
+    Index of the last occurrence of each target, or -1 if it is absent.
+    Returns a NumPy int64 array (a list without NumPy).
+    """
+    if not NUMPY_AVAILABLE:
+        found = []
+        for t in targets:
+            i = bisect_right(arr, t) - 1
+            found.append(i if i >= 0 and arr[i] == t else -1)
+        return found
+    arr, targets = _prepare(arr, targets)
+    found = _search(arr, targets, "right") - 1
+    hit = found >= 0
+    hit[hit] = arr[found[hit]] == targets[hit]
+    found[~hit] = -1
+    return found
+
+def bulk_count_occurrences(arr, targets):
+    """
+    Number of occurrences of each target.
+    Returns a NumPy int64 array (a list without NumPy).
+    """
+    if not NUMPY_AVAILABLE:
+        return [bisect_right(arr, t) - bisect_left(arr, t) for t in targets]
+    arr, targets = _prepare(arr, targets)
+    return _search(arr, targets, "right") - _search(arr, targets, "left")
+
+def bulk_search_rotated(arr, targets):
+    """
+    Index of each target in a rotated sorted array, or -1 if it is absent.
+
+    The rotation point is found once; each target is then looked up in the
+    segment ``search_rotated_array`` would choose. With repeated values the
+    first index in that segment is returned.
+    Returns a NumPy int64 array (a list without NumPy).
+    """
+    n = len(arr)
+    if not NUMPY_AVAILABLE:
+        if not n:
+            return [-1] * len(targets)
+        pivot = find_rotation_point(arr)
+        found = []
+        for t in targets:
+            lo, hi = (0, pivot) if pivot > 0 and t >= arr[0] else (pivot, n)
+            i = bisect_left(arr, t, lo, hi)
+            found.append(i if i < hi and arr[i] == t else -1)
+        return found
+
+    arr, targets = _prepare(arr, targets)
+    if not n:
+        return np.full(targets.shape, -1, dtype=np.int64)
+    pivot = find_rotation_point(arr)
+    # Search both sorted runs, then keep the answer from the run each target belongs in
+    head = _search(arr[:pivot], targets, "left")
+    tail = _search(arr[pivot:], targets, "left") + pivot
+    use_head = (targets >= arr[0]) & (pivot > 0)
+    found = np.where(use_head, head, tail)
+    end = np.where(use_head, pivot, n)
+    hit = found < end
+    hit[hit] = arr[found[hit]] == targets[hit]
+    found[~hit] = -1
+    return found
+
+def open_sorted_file(path: str, dtype: str = "<i8"):
+    """
+    Memory-map a binary file of sorted fixed-size keys (little-endian int64 by default).
+    Only the pages a search touches are read from disk.
+    """
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("Memory-mapped search needs NumPy: pip install numpy")
+    return np.memmap(path, dtype=np.dtype(dtype), mode="r")
+
+def _time(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+def benchmark(size: int = 1_000_000, queries: int = 100_000,
+              seed: Optional[int] = 0) -> List[Dict]:
+    """
+    Time each bulk function against a loop over its scalar counterpart.
+
+    The array holds ``size`` sorted keys with duplicates; half the
+    queries hit existing keys and half miss.
+
+    Returns:
+        One dict per variant with scalar and bulk seconds and the speedup
+    """
+    rng = random.Random(seed)
+    arr = sorted(rng.randrange(size * 2) for _ in range(size))
+    targets = [rng.choice(arr) if i % 2 else rng.randrange(size * 2) for i in range(queries)]
+    pivot = size // 3
+    rotated = arr[pivot:] + arr[:pivot]
+
+    bulk_arr = np.asarray(arr) if NUMPY_AVAILABLE else arr
+    bulk_rotated = np.asarray(rotated) if NUMPY_AVAILABLE else rotated
+    bulk_targets = np.asarray(targets) if NUMPY_AVAILABLE else targets
+
+    cases = [
+        ("first_occurrence", first_occurrence, bulk_first_occurrence, arr, bulk_arr),
+        ("last_occurrence", last_occurrence, bulk_last_occurrence, arr, bulk_arr),
+        ("lower_bound", lower_bound, bulk_lower_bound, arr, bulk_arr),
+        ("upper_bound", upper_bound, bulk_upper_bound, arr, bulk_arr),
+        ("count_occurrences", count_occurrences, bulk_count_occurrences, arr, bulk_arr),
+        ("search_rotated", search_rotated_array, bulk_search_rotated, rotated, bulk_rotated),
+    ]
+    rows = []
+    for name, scalar, bulk, data, bulk_data in cases:
+        scalar_s = _time(lambda: [scalar(data, t) for t in targets])
+        bulk_s = _time(bulk, bulk_data, bulk_targets)
+        rows.append({
+            "variant": name,
+            "queries": queries,
+            "scalar_seconds": scalar_s,
+            "bulk_seconds": bulk_s,
+            "speedup": scalar_s / bulk_s if bulk_s else float("inf"),
+        })
+    return rows
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point for the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark bulk vs scalar binary search variants")
+    parser.add_argument("--size", type=int, default=1_000_000, help="sorted array length")
+    parser.add_argument("--queries", type=int, default=100_000, help="targets per variant")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{args.queries:,} queries on {args.size:,} keys "
+          f"({'NumPy searchsorted' if NUMPY_AVAILABLE else 'bisect fallback'})")
+    print(f"{'variant':<20}{'scalar s':>12}{'bulk s':>12}{'speedup':>10}")
+    for row in benchmark(args.size, args.queries, args.seed):
+        print(f"{row['variant']:<20}{row['scalar_seconds']:>12.3f}"
+              f"{row['bulk_seconds']:>12.4f}{row['speedup']:>9.0f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
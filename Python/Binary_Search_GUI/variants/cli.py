@@ -15,6 +15,7 @@ from .core import (
     find_rotation_point,
     search_rotated_array
 )
+from .ondisk import SortedKeyFile, VARIANTS
 
 def print_header(title):
     """Print a formatted header with styling"""
@@ -66,6 +67,39 @@ def ask_to_sort_array(arr):
         else:
             print(f"{chalk.red('❌ Please enter y or n.')}")
 
+def search_sorted_file():
+    """Search a sorted key file on disk without loading it into memory"""
+    print(f"\n{chalk.yellow('Sorted File Search')}")
+    print(f"{chalk.yellow('──────────────────')}")
+    path = input(f"{chalk.cyan('Path to sorted file: ')}").strip()
+    layout = input(f"{chalk.cyan('Key format - struct code such as <q, or text for fixed-width lines [<q]: ')}").strip() or "<q"
+    fence = input(f"{chalk.cyan('Keys between fences (blank = automatic, 0 = none): ')}").strip()
+    variant = input(f"{chalk.cyan('Variant (' + ', '.join(VARIANTS) + ') [first]: ')}").strip().lower() or "first"
+    if variant not in VARIANTS:
+        print(f"{chalk.red('❌ Unknown variant.')}")
+        return
+    targets = list(map(int, input(f"{chalk.cyan('Enter targets (space separated): ')}").split()))
+
+    try:
+        keys = SortedKeyFile(path, None if layout == "text" else layout)
+    except (OSError, ValueError) as e:
+        print(f"{chalk.red('❌ ' + str(e))}")
+        return
+    with keys:
+        print_header("RESULT")
+        print_result("File", path)
+        print_result("Keys", f"{len(keys):,} x {keys.record_size} bytes")
+        if variant != "rotated" and fence != "0":
+            start = time.perf_counter()
+            count = keys.cached_fences(int(fence) if fence else None)
+            print_result("Fence Index", f"{count:,} keys every {keys.fence_every:,} "
+                                        f"({time.perf_counter() - start:.2f}s)")
+        for target in targets:
+            q = keys.query(variant, target)
+            found = q.result != -1 if variant != "count" else q.result > 0
+            print_result(f"{variant} {target}",
+                         f"{q.result}  ({q.pages} pages, {q.ms:.3f} ms)", found)
+
 def run_cli():
     """Run the CLI interface with enhanced UX"""
     options = {
@@ -77,7 +111,8 @@ def run_cli():
         "6": "Square Root",
         "7": "Find Rotation Point",
         "8": "Search Rotated Array",
-        "9": "Back to Main Menu"
+        "9": "Search Sorted File (on disk)",
+        "10": "Back to Main Menu"
     }
     
     while True:
@@ -93,9 +128,9 @@ def run_cli():
         print(f"{chalk.blue('╚══════════════════════════════════════════════════════╝')}")
         
         try:
-            choice = input(f"\n{chalk.magenta('➤ Select an option (1-9): ')}").strip()
+            choice = input(f"\n{chalk.magenta('➤ Select an option (1-10): ')}").strip()
             
-            if choice == "9":
+            if choice == "10":
                 print(f"\n{chalk.blue('Returning to main menu...')}")
                 break
             
@@ -103,6 +138,13 @@ def run_cli():
                 print(f"\n{chalk.red('❌ Invalid option. Please try again.')}")
                 continue
                 
+            if choice == "9":  # Sorted file on disk
+                try:
+                    search_sorted_file()
+                except ValueError:
+                    print(f"{chalk.red('❌ Invalid input. Please enter integers only.')}")
+                continue
+
             if choice == "6":  # Square Root
                 try:
                     print(f"\n{chalk.yellow('Square Root Calculation')}")
@@ -8,7 +8,7 @@ def first_occurrence(arr: List[int], target: int) -> int:
     Find the first occurrence of target in sorted array.
     Returns index of first occurrence or -1 if not found.
     """
-    if not arr:
+    if len(arr) == 0:
         return -1
         
     left, right, ans = 0, len(arr) - 1, -1
@@ -28,7 +28,7 @@ def last_occurrence(arr: List[int], target: int) -> int:
     Find the last occurrence of target in sorted array.
     Returns index of last occurrence or -1 if not found.
     """
-    if not arr:
+    if len(arr) == 0:
         return -1
         
     left, right, ans = 0, len(arr) - 1, -1
@@ -48,7 +48,7 @@ def lower_bound(arr: List[int], target: int) -> int:
     Find the first element >= target.
     Returns index of element or -1 if not found.
     """
-    if not arr:
+    if len(arr) == 0:
         return -1
         
     left, right, ans = 0, len(arr) - 1, -1
@@ -66,7 +66,7 @@ def upper_bound(arr: List[int], target: int) -> int:
     Find the first element > target.
     Returns index of element or -1 if not found.
     """
-    if not arr:
+    if len(arr) == 0:
         return -1
         
     left, right, ans = 0, len(arr) - 1, -1
@@ -105,7 +105,7 @@ def count_occurrences(arr: List[int], target: int) -> int:
     """
     Count occurrences of target in sorted array using binary search.
     """
-    if not arr:
+    if len(arr) == 0:
         return 0
         
     first = first_occurrence(arr, target)
@@ -119,7 +119,7 @@ def find_rotation_point(arr: List[int]) -> int:
     Find the rotation point in a rotated sorted array.
     Returns index of the smallest element.
     """
-    if not arr:
+    if len(arr) == 0:
         return -1
         
     left, right = 0, len(arr) - 1
@@ -141,7 +141,7 @@ def search_rotated_array(arr: List[int], target: int) -> int:
     Search for target in a rotated sorted array.
     Returns index of target or -1 if not found.
     """
-    if not arr:
+    if len(arr) == 0:
         return -1
         
     rotation_point = find_rotation_point(arr)
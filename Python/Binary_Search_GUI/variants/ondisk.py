@@ -0,0 +1,323 @@
+"""
+Binary search over huge sorted files without loading them
+
+A sorted key file is memory-mapped and exposed as a read-only sequence, so
+the variants in core.py run on it unchanged: every ``arr[mid]`` becomes a
+seek into the mapping. An optional sparse fence index keeps every k-th key
+in memory; a query first bisects the fences and then searches only the
+k keys between two of them, touching a page or two instead of ~log2(n).
+The fence count is capped, so building reads a bounded number of pages
+however large the file is, and the fences can be saved next to the file
+(``keys.bin.fences``) for later runs.
+
+Two layouts are supported:
+    binary      fixed-size integers, e.g. '<q' (little-endian int64)
+    fixed-width text lines of equal length, each holding one integer
+
+Usage:
+    python -m variants.ondisk keys.bin --variant first 42 1000 123456
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple, Optional, Sequence, Set
+
+from .core import (
+    first_occurrence,
+    last_occurrence,
+    lower_bound,
+    upper_bound,
+    count_occurrences,
+    search_rotated_array
+)
+
+PAGE_SIZE = mmap.PAGESIZE
+VARIANTS = ("first", "last", "lower", "upper", "count", "rotated")
+MAX_FENCES = 4096  # Default fence budget: 32 KB of keys, one page read each to build
+
+FENCES_VERSION = 1
+_FENCES_MAGIC = b"SKFI"
+# magic, version, key format, array typecode, keys per fence, keys in file, fences
+_FENCES_HEADER = struct.Struct("<4sH16s1sQQQ")
+
+class QueryResult(NamedTuple):
+    """One answered query with its cost."""
+    variant: str
+    target: int
+    result: int        # index (or count); -1 when not found, as in core.py
+    pages: int         # distinct file pages read
+    ms: float
+
+class SortedKeyFile:
+    """
+    A sorted file of fixed-size keys, readable by index through mmap.
+
+    Args:
+        path: File to open
+        key_format: struct format of a binary key, or None for fixed-width text
+    """
+
+    def __init__(self, path: str, key_format: Optional[str] = "<q"):
+        self.path = path
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        if key_format:
+            self._struct = struct.Struct(key_format)
+            self.record_size = self._struct.size
+        else:
+            # Fixed-width text: every line is as long as the first one
+            self._struct = None
+            first_line = self._mm.readline() if self._mm else b""
+            self.record_size = len(first_line)
+        if size and (not self.record_size or size % self.record_size):
+            self.close()
+            raise ValueError(f"{path}: size {size} is not a multiple of the record size "
+                             f"{self.record_size}")
+        self._count = size // self.record_size if self.record_size else 0
+
+        self.pages_touched: Set[int] = set()
+        self.fences: Optional[array] = None
+        self.fence_every = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("key index out of range")
+        offset = index * self.record_size
+        self.pages_touched.add(offset // PAGE_SIZE)
+        self.pages_touched.add((offset + self.record_size - 1) // PAGE_SIZE)
+        return self._key(offset)
+
+    def _key(self, offset: int) -> int:
+        """Decode the key at a byte offset without recording the page."""
+        if self._struct is not None:
+            return self._struct.unpack_from(self._mm, offset)[0]
+        return int(self._mm[offset:offset + self.record_size])
+
+    @property
+    def key_format(self) -> str:
+        """The struct format of the keys, or 'text' for fixed-width lines."""
+        return self._struct.format if self._struct is not None else "text"
+
+    @property
+    def _typecode(self) -> str:
+        """Array typecode that holds every key: unsigned formats need 'Q' past 2**63."""
+        code = self.key_format[-1]
+        if code in "efd":
+            return "d"
+        return "Q" if code in "BHILQN" else "q"
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def default_fence_every(self) -> int:
+        """One fence per page of keys, spread wider when that would exceed MAX_FENCES."""
+        per_page = max(1, PAGE_SIZE // self.record_size) if self.record_size else 1
+        return max(per_page, -(-self._count // MAX_FENCES))
+
+    def build_fences(self, every: Optional[int] = None) -> int:
+        """
+        Keep every ``every``-th key in memory (default: ``default_fence_every``).
+
+        Building reads one key per fence, so it is a single forward pass
+        over at most MAX_FENCES pages by default; those reads are not
+        counted in ``pages_touched``. Returns the number of fences.
+        """
+        every = every or self.default_fence_every()
+        fences = array(self._typecode)
+        previous = None
+        for i in range(0, self._count, every):
+            key = self._key(i * self.record_size)
+            if previous is not None and key < previous:
+                raise ValueError(f"{self.path} is not sorted (key {i} is smaller than key {i - every})")
+            fences.append(key)
+            previous = key
+        self.fences = fences
+        self.fence_every = every
+        return len(fences)
+
+    def save_fences(self, path: str):
+        """Write the built fences so later runs skip building them."""
+        if self.fences is None:
+            raise ValueError("No fences to save; call build_fences first")
+        header = _FENCES_HEADER.pack(_FENCES_MAGIC, FENCES_VERSION, self.key_format.encode("ascii"),
+                                     self.fences.typecode.encode("ascii"), self.fence_every,
+                                     self._count, len(self.fences))
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(header)
+            self.fences.tofile(fh)
+        os.replace(tmp, path)
+
+    def load_fences(self, path: str, every: Optional[int] = None) -> int:
+        """
+        Load fences written by ``save_fences`` for this file.
+
+        ValueError if they were saved by another version, for another key
+        layout or length, or with a spacing other than ``every`` (default:
+        ``default_fence_every``). Returns the number of fences.
+        """
+        with open(path, "rb") as fh:
+            data = fh.read()
+        try:
+            magic, version, key_format, typecode, saved_every, count, size = \
+                _FENCES_HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError(f"{path} is not a fence index") from None
+        if magic != _FENCES_MAGIC or version != FENCES_VERSION:
+            raise ValueError(f"{path} was built by an incompatible version")
+        if (key_format.rstrip(b"\0").decode("ascii") != self.key_format or count != self._count
+                or saved_every != (every or self.default_fence_every())):
+            raise ValueError(f"{path} was built for a different file or spacing")
+        fences = array(typecode.decode("ascii"))
+        fences.frombytes(data[_FENCES_HEADER.size:_FENCES_HEADER.size + size * fences.itemsize])
+        if len(fences) != size:
+            raise ValueError(f"{path} is truncated")
+        self.fences = fences
+        self.fence_every = saved_every
+        return size
+
+    def cached_fences(self, every: Optional[int] = None, cache_path: Optional[str] = None) -> int:
+        """
+        Load the fences saved next to the file, building and saving them when needed.
+
+        The saved fences are reused while they are newer than the key file
+        and match it; otherwise they are rebuilt and saved (a read-only
+        location just means the next run rebuilds too).
+        """
+        cache_path = cache_path or fence_cache_path(self.path)
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(self.path):
+                return self.load_fences(cache_path, every)
+        except (OSError, ValueError):
+            pass
+        count = self.build_fences(every)
+        try:
+            self.save_fences(cache_path)
+        except OSError:
+            pass
+        return count
+
+    def _window(self, position: int) -> "KeyWindow":
+        """The keys between fence ``position - 1`` and fence ``position`` (inclusive)."""
+        every = self.fence_every
+        start = max(0, (position - 1) * every)
+        stop = min(self._count, position * every + 1)
+        return KeyWindow(self, start, stop)
+
+    def search(self, variant: str, target: int) -> int:
+        """Run one variant, narrowed by the fences when they are built."""
+        if variant == "rotated":
+            # Fences assume sorted order, so rotated search walks the whole mapping
+            return search_rotated_array(self, target)
+        if self.fences is None:
+            return {
+                "first": first_occurrence,
+                "last": last_occurrence,
+                "lower": lower_bound,
+                "upper": upper_bound,
+                "count": count_occurrences,
+            }[variant](self, target)
+
+        if variant == "count":
+            first = self.search("first", target)
+            return 0 if first == -1 else self.search("last", target) - first + 1
+        if variant in ("first", "lower"):
+            # The answer is the first key >= target, which lies just before the first fence >= target
+            window = self._window(bisect_left(self.fences, target))
+            found = window.offset(lower_bound(window, target))
+            if variant == "first" and found != -1 and self[found] != target:
+                return -1
+            return found
+        # The first key > target lies just before the first fence > target
+        window = self._window(bisect_right(self.fences, target))
+        found = window.offset(upper_bound(window, target))
+        if variant == "upper":
+            return found
+        last = (found if found != -1 else self._count) - 1
+        return last if last >= 0 and self[last] == target else -1
+
+    def query(self, variant: str, target: int) -> QueryResult:
+        """Answer one query and report how many pages and milliseconds it took."""
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown variant: {variant}")
+        self.pages_touched.clear()
+        start = time.perf_counter()
+        result = self.search(variant, target)
+        elapsed = (time.perf_counter() - start) * 1000
+        return QueryResult(variant, target, result, len(self.pages_touched), elapsed)
+
+def fence_cache_path(path: str) -> str:
+    """Where the saved fence index for a key file is kept."""
+    return f"{path}.fences"
+
+class KeyWindow:
+    """A slice [start, stop) of a SortedKeyFile that core.py functions can search."""
+
+    def __init__(self, keys: SortedKeyFile, start: int, stop: int):
+        self.keys = keys
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: int) -> int:
+        return self.keys[self.start + index]
+
+    def offset(self, found: int) -> int:
+        """Map an index within the window back to the file (-1 stays -1)."""
+        return found if found == -1 else self.start + found
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Binary search a huge sorted key file via mmap")
+    parser.add_argument("path", help="sorted key file")
+    parser.add_argument("targets", nargs="+", type=int, help="keys to look up")
+    parser.add_argument("--variant", choices=VARIANTS, default="first")
+    parser.add_argument("--format", default="<q",
+                        help="struct format of binary keys, or 'text' for fixed-width lines")
+    parser.add_argument("--fence", type=int, default=None,
+                        help=f"keys between in-memory fences (default: one page, at most "
+                             f"{MAX_FENCES} fences; 0 disables)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="build the fences without reading or writing PATH.fences")
+    args = parser.parse_args(argv)
+
+    with SortedKeyFile(args.path, None if args.format == "text" else args.format) as keys:
+        if args.fence != 0 and args.variant != "rotated":
+            start = time.perf_counter()
+            if args.no_cache:
+                count = keys.build_fences(args.fence)
+            else:
+                count = keys.cached_fences(args.fence)
+            print(f"Fence index: {count:,} keys every {keys.fence_every:,} "
+                  f"({time.perf_counter() - start:.2f}s)")
+        print(f"{len(keys):,} keys of {keys.record_size} bytes in {args.path}")
+        for target in args.targets:
+            q = keys.query(args.variant, target)
+            print(f"{q.variant:<8}{q.target:>20}  ->  {q.result:>14}   "
+                  f"{q.pages:>3} pages  {q.ms:8.3f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,8 @@
 __version__ = "1.0.0"
 
 from .core import parse_email, ParsedEmail, EmailSliceError, batch_parse_emails
-from .validators import suggest_domain, validate_email_format, get_email_provider_type
+from .validators import suggest_domain, validate_email_format, get_email_provider_type, use_domain_list
+from .domain_index import DomainIndex
 
 __all__ = [
     "__version__", 
@@ -13,5 +14,7 @@ __all__ = [
     "batch_parse_emails",
     "suggest_domain",
     "validate_email_format",
-    "get_email_provider_type"
+    "get_email_provider_type",
+    "use_domain_list",
+    "DomainIndex"
 ]
\ No newline at end of file
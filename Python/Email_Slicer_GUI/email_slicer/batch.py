@@ -0,0 +1,321 @@
+"""High-throughput batch parsing for large mailing lists.
+
+Addresses are streamed in chunks across a process pool and results are
+written as they arrive, so a multi-million line file never sits in memory.
+Everything that depends only on the domain (tldextract split, provider
+type, typo suggestion) is cached per domain, since a list of millions of
+addresses usually has only a few thousand distinct domains.
+"""
+from __future__ import annotations
+from array import array
+from functools import lru_cache
+from itertools import islice
+from multiprocessing import Pool
+from typing import IO, Callable, Iterable, Iterator, List, NamedTuple, Optional
+import csv
+import json
+import os
+import tempfile
+import time
+
+from .core import DOMAIN_CACHE_SIZE, EmailSliceError, ParsedEmail, parse_email
+from .validators import (
+    domain_list_path, get_email_provider_type, suggest_domain, use_domain_list,
+)
+
+# Addresses sent to a worker at a time
+CHUNK_SIZE = 5000
+# Records between progress callbacks
+PROGRESS_EVERY = 10000
+
+FORMATS = ("csv", "jsonl")
+
+FIELDS = [
+    "line", "original", "valid", "normalized", "local_part", "base_username", "tag",
+    "domain", "subdomain", "root_domain", "tld", "is_disposable", "provider_type",
+    "suggestion", "error",
+]
+
+class DomainInfo(NamedTuple):
+    """Per-domain lookups shared by every address on that domain."""
+    provider_type: str
+    suggestion: Optional[str]
+
+class BatchRecord(NamedTuple):
+    """The outcome for one input line; ``parsed`` is None when it was invalid."""
+    line: int
+    original: str
+    parsed: Optional[ParsedEmail]
+    provider_type: str = ""
+    suggestion: Optional[str] = None
+    error: str = ""
+
+    def as_dict(self) -> dict:
+        row = {"line": self.line, "original": self.original, "valid": self.parsed is not None}
+        if self.parsed is not None:
+            row.update(self.parsed.__dict__)
+            row["original"] = self.original
+        row["provider_type"] = self.provider_type
+        row["suggestion"] = self.suggestion
+        row["error"] = self.error
+        return row
+
+class BatchSummary:
+    """Running totals for a batch run."""
+
+    def __init__(self):
+        self.total = 0
+        self.valid = 0
+        self.invalid = 0
+        self.disposable = 0
+        self.domains: set[str] = set()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def emails_per_second(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def add(self, record: BatchRecord):
+        self.total += 1
+        if record.parsed is None:
+            self.invalid += 1
+            return
+        self.valid += 1
+        self.disposable += record.parsed.is_disposable
+        self.domains.add(record.parsed.domain)
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def domain_info(domain: str) -> DomainInfo:
+    """Provider type and typo suggestion for a domain, computed once per domain."""
+    return DomainInfo(get_email_provider_type(domain), suggest_domain(domain))
+
+def parse_record(line: int, email: str, check_disposable: bool = False) -> BatchRecord:
+    """Parse one address into a record instead of raising on invalid input."""
+    try:
+        parsed = parse_email(email, check_disposable)
+    except EmailSliceError as exc:
+        return BatchRecord(line, email.strip(), None, error=str(exc))
+    info = domain_info(parsed.domain)
+    return BatchRecord(line, parsed.original, parsed, info.provider_type, info.suggestion)
+
+def _init_worker(domain_list: Optional[str]):
+    """Give a worker the parent's domain list (spawned workers start without it)."""
+    if domain_list and domain_list != domain_list_path():
+        use_domain_list(domain_list)
+
+def _parse_chunk(task: tuple[int, list[str], bool]) -> list[BatchRecord]:
+    """Worker: parse one chunk. Kept at module level so it pickles."""
+    start, emails, check_disposable = task
+    return [parse_record(start + i, email, check_disposable) for i, email in enumerate(emails)]
+
+def count_lines(path: str) -> int:
+    """Count lines without decoding them; quick even for very large files."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+def iter_email_lines(path: str) -> Iterator[str]:
+    """Stream the non-blank lines of an address file."""
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield line
+
+def _chunks(emails: Iterable[str], check_disposable: bool,
+            chunk_size: int) -> Iterator[tuple[int, list[str], bool]]:
+    it = iter(emails)
+    start = 1
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk, check_disposable
+        start += len(chunk)
+
+def parse_stream(emails: Iterable[str], check_disposable: bool = False,
+                 workers: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE) -> Iterator[BatchRecord]:
+    """
+    Parse a stream of addresses, yielding one record per address in input order.
+
+    Args:
+        emails: Addresses, e.g. from ``iter_email_lines``; consumed lazily
+        check_disposable: Whether to check for disposable email domains
+        workers: Processes to parse with (None for one per CPU, 1 for in-process)
+        chunk_size: Addresses handed to a worker at a time
+
+    Yields:
+        BatchRecord for every address, numbered from 1
+    """
+    tasks = _chunks(emails, check_disposable, chunk_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            yield from _parse_chunk(task)
+        return
+    with Pool(workers, initializer=_init_worker, initargs=(domain_list_path(),)) as pool:
+        for records in pool.imap(_parse_chunk, tasks):
+            yield from records
+
+def write_records(records: Iterable[BatchRecord], out: IO[str], fmt: str = "csv",
+                  include_invalid: bool = True, summary: Optional[BatchSummary] = None,
+                  progress: Optional[Callable[[BatchSummary], None]] = None) -> BatchSummary:
+    """
+    Write records as they arrive, as CSV rows or JSON lines.
+
+    Args:
+        records: Records from ``parse_stream``
+        out: Text file to write to
+        fmt: 'csv' or 'jsonl'
+        include_invalid: Whether invalid addresses get a row (with their error)
+        summary: Summary to update, e.g. one a progress display is watching
+        progress: Called with the summary every ``PROGRESS_EVERY`` records
+
+    Returns:
+        BatchSummary with the run's totals
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown output format: {fmt}")
+    summary = summary or BatchSummary()
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n")
+        writer.writeheader()
+    for record in records:
+        summary.add(record)
+        if progress is not None and summary.total % PROGRESS_EVERY == 0:
+            progress(summary)
+        if record.parsed is None and not include_invalid:
+            continue
+        row = record.as_dict()
+        if writer is not None:
+            writer.writerow(row)
+        else:
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    summary.end = time.perf_counter()
+    return summary
+
+def output_format(path: str, fmt: Optional[str] = None) -> str:
+    """The explicit format, or the one implied by the output file's suffix."""
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Cannot infer output format from {path!r}; use csv or jsonl")
+    return fmt
+
+def process_file(path: str, output: str, fmt: Optional[str] = None,
+                 check_disposable: bool = False, workers: Optional[int] = None,
+                 chunk_size: int = CHUNK_SIZE, include_invalid: bool = True,
+                 summary: Optional[BatchSummary] = None,
+                 progress: Optional[Callable[[BatchSummary], None]] = None) -> BatchSummary:
+    """Parse an address file into a CSV or JSONL file, streaming both ends."""
+    fmt = output_format(output, fmt)
+    records = parse_stream(iter_email_lines(path), check_disposable, workers, chunk_size)
+    with open(output, "w", encoding="utf-8", newline="") as out:
+        return write_records(records, out, fmt, include_invalid, summary, progress)
+
+EXPORT_FORMATS = ("json", "jsonl", "csv")
+
+class ResultSpool:
+    """
+    Batch results kept on disk as JSON lines, with an offset per row.
+
+    Rows cost eight bytes of memory each, so views can page through a
+    million results and exports can stream them without holding them all.
+    Rows are appended and read from one thread; call ``close`` to delete
+    the backing file.
+    """
+
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix="email_slicer_", suffix=".jsonl")
+        self._out = os.fdopen(fd, "wb")
+        self._offsets = array("Q")
+        self._size = 0
+        self._reader: Optional[IO[bytes]] = None
+        self._dirty = False
+
+    @staticmethod
+    def encode(record: BatchRecord) -> bytes:
+        """One record as a JSON line, ready for ``append``."""
+        return json.dumps(record.as_dict(), ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def append(self, lines: Iterable[bytes]):
+        """Add rows encoded with ``encode``."""
+        for line in lines:
+            self._offsets.append(self._size)
+            self._out.write(line)
+            self._size += len(line)
+        self._dirty = True
+
+    def rows(self, start: int, stop: int) -> List[dict]:
+        """Rows ``start`` up to ``stop`` (clamped to what has arrived so far)."""
+        stop = min(stop, len(self._offsets))
+        if start >= stop:
+            return []
+        if self._dirty:
+            self._out.flush()
+            self._dirty = False
+        if self._reader is None:
+            self._reader = open(self.path, "rb")
+        self._reader.seek(self._offsets[start])
+        return [json.loads(self._reader.readline()) for _ in range(start, stop)]
+
+    def export(self, path: str, fmt: str = "json") -> int:
+        """
+        Stream every row to a file.
+
+        Args:
+            path: File to write
+            fmt: 'json' (one array), 'jsonl' or 'csv'
+
+        Returns:
+            int: Rows written
+        """
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {fmt}")
+        self._out.flush()
+        self._dirty = False
+        count = 0
+        with open(self.path, "rb") as src:
+            if fmt == "csv":
+                with open(path, "w", encoding="utf-8", newline="") as out:
+                    writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n")
+                    writer.writeheader()
+                    for line in src:
+                        writer.writerow(json.loads(line))
+                        count += 1
+                return count
+            with open(path, "wb") as out:
+                if fmt == "json":
+                    out.write(b"[")
+                for line in src:
+                    if fmt == "json":
+                        out.write(b",\n" if count else b"\n")
+                        line = line.rstrip(b"\n")
+                    out.write(line)
+                    count += 1
+                if fmt == "json":
+                    out.write(b"\n]\n")
+        return count
+
+    def close(self):
+        """Close and delete the backing file."""
+        self._out.close()
+        if self._reader is not None:
+            self._reader.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
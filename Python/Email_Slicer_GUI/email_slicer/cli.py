@@ -2,6 +2,7 @@
 from __future__ import annotations
 import json
 import sys
+import time
 from typing import Optional, List
 from pathlib import Path
 
@@ -14,7 +15,9 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 import questionary
 
 from email_slicer.core import parse_email, EmailSliceError, batch_parse_emails
-from email_slicer.validators import suggest_domain, get_email_provider_type
+from email_slicer.batch import BatchSummary, CHUNK_SIZE, FORMATS, parse_stream, process_file
+from email_slicer.validators import suggest_domain, get_email_provider_type, use_domain_list, DOMAIN_LIST_ENV
+from email_slicer.domain_index import DomainIndex, index_cache_path, read_domain_list
 
 app = typer.Typer(
     help="Email Slicer — Extract and analyze email address components",
@@ -86,6 +89,7 @@ def interactive_mode():
                 console.print("• [green]email@example.com[/green] - Parse a single email")
                 console.print("• [green]batch filename.txt[/green] - Process a batch file")
                 console.print("• [green]validate email@example.com[/green] - Validate an email")
+                console.print("• [green]domains domains.txt[/green] - Suggest typo fixes from a domain list")
                 console.print("• [green]exit[/green] - Quit the application")
                 console.print("• [green]help[/green] - Show this help\n")
                 continue
@@ -98,6 +102,16 @@ def interactive_mode():
                     console.print("[red]Error: Please specify a filename[/red]")
                 continue
                 
+            if command.startswith('domains '):
+                filename = command[8:].strip()
+                try:
+                    with console.status("Loading domain list..."):
+                        index = use_domain_list(filename)
+                    console.print(f"[green]✓ Suggesting from {len(index):,} known domains[/green]")
+                except OSError as e:
+                    console.print(f"[red]❌ Error reading file:[/red] {e}")
+                continue
+                
             if command.startswith('validate '):
                 email = command[9:].strip()
                 if email:
@@ -152,12 +166,9 @@ def process_batch_file(filename, show_all=False):
         task = progress.add_task("Processing emails...", total=len(lines))
         
         parsed_emails = []
-        for email in lines:
-            try:
-                parsed = parse_email(email, check_disposable=show_all)
-                parsed_emails.append(parsed)
-            except EmailSliceError:
-                pass
+        for record in parse_stream(lines, check_disposable=show_all, workers=1):
+            if record.parsed is not None:
+                parsed_emails.append(record.parsed)
             progress.update(task, advance=1)
 
     invalid_count = len(lines) - len(parsed_emails)
@@ -197,6 +208,12 @@ def validate_email_interactive(email):
             provider_type = get_email_provider_type(pe.domain)
             table.add_row("Provider Type", f"[blue]{provider_type.title()}[/blue]", "Email service category")
             
+            suggestion = suggest_domain(pe.domain)
+            if suggestion:
+                table.add_row("Domain Typo", "[yellow]MAYBE[/yellow]", f"Did you mean {suggestion}?")
+            else:
+                table.add_row("Domain Typo", "[green]NO[/green]", "No close match to a known domain")
+            
             if hasattr(pe, 'is_disposable') and pe.is_disposable:
                 table.add_row("Disposable", "[red]YES[/red]", "Temporary email address")
             else:
@@ -227,12 +244,56 @@ def slice(
     if suggestion:
         console.print(f"\n[yellow]⚠️  Suggestion:[/yellow] Did you mean [bold]{suggestion}[/bold]?")
 
+def _stream_batch(path: str, output: str, fmt: Optional[str], check_disposable: bool,
+                  workers: Optional[int], chunk_size: int):
+    """Parse a (possibly huge) file straight into a CSV/JSONL file."""
+    if fmt and fmt not in FORMATS:
+        console.print(f"[red]❌ Unknown format:[/red] {fmt} (choose {', '.join(FORMATS)})")
+        raise typer.Exit(code=2)
+
+    summary = BatchSummary()
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        transient=True,
+    ) as progress:
+        task = progress.add_task("Processing emails...", total=None)
+
+        def report(summary: BatchSummary):
+            progress.update(task, description=(
+                f"Processing emails... {summary.total:,} ({summary.emails_per_second:,.0f}/s)"
+            ))
+
+        try:
+            process_file(path, output, fmt, check_disposable, workers, chunk_size,
+                         summary=summary, progress=report)
+        except (OSError, UnicodeDecodeError) as e:
+            console.print(f"[red]❌ Error processing file:[/red] {e}")
+            raise typer.Exit(code=3)
+
+    console.print(Panel.fit(
+        f"[green]✓ Valid emails:[/green] {summary.valid:,}\n"
+        f"[red]✗ Invalid emails:[/red] {summary.invalid:,}\n"
+        f"[blue]Distinct domains:[/blue] {len(summary.domains):,}\n"
+        f"[cyan]Throughput:[/cyan] {summary.emails_per_second:,.0f} emails/s "
+        f"in {summary.elapsed:.1f}s",
+        title="Batch Processing Summary",
+        border_style="blue"
+    ))
+    console.print(f"[green]✓ Results saved to:[/green] {output}")
+
 @app.command()
 def batch(
     path: str = typer.Argument(..., help="Path to file containing emails (one per line)"),
     json: bool = typer.Option(False, "--json", "-j", help="Output in JSON format"),
     all: bool = typer.Option(False, "--all", "-a", help="Show all components including extended info"),
-    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path")
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Output file path"),
+    format: Optional[str] = typer.Option(
+        None, "--format", "-f",
+        help="Stream results to --output as csv or jsonl (implied by a .csv/.jsonl output)"
+    ),
+    workers: Optional[int] = typer.Option(None, "--workers", "-w", help="Parser processes (default: one per CPU)"),
+    chunk_size: int = typer.Option(CHUNK_SIZE, "--chunk-size", help="Emails sent to a worker at a time")
 ):
     """Process multiple emails from a file."""
     file_path = Path(path)
@@ -240,6 +301,10 @@ def batch(
         console.print(f"[red]❌ File not found:[/red] {path}")
         raise typer.Exit(code=2)
 
+    if output and (format or Path(output).suffix.lower() in (".csv", ".jsonl")):
+        _stream_batch(path, output, format, all, workers, chunk_size)
+        return
+
     try:
         with open(file_path, "r", encoding="utf-8") as fh:
             lines = [l.strip() for l in fh if l.strip()]
@@ -260,12 +325,9 @@ def batch(
         task = progress.add_task("Processing emails...", total=len(lines))
         
         parsed_emails = []
-        for email in lines:
-            try:
-                parsed = parse_email(email, check_disposable=all)
-                parsed_emails.append(parsed)
-            except EmailSliceError:
-                pass
+        for record in parse_stream(lines, check_disposable=all, workers=workers):
+            if record.parsed is not None:
+                parsed_emails.append(record.parsed)
             progress.update(task, advance=1)
 
     invalid_count = len(lines) - len(parsed_emails)
@@ -331,6 +393,12 @@ def validate(
             provider_type = get_email_provider_type(pe.domain)
             table.add_row("Provider Type", f"[blue]{provider_type.title()}[/blue]", "Email service category")
             
+            suggestion = suggest_domain(pe.domain)
+            if suggestion:
+                table.add_row("Domain Typo", "[yellow]MAYBE[/yellow]", f"Did you mean {suggestion}?")
+            else:
+                table.add_row("Domain Typo", "[green]NO[/green]", "No close match to a known domain")
+            
             if hasattr(pe, 'is_disposable') and pe.is_disposable:
                 table.add_row("Disposable", "[red]YES[/red]", "Temporary email address")
             else:
@@ -341,6 +409,27 @@ def validate(
     
     console.print(Panel.fit(table, title=f"Email Validation: {email}"))
 
+@app.command("build-index")
+def build_index(
+    path: str = typer.Argument(..., help="Known-good domain list (one per line, most popular first)"),
+    output: Optional[str] = typer.Option(None, "--output", "-o", help="Index file (default: next to the list)"),
+    max_deletes: int = typer.Option(1, "--max-deletes", help="Edits the index can bridge (memory grows fast)")
+):
+    """Prebuild the typo-suggestion index for a domain list."""
+    if not Path(path).exists():
+        console.print(f"[red]❌ File not found:[/red] {path}")
+        raise typer.Exit(code=2)
+
+    output = output or index_cache_path(path)
+    with console.status("Building domain index..."):
+        started = time.perf_counter()
+        index = DomainIndex(read_domain_list(path), max_deletes)
+        index.save(output)
+        elapsed = time.perf_counter() - started
+
+    console.print(f"[green]✓ Indexed {len(index):,} domains in {elapsed:.1f}s:[/green] {output}")
+    console.print(f"Use it with [bold]{DOMAIN_LIST_ENV}={path}[/bold]")
+
 def main():
     """Main entry point for the CLI."""
     # If no arguments provided, run in interactive mode
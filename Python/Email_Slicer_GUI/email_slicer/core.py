@@ -1,6 +1,7 @@
 """Core parsing and validation for Email Slicer."""
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 import re
 
@@ -39,6 +40,49 @@ def _split_local(local: str) -> tuple[str, Optional[str]]:
         return base, tag
     return local, None
 
+# Distinct domains remembered by the per-domain caches. Mailing lists have a
+# few thousand domains among millions of addresses, so this covers them all.
+DOMAIN_CACHE_SIZE = 65536
+
+# Plain ASCII dot-atom local parts, which email_validator passes through unchanged
+_SIMPLE_LOCAL = re.compile(r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*")
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def _validate_domain(domain: str) -> tuple[Optional[str], Optional[str], str]:
+    """Validate the part after the @ once per domain; returns (domain, ASCII domain, error)."""
+    try:
+        v = validate_email(f"postmaster@{domain}", check_deliverability=False)
+    except EmailNotValidError as exc:
+        return None, None, str(exc)
+    return v.domain, v.ascii_domain, ""
+
+def _normalize_email(email: str) -> str:
+    """
+    Validate an address and return its normalized form.
+
+    Domain validation (IDNA checks) dominates email_validator's cost, so for
+    plain addresses it is done once per domain and reused; anything unusual
+    (quoting, non-ASCII local parts, display names) gets the full check.
+    """
+    local, at, domain = email.rpartition("@")
+    if at and len(local) <= 64 and _SIMPLE_LOCAL.fullmatch(local):
+        normalized_domain, ascii_domain, error = _validate_domain(domain)
+        if error:
+            raise EmailSliceError(error)
+        normalized = f"{local}@{normalized_domain}"
+        if max(len(normalized.encode("utf-8")), len(local) + 1 + len(ascii_domain)) <= 254:
+            return normalized
+    try:
+        return validate_email(email, check_deliverability=False).email
+    except EmailNotValidError as exc:
+        raise EmailSliceError(str(exc)) from exc
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def _extract_domain(domain: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """Split a domain into (subdomain, root domain, suffix) with tldextract."""
+    tx = tldextract.extract(domain)
+    return tx.subdomain or None, tx.domain or None, tx.suffix or None
+
 def _is_disposable_domain(domain: str) -> bool:
     """Check if the domain is a known disposable email provider."""
     return domain.lower() in DISPOSABLE_DOMAINS
@@ -61,20 +105,12 @@ def parse_email(email: str, check_disposable: bool = False) -> ParsedEmail:
     if not email:
         raise EmailSliceError("Empty email string")
 
-    try:
-        v = validate_email(email, check_deliverability=False)
-    except EmailNotValidError as exc:
-        raise EmailSliceError(str(exc)) from exc
-
-    normalized = v.email
+    normalized = _normalize_email(email)
     local_part, domain = normalized.rsplit("@", 1)
     base_username, tag = _split_local(local_part)
 
-    # Use tldextract for proper domain parsing
-    tx = tldextract.extract(domain)
-    subdomain = tx.subdomain if tx.subdomain else None
-    root_domain = tx.domain if tx.domain else None
-    tld_part = tx.suffix if tx.suffix else None
+    # Use tldextract for proper domain parsing (cached per domain)
+    subdomain, root_domain, tld_part = _extract_domain(domain)
     
     # Check if domain is disposable
     is_disposable = _is_disposable_domain(domain) if check_disposable else False
@@ -92,22 +128,20 @@ def parse_email(email: str, check_disposable: bool = False) -> ParsedEmail:
         is_disposable=is_disposable
     )
 
-def batch_parse_emails(emails: list[str], check_disposable: bool = False) -> list[ParsedEmail]:
+def batch_parse_emails(emails: list[str], check_disposable: bool = False,
+                       workers: int = 1) -> list[ParsedEmail]:
     """
     Parse multiple email addresses.
     
     Args:
         emails: List of email addresses to parse
         check_disposable: Whether to check for disposable email domains
+        workers: Processes to parse with (None for one per CPU)
         
     Returns:
         List of ParsedEmail objects
     """
-    results = []
-    for email in emails:
-        try:
-            parsed = parse_email(email, check_disposable)
-            results.append(parsed)
-        except EmailSliceError:
-            continue  # Skip invalid emails
-    return results
\ No newline at end of file
+    from .batch import parse_stream  # batch builds on this module
+
+    return [record.parsed for record in parse_stream(emails, check_disposable, workers)
+            if record.parsed is not None]
\ No newline at end of file
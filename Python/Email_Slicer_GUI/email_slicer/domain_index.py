@@ -0,0 +1,253 @@
+"""Typo-tolerant lookup of known-good domains.
+
+A symmetric-delete index (the SymSpell idea): every known domain is stored
+under the strings left after removing up to ``max_deletes`` characters, and
+a query looks up its own deletes. Any domain within that many edits of the
+query shares at least one delete with it, so a lookup touches a handful of
+sorted-array probes instead of scanning the whole list. Candidates are then
+ranked by an edit distance that makes slips onto neighbouring keys cheap.
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+import os
+import struct
+import zlib
+
+# Bump when the file layout changes so stale caches are rebuilt
+INDEX_VERSION = 1
+_MAGIC = b"ESDI"
+_HEADER = struct.Struct("<4sHHQQ")  # magic, version, max deletes, names bytes, entries
+
+DEFAULT_MAX_DISTANCE = 1.0
+
+# Cost of hitting a key next to the intended one, versus 1 for any other edit
+ADJACENT_COST = 0.5
+
+_KEYBOARD_ROWS = ["1234567890-", "qwertyuiop", "asdfghjkl", "zxcvbnm"]
+
+def _adjacent_keys() -> Dict[str, frozenset]:
+    """Keys touching each key on a QWERTY layout (same row and the rows above/below)."""
+    position = {ch: (r, c) for r, row in enumerate(_KEYBOARD_ROWS) for c, ch in enumerate(row)}
+    adjacent: Dict[str, set] = {ch: set() for ch in position}
+    for a, (ra, ca) in position.items():
+        for b, (rb, cb) in position.items():
+            if a != b and abs(ra - rb) <= 1 and abs(ca - cb) <= 1:
+                adjacent[a].add(b)
+    return {ch: frozenset(keys) for ch, keys in adjacent.items()}
+
+ADJACENT = _adjacent_keys()
+
+def keyboard_distance(a: str, b: str) -> float:
+    """
+    Edit distance with transpositions, where substituting a neighbouring key costs less.
+
+    Args:
+        a: First string
+        b: Second string
+
+    Returns:
+        float: Weighted distance; insertions, deletions, transpositions and
+        other substitutions cost 1, adjacent-key substitutions ``ADJACENT_COST``
+    """
+    if a == b:
+        return 0.0
+    prev2: List[float] = []
+    prev = [float(j) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        ca = a[i - 1]
+        near = ADJACENT.get(ca, frozenset())
+        cur = [float(i)] + [0.0] * len(b)
+        for j in range(1, len(b) + 1):
+            cb = b[j - 1]
+            if ca == cb:
+                sub = prev[j - 1]
+            else:
+                sub = prev[j - 1] + (ADJACENT_COST if cb in near else 1.0)
+            cost = min(prev[j] + 1.0, cur[j - 1] + 1.0, sub)
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, prev2[j - 2] + 1.0)
+            cur[j] = cost
+        prev2, prev = prev, cur
+    return prev[-1]
+
+def _deletes(word: str, depth: int) -> set:
+    """The word plus every string made by deleting up to ``depth`` characters."""
+    found = {word}
+    frontier = {word}
+    for _ in range(depth):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        found |= frontier
+    return found
+
+def _hash(key: str) -> int:
+    """A 64-bit hash that is the same in every process (unlike ``hash``)."""
+    data = key.encode("utf-8")
+    return zlib.crc32(data) << 32 | zlib.adler32(data)
+
+class DomainIndex:
+    """
+    Known-good domains indexed for near-miss lookups.
+
+    Each delete string is stored as a 64-bit hash in one sorted array, with
+    the owning domain's id in a parallel array, so a few hundred thousand
+    domains take tens of megabytes and load from disk in milliseconds. Hash
+    collisions only add candidates, which the distance check then drops.
+
+    Domains keep the order they were given in, which serves as a popularity
+    rank: of two equally close candidates the earlier one wins.
+    """
+
+    def __init__(self, domains: Iterable[str] = (), max_deletes: int = 1):
+        self.max_deletes = max_deletes
+        self.source: Optional[str] = None
+        self.domains: List[str] = []
+        seen = set()
+        for domain in domains:
+            domain = domain.lower().strip()
+            if domain and domain not in seen:
+                seen.add(domain)
+                self.domains.append(domain)
+        keys, ids = array("Q"), array("I")
+        for ident, domain in enumerate(self.domains):
+            for key in _deletes(domain, max_deletes):
+                keys.append(_hash(key))
+                ids.append(ident)
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        self._keys = array("Q", [keys[i] for i in order])
+        self._ids = array("I", [ids[i] for i in order])
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+    def __contains__(self, domain: str) -> bool:
+        domain = domain.lower().strip()
+        return any(self.domains[ident] == domain for ident in self._lookup(_hash(domain)))
+
+    def _lookup(self, key: int) -> Iterator[int]:
+        keys, ids = self._keys, self._ids
+        i = bisect_left(keys, key)
+        while i < len(keys) and keys[i] == key:
+            yield ids[i]
+            i += 1
+
+    def candidates(self, domain: str,
+                   max_distance: float = DEFAULT_MAX_DISTANCE) -> List[Tuple[float, str]]:
+        """
+        Known domains near ``domain``, closest (then most popular) first.
+
+        Args:
+            domain: The domain to look up
+            max_distance: Largest ``keyboard_distance`` to accept
+
+        Returns:
+            List of (distance, domain) pairs; an exact match comes first at 0
+        """
+        domain = domain.lower().strip()
+        seen = set()
+        for key in _deletes(domain, self.max_deletes):
+            seen.update(self._lookup(_hash(key)))
+        scored = []
+        for ident in seen:
+            known = self.domains[ident]
+            if abs(len(known) - len(domain)) > max_distance:
+                continue
+            distance = keyboard_distance(domain, known)
+            if distance <= max_distance:
+                scored.append((distance, ident))
+        scored.sort()
+        return [(distance, self.domains[ident]) for distance, ident in scored]
+
+    def suggest(self, domain: str, max_distance: float = DEFAULT_MAX_DISTANCE) -> Optional[str]:
+        """The closest known domain, or None if ``domain`` is known or nothing is close."""
+        found = self.candidates(domain, max_distance)
+        if not found or found[0][0] == 0:
+            return None
+        return found[0][1]
+
+    def save(self, path: str):
+        """Serialize the built index so later runs skip building it."""
+        names = "\n".join(self.domains).encode("utf-8")
+        header = _HEADER.pack(_MAGIC, INDEX_VERSION, self.max_deletes,
+                              len(names), len(self._keys))
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as fh:
+            fh.write(header)
+            fh.write(names)
+            self._keys.tofile(fh)
+            self._ids.tofile(fh)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: str) -> "DomainIndex":
+        """Load an index written by ``save``; ValueError if it is not a compatible index."""
+        with open(path, "rb") as fh:
+            data = fh.read()
+        try:
+            magic, version, max_deletes, names_size, count = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError(f"{path} is not a domain index") from None
+        if magic != _MAGIC or version != INDEX_VERSION:
+            raise ValueError(f"{path} was built by an incompatible version")
+
+        index = cls(max_deletes=max_deletes)
+        offset = _HEADER.size
+        names = data[offset:offset + names_size].decode("utf-8")
+        index.domains = names.split("\n") if names else []
+        offset += names_size
+        keys, ids = array("Q"), array("I")
+        keys.frombytes(data[offset:offset + count * keys.itemsize])
+        offset += count * keys.itemsize
+        ids.frombytes(data[offset:offset + count * ids.itemsize])
+        if len(keys) != count or len(ids) != count:
+            raise ValueError(f"{path} is truncated")
+        index._keys, index._ids = keys, ids
+        return index
+
+def read_domain_list(path: str) -> Iterator[str]:
+    """Domains from a text file, one per line; blank lines and '#' comments are skipped."""
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                yield line
+
+def index_cache_path(path: str) -> str:
+    """Where the prebuilt index for a domain list is kept."""
+    return f"{path}.idx"
+
+def load_domain_index(path: str, cache_path: Optional[str] = None,
+                      max_deletes: int = 1) -> DomainIndex:
+    """
+    Load the index for a domain list, building and caching it when needed.
+
+    The serialized index is reused while it is newer than the list and was
+    built with the same settings; otherwise it is rebuilt and saved (a
+    read-only location just means the next run rebuilds too).
+
+    Args:
+        path: Domain list file, most popular domains first
+        cache_path: Serialized index location (default: next to the list)
+        max_deletes: Edits the index can bridge (memory grows quickly with this)
+
+    Returns:
+        DomainIndex for the list
+    """
+    cache_path = cache_path or index_cache_path(path)
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            index = DomainIndex.load(cache_path)
+            if index.max_deletes == max_deletes:
+                index.source = path
+                return index
+    except (OSError, ValueError):
+        pass
+
+    index = DomainIndex(read_domain_list(path), max_deletes)
+    index.source = path
+    try:
+        index.save(cache_path)
+    except OSError:
+        pass
+    return index
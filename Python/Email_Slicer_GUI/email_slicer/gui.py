@@ -4,13 +4,15 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 from tkinter import font as tkfont
 import threading
-from typing import Dict, List
-import json
+import queue
+import time
+from typing import Callable, Dict, List, Sequence, Tuple
 from pathlib import Path
 import webbrowser
 
 from email_slicer.core import parse_email, EmailSliceError, batch_parse_emails
-from email_slicer.validators import suggest_domain, get_email_provider_type
+from email_slicer.batch import BatchSummary, ResultSpool, count_lines, iter_email_lines, parse_stream
+from email_slicer.validators import suggest_domain, get_email_provider_type, use_domain_list, domain_list_path
 
 class ModernTheme:
     """Modern color theme for the application."""
@@ -89,6 +91,79 @@ class ModernButton(tk.Frame):
         self.btn.config(relief='flat')
         self.command()
 
+class VirtualList(ttk.Frame):
+    """Treeview that only materializes the rows in view, so it can page through millions."""
+    
+    def __init__(self, parent, columns: Sequence[Tuple[str, str, int]],
+                 fetch: Callable[[int, int], List[tuple]], height=12):
+        super().__init__(parent)
+        self.fetch = fetch
+        self.count = 0
+        self.first = 0
+        
+        self.tree = ttk.Treeview(self, columns=[key for key, _, _ in columns],
+                                 show='headings', height=height, selectmode='browse')
+        for key, title, width in columns:
+            self.tree.heading(key, text=title)
+            self.tree.column(key, width=width, anchor=tk.W, stretch=key != columns[0][0])
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.tree.bind('<Configure>', lambda e: self.refresh())
+        self.tree.bind('<MouseWheel>', lambda e: self.scroll_by(-1 if e.delta > 0 else 1, 'units'))
+        self.tree.bind('<Button-4>', lambda e: self.scroll_by(-1, 'units'))
+        self.tree.bind('<Button-5>', lambda e: self.scroll_by(1, 'units'))
+        self.tree.bind('<Prior>', lambda e: self.scroll_by(-1, 'pages'))
+        self.tree.bind('<Next>', lambda e: self.scroll_by(1, 'pages'))
+    
+    def visible_rows(self):
+        """How many rows fit in the widget right now."""
+        row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        height = self.tree.winfo_height()
+        if height <= 1:  # Not laid out yet
+            return int(self.tree.cget('height'))
+        return max(1, (height - row_height) // row_height)
+    
+    def set_count(self, count):
+        """Tell the list how many rows exist; only the visible ones are fetched."""
+        self.count = count
+        self.refresh()
+    
+    def on_scroll(self, action, amount, unit=None):
+        """Scrollbar callback ('moveto' fraction or 'scroll' n units/pages)."""
+        if action == 'moveto':
+            self.first = int(float(amount) * self.count)
+            self.refresh()
+        else:
+            self.scroll_by(int(amount), unit)
+    
+    def scroll_by(self, amount, unit):
+        step = self.visible_rows() if unit == 'pages' else 3
+        self.first += amount * step
+        self.refresh()
+        return "break"
+    
+    def refresh(self):
+        """Re-fill the visible window from ``fetch`` and sync the scrollbar."""
+        visible = self.visible_rows()
+        self.first = max(0, min(self.first, self.count - visible))
+        rows = self.fetch(self.first, min(self.count, self.first + visible)) if self.count else []
+        
+        items = self.tree.get_children()
+        for i, values in enumerate(rows):
+            if i < len(items):
+                self.tree.item(items[i], values=values)
+            else:
+                self.tree.insert('', tk.END, iid=str(i), values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        
+        if self.count:
+            self.scrollbar.set(self.first / self.count, min(1.0, (self.first + visible) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
 class EmailSlicerGUI:
     """Modern GUI for Email Slicer application."""
     
@@ -121,8 +196,16 @@ class EmailSlicerGUI:
         # Create notebook
         self.setup_ui()
         
-        # Store last parsed emails for batch export
-        self.last_parsed_emails = []
+        # Batch results live in an on-disk spool; the queue carries them from the worker
+        self.batch_spool = None
+        self.batch_queue = None
+        self.batch_cancel = None
+        self.batch_started = 0.0
+        self.batch_total = 0
+        self.batch_processed = 0
+        self.batch_invalid = 0
+        # Streams the spool to a file; the spool must outlive it
+        self.export_thread = None
         
     def center_window(self):
         """Center the window on the screen."""
@@ -417,8 +500,18 @@ class EmailSlicerGUI:
                                        variable=self.check_disposable)
         disposable_cb.pack(anchor=tk.W, pady=8)
         
+        domains_row = ttk.Frame(options_card)
+        domains_row.pack(fill=tk.X, pady=8)
+        
+        self.domain_list_var = tk.StringVar(value=self.domain_list_label())
+        ttk.Label(domains_row, textvariable=self.domain_list_var,
+                 font=('Arial', 10)).pack(side=tk.LEFT)
+        
+        ttk.Button(domains_row, text="📚 Load Domain List",
+                  command=self.load_domain_list, width=18).pack(side=tk.RIGHT)
+        
         self.export_json = tk.BooleanVar(value=True)
-        export_cb = ttk.Checkbutton(options_card, text="Export results as JSON format",
+        export_cb = ttk.Checkbutton(options_card, text="Export results as JSON format (CSV when unchecked)",
                                    variable=self.export_json)
         export_cb.pack(anchor=tk.W, pady=8)
         
@@ -436,7 +529,13 @@ class EmailSlicerGUI:
         clear_btn = ttk.Button(action_frame, text="🗑️ Clear Results", 
                              command=self.clear_batch_results,
                              width=15)
-        clear_btn.pack(side=tk.LEFT)
+        clear_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Stop button
+        stop_btn = ttk.Button(action_frame, text="⏹️ Stop", 
+                            command=self.stop_batch,
+                            width=10)
+        stop_btn.pack(side=tk.LEFT)
         
         # Results
         results_card = ttk.LabelFrame(self.batch_frame, text="📊 Batch Results", padding=20)
@@ -463,7 +562,7 @@ class EmailSlicerGUI:
                                           style="Custom.Horizontal.TProgressbar")
         self.progress_bar.pack(fill=tk.X, pady=(5, 0))
         
-        # Results text area
+        # Results list
         results_label_frame = ttk.Frame(results_card)
         results_label_frame.pack(fill=tk.X, pady=(10, 5))
         
@@ -476,11 +575,17 @@ class EmailSlicerGUI:
                  font=('Arial', 10),
                  foreground=ModernTheme.SECONDARY).pack(side=tk.LEFT, padx=(10, 0))
         
-        self.results_text = scrolledtext.ScrolledText(results_card, height=12, 
-                                                    font=('Consolas', 10), 
-                                                    wrap=tk.WORD,
-                                                    bg=ModernTheme.CARD_BG)
-        self.results_text.pack(fill=tk.BOTH, expand=True, pady=5)
+        self.results_list = VirtualList(results_card, [
+            ('line', '#', 70),
+            ('email', 'Email', 220),
+            ('local', 'Local Part', 120),
+            ('domain', 'Domain', 140),
+            ('tag', 'Tag', 70),
+            ('provider', 'Provider', 80),
+            ('disposable', 'Disposable', 80),
+            ('suggestion', 'Did You Mean', 110),
+        ], self.fetch_batch_rows)
+        self.results_list.pack(fill=tk.BOTH, expand=True, pady=5)
         
         # Export button
         export_frame = ttk.Frame(results_card)
@@ -648,6 +753,43 @@ insights into email address components.
             self.file_var.set(filename)
             self.summary_var.set(f"📁 Selected file: {Path(filename).name}")
     
+    def domain_list_label(self):
+        """Describe where typo suggestions come from."""
+        path = domain_list_path()
+        if path:
+            return f"💡 Typo suggestions from: {Path(path).name}"
+        return "💡 Typo suggestions from: common providers"
+    
+    def load_domain_list(self):
+        """Load a known-good domain list for typo suggestions."""
+        filename = filedialog.askopenfilename(
+            title="Select known-good domain list",
+            filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
+        )
+        if not filename:
+            return
+        
+        self.domain_list_var.set(f"⏳ Indexing {Path(filename).name}...")
+        
+        # Building a large index takes a while the first time; keep the UI responsive
+        def load_thread():
+            try:
+                index = use_domain_list(filename)
+            except OSError as e:
+                error = str(e)
+                self.root.after(0, lambda: messagebox.showerror("Error", f"❌ Could not read domain list:\n{error}"))
+                self.root.after(0, lambda: self.domain_list_var.set(self.domain_list_label()))
+                return
+            self.root.after(0, lambda: self.domain_list_var.set(self.domain_list_label()))
+            self.root.after(0, lambda: self.show_toast(f"📚 {len(index):,} domains loaded", ModernTheme.SUCCESS))
+        
+        threading.Thread(target=load_thread, daemon=True).start()
+    
+    # Rows handed from the batch worker to the UI at a time, and how often the UI drains them
+    BATCH_ROWS = 2000
+    POLL_MS = 100
+    POLL_BUDGET = 0.05  # Seconds of each poll spent draining the queue
+    
     def process_batch(self):
         """Process batch of emails from file."""
         filename = self.file_var.get()
@@ -655,111 +797,208 @@ insights into email address components.
             messagebox.showerror("Error", "❌ Please select a file first.")
             return
         
-        try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                emails = [line.strip() for line in f if line.strip()]
-        except Exception as e:
-            messagebox.showerror("Error", f"❌ Could not read file:\n{e}")
+        if not Path(filename).is_file():
+            messagebox.showerror("Error", f"❌ Could not read file:\n{filename}")
             return
-        
-        if not emails:
-            messagebox.showwarning("Warning", "📭 The selected file is empty.")
+        if self.exporting():
+            messagebox.showinfo("Info", "⏳ Wait for the export to finish before starting a new batch.")
             return
         
-        # Clear previous results
-        self.results_text.delete(1.0, tk.END)
+        # Drop any previous run and its results
+        self.discard_batch()
+        self.batch_spool = ResultSpool()
+        self.batch_queue = queue.Queue(maxsize=64)
+        self.batch_cancel = threading.Event()
+        self.batch_started = time.perf_counter()
+        self.batch_total = self.batch_processed = self.batch_invalid = 0
+        
+        self.results_list.first = 0
+        self.results_list.set_count(0)
+        self.results_count_var.set("(0 emails)")
         self.progress_var.set(0)
-        self.summary_var.set(f"🔄 Processing {len(emails)} emails...")
+        self.summary_var.set(f"🔄 Processing {Path(filename).name}...")
         
-        # Process in background to avoid UI freeze
-        def process_thread():
-            total = len(emails)
-            parsed_emails = []
-            
-            for i, email in enumerate(emails):
+        # Parse in the background; the UI drains the queue with root.after
+        threading.Thread(target=self.batch_worker,
+                         args=(filename, self.check_disposable.get(), self.batch_queue, self.batch_cancel),
+                         daemon=True).start()
+        self.root.after(self.POLL_MS, self.poll_batch)
+    
+    def batch_worker(self, filename, check_disposable, out, cancel):
+        """Worker thread: parse the file and post encoded rows to the queue."""
+        def post(message):
+            # Bounded queue: wait for the UI, but give up once cancelled
+            while not cancel.is_set():
                 try:
-                    parsed = parse_email(email, self.check_disposable.get())
-                    parsed_emails.append(parsed)
-                    
-                    # Update progress
-                    progress = (i + 1) / total * 100
-                    self.root.after(0, lambda p=progress: self.progress_var.set(p))
-                    
-                except EmailSliceError:
-                    continue
-            
-            invalid_count = total - len(parsed_emails)
-            self.last_parsed_emails = parsed_emails
-            
-            # Update UI in main thread
-            self.root.after(0, lambda: self.update_batch_results(parsed_emails, invalid_count, total))
+                    out.put(message, timeout=0.2)
+                    return True
+                except queue.Full:
+                    pass
+            return False
         
-        threading.Thread(target=process_thread, daemon=True).start()
+        try:
+            post(("total", count_lines(filename)))
+            summary = BatchSummary()
+            rows = []
+            for record in parse_stream(iter_email_lines(filename), check_disposable, workers=1):
+                summary.add(record)
+                if record.parsed is not None:
+                    rows.append(ResultSpool.encode(record))
+                if summary.total % self.BATCH_ROWS == 0:
+                    if not post(("rows", rows, summary.total, summary.invalid)):
+                        return
+                    rows = []
+            post(("rows", rows, summary.total, summary.invalid))
+            post(("done", len(summary.domains)))
+        except (OSError, UnicodeDecodeError) as e:
+            post(("error", str(e)))
     
-    def update_batch_results(self, parsed_emails, invalid_count, total_count):
-        """Update batch processing results."""
-        # Update summary
-        self.summary_var.set(
-            f"✅ Processed: {len(parsed_emails)} valid, ❌ {invalid_count} invalid out of {total_count} total emails"
-        )
-        
-        # Update results counter
-        self.results_count_var.set(f"({len(parsed_emails)} emails)")
-        
-        # Clear results text
-        self.results_text.delete(1.0, tk.END)
+    def poll_batch(self):
+        """Drain the worker's queue for a moment, then refresh progress and the list."""
+        if self.batch_queue is None:
+            return
+        finished = None
+        deadline = time.perf_counter() + self.POLL_BUDGET
+        while time.perf_counter() < deadline:
+            try:
+                message = self.batch_queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = message[0]
+            if kind == "total":
+                self.batch_total = message[1]
+            elif kind == "rows":
+                self.batch_spool.append(message[1])
+                self.batch_processed, self.batch_invalid = message[2], message[3]
+            else:
+                finished = message
+                break
+        
+        valid = len(self.batch_spool)
+        elapsed = time.perf_counter() - self.batch_started
+        rate = self.batch_processed / elapsed if elapsed else 0.0
+        if self.batch_total:
+            self.progress_var.set(min(100.0, self.batch_processed / self.batch_total * 100))
+        self.results_count_var.set(f"({valid:,} emails)")
+        self.results_list.set_count(valid)
+        
+        if finished is None:
+            self.summary_var.set(
+                f"🔄 Processed {self.batch_processed:,} of ~{self.batch_total:,} "
+                f"• ❌ {self.batch_invalid:,} invalid • ⚡ {rate:,.0f} emails/s"
+            )
+            self.root.after(self.POLL_MS, self.poll_batch)
+            return
         
-        # Add results with formatting
-        for i, pe in enumerate(parsed_emails, 1):
-            self.results_text.insert(tk.END, f"📧 {i}. {pe.original}\n")
-            self.results_text.insert(tk.END, f"   👤 Local: {pe.local_part}\n")
-            self.results_text.insert(tk.END, f"   🌐 Domain: {pe.domain}\n")
-            
-            if pe.tag:
-                self.results_text.insert(tk.END, f"   🏷️ Tag: {pe.tag}\n")
-            
-            if pe.is_disposable:
-                self.results_text.insert(tk.END, f"   ⚠️ Disposable email\n")
-            
-            provider_type = get_email_provider_type(pe.domain)
-            self.results_text.insert(tk.END, f"   🏢 Provider: {provider_type.title()}\n")
-            
-            self.results_text.insert(tk.END, "─" * 50 + "\n\n")
+        self.batch_queue = None
+        if finished[0] == "error":
+            self.summary_var.set("❌ Batch processing failed")
+            messagebox.showerror("Error", f"❌ Could not read file:\n{finished[1]}")
+            return
+        if not self.batch_processed:
+            self.summary_var.set("📭 The selected file is empty.")
+            messagebox.showwarning("Warning", "📭 The selected file is empty.")
+            return
         
-        # Show completion toast
-        self.show_toast(f"✅ Batch processing complete! {len(parsed_emails)} emails analyzed.", ModernTheme.SUCCESS)
+        self.progress_var.set(100)
+        self.summary_var.set(
+            f"✅ Processed: {valid:,} valid, ❌ {self.batch_invalid:,} invalid out of "
+            f"{self.batch_processed:,} total emails • {finished[1]:,} domains in {elapsed:.1f}s"
+        )
+        self.show_toast(f"✅ Batch processing complete! {valid:,} emails analyzed.", ModernTheme.SUCCESS)
+    
+    def fetch_batch_rows(self, start, stop):
+        """Rows for the virtual list, read from the spool on demand."""
+        if self.batch_spool is None:
+            return []
+        rows = []
+        for row in self.batch_spool.rows(start, stop):
+            rows.append((
+                row['line'], row['original'], row['local_part'], row['domain'],
+                row['tag'] or "", row['provider_type'].title(),
+                "⚠️ Yes" if row['is_disposable'] else "No",
+                row['suggestion'] or "",
+            ))
+        return rows
+    
+    def stop_batch(self):
+        """Stop a running batch, keeping the rows processed so far."""
+        if self.batch_cancel is not None and self.batch_queue is not None:
+            self.batch_cancel.set()
+            self.batch_queue = None
+            self.summary_var.set(
+                f"⏹️ Stopped after {self.batch_processed:,} emails ({len(self.batch_spool):,} valid)"
+            )
+    
+    def discard_batch(self):
+        """Cancel any running batch and delete its spooled results."""
+        if self.batch_cancel is not None:
+            self.batch_cancel.set()
+        self.batch_queue = None
+        if self.batch_spool is not None:
+            self.batch_spool.close()
+            self.batch_spool = None
+    
+    def exporting(self):
+        """Whether an export is still reading the current spool."""
+        return self.export_thread is not None and self.export_thread.is_alive()
     
     def clear_batch_results(self):
         """Clear batch processing results."""
-        self.results_text.delete(1.0, tk.END)
+        if self.exporting():
+            messagebox.showinfo("Info", "⏳ Wait for the export to finish before clearing the results.")
+            return
+        self.discard_batch()
+        self.results_list.first = 0
+        self.results_list.set_count(0)
         self.progress_var.set(0)
         self.summary_var.set("👆 Select a file and click 'Process Batch' to start")
         self.results_count_var.set("(0 emails)")
-        self.last_parsed_emails = []
         self.show_toast("🗑️ Results cleared", ModernTheme.SECONDARY)
     
     def export_results(self):
-        """Export batch results to JSON file."""
-        if not self.last_parsed_emails:
+        """Export batch results, streaming them from the spool to disk."""
+        if self.batch_spool is None or not len(self.batch_spool):
             messagebox.showinfo("Info", "📭 No results to export. Process a batch first.")
             return
-            
+        if self.batch_queue is not None:
+            messagebox.showinfo("Info", "⏳ Wait for the batch to finish (or stop it) before exporting.")
+            return
+        if self.exporting():
+            messagebox.showinfo("Info", "⏳ An export is already running.")
+            return
+        
+        if self.export_json.get():
+            title, extension, fmt = "Save results as JSON", ".json", "json"
+            filetypes = [("JSON files", "*.json"), ("JSON Lines files", "*.jsonl"), ("All files", "*.*")]
+        else:
+            title, extension, fmt = "Save results as CSV", ".csv", "csv"
+            filetypes = [("CSV files", "*.csv"), ("All files", "*.*")]
         filename = filedialog.asksaveasfilename(
-            title="Save results as JSON",
-            defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            title=title,
+            defaultextension=extension,
+            filetypes=filetypes
         )
+        if not filename:
+            return
+        if filename.lower().endswith(".jsonl"):
+            fmt = "jsonl"
         
-        if filename:
+        spool = self.batch_spool
+        self.summary_var.set(f"💾 Exporting {len(spool):,} results...")
+        
+        def export_thread():
             try:
-                results = [pe.__dict__ for pe in self.last_parsed_emails]
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2, ensure_ascii=False)
-                
-                messagebox.showinfo("Success", f"✅ Results exported to:\n{filename}")
-                self.show_toast("💾 Results exported successfully!", ModernTheme.SUCCESS)
-            except Exception as e:
-                messagebox.showerror("Error", f"❌ Could not export results:\n{e}")
+                count = spool.export(filename, fmt)
+            except (OSError, ValueError) as e:
+                error = str(e)
+                self.root.after(0, lambda: messagebox.showerror("Error", f"❌ Could not export results:\n{error}"))
+                return
+            self.root.after(0, lambda: self.summary_var.set(f"💾 Exported {count:,} results to {Path(filename).name}"))
+            self.root.after(0, lambda: self.show_toast("💾 Results exported successfully!", ModernTheme.SUCCESS))
+        
+        self.export_thread = threading.Thread(target=export_thread, daemon=True)
+        self.export_thread.start()
     
     def copy_to_clipboard(self, text):
         """Copy text to clipboard."""
@@ -791,6 +1030,9 @@ def main():
     root = tk.Tk()
     app = EmailSlicerGUI(root)
     root.mainloop()
+    if app.export_thread is not None:
+        app.export_thread.join()  # Let a running export finish before its spool is deleted
+    app.discard_batch()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,11 +1,15 @@
 """Simple validators and helpers (typo suggestions)."""
 from __future__ import annotations
 from typing import Optional
-import difflib
+import os
 import re
 
 # Import from the same package
 from .core import DISPOSABLE_DOMAINS
+from .domain_index import DEFAULT_MAX_DISTANCE, DomainIndex, load_domain_index
+
+# Environment variable naming a known-good domain list to suggest from
+DOMAIN_LIST_ENV = "EMAIL_SLICER_DOMAINS"
 
 # Curated common providers (you can extend this list)
 _COMMON_DOMAINS = [
@@ -28,20 +32,62 @@ def validate_email_format(email: str) -> bool:
     pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
     return bool(re.match(pattern, email))
 
-def suggest_domain(domain: str, cutoff: float = 0.7) -> Optional[str]:
+_domain_index: Optional[DomainIndex] = None
+
+def get_domain_index() -> DomainIndex:
+    """
+    The index suggestions are drawn from.
+    
+    Built from the common providers unless a domain list was loaded with
+    ``use_domain_list`` or named by the ``EMAIL_SLICER_DOMAINS`` variable.
+    """
+    global _domain_index
+    if _domain_index is None:
+        path = os.environ.get(DOMAIN_LIST_ENV)
+        try:
+            if path:
+                return use_domain_list(path)
+        except OSError:
+            pass  # Missing or unreadable list: fall back to the common providers
+        _domain_index = DomainIndex(_COMMON_DOMAINS)
+    return _domain_index
+
+def use_domain_list(path: str) -> DomainIndex:
+    """
+    Suggest from a known-good domain list (one per line, most popular first).
+    
+    The built index is cached next to the list, so only the first load of a
+    large list pays for building it.
+    
+    Args:
+        path: Domain list file
+        
+    Returns:
+        DomainIndex: The index now in use
+    """
+    global _domain_index
+    _domain_index = load_domain_index(path)
+    from .batch import domain_info  # batch imports this module
+    domain_info.cache_clear()
+    return _domain_index
+
+def domain_list_path() -> Optional[str]:
+    """The domain list in use, or None for the built-in providers."""
+    return _domain_index.source if _domain_index is not None else None
+
+def suggest_domain(domain: str, max_distance: float = DEFAULT_MAX_DISTANCE) -> Optional[str]:
     """
     Return a suggested domain if domain looks like a typo, else None.
     
     Args:
         domain: The domain to check for suggestions
-        cutoff: Similarity threshold for suggestions (0.0-1.0)
+        max_distance: Largest edit distance to suggest across (a slip onto a
+            neighbouring key counts as half an edit)
         
     Returns:
-        Optional[str]: Suggested domain or None
+        Optional[str]: Suggested domain or None (also for known domains)
     """
-    domain = domain.lower().strip()
-    matches = difflib.get_close_matches(domain, _COMMON_DOMAINS, n=1, cutoff=cutoff)
-    return matches[0] if matches else None
+    return get_domain_index().suggest(domain, max_distance)
 
 def get_email_provider_type(domain: str) -> str:
     """
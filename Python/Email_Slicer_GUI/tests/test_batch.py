@@ -0,0 +1,94 @@
+"""Tests for the streaming batch engine."""
+import csv
+import io
+import json
+import os
+from email_slicer.batch import (
+    ResultSpool, count_lines, domain_info, parse_stream, process_file, write_records,
+)
+from email_slicer.core import batch_parse_emails
+
+EMAILS = ["alice@example.com", "not-an-email", "bob+news@gmail.com",
+          "carol@mailinator.com", "dave@gmial.com", "erin@gmail.com"]
+
+def test_parse_stream_keeps_order_and_invalid_lines():
+    """Every input line gets a numbered record, invalid ones with an error."""
+    records = list(parse_stream(EMAILS, check_disposable=True, workers=1, chunk_size=2))
+    assert [r.line for r in records] == list(range(1, len(EMAILS) + 1))
+    assert records[1].parsed is None and records[1].error
+    assert records[2].parsed.tag == "news"
+    assert records[2].provider_type == "personal"
+    assert records[3].parsed.is_disposable
+    assert records[4].suggestion == "gmail.com"
+
+def test_domain_info_is_cached_per_domain():
+    """Addresses on the same domain share one lookup."""
+    domain_info.cache_clear()
+    list(parse_stream(EMAILS, workers=1))
+    info = domain_info.cache_info()
+    assert info.misses == 4  # example.com, gmail.com, mailinator.com, gmial.com
+    assert info.hits == 1
+
+def test_pool_matches_in_process():
+    """Parsing across a process pool gives the same records in the same order."""
+    serial = list(parse_stream(EMAILS * 3, workers=1, chunk_size=4))
+    pooled = list(parse_stream(EMAILS * 3, workers=2, chunk_size=4))
+    assert serial == pooled
+
+def test_batch_parse_emails_skips_invalid():
+    """The list API still returns only the valid addresses."""
+    parsed = batch_parse_emails(EMAILS)
+    assert [pe.domain for pe in parsed] == ["example.com", "gmail.com", "mailinator.com",
+                                            "gmial.com", "gmail.com"]
+
+def test_write_records_csv_and_jsonl():
+    """Results are written as CSV rows or JSON lines, one per address."""
+    out = io.StringIO()
+    summary = write_records(parse_stream(EMAILS, workers=1), out, "csv", include_invalid=False)
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert len(rows) == summary.valid == 5
+    assert summary.invalid == 1
+    assert len(summary.domains) == 4
+    assert rows[0]["root_domain"] == "example"
+
+    out = io.StringIO()
+    write_records(parse_stream(EMAILS, workers=1), out, "jsonl")
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(lines) == len(EMAILS)
+    assert lines[1]["valid"] is False
+
+def test_process_file_infers_format(tmp_path):
+    """The output format follows the output file's suffix."""
+    source = tmp_path / "emails.txt"
+    source.write_text("\n".join(EMAILS) + "\n\n", encoding="utf-8")
+    output = tmp_path / "out.jsonl"
+    summary = process_file(str(source), str(output), workers=1)
+    assert summary.total == len(EMAILS)
+    assert len(output.read_text(encoding="utf-8").splitlines()) == len(EMAILS)
+
+def test_count_lines_handles_missing_final_newline(tmp_path):
+    """Lines are counted whether or not the file ends with a newline."""
+    path = tmp_path / "emails.txt"
+    path.write_bytes(b"a@b.com\nc@d.com")
+    assert count_lines(str(path)) == 2
+    path.write_bytes(b"a@b.com\nc@d.com\n")
+    assert count_lines(str(path)) == 2
+
+def test_result_spool_pages_and_exports(tmp_path):
+    """Spooled rows can be read by range and streamed out in every format."""
+    spool = ResultSpool()
+    try:
+        spool.append(ResultSpool.encode(r) for r in parse_stream(EMAILS, workers=1) if r.parsed)
+        assert len(spool) == 5
+        assert [row["line"] for row in spool.rows(1, 3)] == [3, 4]
+        assert spool.rows(4, 99)[0]["original"] == "erin@gmail.com"
+
+        assert spool.export(str(tmp_path / "out.json"), "json") == 5
+        rows = json.loads((tmp_path / "out.json").read_text(encoding="utf-8"))
+        assert [row["domain"] for row in rows][:2] == ["example.com", "gmail.com"]
+        spool.export(str(tmp_path / "out.csv"), "csv")
+        with open(tmp_path / "out.csv", encoding="utf-8") as fh:
+            assert len(list(csv.DictReader(fh))) == 5
+    finally:
+        spool.close()
+    assert not os.path.exists(spool.path)
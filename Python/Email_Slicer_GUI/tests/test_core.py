@@ -60,4 +60,17 @@ def test_disposable_detection():
 def test_normal_email_not_disposable():
     """Test that normal emails are not flagged as disposable."""
     pe = parse_email("user@gmail.com", check_disposable=True)
-    assert pe.is_disposable == False
\ No newline at end of file
+    assert pe.is_disposable == False
+
+def test_cached_domain_validation_matches_email_validator():
+    """The per-domain fast path normalizes and rejects exactly like email_validator."""
+    from email_validator import validate_email, EmailNotValidError
+    for email in ["A.B@Gmail.COM", "a@münchen.de", "ü@x.com", "bad..dots@x.com",
+                  "a@localhost", "a@b..com", "x" * 65 + "@a.com"]:
+        try:
+            expected = validate_email(email, check_deliverability=False).email
+        except EmailNotValidError:
+            with pytest.raises(EmailSliceError):
+                parse_email(email)
+        else:
+            assert parse_email(email).normalized == expected
\ No newline at end of file
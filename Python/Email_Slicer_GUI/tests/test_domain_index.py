@@ -0,0 +1,86 @@
+"""Tests for the domain typo-suggestion index."""
+import os
+import pytest
+from email_slicer import validators
+from email_slicer.batch import domain_info
+from email_slicer.domain_index import DomainIndex, keyboard_distance, load_domain_index
+
+DOMAINS = ["gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "gmx.com", "mail.com"]
+
+def test_keyboard_distance_weights_adjacent_keys():
+    """Slipping onto a neighbouring key costs less than any other edit."""
+    assert keyboard_distance("gmail.com", "gmail.com") == 0
+    assert keyboard_distance("gmail.con", "gmail.com") == 0.5  # n is next to m
+    assert keyboard_distance("gmail.cpm", "gmail.com") == 0.5
+    assert keyboard_distance("gmail.cam", "gmail.com") == 1
+    assert keyboard_distance("gmial.com", "gmail.com") == 1  # transposition
+    assert keyboard_distance("gmai.com", "gmail.com") == 1
+
+def test_suggest_common_typos():
+    """Single slips, transpositions, drops and doubles map to the known domain."""
+    index = DomainIndex(DOMAINS)
+    assert index.suggest("gmial.com") == "gmail.com"
+    assert index.suggest("gmail.con") == "gmail.com"
+    assert index.suggest("yaho.com") == "yahoo.com"
+    assert index.suggest("hotmaill.com") == "hotmail.com"
+    assert index.suggest("GMAIL.CON") == "gmail.com"
+
+def test_known_and_unrelated_domains_get_no_suggestion():
+    """Known domains are not typos, and far-off domains have no close match."""
+    index = DomainIndex(DOMAINS)
+    assert index.suggest("gmail.com") is None
+    assert "Gmail.com" in index
+    assert index.suggest("example.org") is None
+
+def test_adjacent_key_outranks_other_edits():
+    """Of two candidates one edit away, the neighbouring-key slip wins."""
+    index = DomainIndex(["gmail.cam", "gmail.com"])
+    assert index.candidates("gmail.cpm")[0] == (0.5, "gmail.com")
+
+def test_popularity_breaks_ties():
+    """Equally close candidates resolve to the one listed first."""
+    assert DomainIndex(["gmail.co", "gmail.cm"]).suggest("gmail.c") == "gmail.co"
+    assert DomainIndex(["gmail.cm", "gmail.co"]).suggest("gmail.c") == "gmail.cm"
+
+def test_save_and_load_round_trip(tmp_path):
+    """A serialized index answers exactly like the one it was built from."""
+    index = DomainIndex(DOMAINS)
+    path = str(tmp_path / "domains.idx")
+    index.save(path)
+    loaded = DomainIndex.load(path)
+    assert loaded.domains == index.domains
+    for query in ["gmial.com", "gmail.com", "yaho.com", "example.org"]:
+        assert loaded.candidates(query) == index.candidates(query)
+
+def test_load_rejects_other_files(tmp_path):
+    """Anything that is not a compatible index is refused."""
+    path = tmp_path / "junk.idx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(ValueError):
+        DomainIndex.load(str(path))
+
+def test_load_domain_index_caches_and_rebuilds(tmp_path):
+    """The index is built once, reused, and rebuilt when the list changes."""
+    source = tmp_path / "domains.txt"
+    source.write_text("# known good\ngmail.com\nexample.org\n\n", encoding="utf-8")
+    index = load_domain_index(str(source))
+    assert index.domains == ["gmail.com", "example.org"]
+    cache = str(source) + ".idx"
+    assert os.path.exists(cache)
+
+    source.write_text("gmail.com\nexample.org\nexample.net\n", encoding="utf-8")
+    os.utime(cache, (0, 0))
+    assert load_domain_index(str(source)).suggest("exampel.net") == "example.net"
+
+def test_use_domain_list_switches_suggestions(tmp_path):
+    """suggest_domain draws from the loaded list."""
+    source = tmp_path / "domains.txt"
+    source.write_text("example.org\n", encoding="utf-8")
+    try:
+        validators.use_domain_list(str(source))
+        assert validators.domain_list_path() == str(source)
+        assert validators.suggest_domain("exmaple.org") == "example.org"
+        assert validators.suggest_domain("gmial.com") is None
+    finally:
+        validators._domain_index = None
+        domain_info.cache_clear()
@@ -3,72 +3,217 @@
 The solver implements:
 - wordlist filtering by known pattern and excluded letters
 - letter frequency scoring across remaining candidates
+- an entropy policy that picks the letter whose revealed pattern splits the
+  candidates most evenly, memoized per game state
 - simple tie-breakers
 
+Candidates are tracked as bitsets over a precomputed word index, so
+filtering is a handful of integer ANDs and scoring is one popcount per
+letter, whatever the size of the dictionary.
+
 This is intentionally lightweight so you can replace the internals with a ML model later.
 """
 from collections import Counter
-from typing import List, Set, Optional
+from math import log2
+from typing import Dict, FrozenSet, List, Set, Optional, Tuple
+
+POLICIES = ('frequency', 'entropy')
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+    def _popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+class WordIndex:
+    """Words bucketed by length, with bitsets over each bucket.
+
+    Bit k of a bitset stands for ``buckets[length][k]``. ``positions[length][i]``
+    maps a letter to the words with that letter at position i, and
+    ``presence[length]`` maps a letter to the words containing it anywhere.
+    """
+
+    def __init__(self, words: List[str]):
+        self.buckets: Dict[int, List[str]] = {}
+        for w in words:
+            self.buckets.setdefault(len(w), []).append(w)
+
+        self.positions: Dict[int, List[Dict[str, int]]] = {}
+        self.presence: Dict[int, Dict[str, int]] = {}
+        self.full: Dict[int, int] = {}
+        for length, bucket in self.buckets.items():
+            positions: List[Dict[str, int]] = [{} for _ in range(length)]
+            presence: Dict[str, int] = {}
+            for k, w in enumerate(bucket):
+                bit = 1 << k
+                for i, ch in enumerate(w):
+                    positions[i][ch] = positions[i].get(ch, 0) | bit
+                for ch in set(w):
+                    presence[ch] = presence.get(ch, 0) | bit
+            self.positions[length] = positions
+            self.presence[length] = presence
+            self.full[length] = (1 << len(bucket)) - 1
+
+    def match(self, pattern: str, excluded: Set[str]) -> int:
+        """Bitset of words fitting ``pattern`` ('_' for unknown) and avoiding ``excluded``.
+
+        A letter revealed anywhere in the pattern cannot hide under a '_',
+        since a correct guess reveals every occurrence.
+        """
+        length = len(pattern)
+        if length not in self.buckets:
+            return 0
+        positions = self.positions[length]
+        presence = self.presence[length]
+        bits = self.full[length]
+        revealed = {ch for ch in pattern if ch != '_'}
+        for i, ch in enumerate(pattern):
+            if ch == '_':
+                for r in revealed:
+                    bits &= ~positions[i].get(r, 0)
+            else:
+                bits &= positions[i].get(ch, 0)
+            if not bits:
+                return 0
+        for x in excluded:
+            bits &= ~presence.get(x, 0)
+        return bits
+
+    def letter_counts(self, length: int, bits: int, skip: Set[str]) -> Counter:
+        """Number of words in ``bits`` containing each letter, in alphabetical order."""
+        cnt = Counter()
+        presence = self.presence.get(length, {})
+        for ch in sorted(presence):
+            if ch not in skip:
+                n = _popcount(bits & presence[ch])
+                if n:
+                    cnt[ch] = n
+        return cnt
+
+    def partition_sizes(self, length: int, bits: int, letter: str) -> List[int]:
+        """Sizes of the classes ``bits`` splits into by where ``letter`` appears.
+
+        Words without the letter form one class; the rest are split one
+        position at a time, so this costs a few ANDs per class and position.
+        """
+        present = bits & self.presence[length].get(letter, 0)
+        sizes = [_popcount(bits ^ present)] if bits != present else []
+        groups = [present] if present else []
+        for position in self.positions[length]:
+            at = position.get(letter, 0)
+            if not at:
+                continue
+            split = []
+            for g in groups:
+                hit = g & at
+                if hit and hit != g:
+                    split.append(hit)
+                    split.append(g ^ hit)
+                else:
+                    split.append(g)
+            groups = split
+        sizes.extend(_popcount(g) for g in groups)
+        return sizes
+
+    def words(self, length: int, bits: int) -> List[str]:
+        bucket = self.buckets.get(length, [])
+        # Reversed binary string: character k is bit k
+        return [bucket[k] for k, flag in enumerate(bin(bits)[:1:-1]) if flag == '1']
 
 class AISolver:
-    def __init__(self, wordlist: List[str]):
+    # Entropy choices remembered per state; cleared when it grows past this
+    MEMO_LIMIT = 200000
+
+    def __init__(self, wordlist: List[str], policy: str = 'frequency'):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy: {policy}")
+        self.policy = policy
         # normalize
         self.wordlist = [w.lower() for w in wordlist]
-        self.candidates = list(self.wordlist)
+        self.index = WordIndex(self.wordlist)
         self.guessed: Set[str] = set()
         self.excluded: Set[str] = set()
+        # Candidate bitsets per word length; all lengths until a pattern is seen
+        self._bits: Dict[int, int] = dict(self.index.full)
+        # (pattern, guessed, excluded) -> letter; kept across games
+        self._memo: Dict[Tuple[str, FrozenSet[str], FrozenSet[str]], Optional[str]] = {}
+
+    @property
+    def candidates(self) -> List[str]:
+        return [w for length, bits in self._bits.items() for w in self.index.words(length, bits)]
+
+    def candidate_count(self) -> int:
+        return sum(_popcount(bits) for bits in self._bits.values())
 
     def reset(self):
-        self.candidates = list(self.wordlist)
+        self._bits = dict(self.index.full)
         self.guessed.clear()
         self.excluded.clear()
 
     def filter_candidates(self, pattern: str):
         # pattern: underscores for unknown, letters for known positions, no spaces
-        new = []
-        plen = len(pattern)
         pattern = pattern.lower()
-        for w in self.candidates:
-            if len(w) != plen:
-                continue
-            ok = True
-            for i, ch in enumerate(pattern):
-                if ch == '_':
-                    # position unknown: if this word has a letter already guessed that contradicts
-                    # (i.e., guessed letters that must appear in pattern elsewhere) we still allow;
-                    # main check is that known letters must match.
-                    continue
-                else:
-                    if w[i] != ch:
-                        ok = False
-                        break
-            if not ok:
-                continue
-            # exclude words containing any excluded letters
-            if any(x in w for x in self.excluded):
-                continue
-            # ensure that all revealed letters in pattern are indeed present in word (redundant due to position check)
-            new.append(w)
-        self.candidates = new
+        plen = len(pattern)
+        # Narrow the current candidates of this length; other lengths drop out
+        bits = self._bits.get(plen, 0)
+        if bits:
+            bits &= self.index.match(pattern, self.excluded)
+        self._bits = {plen: bits}
 
     def score_letters(self) -> Counter:
         cnt = Counter()
-        for w in self.candidates:
-            unique = set(w) - self.guessed
-            cnt.update(unique)
+        for length, bits in self._bits.items():
+            cnt.update(self.index.letter_counts(length, bits, self.guessed))
         return cnt
 
+    def entropy_scores(self) -> Dict[str, float]:
+        """Expected information (bits) from guessing each unguessed letter.
+
+        Guessing a letter partitions the candidates by the pattern it would
+        reveal; the entropy of that partition is what the guess tells us.
+        """
+        scores: Dict[str, float] = {}
+        for length, bits in self._bits.items():
+            total = _popcount(bits)
+            if not total:
+                continue
+            for ch in self.index.letter_counts(length, bits, self.guessed):
+                sizes = self.index.partition_sizes(length, bits, ch)
+                # log2(N) - sum(n log2 n) / N
+                info = log2(total) - sum(n * log2(n) for n in sizes) / total
+                scores[ch] = scores.get(ch, 0.0) + info * total
+        n = self.candidate_count()
+        return {ch: v / n for ch, v in scores.items()} if n else {}
+
+    def _choose(self, pattern: str) -> Optional[str]:
+        scores = self.score_letters()
+        if not scores:
+            return None
+        if self.policy == 'frequency':
+            # choose highest frequency letter
+            guess, _ = scores.most_common(1)[0]
+            return guess
+
+        key = (pattern, frozenset(self.guessed), frozenset(self.excluded))
+        if key in self._memo:
+            return self._memo[key]
+        info = self.entropy_scores()
+        # Most information; ties go to the letter in more words, then alphabetical
+        guess = max(scores, key=lambda ch: (round(info.get(ch, 0.0), 9), scores[ch], -ord(ch)))
+        if len(self._memo) >= self.MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[key] = guess
+        return guess
+
     def next_guess(self, pattern: str, banned: Optional[Set[str]] = None) -> Optional[str]:
         if banned:
             self.excluded |= {b.lower() for b in banned}
         # normalize pattern remove spaces
         pattern = pattern.replace(' ', '')
         self.filter_candidates(pattern)
-        scores = self.score_letters()
-        if not scores:
+        guess = self._choose(pattern.lower())
+        if guess is None:
             return None
-        # choose highest frequency letter
-        guess, _ = scores.most_common(1)[0]
         self.guessed.add(guess)
         return guess
 
@@ -97,5 +242,5 @@ class AISolver:
             'pattern': pattern,
             'lives_left': lives,
             'guesses': list(self.guessed),
-            'candidates_left': len(self.candidates)
+            'candidates_left': self.candidate_count()
         }
\ No newline at end of file
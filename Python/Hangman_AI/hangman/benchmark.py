@@ -0,0 +1,99 @@
+"""Headless benchmark for the Hangman AI.
+
+Plays every word of a dictionary with each guess policy across a process
+pool and reports win rate, average wrong guesses and per-guess latency.
+Each worker builds its AISolver (and word index) once, then plays chunks
+of words, so the entropy memo is shared by all games in that worker.
+"""
+import math
+import os
+import time
+from multiprocessing import Pool
+from typing import Dict, Iterable, List, Optional, Tuple
+from .ai_solver import AISolver, POLICIES
+
+_worker_ai: Optional[AISolver] = None
+
+def _init_worker(words: List[str], policy: str):
+    global _worker_ai
+    _worker_ai = AISolver(words, policy=policy)
+
+def play_word(ai: AISolver, secret: str, max_lives: int = 7) -> Tuple[bool, int, int, List[float]]:
+    """Play one game; returns (solved, wrong guesses, guesses, seconds spent choosing each guess)."""
+    ai.reset()
+    lives = max_lives
+    guesses = 0
+    thinking: List[float] = []
+    while lives > 0 and not all(c in ai.guessed for c in secret):
+        pattern = ''.join(c if c in ai.guessed else '_' for c in secret)
+        start = time.perf_counter()
+        g = ai.next_guess(pattern)
+        elapsed = time.perf_counter() - start
+        if g is None:
+            break
+        thinking.append(elapsed)
+        guesses += 1
+        if g not in secret:
+            lives -= 1
+            ai.excluded.add(g)
+    solved = all(c in ai.guessed for c in secret)
+    return solved, max_lives - lives, guesses, thinking
+
+def _play_chunk(task: Tuple[List[str], int]) -> List[Tuple[bool, int, int, List[float]]]:
+    words, max_lives = task
+    return [play_word(_worker_ai, w, max_lives) for w in words]
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def benchmark_policy(words: List[str], policy: str, workers: Optional[int] = None,
+                     max_lives: int = 7, chunk_size: int = 200) -> Dict:
+    """Play every word with one policy and summarize the results."""
+    words = [w.lower() for w in words]
+    chunks = [(words[i:i + chunk_size], max_lives) for i in range(0, len(words), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    if workers == 1:
+        _init_worker(words, policy)
+        batches = [_play_chunk(chunk) for chunk in chunks]
+    else:
+        with Pool(workers, initializer=_init_worker, initargs=(words, policy)) as pool:
+            batches = pool.map(_play_chunk, chunks)
+    elapsed = time.perf_counter() - started
+
+    games = wins = wrong = guesses = 0
+    guess_ms: List[float] = []
+    for batch in batches:
+        for solved, misses, n, thinking in batch:
+            games += 1
+            wins += solved
+            wrong += misses
+            guesses += n
+            guess_ms.extend(seconds * 1000 for seconds in thinking)
+    # Percentiles over every guess, so a few slow openings are not averaged away per game
+    ordered = sorted(guess_ms)
+    return {
+        'policy': policy,
+        'games': games,
+        'wins': wins,
+        'win_rate': wins / games if games else 0.0,
+        'avg_wrong_guesses': wrong / games if games else 0.0,
+        'avg_guesses': guesses / games if games else 0.0,
+        'seconds': elapsed,
+        'games_per_second': games / elapsed if elapsed else 0.0,
+        'guess_latency_ms': {
+            'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+            'p50': percentile(ordered, 50),
+            'p99': percentile(ordered, 99),
+        },
+    }
+
+def run_benchmark(words: List[str], policies: Iterable[str] = POLICIES,
+                  workers: Optional[int] = None, max_lives: int = 7) -> List[Dict]:
+    """Benchmark each policy on the same dictionary."""
+    return [benchmark_policy(words, policy, workers, max_lives) for policy in policies]
@@ -3,7 +3,8 @@ import os
 import sys
 import time
 from .core import Hangman
-from .ai_solver import AISolver
+from .ai_solver import AISolver, POLICIES
+from .benchmark import benchmark_policy
 
 def clear_screen():
     """Clear the terminal screen."""
@@ -221,42 +222,37 @@ def ai_solve_interactive():
     if another == 'y' or another == 'yes':
         ai_solve_interactive()
 
-def run_benchmarks():
-    words = load_wordlist() or ['python','hangman','assistant','programming','developer','testing','algorithm','computer','software','hardware']
-    from time import time
-    ai = AISolver(words)
-    wins = 0
-    total_time = 0
+def run_benchmarks(wordlist_path: str = None, policies=POLICIES, workers: int = None,
+                   interactive: bool = True):
+    """Play the whole dictionary headlessly with each policy and compare them."""
+    words = load_wordlist(wordlist_path) or ['python','hangman','assistant','programming','developer','testing','algorithm','computer','software','hardware']
     
-    print_header()
-    print("    \033[1;35mRunning benchmarks...\033[0m\n")
+    if interactive:
+        print_header()
+    print(f"    \033[1;35mRunning benchmarks on {len(words)} words...\033[0m\n")
     
-    for i, w in enumerate(words):
-        start_time = time()
-        r = ai.solve(w, max_lives=7, verbose=False)
-        end_time = time()
-        time_taken = end_time - start_time
-        total_time += time_taken
-        
-        status = "\033[1;32m✅\033[0m" if r['solved'] else "\033[1;31m❌\033[0m"
-        color = "\033[1;32m" if r['solved'] else "\033[1;31m"
-        print(f"    {i+1:2d}. {w:12} {status} {color}{time_taken:.4f}s\033[0m")
+    reports = []
+    for policy in policies:
+        r = benchmark_policy(words, policy, workers)
+        reports.append(r)
+        success_rate = r['win_rate'] * 100
+        color_rate = "\033[1;32m" if success_rate > 80 else "\033[1;33m" if success_rate > 60 else "\033[1;31m"
+        latency = r['guess_latency_ms']
         
-        if r['solved']:
-            wins += 1
-        ai.reset()
-    
-    success_rate = (wins/len(words))*100
-    color_rate = "\033[1;32m" if success_rate > 80 else "\033[1;33m" if success_rate > 60 else "\033[1;31m"
-    
-    print(f"\n    \033[1;34mSolved:\033[0m {wins}/{len(words)} words")
-    print(f"    \033[1;34mSuccess rate:\033[0m {color_rate}{success_rate:.2f}%\033[0m")
-    print(f"    \033[1;34mAverage time:\033[0m \033[1;36m{total_time/len(words):.4f}s\033[0m\n")
+        print(f"    \033[1;36m{policy.capitalize()} policy\033[0m")
+        print(f"    \033[1;34mSolved:\033[0m {r['wins']}/{r['games']} words")
+        print(f"    \033[1;34mSuccess rate:\033[0m {color_rate}{success_rate:.2f}%\033[0m")
+        print(f"    \033[1;34mAverage wrong guesses:\033[0m {r['avg_wrong_guesses']:.3f}")
+        print(f"    \033[1;34mPer-guess latency:\033[0m \033[1;36mmean {latency['mean']:.3f}ms, "
+              f"p50 {latency['p50']:.3f}ms, p99 {latency['p99']:.3f}ms\033[0m")
+        print(f"    \033[1;34mThroughput:\033[0m {r['games_per_second']:.1f} games/s\n")
     
-    # Ask if user wants to run benchmarks again
-    again = input("    \033[1;33mRun benchmarks again? (y/n): \033[0m").strip().lower()
-    if again == 'y' or again == 'yes':
-        run_benchmarks()
+    if interactive:
+        # Ask if user wants to run benchmarks again
+        again = input("    \033[1;33mRun benchmarks again? (y/n): \033[0m").strip().lower()
+        if again == 'y' or again == 'yes':
+            run_benchmarks(wordlist_path, policies, workers)
+    return reports
 
 if __name__ == '__main__':
     human_vs_ai()
\ No newline at end of file
@@ -2,6 +2,7 @@
 import argparse
 import sys
 from hangman import cli, gui
+from hangman.ai_solver import POLICIES
 
 def print_welcome():
     """Print a beautiful welcome message."""
@@ -50,8 +51,15 @@ def main():
         parser = argparse.ArgumentParser(description="Hangman AI project")
         parser.add_argument('--mode', '-m', choices=['cli','gui','ai','bench'], default='cli',
                            help='cli (command line interface), gui (graphical interface), ai (AI solves secret word), bench (run solver tests)')
+        parser.add_argument('--wordlist', help='bench: dictionary file, one word per line')
+        parser.add_argument('--policy', choices=POLICIES, action='append',
+                           help='bench: guess policy to test (repeatable; default: all)')
+        parser.add_argument('--workers', type=int, help='bench: worker processes (default: CPU count)')
         args = parser.parse_args()
         mode = args.mode
+        if mode == 'bench':
+            cli.run_benchmarks(args.wordlist, args.policy or POLICIES, args.workers, interactive=False)
+            return
     else:
         # Interactive mode selection
         mode = select_mode()
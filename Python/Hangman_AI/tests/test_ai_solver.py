@@ -17,3 +17,61 @@ def test_solve_known_word(sample_wordlist):
     res = ai.solve('hangman', max_lives=10)
     assert isinstance(res, dict)
     assert 'solved' in res
+
+def test_filter_matches_brute_force(sample_wordlist):
+    words = sample_wordlist + ['pattern', 'cottons', 'tattoos', 'dragons', 'lantern']
+    ai = AISolver(words)
+    ai.excluded = {'s'}
+    ai.filter_candidates('_a_t___')
+    expected = [w for w in words if len(w) == 7 and w[1] == 'a' and w[3] == 't'
+                and 's' not in w and 'a' not in w[:1] + w[2] + w[4:]
+                and 't' not in w[:1] + w[2] + w[4:]]
+    assert sorted(ai.candidates) == sorted(expected) == ['lantern']
+    assert ai.candidate_count() == 1
+
+def test_score_letters_counts_words(sample_wordlist):
+    ai = AISolver(sample_wordlist)
+    ai.filter_candidates('_______')
+    scores = ai.score_letters()
+    assert scores['n'] == 2  # hangman, testing
+    assert scores['t'] == 1
+    ai.guessed.add('n')
+    assert 'n' not in ai.score_letters()
+
+def test_partition_sizes_cover_candidates(sample_wordlist):
+    ai = AISolver(sample_wordlist + ['banana', 'bandana'])
+    ai.filter_candidates('_______')
+    bits = ai._bits[7]
+    sizes = ai.index.partition_sizes(7, bits, 'a')
+    assert sum(sizes) == ai.candidate_count() == 3
+    # hangman (a at 1 and 5) and bandana (a at 1, 4 and 6) reveal different patterns; testing has none
+    assert sorted(sizes) == [1, 1, 1]
+
+def test_entropy_policy_solves_and_memoizes():
+    words = ['cat', 'bat', 'hat', 'mat', 'rat', 'sat', 'cot', 'dog']
+    # 't' is in the most words, but 'a' splits the candidates more evenly
+    assert AISolver(words).next_guess('___') == 't'
+    ai = AISolver(words, policy='entropy')
+    assert ai.next_guess('___') == 'a'
+    res = ai.solve('rat', max_lives=7)
+    assert res['solved']
+    assert ai._memo
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        AISolver(['word'], policy='random')
+
+def test_benchmark_policies_across_processes(sample_wordlist):
+    from hangman.benchmark import run_benchmark
+    serial, pooled = run_benchmark(sample_wordlist, ['entropy'], workers=1) + \
+        run_benchmark(sample_wordlist, ['entropy'], workers=2)
+    assert serial['games'] == pooled['games'] == len(sample_wordlist)
+    assert serial['wins'] == pooled['wins']
+    assert serial['avg_wrong_guesses'] == pooled['avg_wrong_guesses']
+
+def test_play_word_times_each_guess(sample_wordlist):
+    from hangman.benchmark import play_word
+    solved, wrong, guesses, thinking = play_word(AISolver(sample_wordlist), 'hangman')
+    assert solved
+    assert len(thinking) == guesses > wrong
+    assert all(seconds >= 0 for seconds in thinking)
@@ -8,6 +8,7 @@ import sys
 import os
 from typing import List, Tuple, Optional
 from .core import Minesweeper, GameState
+from .solver import ConstraintSolver
 from .difficulty import BEGINNER, INTERMEDIATE, EXPERT
 
 try:
@@ -17,7 +18,7 @@ except ImportError:
     PYGAME_AVAILABLE = False
 
 class MinesweeperAI:
-    """AI solver for Minesweeper using logical deduction."""
+    """AI solver for Minesweeper using constraint propagation and mine probabilities."""
     
     def __init__(self, game: Minesweeper, verbose: bool = True):
         self.game = game
@@ -25,6 +26,7 @@ class MinesweeperAI:
         self.moves_made = 0
         self.logical_moves = 0
         self.guess_moves = 0
+        self.engine = ConstraintSolver(game)
         
     def get_neighbors(self, row: int, col: int) -> List[Tuple[int, int]]:
         """Get valid neighbors of a cell."""
@@ -68,57 +70,51 @@ class MinesweeperAI:
         return safe_cells, mine_cells
         
     def make_logical_move(self) -> bool:
-        """Make a logical move based on number constraints."""
+        """Make every move the constraint engine can prove."""
         moves_made = False
+        safe_cells, mine_cells = self.engine.deduce()
         
-        for row in range(self.game.rows):
-            for col in range(self.game.cols):
-                if not self.game.revealed[row][col] or self.game.numbers[row][col] == 0:
-                    continue
-                    
-                safe_cells, mine_cells = self.analyze_cell(row, col)
+        # Reveal safe cells
+        for r, c in safe_cells:
+            if self.game.state != GameState.PLAYING:
+                break
+            if not self.game.revealed[r][c]:
+                if self.verbose:
+                    print(f"AI: Revealing safe cell ({r}, {c})")
+                self.game.reveal_cell(r, c)
+                self.engine.note_reveal(r, c)
+                self.moves_made += 1
+                self.logical_moves += 1
+                moves_made = True
+                
+        # Flag mine cells
+        for r, c in mine_cells:
+            if self.game.state != GameState.PLAYING:
+                break
+            if not self.game.flagged[r][c]:
+                if self.verbose:
+                    print(f"AI: Flagging mine at ({r}, {c})")
+                self.game.toggle_flag(r, c)
+                self.engine.note_flag(r, c)
+                self.moves_made += 1
+                self.logical_moves += 1
+                moves_made = True
                 
-                # Reveal safe cells
-                for r, c in safe_cells:
-                    if not self.game.revealed[r][c]:
-                        if self.verbose:
-                            print(f"AI: Revealing safe cell ({r}, {c})")
-                        self.game.reveal_cell(r, c)
-                        self.moves_made += 1
-                        self.logical_moves += 1
-                        moves_made = True
-                        
-                # Flag mine cells
-                for r, c in mine_cells:
-                    if not self.game.flagged[r][c]:
-                        if self.verbose:
-                            print(f"AI: Flagging mine at ({r}, {c})")
-                        self.game.toggle_flag(r, c)
-                        self.moves_made += 1
-                        self.logical_moves += 1
-                        moves_made = True
-                        
         return moves_made
         
     def make_educated_guess(self) -> bool:
-        """Make an educated guess when no logical moves are available."""
-        # Find all unrevealed, unflagged cells
-        candidates = []
-        for row in range(self.game.rows):
-            for col in range(self.game.cols):
-                if not self.game.revealed[row][col] and not self.game.flagged[row][col]:
-                    candidates.append((row, col))
-                    
-        if not candidates:
+        """Reveal the covered cell with the lowest mine probability."""
+        guess = self.engine.best_guess()
+        if guess is None:
             return False
-            
-        # Choose a random candidate (could be improved with probability analysis)
-        row, col = random.choice(candidates)
+        row, col = guess
         
         if self.verbose:
-            print(f"AI: Making educated guess at ({row}, {col})")
+            probability = self.engine.cell_probabilities().get(guess, 0.0)
+            print(f"AI: Making educated guess at ({row}, {col}) - {probability:.1%} mine risk")
             
         success = self.game.reveal_cell(row, col)
+        self.engine.note_reveal(row, col)
         self.moves_made += 1
         self.guess_moves += 1
         
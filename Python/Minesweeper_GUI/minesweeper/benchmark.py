@@ -0,0 +1,225 @@
+"""
+Headless batch runner for the Minesweeper AI.
+
+Plays seeded games for each difficulty across a process pool and reports
+win rate (with a 95% Wilson interval), moves per second, the share of
+logical versus guessed moves and per-game latency percentiles.
+
+Usage:
+    python -m minesweeper.benchmark --games 1000 --difficulty Expert --json results.json
+"""
+import argparse
+import csv
+import json
+import math
+import random
+import sys
+import time
+from dataclasses import dataclass, asdict, fields
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .core import Minesweeper, GameState
+from .ai_solver import MinesweeperAI
+from .difficulty import Difficulty, ALL_DIFFICULTIES, get_difficulty_by_name
+
+@dataclass
+class GameResult:
+    """Outcome of one headless AI game."""
+    difficulty: str
+    seed: int
+    won: bool
+    moves: int
+    logical_moves: int
+    guess_moves: int
+    seconds: float
+
+def play_game(task: Tuple[Difficulty, int, bool, int]) -> GameResult:
+    """Play one seeded game with the AI (runs inside pool workers)."""
+    difficulty, seed, use_lives, max_steps = task
+    lives = difficulty.lives if use_lives else 0
+    game = Minesweeper(difficulty.rows, difficulty.cols, difficulty.mines, lives, seed=seed)
+    ai = MinesweeperAI(game, verbose=False)
+
+    # The opening click is drawn from the global generator; seed it for reproducibility
+    random.seed(seed)
+    start = time.perf_counter()
+    ai.solve_complete(max_steps=max_steps)
+    elapsed = time.perf_counter() - start
+
+    return GameResult(
+        difficulty=difficulty.name,
+        seed=seed,
+        won=game.state == GameState.WON,
+        moves=ai.moves_made,
+        logical_moves=ai.logical_moves,
+        guess_moves=ai.guess_moves,
+        seconds=elapsed
+    )
+
+def wilson_interval(wins: int, games: int, z: float = 1.96) -> Tuple[float, float]:
+    """95% Wilson score interval for a win rate."""
+    if games == 0:
+        return 0.0, 0.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    # The interval always contains the observed rate, including 0% and 100%
+    low = 0.0 if wins == 0 else max(0.0, centre - margin)
+    high = 1.0 if wins == games else min(1.0, centre + margin)
+    return low, high
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+class _Tally:
+    """Running totals for one difficulty, so results need not be kept in memory."""
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.moves = 0
+        self.logical_moves = 0
+        self.guess_moves = 0
+        self.seconds = 0.0
+        self.latencies: List[float] = []
+
+    def add(self, result: GameResult):
+        self.games += 1
+        self.wins += result.won
+        self.moves += result.moves
+        self.logical_moves += result.logical_moves
+        self.guess_moves += result.guess_moves
+        self.seconds += result.seconds
+        self.latencies.append(result.seconds * 1000)
+
+    def summary(self) -> Dict:
+        low, high = wilson_interval(self.wins, self.games)
+        ordered = sorted(self.latencies)
+        decided = self.logical_moves + self.guess_moves
+        return {
+            'games': self.games,
+            'wins': self.wins,
+            'win_rate': self.wins / self.games if self.games else 0.0,
+            'win_rate_ci95': [low, high],
+            'moves_per_second': self.moves / self.seconds if self.seconds else 0.0,
+            'logical_ratio': self.logical_moves / decided if decided else 0.0,
+            'guess_ratio': self.guess_moves / decided if decided else 0.0,
+            'latency_ms': {
+                'mean': sum(ordered) / len(ordered) if ordered else 0.0,
+                'p50': percentile(ordered, 50),
+                'p90': percentile(ordered, 90),
+                'p99': percentile(ordered, 99),
+                'max': ordered[-1] if ordered else 0.0,
+            },
+        }
+
+def iter_results(difficulties: Iterable[Difficulty], games: int, workers: int = 1,
+                 seed: int = 0, use_lives: bool = False, max_steps: int = 1000,
+                 chunksize: int = 64) -> Iterator[GameResult]:
+    """
+    Yield game results as they finish.
+
+    Game ``i`` of every difficulty uses seed ``seed + i``, so runs with the
+    same arguments replay the same boards regardless of worker count.
+    """
+    tasks = ((difficulty, seed + i, use_lives, max_steps)
+             for difficulty in difficulties for i in range(games))
+    if workers <= 1:
+        yield from map(play_game, tasks)
+        return
+    with Pool(processes=workers) as pool:
+        yield from pool.imap_unordered(play_game, tasks, chunksize=chunksize)
+
+def run_benchmark(difficulties: Iterable[Difficulty], games: int, workers: int = 1,
+                  seed: int = 0, use_lives: bool = False, max_steps: int = 1000,
+                  csv_path: Optional[str] = None) -> Dict:
+    """
+    Play ``games`` games per difficulty and summarize them.
+
+    Args:
+        difficulties: Difficulties to benchmark
+        games: Games per difficulty
+        workers: Worker processes (1 runs in-process)
+        seed: First board seed
+        use_lives: Play with each difficulty's lives instead of none
+        max_steps: Step limit passed to ``solve_complete``
+        csv_path: Optional path for per-game rows, written as games finish
+
+    Returns:
+        Dict with run settings and a summary per difficulty name
+    """
+    difficulties = list(difficulties)
+    tallies = {difficulty.name: _Tally() for difficulty in difficulties}
+    started = time.perf_counter()
+
+    csv_file = open(csv_path, 'w', newline='') if csv_path else None
+    try:
+        writer = None
+        if csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=[f.name for f in fields(GameResult)])
+            writer.writeheader()
+        for result in iter_results(difficulties, games, workers, seed, use_lives, max_steps):
+            tallies[result.difficulty].add(result)
+            if writer:
+                writer.writerow(asdict(result))
+    finally:
+        if csv_file:
+            csv_file.close()
+
+    return {
+        'games_per_difficulty': games,
+        'workers': workers,
+        'seed': seed,
+        'use_lives': use_lives,
+        'wall_seconds': time.perf_counter() - started,
+        'difficulties': {name: tally.summary() for name, tally in tallies.items()},
+    }
+
+def print_report(report: Dict):
+    """Print a compact table of benchmark results."""
+    print(f"{'Difficulty':<14}{'Games':>8}{'Win rate':>10}{'95% CI':>17}"
+          f"{'Moves/s':>10}{'Logic':>8}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, summary in report['difficulties'].items():
+        low, high = summary['win_rate_ci95']
+        latency = summary['latency_ms']
+        print(f"{name:<14}{summary['games']:>8}{summary['win_rate']:>10.1%}"
+              f"{f'{low:.1%}-{high:.1%}':>17}{summary['moves_per_second']:>10.0f}"
+              f"{summary['logical_ratio']:>8.1%}{latency['p50']:>9.1f}{latency['p99']:>9.1f}")
+    print(f"Wall time: {report['wall_seconds']:.1f}s with {report['workers']} worker(s)")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the Minesweeper AI on seeded games")
+    parser.add_argument('--games', type=int, default=100, help="games per difficulty")
+    parser.add_argument('--difficulty', action='append',
+                        choices=[d.name for d in ALL_DIFFICULTIES],
+                        help="difficulty to run (repeatable, default: all)")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes")
+    parser.add_argument('--seed', type=int, default=0, help="first board seed")
+    parser.add_argument('--max-steps', type=int, default=1000, help="AI step limit per game")
+    parser.add_argument('--use-lives', action='store_true', help="play with the difficulty's lives")
+    parser.add_argument('--json', help="write the summary to this JSON file")
+    parser.add_argument('--csv', help="write per-game results to this CSV file")
+    args = parser.parse_args(argv)
+
+    if args.difficulty:
+        difficulties = [get_difficulty_by_name(name) for name in args.difficulty]
+    else:
+        difficulties = ALL_DIFFICULTIES
+
+    report = run_benchmark(difficulties, args.games, args.workers, args.seed,
+                           args.use_lives, args.max_steps, args.csv)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
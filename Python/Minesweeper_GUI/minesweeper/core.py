@@ -4,9 +4,16 @@ Core Minesweeper game logic with enhanced features including life system.
 """
 import random
 import time
+from collections import deque
 from typing import List, Tuple, Set, Optional
 from enum import Enum
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 class GameState(Enum):
     """Game state enumeration."""
     PLAYING = "playing"
@@ -14,9 +21,72 @@ class GameState(Enum):
     LOST = "lost"
     PAUSED = "paused"
 
+class _GridRow:
+    """Row view over a flat padded grid, indexable like a list."""
+    __slots__ = ('_buf', '_start', '_cols', '_cast')
+    
+    def __init__(self, buf: bytearray, start: int, cols: int, cast):
+        self._buf = buf
+        self._start = start
+        self._cols = cols
+        self._cast = cast
+        
+    def __len__(self) -> int:
+        return self._cols
+        
+    def __getitem__(self, col: int):
+        if not 0 <= col < self._cols:
+            if -self._cols <= col < 0:
+                col += self._cols
+            else:
+                raise IndexError("grid column out of range")
+        return self._cast(self._buf[self._start + col])
+        
+    def __setitem__(self, col: int, value) -> None:
+        if not 0 <= col < self._cols:
+            raise IndexError("grid column out of range")
+        self._buf[self._start + col] = int(value)
+        
+    def __iter__(self):
+        cast = self._cast
+        return (cast(v) for v in self._buf[self._start:self._start + self._cols])
+
+
+class _GridView:
+    """2D ``grid[row][col]`` view over a flat padded bytearray."""
+    __slots__ = ('_buf', '_rows', '_cols', '_stride', '_cast')
+    
+    def __init__(self, buf: bytearray, rows: int, cols: int, cast=bool):
+        self._buf = buf
+        self._rows = rows
+        self._cols = cols
+        self._stride = cols + 2
+        self._cast = cast
+        
+    def __len__(self) -> int:
+        return self._rows
+        
+    def __getitem__(self, row: int) -> _GridRow:
+        if not 0 <= row < self._rows:
+            if -self._rows <= row < 0:
+                row += self._rows
+            else:
+                raise IndexError("grid row out of range")
+        return _GridRow(self._buf, (row + 1) * self._stride + 1, self._cols, self._cast)
+        
+    def __iter__(self):
+        return (self[row] for row in range(self._rows))
+
+
 class Minesweeper:
     """
     Enhanced Minesweeper game with life system and advanced features.
+    
+    Cells live in flat bytearrays padded with a one-cell border, so the
+    eight neighbours of index ``i`` are ``i + offset`` for a fixed offset
+    table and never need bounds checks. ``board``, ``revealed``, ``flagged``
+    and ``numbers`` are ``grid[row][col]`` views over those arrays. Revealed
+    and flag counts are kept up to date on every change.
     """
     
     def __init__(self, rows: int = 9, cols: int = 9, mines: int = 10, 
@@ -38,6 +108,11 @@ class Minesweeper:
         self.current_lives = lives
         self.seed = seed
         
+        # Padded layout: index = (row + 1) * stride + (col + 1)
+        self._stride = cols + 2
+        s = self._stride
+        self._offsets = (-s - 1, -s, -s + 1, -1, 1, s - 1, s, s + 1)
+        
         # Game state
         self.state = GameState.PLAYING
         self.first_click = True
@@ -55,15 +130,39 @@ class Minesweeper:
         self.start_time = None
         self.end_time = None
         
-        # Initialize boards
-        self.board = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        self.revealed = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        self.flagged = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        self.numbers = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        # Initialize flat grids; the border is marked revealed so flood fill stops there
+        size = (self.rows + 2) * self._stride
+        self._mines = bytearray(size)
+        self._revealed = bytearray(b'\x01') * size
+        self._flagged = bytearray(size)
+        self._numbers = bytearray(size)
+        for row in range(self.rows):
+            start = (row + 1) * self._stride + 1
+            self._revealed[start:start + self.cols] = bytes(self.cols)
+        
+        self.board = _GridView(self._mines, self.rows, self.cols)
+        self.revealed = _GridView(self._revealed, self.rows, self.cols)
+        self.flagged = _GridView(self._flagged, self.rows, self.cols)
+        self.numbers = _GridView(self._numbers, self.rows, self.cols, int)
+        
+        # Incremental counters
+        self._mine_indices: List[int] = []
+        self._revealed_safe = 0
+        self._flag_count = 0
+        
+        # Flat indices of cells whose display changed since take_changes()
+        self._changes: List[int] = []
         
         # Mine placement will happen on first click
         self.mines_placed = False
         
+    def _index(self, row: int, col: int) -> int:
+        return (row + 1) * self._stride + col + 1
+        
+    def _position(self, index: int) -> Tuple[int, int]:
+        row, col = divmod(index, self._stride)
+        return row - 1, col - 1
+        
     def is_valid_position(self, row: int, col: int) -> bool:
         """Check if position is within board bounds."""
         return 0 <= row < self.rows and 0 <= col < self.cols
@@ -85,40 +184,61 @@ class Minesweeper:
         if self.mines_placed:
             return
             
-        random.seed(self.seed)
+        # Own generator: seeding the global one would make every later draw predictable
+        rng = random.Random(self.seed)
         
         # Get all positions except first click and its neighbors
         forbidden_positions = set()
         forbidden_positions.add((first_click_row, first_click_col))
         forbidden_positions.update(self.get_neighbors(first_click_row, first_click_col))
+        forbidden = sorted(r * self.cols + c for r, c in forbidden_positions)
         
-        available_positions = []
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if (r, c) not in forbidden_positions:
-                    available_positions.append((r, c))
-        
-        # Place mines randomly
-        mine_positions = random.sample(available_positions, 
-                                     min(self.total_mines, len(available_positions)))
+        # Sample ranks among the allowed cells (same draws as sampling a list of them)
+        available = self.rows * self.cols - len(forbidden)
+        ranks = rng.sample(range(available), min(self.total_mines, available))
         
-        for row, col in mine_positions:
-            self.board[row][col] = True
+        for rank in ranks:
+            # Map the rank back to a row-major cell, skipping forbidden cells
+            cell = rank
+            for blocked in forbidden:
+                if blocked <= cell:
+                    cell += 1
+            row, col = divmod(cell, self.cols)
+            index = self._index(row, col)
+            self._mines[index] = 1
+            self._mine_indices.append(index)
             
         # Calculate numbers
         self._calculate_numbers()
         self.mines_placed = True
         
     def _calculate_numbers(self):
-        """Calculate numbers for each cell."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if not self.board[row][col]:  # Not a mine
-                    count = 0
-                    for neighbor_row, neighbor_col in self.get_neighbors(row, col):
-                        if self.board[neighbor_row][neighbor_col]:
-                            count += 1
-                    self.numbers[row][col] = count
+        """Calculate numbers for each cell by convolving the mine grid with a 3x3 kernel."""
+        if NUMPY_AVAILABLE:
+            mines = np.frombuffer(bytes(self._mines), dtype=np.uint8).reshape(self.rows + 2, self._stride)
+            counts = np.zeros_like(mines)
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    if dr or dc:
+                        counts[1:-1, 1:-1] += mines[1 + dr:self.rows + 1 + dr, 1 + dc:self.cols + 1 + dc]
+            counts[mines == 1] = 0
+            self._numbers[:] = counts.tobytes()
+            return
+            
+        # Scatter each mine into its neighbours: O(mines) instead of O(cells * 8)
+        numbers = self._numbers
+        for index in self._mine_indices:
+            for offset in self._offsets:
+                numbers[index + offset] += 1
+        for index in self._mine_indices:
+            numbers[index] = 0
+        # Clear the padding border, which received counts from edge mines
+        for index in range(self._stride):
+            numbers[index] = 0
+            numbers[len(numbers) - 1 - index] = 0
+        for row in range(1, self.rows + 1):
+            numbers[row * self._stride] = 0
+            numbers[row * self._stride + self._stride - 1] = 0
                     
     def reveal_cell(self, row: int, col: int) -> bool:
         """
@@ -127,7 +247,8 @@ class Minesweeper:
         if not self.is_valid_position(row, col):
             return False
             
-        if self.revealed[row][col] or self.flagged[row][col]:
+        index = self._index(row, col)
+        if self._revealed[index] or self._flagged[index]:
             return True
             
         if self.state != GameState.PLAYING:
@@ -139,11 +260,10 @@ class Minesweeper:
             self.first_click = False
             self.start_time = time.time()
             
-        # Reveal the cell
-        self.revealed[row][col] = True
-        
         # Check if it's a mine
-        if self.board[row][col]:
+        if self._mines[index]:
+            self._revealed[index] = 1
+            self._changes.append(index)
             if self.max_lives > 0:  # Lives system enabled
                 self.current_lives -= 1
                 if self.current_lives > 0:
@@ -160,25 +280,54 @@ class Minesweeper:
                 self.end_time = time.time()
                 return False
                 
-        # If it's a zero, reveal neighbors automatically
-        if self.numbers[row][col] == 0:
-            for neighbor_row, neighbor_col in self.get_neighbors(row, col):
-                if not self.revealed[neighbor_row][neighbor_col]:
-                    self.reveal_cell(neighbor_row, neighbor_col)
+        # Reveal the cell, flood-filling zeros iteratively (breadth first)
+        self._changes.extend(self._flood_reveal(index))
                     
         # Check win condition
         self._check_win_condition()
         return True
         
+    def _flood_reveal(self, index: int) -> List[int]:
+        """Reveal a safe cell and, through zeros, its connected region."""
+        revealed = self._revealed
+        flagged = self._flagged
+        numbers = self._numbers
+        offsets = self._offsets
+        
+        revealed[index] = 1
+        opened = [index]
+        queue = deque(opened) if numbers[index] == 0 else deque()
+        while queue:
+            current = queue.popleft()
+            for offset in offsets:
+                neighbor = current + offset
+                # Border cells are pre-revealed; flagged cells stay covered
+                if revealed[neighbor] or flagged[neighbor]:
+                    continue
+                revealed[neighbor] = 1
+                opened.append(neighbor)
+                if numbers[neighbor] == 0:
+                    queue.append(neighbor)
+                    
+        self._revealed_safe += len(opened)
+        return opened
+        
     def toggle_flag(self, row: int, col: int) -> bool:
         """Toggle flag on a cell."""
         if not self.is_valid_position(row, col):
             return False
             
-        if self.revealed[row][col] or self.state != GameState.PLAYING:
+        index = self._index(row, col)
+        if self._revealed[index] or self.state != GameState.PLAYING:
             return False
             
-        self.flagged[row][col] = not self.flagged[row][col]
+        if self._flagged[index]:
+            self._flagged[index] = 0
+            self._flag_count -= 1
+        else:
+            self._flagged[index] = 1
+            self._flag_count += 1
+        self._changes.append(index)
         self._check_win_condition()
         return True
         
@@ -187,24 +336,27 @@ class Minesweeper:
         if self.state != GameState.PLAYING:
             return
             
-        # Count revealed non-mine cells
-        revealed_count = 0
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.revealed[row][col] and not self.board[row][col]:
-                    revealed_count += 1
-                    
         # Win if all non-mine cells are revealed
-        total_non_mines = self.rows * self.cols - self.total_mines
-        if revealed_count == total_non_mines:
+        mine_count = len(self._mine_indices) if self.mines_placed else self.total_mines
+        total_non_mines = self.rows * self.cols - mine_count
+        if self._revealed_safe == total_non_mines:
             self.state = GameState.WON
             self.end_time = time.time()
             
     def get_remaining_mines(self) -> int:
         """Get the number of remaining mines (total mines - flags placed)."""
-        flag_count = sum(sum(row) for row in self.flagged)
-        return max(0, self.total_mines - flag_count)
-        
+        return max(0, self.total_mines - self._flag_count)
+
+    @property
+    def revealed_count(self) -> int:
+        """Number of revealed cells that are not mines."""
+        return self._revealed_safe
+
+    @property
+    def flag_count(self) -> int:
+        """Number of flags currently placed."""
+        return self._flag_count
+
     def get_game_time(self) -> float:
         """Get the current game time in seconds."""
         if self.start_time is None:
@@ -231,10 +383,20 @@ class Minesweeper:
             
     def reveal_all_mines(self):
         """Reveal all mines (for game over display)."""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col]:
-                    self.revealed[row][col] = True
+        for index in self._mine_indices:
+            self._revealed[index] = 1
+        self._changes.extend(self._mine_indices)
+        
+    def take_changes(self) -> List[Tuple[int, int]]:
+        """
+        Return the cells whose display changed since the last call, and clear them.
+        
+        Reveals (including whole flood-filled areas), flag toggles and
+        reveal_all_mines are recorded, so front ends can repaint only these
+        cells instead of the whole board.
+        """
+        changes, self._changes = self._changes, []
+        return [self._position(index) for index in dict.fromkeys(changes)]
                     
     def get_board_state(self) -> dict:
         """Get complete board state for external interfaces."""
@@ -125,6 +125,9 @@ except ImportError:
             if revealed_safe == total_safe:
                 self.state = GameState.WON
         
+        def take_changes(self):
+            return None  # Unknown; callers repaint the whole board
+        
         def get_remaining_mines(self):
             flags = sum(sum(row) for row in self.flagged)
             return max(0, self.total_mines - flags)
@@ -164,6 +167,33 @@ class UltraSimpleMinesweeperGUI:
         
         self.running = True
         
+        # Pre-rendered glyphs and static text, so frames never call font.render for cells
+        self.glyphs = self.build_glyphs()
+        self.title_surface = self.font.render("Minesweeper", True, (255, 255, 255))
+        self.controls_surface = self.small_font.render(
+            "Left: Reveal | Right: Flag | R: Restart | ESC: Quit", True, (150, 150, 150))
+        self.state_surfaces = {
+            GameState.WON: self.font.render("You Win! Press R to restart", True, (100, 255, 100)),
+            GameState.LOST: self.font.render("Game Over! Press R to restart", True, (255, 100, 100)),
+        }
+        self.full_redraw = True
+        self.info_text = None
+        self.shown_state = None
+        
+    def build_glyphs(self):
+        """Render the mine, flag and number glyphs once."""
+        number_colors = [
+            (0, 0, 0), (0, 0, 255), (0, 128, 0), (255, 0, 0),
+            (0, 0, 128), (128, 0, 0), (0, 128, 128), (0, 0, 0), (128, 128, 128)
+        ]
+        glyphs = {
+            'mine': self.small_font.render("X", True, (0, 0, 0)),
+            'flag': self.small_font.render("F", True, (255, 255, 255)),
+        }
+        for num in range(1, 9):
+            glyphs[num] = self.small_font.render(str(num), True, number_colors[num])
+        return glyphs
+        
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -193,47 +223,60 @@ class UltraSimpleMinesweeperGUI:
     
     def restart_game(self):
         self.game = Minesweeper(BEGINNER.rows, BEGINNER.cols, BEGINNER.mines, BEGINNER.lives)
+        self.full_redraw = True
     
     def draw(self):
-        # Clear screen with dark background
-        self.screen.fill((40, 44, 52))
+        """Repaint what changed since the last frame and return the dirty rectangles."""
+        dirty = []
+        changes = self.game.take_changes()
+        
+        if self.full_redraw or changes is None:
+            # Clear screen with dark background
+            self.screen.fill((40, 44, 52))
+            self.screen.blit(self.title_surface, (20, 20))
+            
+            # Draw board background
+            board_width = self.game.cols * self.cell_size
+            board_height = self.game.rows * self.cell_size
+            pygame.draw.rect(self.screen, (60, 60, 60), 
+                            (self.board_x - 5, self.board_y - 5, 
+                             board_width + 10, board_height + 10))
+            
+            changes = [(row, col) for row in range(self.game.rows) for col in range(self.game.cols)]
+            self.screen.blit(self.controls_surface, (20, self.screen_height - 25))
+            self.full_redraw = False
+            self.info_text = None
+            self.shown_state = None
+            dirty.append(self.screen.get_rect())
         
-        # Draw title
-        title = self.font.render("Minesweeper", True, (255, 255, 255))
-        self.screen.blit(title, (20, 20))
+        # Draw only the cells that changed
+        for row, col in changes:
+            dirty.append(self.draw_cell(row, col))
         
-        # Draw game info
+        # Draw game info when the text changes (about once a second)
         info_text = f"Mines: {self.game.get_remaining_mines()} | Time: {int(self.game.get_game_time())}s"
         if self.game.max_lives > 0:
             info_text += f" | Lives: {self.game.current_lives}"
-        
-        info = self.small_font.render(info_text, True, (200, 200, 200))
-        self.screen.blit(info, (20, 50))
-        
-        # Draw board background
-        board_width = self.game.cols * self.cell_size
-        board_height = self.game.rows * self.cell_size
-        pygame.draw.rect(self.screen, (60, 60, 60), 
-                        (self.board_x - 5, self.board_y - 5, 
-                         board_width + 10, board_height + 10))
-        
-        # Draw cells
-        for row in range(self.game.rows):
-            for col in range(self.game.cols):
-                self.draw_cell(row, col)
+        if info_text != self.info_text:
+            self.info_text = info_text
+            info_rect = pygame.Rect(0, 48, self.screen_width, self.board_y - 53)
+            self.screen.fill((40, 44, 52), info_rect)
+            info = self.small_font.render(info_text, True, (200, 200, 200))
+            self.screen.blit(info, (20, 50))
+            dirty.append(info_rect)
         
         # Draw game state
-        if self.game.state == GameState.WON:
-            state_text = self.font.render("You Win! Press R to restart", True, (100, 255, 100))
-            self.screen.blit(state_text, (self.screen_width // 2 - 120, self.screen_height - 40))
-        elif self.game.state == GameState.LOST:
-            state_text = self.font.render("Game Over! Press R to restart", True, (255, 100, 100))
-            self.screen.blit(state_text, (self.screen_width // 2 - 120, self.screen_height - 40))
-        
-        # Draw controls
-        controls = self.small_font.render("Left: Reveal | Right: Flag | R: Restart | ESC: Quit", 
-                                         True, (150, 150, 150))
-        self.screen.blit(controls, (20, self.screen_height - 25))
+        if self.game.state != self.shown_state:
+            self.shown_state = self.game.state
+            state_rect = pygame.Rect(0, self.screen_height - 40, self.screen_width, 40)
+            self.screen.fill((40, 44, 52), state_rect)
+            if self.game.state in self.state_surfaces:
+                self.screen.blit(self.state_surfaces[self.game.state],
+                                 (self.screen_width // 2 - 120, self.screen_height - 40))
+            self.screen.blit(self.controls_surface, (20, self.screen_height - 25))
+            dirty.append(state_rect)
+            
+        return dirty
     
     def draw_cell(self, row, col):
         x = self.board_x + col * self.cell_size
@@ -255,31 +298,25 @@ class UltraSimpleMinesweeperGUI:
         pygame.draw.rect(self.screen, color, rect)
         pygame.draw.rect(self.screen, (80, 80, 80), rect, 1)  # Border
         
-        # Draw cell content
+        # Draw cell content from the glyph cache
+        glyph = None
         if self.game.revealed[row][col] and self.game.board[row][col]:
-            # Mine
-            text = self.small_font.render("X", True, (0, 0, 0))
-            self.screen.blit(text, (x + 10, y + 8))
+            glyph = self.glyphs['mine']
         elif self.game.revealed[row][col] and self.game.numbers[row][col] > 0:
-            # Number
-            number_colors = [
-                (0, 0, 0), (0, 0, 255), (0, 128, 0), (255, 0, 0),
-                (0, 0, 128), (128, 0, 0), (0, 128, 128), (0, 0, 0), (128, 128, 128)
-            ]
-            color_idx = min(self.game.numbers[row][col], len(number_colors) - 1)
-            text = self.small_font.render(str(self.game.numbers[row][col]), True, number_colors[color_idx])
-            self.screen.blit(text, (x + 10, y + 8))
+            glyph = self.glyphs[min(self.game.numbers[row][col], 8)]
         elif self.game.flagged[row][col]:
-            # Flag
-            text = self.small_font.render("F", True, (255, 255, 255))
-            self.screen.blit(text, (x + 10, y + 8))
+            glyph = self.glyphs['flag']
+        if glyph is not None:
+            self.screen.blit(glyph, (x + 10, y + 8))
+        return rect
     
     def run(self):
         try:
             while self.running:
                 self.handle_events()
-                self.draw()
-                pygame.display.flip()
+                dirty = self.draw()
+                if dirty:
+                    pygame.display.update(dirty)
                 self.clock.tick(60)
         except Exception as e:
             print(f"Game error: {e}")
@@ -73,6 +73,30 @@ class SoundManager:
         except Exception:
             pass
 
+# Boards with more cells than this are drawn on a single canvas
+CANVAS_THRESHOLD = 1000
+CANVAS_CELL_SIZE = 20
+
+NUMBER_COLORS = ['', '#3498db', '#27ae60', '#e74c3c', '#8e44ad',
+                 '#d35400', '#f39c12', '#2c3e50', '#34495e']
+
+# Pre-built cell styles keyed by 'hidden', 'flag', 'mine' or the cell's number
+BUTTON_STYLES = {
+    'hidden': dict(text="", bg='#95a5a6', state='normal'),
+    'flag': dict(text="🚩", bg='#e74c3c', state='normal'),
+    'mine': dict(text="💥", bg='#e74c3c', state='disabled'),
+}
+CANVAS_STYLES = {
+    'hidden': dict(text="", bg='#95a5a6', fg='#2c3e50'),
+    'flag': dict(text="🚩", bg='#e74c3c', fg='#ecf0f1'),
+    'mine': dict(text="💥", bg='#e74c3c', fg='#2c3e50'),
+}
+for _num in range(9):
+    BUTTON_STYLES[_num] = dict(text=str(_num) if _num else "", bg='#ecf0f1', state='disabled',
+                               fg=NUMBER_COLORS[_num] or '#2c3e50')
+    CANVAS_STYLES[_num] = dict(text=str(_num) if _num else "", bg='#ecf0f1',
+                               fg=NUMBER_COLORS[_num] or '#2c3e50')
+
 class MinesweeperGUI:
     """Enhanced Tkinter GUI for Minesweeper."""
     
@@ -80,6 +104,7 @@ class MinesweeperGUI:
         self.root = tk.Tk()
         self.game = None
         self.buttons = []
+        self.canvas = None
         self.timer_running = False
         self.sound_manager = SoundManager()
         self.setup_window()
@@ -228,9 +253,14 @@ class MinesweeperGUI:
             widget.destroy()
             
         self.buttons = []
+        self.canvas = None
+        self.cell_items = {}
+        # Style currently shown per cell, so unchanged cells are never reconfigured
+        self.cell_keys = [[None] * self.game.cols for _ in range(self.game.rows)]
         
-        # Calculate button size based on window size
-        button_size = min(30, max(20, 600 // max(self.game.rows, self.game.cols)))
+        if self.game.rows * self.game.cols > CANVAS_THRESHOLD:
+            self.create_canvas_board()
+            return
         
         for row in range(self.game.rows):
             button_row = []
@@ -252,6 +282,77 @@ class MinesweeperGUI:
                 button_row.append(btn)
             self.buttons.append(button_row)
             
+    def create_canvas_board(self):
+        """
+        Draw large boards on one scrollable canvas instead of a widget per cell.
+        
+        Only the cells in view get canvas items; they are created and deleted
+        as the view scrolls or resizes, so a huge board costs no more than a
+        screenful.
+        """
+        size = CANVAS_CELL_SIZE
+        width, height = self.game.cols * size, self.game.rows * size
+        self.canvas = tk.Canvas(self.board_frame, bg='#2c3e50', highlightthickness=0,
+                                width=min(width, 900), height=min(height, 600),
+                                scrollregion=(0, 0, width, height))
+        x_scroll = ttk.Scrollbar(self.board_frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        y_scroll = ttk.Scrollbar(self.board_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        # The canvas reports every view change (scroll or resize) through these
+        self.canvas.configure(xscrollcommand=lambda *view: self.on_canvas_view(x_scroll, *view),
+                              yscrollcommand=lambda *view: self.on_canvas_view(y_scroll, *view))
+        self.canvas.grid(row=0, column=0, sticky='nsew')
+        y_scroll.grid(row=0, column=1, sticky='ns')
+        x_scroll.grid(row=1, column=0, sticky='ew')
+        self.viewport_pending = False
+        
+        self.canvas.bind('<Button-1>', lambda e: self.on_canvas_click(e, self.on_left_click))
+        self.canvas.bind('<Button-3>', lambda e: self.on_canvas_click(e, self.on_right_click))
+        self.draw_viewport()
+        
+    def on_canvas_view(self, scrollbar, first, last):
+        """Move the scrollbar and redraw the viewport once the view settles."""
+        scrollbar.set(first, last)
+        if not self.viewport_pending:
+            self.viewport_pending = True
+            self.root.after_idle(self.draw_viewport)
+            
+    def draw_viewport(self):
+        """Keep canvas items only for the cells currently in view."""
+        self.viewport_pending = False
+        if self.canvas is None:
+            return
+        size = CANVAS_CELL_SIZE
+        left, top = int(self.canvas.canvasx(0)), int(self.canvas.canvasy(0))
+        right = left + max(self.canvas.winfo_width(), int(self.canvas['width']))
+        bottom = top + max(self.canvas.winfo_height(), int(self.canvas['height']))
+        rows = range(max(0, top // size), min(self.game.rows, bottom // size + 1))
+        cols = range(max(0, left // size), min(self.game.cols, right // size + 1))
+        
+        for row, col in list(self.cell_items):
+            if row not in rows or col not in cols:
+                for item in self.cell_items.pop((row, col)):
+                    self.canvas.delete(item)
+                self.cell_keys[row][col] = None
+                
+        for row in rows:
+            for col in cols:
+                if (row, col) in self.cell_items:
+                    continue
+                x, y = col * size, row * size
+                rect = self.canvas.create_rectangle(x + 1, y + 1, x + size - 1, y + size - 1,
+                                                    fill='#95a5a6', outline='#2c3e50')
+                text = self.canvas.create_text(x + size // 2, y + size // 2, text="",
+                                               font=('Arial', 8, 'bold'))
+                self.cell_items[(row, col)] = (rect, text)
+                self.draw_cell(row, col)
+        
+    def on_canvas_click(self, event, handler):
+        """Map a canvas click to the cell under the pointer."""
+        col = int(self.canvas.canvasx(event.x)) // CANVAS_CELL_SIZE
+        row = int(self.canvas.canvasy(event.y)) // CANVAS_CELL_SIZE
+        if self.game.is_valid_position(row, col):
+            handler(row, col)
+            
     def on_left_click(self, row, col):
         """Handle left mouse click."""
         if self.game.state != GameState.PLAYING:
@@ -269,7 +370,7 @@ class MinesweeperGUI:
                 self.status_label.config(text="💀 Game Over!")
                 messagebox.showinfo("Game Over", "💥 You ran out of lives!")
                 
-        self.update_display()
+        self.update_display(self.game.take_changes())
         self.check_game_end()
         
     def on_right_click(self, row, col):
@@ -278,14 +379,29 @@ class MinesweeperGUI:
             return
             
         self.game.toggle_flag(row, col)
-        self.update_display()
+        self.update_display(self.game.take_changes())
         
-    def update_display(self):
-        """Update the display."""
+    def update_display(self, cells=None):
+        """
+        Update the info bar and repaint cells.
+        
+        Args:
+            cells: Cells to repaint (e.g. from ``game.take_changes()``), or None for all
+        """
         if not self.game:
             return
             
-        # Update info labels
+        self.update_info()
+        
+        if cells is None and self.canvas is not None:
+            cells = list(self.cell_items)  # Off-screen cells are drawn as they scroll in
+        elif cells is None:
+            cells = ((row, col) for row in range(self.game.rows) for col in range(self.game.cols))
+        for row, col in cells:
+            self.draw_cell(row, col)
+            
+    def update_info(self):
+        """Update the info labels."""
         self.time_label.config(text=f"⏱️ Time: {int(self.game.get_game_time())}s")
         self.mines_label.config(text=f"💣 Mines: {self.game.get_remaining_mines()}")
         
@@ -294,28 +410,30 @@ class MinesweeperGUI:
         else:
             self.lives_label.config(text="💀 Hardcore Mode")
             
-        # Update board
-        for row in range(self.game.rows):
-            for col in range(self.game.cols):
-                btn = self.buttons[row][col]
-                
-                if self.game.flagged[row][col]:
-                    btn.config(text="🚩", bg='#e74c3c', state='normal')
-                elif not self.game.revealed[row][col]:
-                    btn.config(text="", bg='#95a5a6', state='normal')
-                else:
-                    btn.config(state='disabled')
-                    if self.game.board[row][col]:
-                        btn.config(text="💥", bg='#e74c3c')
-                    else:
-                        num = self.game.numbers[row][col]
-                        if num == 0:
-                            btn.config(text="", bg='#ecf0f1')
-                        else:
-                            colors = ['', '#3498db', '#27ae60', '#e74c3c', '#8e44ad', 
-                                    '#d35400', '#f39c12', '#2c3e50', '#34495e']
-                            btn.config(text=str(num), bg='#ecf0f1', 
-                                     fg=colors[min(num, len(colors)-1)])
+    def draw_cell(self, row, col):
+        """Apply a cell's cached style if it changed."""
+        if self.game.flagged[row][col]:
+            key = 'flag'
+        elif not self.game.revealed[row][col]:
+            key = 'hidden'
+        elif self.game.board[row][col]:
+            key = 'mine'
+        else:
+            key = self.game.numbers[row][col]
+            
+        if self.canvas is not None and (row, col) not in self.cell_items:
+            return  # Off screen; drawn by draw_viewport when scrolled into view
+        if self.cell_keys[row][col] == key:
+            return
+        self.cell_keys[row][col] = key
+        
+        if self.canvas is not None:
+            rect, text = self.cell_items[(row, col)]
+            style = CANVAS_STYLES[key]
+            self.canvas.itemconfigure(rect, fill=style['bg'])
+            self.canvas.itemconfigure(text, text=style['text'], fill=style['fg'])
+        else:
+            self.buttons[row][col].config(**BUTTON_STYLES[key])
                                      
     def check_game_end(self):
         """Check if game has ended."""
@@ -329,7 +447,7 @@ class MinesweeperGUI:
     def start_timer(self):
         """Start the game timer."""
         if self.timer_running and self.game:
-            self.update_display()
+            self.update_info()
             self.root.after(1000, self.start_timer)
             
     def run(self):
@@ -0,0 +1,159 @@
+"""
+Load-test client for the Minesweeper multiplayer server.
+
+Simulates many concurrent players spread over rooms. Each player joins,
+reveals random covered cells (tracking its board from the server's deltas)
+and records the round-trip latency of every move.
+
+Usage:
+    python -m minesweeper.loadtest --players 2000 --rooms 100 --moves 20 --spawn-server
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List, Optional
+from .benchmark import percentile
+from .server import FRAME, CELL_HIDDEN, MinesweeperServer, decode_delta
+
+async def read_message(reader: asyncio.StreamReader, encoding: str) -> Dict:
+    """Read one server message in either wire encoding."""
+    if encoding == 'binary':
+        kind, length = FRAME.unpack(await reader.readexactly(FRAME.size))
+        payload = await reader.readexactly(length)
+        return decode_delta(payload) if kind == b'D' else json.loads(payload)
+    line = await reader.readline()
+    if not line:
+        raise ConnectionError("server closed the connection")
+    return json.loads(line)
+
+async def read_until(reader: asyncio.StreamReader, encoding: str, kind: str) -> Dict:
+    """Read messages, skipping broadcasts, until one of the given type arrives."""
+    while True:
+        message = await read_message(reader, encoding)
+        if message['type'] == kind:
+            return message
+        if message['type'] == 'error':
+            raise RuntimeError(message['message'])
+
+async def simulate_player(host: str, port: int, room: str, name: str, moves: int,
+                          encoding: str, difficulty: str, latencies: List[float]) -> Dict:
+    """Play up to ``moves`` random reveals as one client."""
+    reader, writer = await asyncio.open_connection(host, port)
+
+    def send(message: Dict):
+        writer.write(json.dumps(message).encode() + b'\n')
+
+    try:
+        send({'type': 'join', 'room': room, 'name': name, 'difficulty': difficulty,
+              'encoding': encoding})
+        joined = await read_until(reader, encoding, 'joined')
+
+        # Covered cells, removed lazily as deltas reveal them
+        covered = [(r, c) for r in range(joined['rows']) for c in range(joined['cols'])]
+        random.shuffle(covered)
+        hidden = set(covered)
+        made, cells_received, state = 0, 0, 'playing'
+
+        while made < moves and covered and state == 'playing':
+            cell = covered.pop()
+            if cell not in hidden:
+                continue
+            start = time.perf_counter()
+            send({'type': 'reveal', 'row': cell[0], 'col': cell[1]})
+            delta = await read_until(reader, encoding, 'delta')
+            latencies.append((time.perf_counter() - start) * 1000)
+
+            made += 1
+            cells_received += len(delta['cells'])
+            state = delta['state']
+            for r, c, value in delta['cells']:
+                if value != CELL_HIDDEN:
+                    hidden.discard((r, c))
+
+        send({'type': 'leave'})
+        await writer.drain()
+        return {'moves': made, 'cells': cells_received, 'state': state}
+    finally:
+        writer.close()
+
+async def run_load_test(host: str, port: int, players: int, rooms: int, moves: int,
+                        encoding: str = 'json', difficulty: str = 'Expert') -> Dict:
+    """
+    Run ``players`` simulated clients concurrently and summarize the run.
+
+    Returns:
+        Dict with totals, throughput and move latency percentiles (ms)
+    """
+    latencies: List[float] = []
+    started = time.perf_counter()
+    results = await asyncio.gather(*(
+        simulate_player(host, port, f"room-{i % rooms}", f"player-{i}", moves,
+                        encoding, difficulty, latencies)
+        for i in range(players)
+    ), return_exceptions=True)
+    elapsed = time.perf_counter() - started
+
+    completed = [r for r in results if isinstance(r, dict)]
+    errors = [r for r in results if isinstance(r, BaseException)]
+    total_moves = sum(r['moves'] for r in completed)
+    ordered = sorted(latencies)
+    return {
+        'players': players,
+        'rooms': rooms,
+        'encoding': encoding,
+        'completed': len(completed),
+        'errors': len(errors),
+        'first_error': repr(errors[0]) if errors else None,
+        'moves': total_moves,
+        'cells_received': sum(r['cells'] for r in completed),
+        'seconds': elapsed,
+        'moves_per_second': total_moves / elapsed if elapsed else 0.0,
+        'latency_ms': {
+            'p50': percentile(ordered, 50),
+            'p90': percentile(ordered, 90),
+            'p99': percentile(ordered, 99),
+            'max': ordered[-1] if ordered else 0.0,
+        },
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Load-test the Minesweeper multiplayer server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--players', type=int, default=1000)
+    parser.add_argument('--rooms', type=int, default=50)
+    parser.add_argument('--moves', type=int, default=20, help="reveals per player")
+    parser.add_argument('--encoding', choices=['json', 'binary'], default='json')
+    parser.add_argument('--difficulty', default='Expert')
+    parser.add_argument('--spawn-server', action='store_true',
+                        help="run a server in this process on a free port")
+    parser.add_argument('--json', help="write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    async def run() -> Dict:
+        server = None
+        host, port = args.host, args.port
+        if args.spawn_server:
+            server = MinesweeperServer(host, 0)
+            await server.start()
+            port = server.port
+        try:
+            return await run_load_test(host, port, args.players, args.rooms, args.moves,
+                                       args.encoding, args.difficulty)
+        finally:
+            if server is not None:
+                await server.close()
+
+    report = asyncio.run(run())
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 1 if report['errors'] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
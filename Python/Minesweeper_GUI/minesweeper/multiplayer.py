@@ -12,22 +12,30 @@ from .difficulty import BEGINNER, INTERMEDIATE, EXPERT
 class MultiplayerGame:
     """Multiplayer Minesweeper game manager."""
     
-    def __init__(self, difficulty, num_players: int = 2):
+    def __init__(self, difficulty, num_players: int = 2, seed: Optional[int] = None):
         self.difficulty = difficulty
-        self.num_players = num_players
+        self.num_players = 0
+        self.seed = seed
         self.players = {}
         self.current_player = 0
         self.game_active = False
         
         # Create individual games for each player
         for i in range(num_players):
-            player_name = f"Player {i + 1}"
-            self.players[player_name] = {
-                'game': Minesweeper(difficulty.rows, difficulty.cols, difficulty.mines, difficulty.lives),
-                'score': 0,
-                'time_penalty': 0.0,
-                'status': 'waiting'
-            }
+            self.add_player(f"Player {i + 1}")
+            
+    def add_player(self, player_name: str) -> Dict:
+        """Add a player with their own board (all boards share the match seed)."""
+        difficulty = self.difficulty
+        self.players[player_name] = {
+            'game': Minesweeper(difficulty.rows, difficulty.cols, difficulty.mines, difficulty.lives,
+                                seed=self.seed),
+            'score': 0,
+            'time_penalty': 0.0,
+            'status': 'waiting'
+        }
+        self.num_players = len(self.players)
+        return self.players[player_name]
             
     def get_current_player_name(self) -> str:
         """Get current player name."""
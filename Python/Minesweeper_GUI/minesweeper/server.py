@@ -0,0 +1,433 @@
+"""
+Asyncio multiplayer server for Minesweeper tournaments.
+
+Clients connect over TCP and send newline-delimited JSON commands:
+
+    {"type": "join", "room": "final", "name": "alice", "difficulty": "Expert", "encoding": "json"}
+    {"type": "reveal", "row": 3, "col": 7}
+    {"type": "flag", "row": 3, "col": 8}
+    {"type": "leaderboard"}
+    {"type": "leave"}
+
+Every player in a room plays their own board generated from the room's
+seed. After each move the server sends only the cells that changed. With
+``"encoding": "json"`` replies are JSON lines; with ``"encoding": "binary"``
+every reply is a frame of one kind byte and a 4-byte length, where kind
+``D`` carries a packed delta and ``J`` carries JSON.
+
+The server holds the authoritative boards and leaderboards in memory and
+periodically snapshots them as move logs, which are replayed on restart.
+
+Usage:
+    python -m minesweeper.server --port 8765 --snapshot server_state.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import struct
+import time
+from typing import Dict, List, Optional, Tuple
+from .core import Minesweeper, GameState
+from .difficulty import ALL_DIFFICULTIES, get_difficulty_by_name
+from .multiplayer import MultiplayerGame
+
+# Cell values sent to clients: 0-8 are revealed numbers
+CELL_HIDDEN = 9
+CELL_FLAG = 10
+CELL_MINE = 11
+
+STATE_CODES = {GameState.PLAYING: 0, GameState.WON: 1, GameState.LOST: 2, GameState.PAUSED: 3}
+STATE_NAMES = {code: state.value for state, code in STATE_CODES.items()}
+
+FRAME = struct.Struct('!cI')            # kind, payload length
+DELTA_HEADER = struct.Struct('!IBHII')  # seq, state, lives, score, cell count
+DELTA_CELL = struct.Struct('!HHB')      # row, col, value
+
+def cell_value(game: Minesweeper, row: int, col: int) -> int:
+    """Client-visible value of one cell."""
+    if game.flagged[row][col]:
+        return CELL_FLAG
+    if not game.revealed[row][col]:
+        return CELL_HIDDEN
+    if game.board[row][col]:
+        return CELL_MINE
+    return game.numbers[row][col]
+
+def encode_delta(delta: Dict) -> bytes:
+    """Pack a delta message into the binary wire format (without the frame header)."""
+    cells = delta['cells']
+    parts = [DELTA_HEADER.pack(delta['seq'], STATE_CODES[GameState(delta['state'])],
+                               delta['lives'], delta['score'], len(cells))]
+    parts.extend(DELTA_CELL.pack(r, c, v) for r, c, v in cells)
+    return b''.join(parts)
+
+def decode_delta(payload: bytes) -> Dict:
+    """Unpack a binary delta into the same dict shape as the JSON encoding."""
+    seq, state, lives, score, count = DELTA_HEADER.unpack_from(payload)
+    offset = DELTA_HEADER.size
+    cells = [list(DELTA_CELL.unpack_from(payload, offset + i * DELTA_CELL.size)) for i in range(count)]
+    return {'type': 'delta', 'seq': seq, 'state': STATE_NAMES[state], 'lives': lives,
+            'score': score, 'cells': cells}
+
+class ServerError(Exception):
+    """Raised for invalid client requests; reported back as an error message."""
+
+class _Session:
+    """One connected client."""
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.name: Optional[str] = None
+        self.room: Optional['GameRoom'] = None
+        self.encoding = 'json'
+        self.seq = 0
+
+    def send(self, message: Dict):
+        """Queue a message; callers await ``drain`` for backpressure."""
+        if self.writer.is_closing():
+            return
+        if self.encoding == 'binary':
+            if message['type'] == 'delta':
+                payload, kind = encode_delta(message), b'D'
+            else:
+                payload, kind = json.dumps(message, separators=(',', ':')).encode(), b'J'
+            self.writer.write(FRAME.pack(kind, len(payload)) + payload)
+        else:
+            self.writer.write(json.dumps(message, separators=(',', ':')).encode() + b'\n')
+
+    async def drain(self):
+        try:
+            await self.writer.drain()
+        except ConnectionError:
+            pass
+
+class GameRoom:
+    """A match: one board per player, all generated from the room seed."""
+
+    def __init__(self, room_id: str, difficulty, seed: int):
+        self.room_id = room_id
+        self.match = MultiplayerGame(difficulty, num_players=0, seed=seed)
+        self.sessions: Dict[str, _Session] = {}
+        self.moves: Dict[str, List[Tuple[str, int, int]]] = {}
+        self.finished: Dict[str, bool] = {}
+        self.leaderboard_dirty = False
+
+    @property
+    def difficulty(self):
+        return self.match.difficulty
+
+    @property
+    def seed(self) -> int:
+        return self.match.seed
+
+    def add_player(self, name: str):
+        if name not in self.match.players:
+            self.match.add_player(name)
+            self.moves[name] = []
+            self.finished[name] = False
+        self.leaderboard_dirty = True
+
+    def apply_move(self, name: str, action: str, row: int, col: int) -> Minesweeper:
+        """Apply a move to the player's board and log it for snapshots."""
+        game = self.match.players[name]['game']
+        if not game.is_valid_position(row, col):
+            raise ServerError(f"cell ({row}, {col}) is off the board")
+        self.match.make_move(name, row, col, action)
+        self.moves[name].append((action, row, col))
+        self.leaderboard_dirty = True
+        return game
+
+    def leaderboard(self, limit: int = 10) -> List[Dict]:
+        entries = self.match.get_leaderboard()[:limit]
+        return [{'name': e['name'], 'score': e['score'], 'time': round(e['time'], 2),
+                 'state': e['state'].value, 'lives': e['lives']} for e in entries]
+
+class MinesweeperServer:
+    """Room-based Minesweeper game server over asyncio TCP streams."""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765,
+                 snapshot_path: Optional[str] = None, snapshot_interval: float = 30.0,
+                 broadcast_interval: float = 1.0):
+        """
+        Initialize the server.
+
+        Args:
+            host: Interface to bind (localhost by default)
+            port: TCP port (0 picks a free port)
+            snapshot_path: JSON file for periodic state snapshots, or None
+            snapshot_interval: Seconds between snapshots
+            broadcast_interval: Seconds between room leaderboard broadcasts
+        """
+        self.host = host
+        self.port = port
+        self.snapshot_path = snapshot_path
+        self.snapshot_interval = snapshot_interval
+        self.broadcast_interval = broadcast_interval
+        self.rooms: Dict[str, GameRoom] = {}
+        self.records: Dict[str, Dict] = {}
+        self.stats = {'connections': 0, 'moves': 0, 'cells_sent': 0}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: List[asyncio.Task] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> asyncio.AbstractServer:
+        """Load any snapshot, bind the socket and start background tasks."""
+        if self.snapshot_path and os.path.exists(self.snapshot_path):
+            self.load_snapshot()
+        self._server = await asyncio.start_server(self.handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._tasks.append(asyncio.ensure_future(self._broadcast_loop()))
+        if self.snapshot_path:
+            self._tasks.append(asyncio.ensure_future(self._snapshot_loop()))
+        return self._server
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        """Stop background tasks, write a final snapshot and close the socket."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        if self.snapshot_path:
+            self.save_snapshot()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # ------------------------------------------------------------------
+    # Client handling
+    # ------------------------------------------------------------------
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        session = _Session(writer)
+        self.stats['connections'] += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                    if not isinstance(message, dict):
+                        raise ServerError("message must be a JSON object")
+                    if message.get('type') == 'leave':
+                        break
+                    self.dispatch(session, message)
+                except (ValueError, ServerError) as e:
+                    session.send({'type': 'error', 'message': str(e)})
+                await session.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if session.room is not None:
+                session.room.sessions.pop(session.name, None)
+            writer.close()
+
+    def dispatch(self, session: _Session, message: Dict):
+        """Handle one client command."""
+        kind = message.get('type')
+        if kind == 'join':
+            self._join(session, message)
+        elif kind in ('reveal', 'flag'):
+            if session.room is None:
+                raise ServerError("join a room first")
+            try:
+                row, col = int(message['row']), int(message['col'])
+            except (KeyError, TypeError):
+                raise ServerError("row and col are required")
+            self._move(session, kind, row, col)
+        elif kind == 'leaderboard':
+            if message.get('scope') == 'global' or session.room is None:
+                session.send({'type': 'leaderboard', 'scope': 'global',
+                              'players': self.global_leaderboard()})
+            else:
+                session.send({'type': 'leaderboard', 'scope': 'room',
+                              'players': session.room.leaderboard()})
+        else:
+            raise ServerError(f"unknown message type: {kind!r}")
+
+    def _join(self, session: _Session, message: Dict):
+        name = str(message.get('name') or '').strip()
+        room_id = str(message.get('room') or '').strip()
+        if not name or not room_id:
+            raise ServerError("name and room are required")
+        if session.room is not None:
+            raise ServerError("already in a room")
+
+        room = self.rooms.get(room_id)
+        if room is None:
+            names = [d.name.lower() for d in ALL_DIFFICULTIES]
+            difficulty_name = str(message.get('difficulty', 'Beginner'))
+            if difficulty_name.lower() not in names:
+                raise ServerError(f"unknown difficulty: {difficulty_name}")
+            # The seed never leaves the server (only snapshots store it): whoever
+            # knew it could rebuild every board in the room. Drawn from the OS CSPRNG:
+            # place_mines seeds its own generator, but the global one is predictable
+            seed = secrets.randbits(63)
+            room = self.rooms[room_id] = GameRoom(room_id, get_difficulty_by_name(difficulty_name), seed)
+        if name in room.sessions:
+            raise ServerError(f"{name} is already connected to {room_id}")
+
+        session.encoding = 'binary' if message.get('encoding') == 'binary' else 'json'
+        session.name, session.room = name, room
+        room.add_player(name)
+        room.sessions[name] = session
+
+        difficulty = room.difficulty
+        session.send({'type': 'joined', 'room': room_id, 'rows': difficulty.rows,
+                      'cols': difficulty.cols, 'mines': difficulty.mines,
+                      'lives': difficulty.lives})
+
+        # A rejoining player gets their board's visible cells once
+        game = room.match.players[name]['game']
+        if room.moves[name]:
+            cells = [(r, c) for r in range(game.rows) for c in range(game.cols)
+                     if game.revealed[r][c] or game.flagged[r][c]]
+            self._send_delta(session, game, cells)
+        game.take_changes()
+
+    def _move(self, session: _Session, action: str, row: int, col: int):
+        room = session.room
+        if room.finished[session.name]:
+            raise ServerError("your game is over")
+        game = room.apply_move(session.name, action, row, col)
+        self.stats['moves'] += 1
+        self._send_delta(session, game, game.take_changes())
+
+        if game.state != GameState.PLAYING:
+            room.finished[session.name] = True
+            self._record_result(session.name, room)
+
+    def _send_delta(self, session: _Session, game: Minesweeper, cells: List[Tuple[int, int]]):
+        session.seq += 1
+        player = session.room.match.players[session.name]
+        self.stats['cells_sent'] += len(cells)
+        session.send({
+            'type': 'delta',
+            'seq': session.seq,
+            'state': game.state.value,
+            'lives': game.current_lives,
+            'score': player['score'],
+            'cells': [[r, c, cell_value(game, r, c)] for r, c in cells],
+        })
+
+    # ------------------------------------------------------------------
+    # Leaderboards
+    # ------------------------------------------------------------------
+
+    def _record_result(self, name: str, room: GameRoom):
+        player = room.match.players[name]
+        game = player['game']
+        record = self.records.setdefault(name, {'games': 0, 'wins': 0, 'total_score': 0,
+                                                'best_time': None})
+        record['games'] += 1
+        record['total_score'] += player['score']
+        if game.state == GameState.WON:
+            record['wins'] += 1
+            total_time = game.get_game_time() + player['time_penalty']
+            if record['best_time'] is None or total_time < record['best_time']:
+                record['best_time'] = round(total_time, 2)
+
+    def global_leaderboard(self, limit: int = 20) -> List[Dict]:
+        """Players ranked by wins, then total score, across all rooms."""
+        ranked = sorted(self.records.items(),
+                        key=lambda item: (-item[1]['wins'], -item[1]['total_score']))
+        return [{'name': name, **record} for name, record in ranked[:limit]]
+
+    async def _broadcast_loop(self):
+        """Push room leaderboards at most once per interval, only when they changed."""
+        while True:
+            await asyncio.sleep(self.broadcast_interval)
+            for room in list(self.rooms.values()):
+                if not room.leaderboard_dirty or not room.sessions:
+                    continue
+                room.leaderboard_dirty = False
+                message = {'type': 'leaderboard', 'scope': 'room', 'players': room.leaderboard()}
+                for session in list(room.sessions.values()):
+                    session.send(message)
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict:
+        """Serializable server state: each board as its seed plus move log."""
+        return {
+            'version': 1,
+            'saved_at': time.time(),
+            'rooms': {
+                room_id: {
+                    'difficulty': room.difficulty.name,
+                    'seed': room.seed,
+                    'players': {name: [list(move) for move in moves]
+                                for name, moves in room.moves.items()},
+                }
+                for room_id, room in self.rooms.items()
+            },
+            'records': self.records,
+        }
+
+    def save_snapshot(self):
+        """Write a snapshot atomically (temp file, then rename)."""
+        temp_path = f"{self.snapshot_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(self.snapshot(), f, separators=(',', ':'))
+        os.replace(temp_path, self.snapshot_path)
+
+    def load_snapshot(self):
+        """Rebuild rooms by replaying every logged move."""
+        with open(self.snapshot_path) as f:
+            data = json.load(f)
+        self.records = data.get('records', {})
+        for room_id, saved in data.get('rooms', {}).items():
+            room = GameRoom(room_id, get_difficulty_by_name(saved['difficulty']), saved['seed'])
+            for name, moves in saved['players'].items():
+                room.add_player(name)
+                for action, row, col in moves:
+                    room.apply_move(name, action, row, col)
+                game = room.match.players[name]['game']
+                game.take_changes()
+                room.finished[name] = game.state != GameState.PLAYING
+            self.rooms[room_id] = room
+
+    async def _snapshot_loop(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            self.save_snapshot()
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Run the Minesweeper multiplayer server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--snapshot', help="JSON file for state snapshots")
+    parser.add_argument('--snapshot-interval', type=float, default=30.0)
+    args = parser.parse_args(argv)
+
+    server = MinesweeperServer(args.host, args.port, args.snapshot, args.snapshot_interval)
+
+    async def run():
+        await server.start()
+        print(f"Minesweeper server listening on {server.host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""
+Constraint-propagation and probability engine for the Minesweeper AI.
+"""
+from collections import defaultdict
+from math import comb
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from .core import Minesweeper
+
+Cell = Tuple[int, int]
+
+
+class ComponentSolution:
+    """Exact enumeration result for one independent frontier component."""
+
+    def __init__(self, cells: List[int]):
+        self.cells = cells
+        # mines in component -> number of consistent assignments
+        self.counts: Dict[int, int] = defaultdict(int)
+        # mines in component -> per-cell number of assignments with that cell mined
+        self.hits: Dict[int, List[int]] = {}
+
+
+class ConstraintSolver:
+    """
+    Incremental constraint solver with exact mine probabilities.
+
+    Every revealed number with covered neighbours is a constraint "these
+    cells hold N mines". Only constraints touched by the latest reveal or
+    flag are recomputed. Deduction runs the single-cell rules, then a
+    pairwise rule between overlapping constraints (which covers subsets).
+    When that finds nothing, the frontier is split into independent
+    components, each is enumerated exactly (results are memoized until the
+    component changes), and the components are combined with the global
+    mine count to get every covered cell's mine probability.
+    """
+
+    def __init__(self, game: Minesweeper, max_component_cells: int = 48):
+        """
+        Initialize the solver.
+
+        Args:
+            game: Game to analyze
+            max_component_cells: Largest component enumerated exactly; bigger
+                components fall back to per-constraint estimates
+        """
+        self.game = game
+        self.max_component_cells = max_component_cells
+        self.rows = game.rows
+        self.cols = game.cols
+        self.neighbors = [
+            tuple((r + dr) * self.cols + (c + dc)
+                  for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                  if (dr or dc) and 0 <= r + dr < self.rows and 0 <= c + dc < self.cols)
+            for r in range(self.rows) for c in range(self.cols)
+        ]
+        self._component_cache: Dict[FrozenSet, ComponentSolution] = {}
+        self.reset()
+
+    def reset(self):
+        """Forget everything known about the board."""
+        self.revealed: Set[int] = set()
+        self.mines: Set[int] = set()
+        self.constraints: Dict[int, Tuple[FrozenSet[int], int]] = {}
+        self.cell_constraints: Dict[int, Set[int]] = defaultdict(set)
+        self.dirty: Set[int] = set()
+        self._probabilities: Optional[Dict[int, float]] = None
+        self._certain: Tuple[Set[int], Set[int]] = (set(), set())
+        self._safe_revealed = 0
+        self._flags = 0
+
+    def _cell(self, index: int) -> Cell:
+        return divmod(index, self.cols)
+
+    # ------------------------------------------------------------------
+    # Tracking board changes
+    # ------------------------------------------------------------------
+
+    def _mark_known(self, index: int):
+        """Record that a covered cell became known and dirty its constraints."""
+        self.dirty.update(self.cell_constraints.pop(index, ()))
+        self._probabilities = None
+
+    def sync(self):
+        """Rescan the board if it changed behind the solver's back."""
+        if (self.game.revealed_count == self._safe_revealed and
+                self.game.flag_count == self._flags):
+            return
+        self.reset()
+        game = self.game
+        for index in range(self.rows * self.cols):
+            row, col = divmod(index, self.cols)
+            if game.revealed[row][col]:
+                self.revealed.add(index)
+                self.dirty.add(index)
+                if game.board[row][col]:
+                    self.mines.add(index)
+                else:
+                    self._safe_revealed += 1
+            elif game.flagged[row][col]:
+                self.mines.add(index)
+                self._flags += 1
+
+    def note_reveal(self, row: int, col: int):
+        """Record a reveal at (row, col), including any flood-filled area."""
+        game = self.game
+        stack = [row * self.cols + col]
+        while stack:
+            index = stack.pop()
+            r, c = divmod(index, self.cols)
+            if index in self.revealed or not game.revealed[r][c]:
+                continue
+            self.revealed.add(index)
+            self.dirty.add(index)
+            self._mark_known(index)
+            if game.board[r][c]:
+                self.mines.add(index)  # Mine hit with lives left
+                continue
+            self._safe_revealed += 1
+            if game.numbers[r][c] == 0:
+                stack.extend(self.neighbors[index])
+
+    def note_flag(self, row: int, col: int):
+        """Record a flag placed at (row, col)."""
+        index = row * self.cols + col
+        if index not in self.mines:
+            self.mines.add(index)
+            self._flags += 1
+            self._mark_known(index)
+
+    def _refresh_constraints(self) -> Set[int]:
+        """Rebuild the dirty constraints and return the owners that changed."""
+        changed = set()
+        for owner in self.dirty:
+            old = self.constraints.pop(owner, None)
+            if old is not None:
+                for cell in old[0]:
+                    self.cell_constraints[cell].discard(owner)
+            if owner not in self.revealed or owner in self.mines:
+                continue
+
+            r, c = divmod(owner, self.cols)
+            unknown = []
+            remaining = self.game.numbers[r][c]
+            for cell in self.neighbors[owner]:
+                if cell in self.mines:
+                    remaining -= 1
+                elif cell not in self.revealed:
+                    unknown.append(cell)
+            if not unknown:
+                continue
+
+            self.constraints[owner] = (frozenset(unknown), remaining)
+            for cell in unknown:
+                self.cell_constraints[cell].add(owner)
+            changed.add(owner)
+        self.dirty.clear()
+        return changed
+
+    # ------------------------------------------------------------------
+    # Deduction
+    # ------------------------------------------------------------------
+
+    def deduce(self) -> Tuple[List[Cell], List[Cell]]:
+        """
+        Find cells that are certainly safe and certainly mines.
+
+        Returns:
+            Tuple of (safe cells, mine cells)
+        """
+        self.sync()
+        changed = self._refresh_constraints()
+        safe: Set[int] = set()
+        mines: Set[int] = set()
+
+        for owner in changed:
+            cells, remaining = self.constraints[owner]
+            if remaining == 0:
+                safe.update(cells)
+            elif remaining == len(cells):
+                mines.update(cells)
+
+            # Pairwise rule against every overlapping constraint
+            others = set()
+            for cell in cells:
+                others.update(self.cell_constraints[cell])
+            others.discard(owner)
+            for other in others:
+                other_cells, other_remaining = self.constraints[other]
+                for a, ra, b, rb in ((cells, remaining, other_cells, other_remaining),
+                                     (other_cells, other_remaining, cells, remaining)):
+                    only_b = b - a
+                    if only_b and rb - ra == len(only_b):
+                        mines.update(only_b)
+                        safe.update(a - b)
+
+        if not safe and not mines:
+            self.probabilities()
+            safe, mines = self._certain
+
+        return [self._cell(i) for i in sorted(safe)], [self._cell(i) for i in sorted(mines - safe)]
+
+    # ------------------------------------------------------------------
+    # Probabilities
+    # ------------------------------------------------------------------
+
+    def _components(self) -> List[List[int]]:
+        """Split the frontier into groups of cells linked by shared constraints."""
+        seen: Set[int] = set()
+        components = []
+        for start in self.cell_constraints:
+            if start in seen or not self.cell_constraints[start]:
+                continue
+            component, stack = [], [start]
+            seen.add(start)
+            while stack:
+                cell = stack.pop()
+                component.append(cell)
+                for owner in self.cell_constraints[cell]:
+                    for other in self.constraints[owner][0]:
+                        if other not in seen:
+                            seen.add(other)
+                            stack.append(other)
+            components.append(component)
+        return components
+
+    def _enumerate(self, cells: List[int]) -> ComponentSolution:
+        """Count every consistent mine assignment of one component."""
+        owners = sorted({o for cell in cells for o in self.cell_constraints[cell]})
+        key = frozenset((o,) + self.constraints[o] for o in owners)
+        cached = self._component_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Order cells so each constraint closes as early as possible
+        order, placed = [], set()
+        for owner in owners:
+            for cell in sorted(self.constraints[owner][0]):
+                if cell not in placed:
+                    placed.add(cell)
+                    order.append(cell)
+        position = {cell: i for i, cell in enumerate(order)}
+        need = [self.constraints[o][1] for o in owners]
+        left = [len(self.constraints[o][0]) for o in owners]
+        cell_owners = [[] for _ in order]
+        for i, owner in enumerate(owners):
+            for cell in self.constraints[owner][0]:
+                cell_owners[position[cell]].append(i)
+
+        solution = ComponentSolution(order)
+        mined: List[int] = []
+        n = len(order)
+
+        def search(i: int):
+            if i == n:
+                k = len(mined)
+                solution.counts[k] += 1
+                hits = solution.hits.setdefault(k, [0] * n)
+                for j in mined:
+                    hits[j] += 1
+                return
+            for value in (0, 1):
+                ok = True
+                for c in cell_owners[i]:
+                    need[c] -= value
+                    left[c] -= 1
+                    if need[c] < 0 or need[c] > left[c]:
+                        ok = False
+                if ok:
+                    if value:
+                        mined.append(i)
+                    search(i + 1)
+                    if value:
+                        mined.pop()
+                for c in cell_owners[i]:
+                    need[c] += value
+                    left[c] += 1
+
+        search(0)
+        if len(self._component_cache) > 4096:
+            self._component_cache.clear()
+        self._component_cache[key] = solution
+        return solution
+
+    def _local_estimate(self, cell: int) -> float:
+        """Fallback probability from the riskiest constraint on a cell."""
+        return max(self.constraints[o][1] / len(self.constraints[o][0])
+                   for o in self.cell_constraints[cell])
+
+    @staticmethod
+    def _convolve(distributions: List[Dict[int, int]]) -> Dict[int, int]:
+        total = {0: 1}
+        for dist in distributions:
+            combined: Dict[int, int] = defaultdict(int)
+            for k1, w1 in total.items():
+                for k2, w2 in dist.items():
+                    combined[k1 + k2] += w1 * w2
+            total = combined
+        return total
+
+    def probabilities(self) -> Dict[int, float]:
+        """
+        Mine probability for every covered, unflagged cell (by flat index).
+
+        Frontier components are weighted by how many ways the remaining
+        mines fit into the unconstrained interior cells.
+        """
+        if self._probabilities is not None:
+            return self._probabilities
+        self.sync()
+        self._refresh_constraints()
+
+        probabilities: Dict[int, float] = {}
+        certain_safe: Set[int] = set()
+        certain_mines: Set[int] = set()
+        remaining_mines = self.game.total_mines - len(self.mines)
+        frontier = {cell for cell, owners in self.cell_constraints.items() if owners}
+        interior = [i for i in range(self.rows * self.cols)
+                    if i not in self.revealed and i not in self.mines and i not in frontier]
+
+        exact: List[ComponentSolution] = []
+        for cells in self._components():
+            if len(cells) > self.max_component_cells:
+                for cell in cells:
+                    probabilities[cell] = self._local_estimate(cell)
+                remaining_mines -= round(sum(probabilities[cell] for cell in cells))
+                continue
+            exact.append(self._enumerate(cells))
+
+        def weight(k: int) -> int:
+            rest = remaining_mines - k
+            return comb(len(interior), rest) if 0 <= rest <= len(interior) else 0
+
+        total_dist = self._convolve([s.counts for s in exact])
+        total_weight = sum(ways * weight(k) for k, ways in total_dist.items())
+        if total_weight == 0:
+            # Inconsistent with the mine count (e.g. a wrong flag); use local estimates
+            for solution in exact:
+                for cell in solution.cells:
+                    probabilities[cell] = self._local_estimate(cell)
+            if interior:
+                density = max(0, remaining_mines) / (len(interior) + len(frontier))
+                for cell in interior:
+                    probabilities[cell] = min(1.0, density)
+            self._probabilities = probabilities
+            self._certain = (certain_safe, certain_mines)
+            return probabilities
+
+        # Exact integer numerators decide certainty; floats are only for ranking
+        for i, solution in enumerate(exact):
+            others = self._convolve([s.counts for j, s in enumerate(exact) if j != i])
+            numerators = [0] * len(solution.cells)
+            for k, hits in solution.hits.items():
+                factor = sum(ways * weight(k + k2) for k2, ways in others.items())
+                if factor:
+                    for j, h in enumerate(hits):
+                        numerators[j] += h * factor
+            for cell, numerator in zip(solution.cells, numerators):
+                probabilities[cell] = numerator / total_weight
+                if numerator == 0:
+                    certain_safe.add(cell)
+                elif numerator == total_weight:
+                    certain_mines.add(cell)
+
+        if interior:
+            expected = sum(ways * weight(k) * (remaining_mines - k)
+                           for k, ways in total_dist.items())
+            density = expected / (total_weight * len(interior))
+            for cell in interior:
+                probabilities[cell] = density
+            if expected == 0:
+                certain_safe.update(interior)
+            elif expected == total_weight * len(interior):
+                certain_mines.update(interior)
+
+        self._probabilities = probabilities
+        self._certain = (certain_safe, certain_mines)
+        return probabilities
+
+    def best_guess(self) -> Optional[Cell]:
+        """Covered cell with the lowest mine probability."""
+        probabilities = self.probabilities()
+        if not probabilities:
+            return None
+
+        def risk(cell: int):
+            # Ties go to cells with fewer covered neighbours (more likely to open up)
+            covered = sum(1 for n in self.neighbors[cell] if n not in self.revealed)
+            return (probabilities[cell], covered, cell)
+
+        return self._cell(min(probabilities, key=risk))
+
+    def cell_probabilities(self) -> Dict[Cell, float]:
+        """Mine probabilities keyed by (row, col)."""
+        return {self._cell(i): p for i, p in self.probabilities().items()}
@@ -11,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from minesweeper.core import Minesweeper, GameState
 from minesweeper.ai_solver import MinesweeperAI
+from minesweeper.solver import ConstraintSolver
 from minesweeper.difficulty import BEGINNER
 
 class TestMinesweeperAI(unittest.TestCase):
@@ -176,6 +177,38 @@ class TestMinesweeperAI(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(self.ai.moves_made, initial_moves)
 
+class TestConstraintSolver(unittest.TestCase):
+    """Test cases for the constraint and probability engine."""
+    
+    def test_deductions_are_correct(self):
+        """Test that every proven cell matches the hidden board."""
+        game = Minesweeper(16, 30, 99, 0, seed=7)
+        ai = MinesweeperAI(game, verbose=False)
+        game.reveal_cell(8, 15)
+        
+        for _ in range(200):
+            if game.state != GameState.PLAYING:
+                break
+            safe_cells, mine_cells = ai.engine.deduce()
+            for r, c in safe_cells:
+                self.assertFalse(game.board[r][c])
+            for r, c in mine_cells:
+                self.assertTrue(game.board[r][c])
+            if not ai.make_logical_move():
+                ai.make_educated_guess()
+                
+    def test_probabilities_sum_to_remaining_mines(self):
+        """Test that cell probabilities account for every unflagged mine."""
+        game = Minesweeper(9, 9, 10, 0, seed=3)
+        game.reveal_cell(0, 0)
+        engine = ConstraintSolver(game)
+        
+        probabilities = engine.cell_probabilities()
+        self.assertAlmostEqual(sum(probabilities.values()), 10)
+        for (r, c), p in probabilities.items():
+            self.assertFalse(game.revealed[r][c])
+            self.assertTrue(0.0 <= p <= 1.0)
+
 class TestAIPerformance(unittest.TestCase):
     """Test AI performance on different difficulties."""
     
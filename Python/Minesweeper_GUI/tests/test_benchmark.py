@@ -0,0 +1,52 @@
+"""
+Unit tests for the headless AI benchmark runner.
+"""
+import csv
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from minesweeper.benchmark import play_game, run_benchmark, wilson_interval, percentile
+from minesweeper.difficulty import BEGINNER
+
+class TestBenchmark(unittest.TestCase):
+    """Test cases for the benchmark runner."""
+    
+    def test_games_are_reproducible(self):
+        """Test that a seed always replays the same game."""
+        first = play_game((BEGINNER, 5, False, 1000))
+        second = play_game((BEGINNER, 5, False, 1000))
+        self.assertEqual(first.won, second.won)
+        self.assertEqual(first.moves, second.moves)
+        
+    def test_run_benchmark_summary(self):
+        """Test summary fields and per-game CSV output."""
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "games.csv"
+            report = run_benchmark([BEGINNER], games=6, csv_path=str(csv_path))
+            
+            with open(csv_path, newline='') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual(len(rows), 6)
+            
+        summary = report['difficulties']['Beginner']
+        self.assertEqual(summary['games'], 6)
+        low, high = summary['win_rate_ci95']
+        self.assertTrue(low <= summary['win_rate'] <= high)
+        self.assertAlmostEqual(summary['logical_ratio'] + summary['guess_ratio'], 1.0)
+        self.assertLessEqual(summary['latency_ms']['p50'], summary['latency_ms']['max'])
+        
+    def test_statistics_helpers(self):
+        """Test confidence interval and percentile helpers."""
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual((low + high) / 2, 0.5)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 0.0))
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 100), 4.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@
 """
 Unit tests for the core Minesweeper game logic.
 """
+import random
 import unittest
 import sys
 from pathlib import Path
@@ -79,6 +80,16 @@ class TestMinesweeper(unittest.TestCase):
         mine_count = sum(sum(row) for row in self.game.board)
         self.assertEqual(mine_count, 10)
         
+    def test_mine_placement_leaves_global_random_alone(self):
+        """Test that the seed drives a private generator, not the global one."""
+        state = random.getstate()
+        self.game.reveal_cell(4, 4)
+        self.assertEqual(random.getstate(), state)
+        
+        other = Minesweeper(9, 9, 10, 3, seed=42)
+        other.reveal_cell(4, 4)
+        self.assertEqual([list(row) for row in other.board], [list(row) for row in self.game.board])
+        
     def test_flag_toggle(self):
         """Test flag toggling."""
         # Should be able to flag unrevealed cell
@@ -198,6 +209,35 @@ class TestMinesweeper(unittest.TestCase):
                 self.assertFalse(self.game.board[row][col])
                 self.assertEqual(self.game.numbers[row][col], 0)
 
+    def test_numbers_match_neighbor_mines(self):
+        """Test precomputed numbers against a direct neighbor count."""
+        self.game.reveal_cell(4, 4)
+        for row in range(self.game.rows):
+            for col in range(self.game.cols):
+                if self.game.board[row][col]:
+                    continue
+                expected = sum(self.game.board[r][c] for r, c in self.game.get_neighbors(row, col))
+                self.assertEqual(self.game.numbers[row][col], expected)
+
+    def test_take_changes(self):
+        """Test that reveals and flags report exactly the cells they changed."""
+        self.game.reveal_cell(4, 4)
+        changes = self.game.take_changes()
+        revealed = [(r, c) for r in range(9) for c in range(9) if self.game.revealed[r][c]]
+        self.assertEqual(sorted(changes), revealed)
+        self.assertEqual(self.game.take_changes(), [])
+        
+        hidden = next((r, c) for r in range(9) for c in range(9) if not self.game.revealed[r][c])
+        self.game.toggle_flag(*hidden)
+        self.assertEqual(self.game.take_changes(), [hidden])
+
+    def test_large_board_flood_fill(self):
+        """Test that flood fill on a huge sparse board does not recurse."""
+        game = Minesweeper(400, 400, 1, seed=1)
+        self.assertTrue(game.reveal_cell(200, 200))
+        self.assertEqual(game.state, GameState.WON)
+        self.assertEqual(game.get_remaining_mines(), 1)
+
 class TestGameWithoutLives(unittest.TestCase):
     """Test game without lives system (hardcore mode)."""
     
@@ -0,0 +1,116 @@
+"""
+Unit tests for the multiplayer server.
+"""
+import asyncio
+import json
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from minesweeper.server import MinesweeperServer, encode_delta, decode_delta, CELL_HIDDEN
+from minesweeper.loadtest import read_until, run_load_test
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asyncio game server."""
+    
+    async def asyncSetUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.snapshot = str(Path(self.tmp.name) / "state.json")
+        self.server = MinesweeperServer(port=0, snapshot_path=self.snapshot)
+        await self.server.start()
+        
+    async def asyncTearDown(self):
+        await self.server.close()
+        self.tmp.cleanup()
+        
+    async def connect(self, name, encoding='json', room='r1'):
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        writer.write(json.dumps({'type': 'join', 'room': room, 'name': name,
+                                 'difficulty': 'Beginner', 'encoding': encoding}).encode() + b'\n')
+        joined = await read_until(reader, encoding, 'joined')
+        return reader, writer, joined
+        
+    async def test_reveal_sends_only_changed_cells(self):
+        """Test that a move's reply lists exactly the cells it changed."""
+        reader, writer, joined = await self.connect('alice')
+        self.assertEqual((joined['rows'], joined['cols']), (9, 9))
+        self.assertNotIn('seed', joined)
+        
+        writer.write(b'{"type": "reveal", "row": 4, "col": 4}\n')
+        delta = await read_until(reader, 'json', 'delta')
+        game = self.server.rooms['r1'].match.players['alice']['game']
+        revealed = sum(sum(row) for row in game.revealed)
+        self.assertEqual(len(delta['cells']), revealed)
+        self.assertTrue(all(value != CELL_HIDDEN for _, _, value in delta['cells']))
+        writer.close()
+        
+    async def test_binary_encoding_matches_json(self):
+        """Test that both encodings describe the same board."""
+        json_reader, json_writer, _ = await self.connect('alice', 'json')
+        bin_reader, bin_writer, _ = await self.connect('bob', 'binary')
+        for writer in (json_writer, bin_writer):
+            writer.write(b'{"type": "reveal", "row": 0, "col": 0}\n')
+        json_delta = await read_until(json_reader, 'json', 'delta')
+        bin_delta = await read_until(bin_reader, 'binary', 'delta')
+        self.assertEqual(json_delta['cells'], bin_delta['cells'])
+        self.assertEqual(decode_delta(encode_delta(json_delta)), json_delta)
+        json_writer.close()
+        bin_writer.close()
+        
+    async def test_snapshot_replays_boards(self):
+        """Test that a restarted server restores boards from its snapshot."""
+        reader, writer, _ = await self.connect('alice')
+        writer.write(b'{"type": "reveal", "row": 4, "col": 4}\n')
+        await read_until(reader, 'json', 'delta')
+        writer.close()
+        
+        self.server.save_snapshot()
+        restored = MinesweeperServer(port=0, snapshot_path=self.snapshot)
+        restored.load_snapshot()
+        before = self.server.rooms['r1'].match.players['alice']['game']
+        after = restored.rooms['r1'].match.players['alice']['game']
+        self.assertEqual([list(row) for row in before.revealed], [list(row) for row in after.revealed])
+        
+    async def test_finished_game_rejects_moves(self):
+        """Test that moves after the game ended are refused and not logged."""
+        reader, writer, _ = await self.connect('alice')
+        room = self.server.rooms['r1']
+        game = room.match.players['alice']['game']
+        writer.write(b'{"type": "reveal", "row": 4, "col": 4}\n')  # Places the mines
+        await read_until(reader, 'json', 'delta')
+        if not room.finished['alice']:  # Unless the first flood fill already won
+            mine = next((r, c) for r in range(game.rows) for c in range(game.cols) if game.board[r][c])
+            game.current_lives = 0
+            writer.write(json.dumps({'type': 'reveal', 'row': mine[0], 'col': mine[1]}).encode() + b'\n')
+            await read_until(reader, 'json', 'delta')
+        self.assertTrue(room.finished['alice'])
+        
+        moves = len(room.moves['alice'])
+        writer.write(b'{"type": "reveal", "row": 0, "col": 0}\n')
+        with self.assertRaisesRegex(RuntimeError, 'over'):
+            await read_until(reader, 'json', 'delta')
+        self.assertEqual(len(room.moves['alice']), moves)
+        writer.close()
+        
+    async def test_errors_are_reported(self):
+        """Test that bad requests get an error reply instead of a disconnect."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.server.port)
+        writer.write(b'{"type": "reveal", "row": 1, "col": 1}\n')
+        message = json.loads(await reader.readline())
+        self.assertEqual(message['type'], 'error')
+        writer.close()
+        
+    async def test_load_test_client(self):
+        """Test a small simulated load run."""
+        report = await run_load_test('127.0.0.1', self.server.port, players=20, rooms=3,
+                                     moves=5, difficulty='Beginner')
+        self.assertEqual(report['errors'], 0)
+        self.assertEqual(report['completed'], 20)
+        self.assertGreater(report['moves'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
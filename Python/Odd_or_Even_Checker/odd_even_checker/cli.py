@@ -2,6 +2,9 @@ import argparse
 import sys
 from odd_even_checker.core import classify, check_range
 
+# Rows shown at a time in interactive range mode
+PAGE_SIZE = 50
+
 
 def print_banner():
     """Print a stylish banner for the CLI."""
@@ -61,8 +64,13 @@ def interactive_mode():
             break
 
 
+def print_summary(results):
+    """Print the even/odd counts for a range."""
+    print(f"🔢 {len(results):,} numbers: {results.evens:,} even, {results.odds:,} odd")
+
+
 def range_mode():
-    """Check a range of numbers."""
+    """Check a range of numbers, one page at a time."""
     try:
         start = validate_number(input("Enter start number: "))
         end = validate_number(input("Enter end number: "))
@@ -70,9 +78,15 @@ def range_mode():
         results = check_range(start, end)
         
         print(f"\n📊 Results for range {start} to {end}:")
+        print_summary(results)
         print("-" * 30)
-        for num, classification in results.items():
-            print(f"{num:>6} : {classification}")
+        for offset in range(0, len(results), PAGE_SIZE):
+            for num, classification in results.page(offset, PAGE_SIZE):
+                print(f"{num:>6} : {classification}")
+            remaining = len(results) - offset - PAGE_SIZE
+            if remaining > 0:
+                if input(f"-- {remaining:,} more (Enter for next page, 'q' to stop) -- ").strip().lower() in ['q', 'quit']:
+                    break
             
     except ValueError as e:
         print(e)
@@ -107,6 +121,18 @@ Examples:
         help="Check a range of numbers from START to END"
     )
     
+    parser.add_argument(
+        "-s", "--summary",
+        action="store_true",
+        help="With --range, only print how many numbers are even and odd"
+    )
+    
+    parser.add_argument(
+        "-o", "--output",
+        metavar="FILE",
+        help="With --range, write every classification to FILE (.csv for CSV) instead of the screen"
+    )
+    
     parser.add_argument(
         "-v", "--version",
         action="version",
@@ -133,11 +159,17 @@ Examples:
             results = check_range(start, end)
             
             print(f"📊 Results for range {start} to {end}:")
-            print("-" * 30)
-            for num, classification in results.items():
-                print(f"{num:>6} : {classification}")
+            print_summary(results)
+            if args.output:
+                fmt = "csv" if args.output.lower().endswith(".csv") else "text"
+                with open(args.output, "w", encoding="utf-8", newline="") as out:
+                    results.write(out, fmt)
+                print(f"💾 Saved {len(results):,} rows to {args.output}")
+            elif not args.summary:
+                print("-" * 30)
+                results.write(sys.stdout)
                 
-        except TypeError as e:
+        except (TypeError, OSError) as e:
             print(e)
             sys.exit(1)
             
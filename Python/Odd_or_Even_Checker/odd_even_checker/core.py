@@ -1,3 +1,12 @@
+from collections.abc import Mapping
+from typing import Iterator, List, TextIO, Tuple
+
+# Numbers classified per chunk when streaming a range
+DEFAULT_CHUNK_SIZE = 10000
+
+_LABELS = ("even", "odd")
+
+
 def is_even(number: int) -> bool:
     """Return True if the number is even, False if odd.
     
@@ -31,17 +40,128 @@ def classify(number: int) -> str:
     return "even" if is_even(number) else "odd"
 
 
-def check_range(start: int, end: int) -> dict:
-    """Check a range of numbers and return their classifications.
+def count_evens(start: int, end: int) -> int:
+    """Count the even numbers from start to end (inclusive) without visiting them.
     
     Args:
         start (int): Starting number of the range
         end (int): Ending number of the range
         
     Returns:
-        dict: Dictionary with numbers as keys and classifications as values
+        int: Number of even numbers in the range (0 if start > end)
     """
     if start > end:
-        start, end = end, start  # Swap if start is greater than end
+        return 0
+    return end // 2 - (start - 1) // 2
+
+
+class RangeResult(Mapping):
+    """Classifications of every number from start to end, computed on demand.
+    
+    Behaves like the ``{num: "even"/"odd"}`` dict it replaces, but holds only
+    the two bounds: lookups and counts are O(1), and rows are produced a
+    page or chunk at a time, so ranges of any size cost no memory.
+    """
+    
+    __slots__ = ("start", "end")
+    
+    def __init__(self, start: int, end: int):
+        for bound in (start, end):
+            if not isinstance(bound, int) or isinstance(bound, bool):
+                raise TypeError("Range bounds must be integers")
+        if start > end:
+            start, end = end, start  # Swap if start is greater than end
+        self.start = start
+        self.end = end
+    
+    def __len__(self) -> int:
+        return self.end - self.start + 1
+    
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.start, self.end + 1))
+    
+    def __contains__(self, number) -> bool:
+        return isinstance(number, int) and self.start <= number <= self.end
+    
+    def __getitem__(self, number: int) -> str:
+        if number not in self:
+            raise KeyError(number)
+        return classify(number)
+    
+    def __eq__(self, other):
+        if isinstance(other, RangeResult):
+            return (self.start, self.end) == (other.start, other.end)
+        return super().__eq__(other)
+    
+    def __repr__(self) -> str:
+        return f"RangeResult({self.start}, {self.end})"
+    
+    @property
+    def evens(self) -> int:
+        """Number of even numbers in the range."""
+        return count_evens(self.start, self.end)
+    
+    @property
+    def odds(self) -> int:
+        """Number of odd numbers in the range."""
+        return len(self) - self.evens
+    
+    def page(self, offset: int, size: int) -> List[Tuple[int, str]]:
+        """Return up to ``size`` (number, classification) rows starting at position ``offset``.
+        
+        Args:
+            offset (int): Position in the range (0 is ``start``)
+            size (int): Maximum number of rows
+            
+        Returns:
+            list: (number, "even"/"odd") pairs; empty past the end of the range
+        """
+        first = self.start + max(0, offset)
+        last = min(self.end, first + size - 1)
+        if first > last:
+            return []
+        labels = _LABELS if first % 2 == 0 else _LABELS[::-1]
+        numbers = range(first, last + 1)
+        # Classifications simply alternate, so the labels are sliced, not computed
+        return list(zip(numbers, labels * (len(numbers) // 2) + labels[:len(numbers) % 2]))
+    
+    def chunks(self, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Tuple[int, str]]]:
+        """Yield the whole range as consecutive pages of ``size`` rows."""
+        for offset in range(0, len(self), size):
+            yield self.page(offset, size)
+    
+    def write(self, out: TextIO, fmt: str = "text", chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Stream every row to ``out``, one chunk at a time.
         
-    return {num: classify(num) for num in range(start, end + 1)}
\ No newline at end of file
+        Args:
+            out: Writable text file
+            fmt (str): "text" for the ``num : classification`` lines shown on
+                screen, or "csv" for a ``number,classification`` file
+            chunk_size (int): Rows formatted per write
+        """
+        if fmt == "csv":
+            out.write("number,classification\n")
+            line = "{},{}\n"
+        elif fmt == "text":
+            line = "{:>6} : {}\n"
+        else:
+            raise ValueError(f"Unknown format: {fmt}")
+        for chunk in self.chunks(chunk_size):
+            out.write("".join(line.format(num, label) for num, label in chunk))
+
+
+def check_range(start: int, end: int) -> RangeResult:
+    """Check a range of numbers and return their classifications.
+    
+    Args:
+        start (int): Starting number of the range
+        end (int): Ending number of the range
+        
+    Returns:
+        RangeResult: Mapping with numbers as keys and classifications as values,
+        computed lazily (see ``RangeResult.page``, ``chunks`` and ``write``)
+        
+    Raises:
+        TypeError: If either bound is not an integer
+    """
+    return RangeResult(start, end)
\ No newline at end of file
@@ -1,9 +1,91 @@
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox, filedialog
 import tkinter.font as tkfont
 from odd_even_checker.core import classify, check_range
 
 
+class RangeView(ttk.Frame):
+    """Treeview that only holds the rows in view, so any range scrolls instantly."""
+    
+    def __init__(self, parent, height=15):
+        super().__init__(parent)
+        self.results = None
+        self.first = 0
+        
+        self.tree = ttk.Treeview(self, columns=("number", "classification"),
+                                 show="headings", height=height, selectmode="browse")
+        self.tree.heading("number", text="Number")
+        self.tree.heading("classification", text="Classification")
+        self.tree.column("number", width=160, anchor=tk.E)
+        self.tree.column("classification", width=120, anchor=tk.W)
+        self.tree.tag_configure("even", foreground="#27ae60")
+        self.tree.tag_configure("odd", foreground="#e74c3c")
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.on_scroll)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.tree.bind("<Configure>", lambda e: self.refresh())
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll_by(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll_by(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_by(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self.scroll_by(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll_by(1, "pages"))
+        
+    @property
+    def count(self):
+        return len(self.results) if self.results is not None else 0
+        
+    def visible_rows(self):
+        """How many rows fit in the widget right now."""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        height = self.tree.winfo_height()
+        if height <= 1:  # Not laid out yet
+            return int(self.tree.cget("height"))
+        return max(1, (height - row_height) // row_height)
+        
+    def show(self, results):
+        """Display a range result from the top."""
+        self.results = results
+        self.first = 0
+        self.refresh()
+        
+    def on_scroll(self, action, amount, unit=None):
+        """Scrollbar callback ('moveto' fraction or 'scroll' n units/pages)."""
+        if action == "moveto":
+            self.first = int(float(amount) * self.count)
+            self.refresh()
+        else:
+            self.scroll_by(int(amount), unit)
+            
+    def scroll_by(self, amount, unit):
+        step = self.visible_rows() if unit == "pages" else 3
+        self.first += amount * step
+        self.refresh()
+        return "break"
+        
+    def refresh(self):
+        """Re-fill the visible rows from the range and sync the scrollbar."""
+        visible = self.visible_rows()
+        self.first = max(0, min(self.first, self.count - visible))
+        rows = self.results.page(self.first, visible) if self.count else []
+        
+        items = self.tree.get_children()
+        for i, (num, classification) in enumerate(rows):
+            values = (f"{num:,}", classification)
+            if i < len(items):
+                self.tree.item(items[i], values=values, tags=(classification,))
+            else:
+                self.tree.insert("", tk.END, iid=str(i), values=values, tags=(classification,))
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+            
+        if self.count:
+            self.scrollbar.set(self.first / self.count, min(1.0, (self.first + visible) / self.count))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+
 class OddEvenCheckerGUI:
     def __init__(self, root):
         self.root = root
@@ -138,16 +220,21 @@ class OddEvenCheckerGUI:
                   style="Accent.TButton",
                   command=self.check_range).grid(row=0, column=4, padx=(10, 0))
         
-        # Results text area
-        ttk.Label(self.range_frame, text="Results:", 
+        self.export_button = ttk.Button(range_input_frame, 
+                                        text="Export", 
+                                        command=self.export_range)
+        self.export_button.grid(row=0, column=5, padx=(5, 0))
+        
+        # Results list (only the visible rows exist as widgets)
+        self.range_summary_var = tk.StringVar()
+        self.range_summary_var.set("Results:")
+        ttk.Label(self.range_frame, textvariable=self.range_summary_var, 
                  font=self.normal_font).grid(row=1, column=0, sticky=tk.W, pady=(10, 5))
         
-        self.results_text = scrolledtext.ScrolledText(self.range_frame,
-                                                     width=50,
-                                                     height=15,
-                                                     font=("Consolas", 10))
-        self.results_text.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        self.results_text.config(state=tk.DISABLED)
+        self.range_view = RangeView(self.range_frame)
+        self.range_view.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.range_results = None
+        self.export_thread = None
         
         # Configure grid
         self.range_frame.columnconfigure(0, weight=1)
@@ -184,24 +271,57 @@ class OddEvenCheckerGUI:
             
             results = check_range(start, end)
             
-            # Display results in the text widget
-            self.results_text.config(state=tk.NORMAL)
-            self.results_text.delete(1.0, tk.END)
-            
-            for num, classification in results.items():
-                color_tag = "even" if classification == "even" else "odd"
-                self.results_text.tag_config(color_tag, 
-                                            foreground="#27ae60" if classification == "even" else "#e74c3c")
-                
-                self.results_text.insert(tk.END, f"{num:>6} : ", "normal")
-                self.results_text.insert(tk.END, f"{classification}\n", color_tag)
-                
-            self.results_text.config(state=tk.DISABLED)
+            # Counts are arithmetic and the list only fetches the rows in view
+            self.range_results = results
+            self.range_summary_var.set(f"Results: {len(results):,} numbers, "
+                                       f"{results.evens:,} even, {results.odds:,} odd")
+            self.range_view.show(results)
             
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for the range.")
         except Exception as e:
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
+            
+    def export_range(self):
+        """Save every classification in the current range to a file.
+        
+        The rows are written on a worker thread, so a range of millions of
+        numbers does not freeze the window; the result is reported back
+        through ``root.after``.
+        """
+        if self.range_results is None:
+            messagebox.showinfo("Export", "Check a range first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                            filetypes=[("CSV files", "*.csv"), ("Text files", "*.txt")])
+        if not path:
+            return
+        fmt = "csv" if path.lower().endswith(".csv") else "text"
+        results = self.range_results
+        self.export_button.state(["disabled"])
+        self.root.config(cursor="watch")
+        
+        def export_thread():
+            try:
+                with open(path, "w", encoding="utf-8", newline="") as out:
+                    results.write(out, fmt)
+            except OSError as e:
+                error = str(e)
+                self.root.after(0, lambda: self.export_finished(f"Could not save file: {error}", True))
+                return
+            self.root.after(0, lambda: self.export_finished(f"Saved {len(results):,} rows to {path}"))
+        
+        self.export_thread = threading.Thread(target=export_thread, daemon=True)
+        self.export_thread.start()
+        
+    def export_finished(self, message, failed=False):
+        """Re-enable exporting and report how the export went."""
+        self.export_button.state(["!disabled"])
+        self.root.config(cursor="")
+        if failed:
+            messagebox.showerror("Error", message)
+        else:
+            messagebox.showinfo("Export", message)
 
 
 def main():
@@ -209,6 +329,8 @@ def main():
     root = tk.Tk()
     app = OddEvenCheckerGUI(root)
     root.mainloop()
+    if app.export_thread is not None:
+        app.export_thread.join()  # Finish writing a file the window was closed on
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
+import io
 import pytest
-from odd_even_checker.core import is_even, classify, check_range
+from odd_even_checker.core import is_even, classify, check_range, count_evens
 
 
 class TestIsEven:
@@ -80,4 +81,59 @@ class TestCheckRange:
         """Test range with same start and end."""
         result = check_range(7, 7)
         expected = {7: "odd"}
-        assert result == expected
\ No newline at end of file
+        assert result == expected
+        
+    def test_invalid_bounds(self):
+        """Test that non-integer bounds raise TypeError."""
+        with pytest.raises(TypeError):
+            check_range(1.5, 10)
+        with pytest.raises(TypeError):
+            check_range(1, "10")
+        with pytest.raises(TypeError):
+            check_range(True, 10)
+
+
+class TestRangeResult:
+    """Test the lazy range result returned by check_range."""
+    
+    def test_counts_match_classification(self):
+        """Test that arithmetic counts agree with classifying every number."""
+        for start in range(-6, 6):
+            for end in range(start, start + 7):
+                results = check_range(start, end)
+                evens = sum(1 for n in range(start, end + 1) if is_even(n))
+                assert results.evens == count_evens(start, end) == evens
+                assert results.odds == len(results) - evens
+                
+    def test_huge_range_is_lazy(self):
+        """Test that a range of 10^12 numbers is answered without building it."""
+        results = check_range(1, 10**12)
+        assert len(results) == 10**12
+        assert results.evens == results.odds == 5 * 10**11
+        assert results[10**12] == "even"
+        assert 0 not in results
+        
+    def test_lookup_outside_range(self):
+        """Test that numbers outside the range are missing keys."""
+        results = check_range(1, 5)
+        with pytest.raises(KeyError):
+            results[6]
+        assert results.get(6) is None
+        
+    def test_pages_and_chunks(self):
+        """Test paging, including pages that run past the end."""
+        results = check_range(-3, 6)
+        assert results.page(0, 3) == [(-3, "odd"), (-2, "even"), (-1, "odd")]
+        assert results.page(8, 5) == [(5, "odd"), (6, "even")]
+        assert results.page(10, 5) == []
+        chunks = list(results.chunks(4))
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert [row for chunk in chunks for row in chunk] == list(results.items())
+        
+    def test_write_csv(self):
+        """Test streaming a range out as CSV."""
+        out = io.StringIO()
+        check_range(3, 1).write(out, "csv", chunk_size=2)
+        assert out.getvalue() == "number,classification\n1,odd\n2,even\n3,odd\n"
+        with pytest.raises(ValueError):
+            check_range(1, 2).write(out, "xml")
\ No newline at end of file
@@ -4,7 +4,7 @@ Modern Command-line interface for palindrome checker with rich visuals
 import sys
 import argparse
 from enum import Enum
-from core import is_palindrome, explain
+from core import is_palindrome, explain, scan_file, check_batch, iter_lines
 
 try:
     from rich.console import Console
@@ -21,6 +21,14 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+# Substring search keeps only the longest ones; the views show a handful
+SUBSTRING_LIMIT = 100
+PREVIEW_CHARS = 80
+
+def preview(text, limit=PREVIEW_CHARS):
+    """Shorten long text for display"""
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
 class MessageType(Enum):
     SUCCESS = "green"
     ERROR = "red"
@@ -66,7 +74,7 @@ class EnhancedPalindromeCLI:
             print(content)
             print()
     
-    def create_result_table(self, text, result):
+    def create_result_table(self, text, result, info=None):
         """Create a rich table for results"""
         if not self.console:
             return None
@@ -75,14 +83,14 @@ class EnhancedPalindromeCLI:
         table.add_column("Property", style="cyan", width=15)
         table.add_column("Value", style="white")
         
-        info = explain(text, find_substrings=True)
+        info = info or explain(text)
         
-        table.add_row("Input", f'[bold]"{text}"[/]')
+        table.add_row("Input", f'[bold]"{preview(text)}"[/]')
         table.add_row("Result", 
                      "[bold green]PALINDROME ✓[/]" if result else "[bold red]NOT A PALINDROME ✗[/]")
-        table.add_row("Normalized", f'"{info.normalized}"')
+        table.add_row("Normalized", f'"{preview(info.normalized)}"')
         table.add_row("Length", f"{info.length} characters")
-        table.add_row("Reversed", f'"{info.reversed}"')
+        table.add_row("Reversed", f'"{preview(info.reversed)}"')
         
         return table
     
@@ -98,13 +106,13 @@ class EnhancedPalindromeCLI:
             table.add_column("Length", style="yellow", justify="right")
             
             for start, end, substring in substrings[:8]:
-                table.add_row(f'"{substring}"', f"{start}-{end-1}", str(len(substring)))
+                table.add_row(f'"{preview(substring)}"', f"{start}-{end-1}", str(len(substring)))
             
             self.console.print(table)
         else:
             print("\nPalindromic Substrings:")
             for start, end, substring in substrings[:8]:
-                print(f"  '{substring}' (positions {start}-{end-1}, length: {len(substring)})")
+                print(f"  '{preview(substring)}' (positions {start}-{end-1}, length: {len(substring)})")
     
     def check_text_cli(self, text, show_explain=False, find_substrings=False):
         """
@@ -118,24 +126,23 @@ class EnhancedPalindromeCLI:
                 transient=True,
             ) as progress:
                 progress.add_task(description="Analyzing text...", total=None)
-                result = is_palindrome(text)
-                info = explain(text, find_substrings=find_substrings)
+                info = explain(text, find_substrings=find_substrings, max_substrings=SUBSTRING_LIMIT)
         else:
-            result = is_palindrome(text)
-            info = explain(text, find_substrings=find_substrings)
+            info = explain(text, find_substrings=find_substrings, max_substrings=SUBSTRING_LIMIT)
+        result = info.is_palindrome
         
         # Display main result
         if self.console:
             self.print_panel(
                 "Palindrome Analysis Result", 
-                self.create_result_table(text, result),
+                self.create_result_table(text, result, info),
                 "green" if result else "red"
             )
         else:
             print("\n" + "=" * 60)
             print("Palindrome Check Result")
             print("=" * 60)
-            print(f"Text: '{text}'")
+            print(f"Text: '{preview(text)}'")
             print("✓ PALINDROME" if result else "✗ NOT A PALINDROME")
         
         # Show detailed analysis if requested
@@ -153,9 +160,9 @@ class EnhancedPalindromeCLI:
                     self.show_substrings(info.substrings)
             else:
                 print(f"\nDetailed Analysis:")
-                print(f"Normalized: '{info.normalized}'")
+                print(f"Normalized: '{preview(info.normalized)}'")
                 print(f"Length: {info.length} characters")
-                print(f"Reversed: '{info.reversed}'")
+                print(f"Reversed: '{preview(info.reversed)}'")
                 
                 if info.is_palindrome:
                     print("✓ The normalized text reads the same forwards and backwards")
@@ -165,10 +172,61 @@ class EnhancedPalindromeCLI:
                 if info.substrings and find_substrings:
                     print(f"\nPalindromic Substrings Found:")
                     for start, end, substring in info.substrings[:5]:
-                        print(f"  '{substring}' (positions {start}-{end-1})")
+                        print(f"  '{preview(substring)}' (positions {start}-{end-1})")
                     if len(info.substrings) > 5:
                         print(f"  ... and {len(info.substrings) - 5} more")
     
+    def check_file_cli(self, path, min_length=3):
+        """
+        Stream a (possibly multi-megabyte) text file through the palindrome engine
+        """
+        try:
+            scan = scan_file(path, min_length=min_length, max_results=SUBSTRING_LIMIT)
+        except OSError as e:
+            self.print_message(f"Could not read {path}: {e}", MessageType.ERROR)
+            return None
+        
+        summary = (f"Characters read: {scan.characters}\n"
+                   f"Normalized length: {scan.normalized_length}\n"
+                   f"Distinct palindromes: {scan.distinct}")
+        if scan.longest:
+            summary += (f"\nLongest: '{preview(scan.longest.text)}' "
+                        f"(positions {scan.longest.start}-{scan.longest.end - 1}, "
+                        f"length: {len(scan.longest.text)})")
+        self.print_panel(f"Palindrome Scan: {path}", summary, "blue")
+        
+        if self.console and scan.matches:
+            table = Table(title=f"Longest Palindromes (min length {min_length})", box=ROUNDED)
+            table.add_column("Palindrome", style="green")
+            table.add_column("First at", style="cyan")
+            table.add_column("Length", style="yellow", justify="right")
+            table.add_column("Count", style="magenta", justify="right")
+            for m in scan.matches[:8]:
+                table.add_row(f'"{preview(m.text)}"', f"{m.start}-{m.end-1}", str(len(m.text)), str(m.count))
+            self.console.print(table)
+        elif scan.matches:
+            print(f"Longest Palindromes (min length {min_length}):")
+            for m in scan.matches[:8]:
+                print(f"  '{preview(m.text)}' (first at {m.start}-{m.end-1}, "
+                      f"length: {len(m.text)}, count: {m.count})")
+        return scan
+    
+    def check_batch_cli(self, paths, workers=None):
+        """
+        Check every line of the given files ('-' for stdin), spread across cores
+        """
+        total = palindromes = 0
+        try:
+            for r in check_batch(iter_lines(paths, sys.stdin), workers=workers):
+                total += 1
+                palindromes += r.is_palindrome
+                print(f"{'✓' if r.is_palindrome else '✗'}\t{r.text}")
+        except OSError as e:
+            self.print_message(f"Could not read input: {e}", MessageType.ERROR)
+            return None
+        self.print_message(f"{palindromes} of {total} lines are palindromes", MessageType.INFO)
+        return palindromes, total
+    
     def display_help(self):
         """Show enhanced help information"""
         if self.console:
@@ -301,6 +359,9 @@ Examples:
   %(prog)s "A man, a plan, a canal: Panama"
   %(prog)s -e "Never odd or even"
   %(prog)s -s "Palindrome"
+  %(prog)s --file book.txt --min-length 5  # Stream a large file
+  %(prog)s --batch lines.txt more.txt      # Check every line, using all cores
+  cat lines.txt | %(prog)s --batch -
   %(prog)s -i  # Interactive mode
 
 Install 'rich' for enhanced visuals: pip install rich
@@ -310,8 +371,15 @@ Install 'rich' for enhanced visuals: pip install rich
     parser.add_argument("text", nargs="*", help="Text to check")
     parser.add_argument("-e", "--explain", action="store_true", 
                        help="Show detailed explanation")
-    parser.add_argument("-s", "--substrings", action="store_true",
+    parser.add_argument("-s", "--substrings", "--find-substrings", action="store_true",
                        help="Find palindromic substrings for non-palindromes")
+    parser.add_argument("-f", "--file", help="Scan a text file for palindromes in chunks")
+    parser.add_argument("--min-length", type=int, default=3,
+                       help="Minimum palindrome length for --file (default: 3)")
+    parser.add_argument("-b", "--batch", nargs="+", metavar="FILE",
+                       help="Check each line of these files ('-' for stdin)")
+    parser.add_argument("-w", "--workers", type=int,
+                       help="Worker processes for --batch (default: all cores)")
     parser.add_argument("-i", "--interactive", action="store_true", 
                        help="Interactive mode")
     
@@ -321,6 +389,14 @@ Install 'rich' for enhanced visuals: pip install rich
         cli.interactive_cli()
         return
     
+    if ns.file:
+        cli.check_file_cli(ns.file, min_length=ns.min_length)
+        return
+    
+    if ns.batch:
+        cli.check_batch_cli(ns.batch, workers=ns.workers)
+        return
+    
     if ns.text:
         text = " ".join(ns.text)
         cli.check_text_cli(text, show_explain=ns.explain, find_substrings=ns.substrings)
@@ -3,14 +3,53 @@ Core palindrome logic with enhanced features
 """
 import unicodedata
 import re
+from array import array
 from dataclasses import dataclass
-from typing import List, Tuple
+from functools import lru_cache
+from multiprocessing import Pool
+from typing import Iterable, List, Optional, Tuple
 
 def _strip_diacritics(text: str) -> str:
     """Remove diacritics from text using Unicode normalization"""
     nk = unicodedata.normalize("NFKD", text)
     return "".join(c for c in nk if not unicodedata.combining(c))
 
+class _NormalizeTable(dict):
+    """
+    str.translate table mapping each code point to its normalized form
+    
+    ASCII is filled in up front; any other character is resolved on first
+    sight (NFKD, drop combining marks, keep letters/digits, lowercase) and
+    remembered, so every later occurrence is a plain lookup in C.
+    """
+    
+    def __init__(self, keep_digits: bool, keep_case: bool):
+        super().__init__()
+        self.keep_digits = keep_digits
+        self.keep_case = keep_case
+        for code in range(128):
+            self[code] = self._resolve(code)
+    
+    def _resolve(self, code: int) -> Optional[str]:
+        out = []
+        for c in _strip_diacritics(chr(code)):
+            if c.isalpha() or (self.keep_digits and c.isdigit()):
+                out.append(c if self.keep_case else c.lower())
+        return "".join(out) or None
+    
+    def __missing__(self, code: int) -> Optional[str]:
+        value = self[code] = self._resolve(code)
+        return value
+
+_TABLES = {(d, k): _NormalizeTable(d, k) for d in (True, False) for k in (True, False)}
+
+# Texts up to this length are memoized; longer ones are normalized each time
+_CACHE_MAX_LEN = 4096
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str, keep_digits: bool, keep_case: bool) -> str:
+    return text.translate(_TABLES[keep_digits, keep_case])
+
 def normalize_text(text: str, keep_digits: bool = True, keep_case: bool = False) -> str:
     """
     Normalize text by removing non-alphanumeric characters and diacritics
@@ -25,18 +64,10 @@ def normalize_text(text: str, keep_digits: bool = True, keep_case: bool = False)
     """
     if text is None:
         return ""
-    
-    text = _strip_diacritics(text)
-    out = []
-    
-    for ch in text:
-        if ch.isalpha() or (keep_digits and ch.isdigit()):
-            if keep_case:
-                out.append(ch)
-            else:
-                out.append(ch.lower())
-    
-    return "".join(out)
+    keep_digits, keep_case = bool(keep_digits), bool(keep_case)
+    if len(text) <= _CACHE_MAX_LEN:
+        return _normalize_cached(text, keep_digits, keep_case)
+    return text.translate(_TABLES[keep_digits, keep_case])
 
 def is_palindrome(text: str, **normalize_kwargs) -> bool:
     """
@@ -54,45 +85,236 @@ def is_palindrome(text: str, **normalize_kwargs) -> bool:
         return False
     return norm == norm[::-1]
 
-def find_palindromic_substrings(text: str, min_length: int = 3) -> List[Tuple[int, int, str]]:
+def normalize_with_offsets(text: str, keep_digits: bool = True,
+                           keep_case: bool = False, base: int = 0) -> Tuple[str, List[int]]:
+    """
+    Normalize text like normalize_text, also returning where each kept character came from
+    
+    Args:
+        text: Input text to normalize
+        keep_digits: Whether to keep digits in the normalized text
+        keep_case: Whether to preserve case (default converts to lowercase)
+        base: Offset added to every position (for text read in chunks)
+    
+    Returns:
+        Tuple of (normalized text, offset in the original text of each normalized character)
+    """
+    table = _TABLES[bool(keep_digits), bool(keep_case)]
+    out = []
+    offsets = []
+    for i, ch in enumerate(text or "", base):
+        mapped = table[ord(ch)]
+        if mapped:
+            out.append(mapped)
+            if len(mapped) == 1:
+                offsets.append(i)
+            else:
+                offsets.extend([i] * len(mapped))
+    return "".join(out), offsets
+
+@dataclass(frozen=True)
+class PalindromeMatch:
+    """A palindrome located in the original text"""
+    start: int   # offset of its first character in the original text
+    end: int     # offset just past its last character
+    text: str    # the palindrome in normalized form
+    count: int = 1
+
+def longest_palindrome(text: str) -> Optional[PalindromeMatch]:
     """
-    Find all palindromic substrings in the given text
+    Find the longest palindromic substring with Manacher's algorithm (linear time)
+    
+    Args:
+        text: Text to search
+    
+    Returns:
+        PalindromeMatch with offsets in the original text, or None for empty input
+    """
+    norm, offsets = normalize_with_offsets(text)
+    n = len(norm)
+    if not n:
+        return None
+    
+    # Radii over "^#a#b#...#$": index 2i+2 holds norm[i]; the sentinels stop expansion
+    t = "^#" + "#".join(norm) + "#$"
+    radius = [0] * len(t)
+    center = right = 0
+    best_len, best_center = 0, 0
+    for i in range(1, len(t) - 1):
+        r = min(right - i, radius[2 * center - i]) if i < right else 0
+        while t[i - r - 1] == t[i + r + 1]:
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center, right = i, i + r
+        if r > best_len:
+            best_len, best_center = r, i
+    
+    start = (best_center - best_len) // 2
+    end = start + best_len
+    return PalindromeMatch(offsets[start], offsets[end - 1] + 1, norm[start:end])
+
+class Eertree:
+    """
+    Palindromic tree: one node per distinct palindrome, built online in linear time
+    
+    Node 0 is the imaginary root (length -1) and node 1 the empty root.
+    Characters can be added in any number of calls, so text can be streamed.
+    """
+    
+    def __init__(self):
+        self.length = [-1, 0]
+        self.link = [0, 0]
+        self.edges: List[dict] = [{}, {}]
+        self.parent = [0, 0]
+        self.char = ["", ""]
+        self.count = [0, 0]          # times the node is the longest suffix palindrome
+        self.first_end = [-1, -1]    # normalized index where it first ends
+        self.starts = [-1, -1]       # original offsets of its first occurrence
+        self.ends = [-1, -1]
+        self.text = ""                  # normalized characters seen so far
+        self.offsets = array("q")       # their offsets in the original text
+        self.suffix = 1              # longest palindromic suffix so far
+    
+    def _fit(self, node: int, i: int, ch: str) -> int:
+        text, length, link = self.text, self.length, self.link
+        while True:
+            j = i - length[node] - 1
+            if j >= 0 and text[j] == ch:
+                return node
+            node = link[node]
+    
+    def add(self, normalized: str, offsets: List[int]):
+        """Append normalized characters and their original offsets"""
+        length, link, edges = self.length, self.link, self.edges
+        i = len(self.text)
+        self.text += normalized
+        self.offsets.extend(offsets)
+        for i, ch in enumerate(normalized, i):
+            node = self._fit(self.suffix, i, ch)
+            child = edges[node].get(ch)
+            if child is None:
+                child = len(length)
+                length.append(length[node] + 2)
+                edges.append({})
+                self.parent.append(node)
+                self.char.append(ch)
+                self.count.append(0)
+                self.first_end.append(i)
+                self.starts.append(self.offsets[i - length[child] + 1])
+                self.ends.append(self.offsets[i] + 1)
+                edges[node][ch] = child
+                link.append(1 if length[child] == 1 else edges[self._fit(link[node], i, ch)][ch])
+            self.count[child] += 1
+            self.suffix = child
+    
+    def _finish_counts(self) -> List[int]:
+        """Total occurrences per node: push counts down suffix links (longest first)"""
+        totals = self.count[:]
+        for node in range(len(totals) - 1, 1, -1):
+            totals[self.link[node]] += totals[node]
+        return totals
+    
+    def palindrome(self, node: int) -> str:
+        """Rebuild a node's palindrome from its parent chain"""
+        left = []
+        while node > 1:
+            left.append(self.char[node])
+            node = self.parent[node]
+        right = left[::-1]
+        if node == 0:
+            right = right[1:]  # Odd length: the innermost character is the centre
+        return "".join(left) + "".join(right)
+    
+    def longest(self) -> Optional[PalindromeMatch]:
+        if len(self.length) <= 2:
+            return None
+        node = max(range(2, len(self.length)), key=lambda k: (self.length[k], -k))
+        return PalindromeMatch(self.starts[node], self.ends[node], self.palindrome(node))
+    
+    def matches(self, min_length: int = 1, max_results: Optional[int] = None) -> List[PalindromeMatch]:
+        """Distinct palindromes of at least min_length, longest first, with occurrence counts"""
+        totals = self._finish_counts()
+        nodes = [k for k in range(2, len(self.length)) if self.length[k] >= min_length]
+        nodes.sort(key=lambda k: (-self.length[k], self.first_end[k]))
+        if max_results is not None:
+            nodes = nodes[:max_results]
+        return [PalindromeMatch(self.starts[k], self.ends[k], self.palindrome(k), totals[k])
+                for k in nodes]
+    
+    def __len__(self) -> int:
+        """Number of distinct palindromes"""
+        return len(self.length) - 2
+
+def palindrome_counts(text: str, min_length: int = 1,
+                      max_results: Optional[int] = None) -> List[PalindromeMatch]:
+    """
+    Distinct palindromic substrings with occurrence counts, longest first
+    
+    Args:
+        text: Text to search
+        min_length: Minimum length (in normalized characters)
+        max_results: Keep only this many of the longest palindromes
+    
+    Returns:
+        List of PalindromeMatch for the first occurrence of each palindrome
+    """
+    tree = Eertree()
+    tree.add(*normalize_with_offsets(text))
+    return tree.matches(min_length, max_results)
+
+def find_palindromic_substrings(text: str, min_length: int = 3,
+                                max_results: Optional[int] = None) -> List[Tuple[int, int, str]]:
+    """
+    Find the distinct palindromic substrings in the given text
     
     Args:
         text: Text to search for palindromic substrings
         min_length: Minimum length of substrings to consider
+        max_results: Keep only this many of the longest substrings
     
     Returns:
-        List of tuples (start_index, end_index, substring)
+        List of tuples (start_index, end_index, substring), longest first; indices
+        are offsets of the first occurrence in the original text
     """
-    normalized = normalize_text(text)
-    results = []
-    n = len(normalized)
-    
-    # Check all possible centers for palindromes
-    for center in range(n):
-        # Odd length palindromes
-        left, right = center, center
-        while left >= 0 and right < n and normalized[left] == normalized[right]:
-            length = right - left + 1
-            if length >= min_length:
-                results.append((left, right + 1, normalized[left:right+1]))
-            left -= 1
-            right += 1
-        
-        # Even length palindromes
-        left, right = center, center + 1
-        while left >= 0 and right < n and normalized[left] == normalized[right]:
-            length = right - left + 1
-            if length >= min_length:
-                results.append((left, right + 1, normalized[left:right+1]))
-            left -= 1
-            right += 1
-    
-    # Remove duplicates and sort by length (longest first)
-    results = list(set(results))
-    results.sort(key=lambda x: len(x[2]), reverse=True)
-    return results
+    return [(m.start, m.end, m.text) for m in palindrome_counts(text, min_length, max_results)]
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Summary of a streamed palindrome scan"""
+    characters: int              # original characters read
+    normalized_length: int
+    distinct: int                # distinct palindromes of any length
+    longest: Optional[PalindromeMatch]
+    matches: List[PalindromeMatch]
+
+def scan_palindromes(chunks: Iterable[str], min_length: int = 3,
+                     max_results: Optional[int] = 100) -> ScanResult:
+    """
+    Stream text through an eertree chunk by chunk
+    
+    Palindromes spanning chunk boundaries are found because the tree is
+    extended online; offsets refer to the concatenated original text.
+    """
+    tree = Eertree()
+    base = 0
+    for chunk in chunks:
+        tree.add(*normalize_with_offsets(chunk, base=base))
+        base += len(chunk)
+    return ScanResult(base, len(tree.text), len(tree), tree.longest(),
+                      tree.matches(min_length, max_results))
+
+def scan_file(path: str, min_length: int = 3, max_results: Optional[int] = 100,
+              chunk_size: int = 1 << 20, encoding: str = "utf-8") -> ScanResult:
+    """Scan a text file for palindromes, reading chunk_size characters at a time"""
+    def chunks():
+        with open(path, "r", encoding=encoding, errors="replace") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+    return scan_palindromes(chunks(), min_length, max_results)
 
 @dataclass(frozen=True)
 class Explanation:
@@ -104,13 +326,15 @@ class Explanation:
     reversed: str
     substrings: List[Tuple[int, int, str]]
 
-def explain(text: str, find_substrings: bool = False) -> Explanation:
+def explain(text: str, find_substrings: bool = False,
+            max_substrings: Optional[int] = None) -> Explanation:
     """
     Generate detailed explanation of palindrome check
     
     Args:
         text: Text to analyze
         find_substrings: Whether to search for palindromic substrings
+        max_substrings: Keep only this many of the longest substrings
     
     Returns:
         Explanation object with detailed results
@@ -120,7 +344,7 @@ def explain(text: str, find_substrings: bool = False) -> Explanation:
     
     substrings = []
     if find_substrings and not is_pal and norm:
-        substrings = find_palindromic_substrings(text)
+        substrings = find_palindromic_substrings(text, max_results=max_substrings)
     
     return Explanation(
         original=text,
@@ -129,4 +353,131 @@ def explain(text: str, find_substrings: bool = False) -> Explanation:
         length=len(norm),
         reversed=norm[::-1] if norm else "",
         substrings=substrings
-    )
\ No newline at end of file
+    )
+
+@dataclass(frozen=True)
+class CheckResult:
+    """Outcome of checking one text in a batch"""
+    text: str
+    is_palindrome: bool
+    length: int  # normalized length
+
+def _check_chunk(task) -> List[CheckResult]:
+    texts, keep_digits, keep_case = task
+    results = []
+    for text in texts:
+        norm = normalize_text(text, keep_digits, keep_case)
+        results.append(CheckResult(text, bool(norm) and norm == norm[::-1], len(norm)))
+    return results
+
+def check_batch(texts: Iterable[str], workers: Optional[int] = 1, chunk_size: int = 2000,
+                keep_digits: bool = True, keep_case: bool = False) -> Iterable[CheckResult]:
+    """
+    Check many texts in one call, optionally spread over worker processes
+    
+    Args:
+        texts: Texts (lines, file contents, ...) to check
+        workers: Worker processes; 1 checks in this process, None uses every core
+        chunk_size: Texts sent to a worker at a time
+        keep_digits: Whether to keep digits in the normalized text
+        keep_case: Whether to preserve case
+    
+    Yields:
+        CheckResult for each text, in input order
+    """
+    def chunks():
+        chunk = []
+        for text in texts:
+            chunk.append(text)
+            if len(chunk) >= chunk_size:
+                yield chunk, keep_digits, keep_case
+                chunk = []
+        if chunk:
+            yield chunk, keep_digits, keep_case
+    
+    if workers == 1:
+        for task in chunks():
+            yield from _check_chunk(task)
+        return
+    with Pool(workers) as pool:
+        for results in pool.imap(_check_chunk, chunks()):
+            yield from results
+
+def iter_lines(paths: Iterable[str], stdin=None) -> Iterable[str]:
+    """Yield the non-empty lines of each file ('-' reads stdin)"""
+    for path in paths:
+        f = stdin if path == "-" else open(path, "r", encoding="utf-8", errors="replace")
+        try:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield line
+        finally:
+            if path != "-":
+                f.close()
+
+def _common_prefix(a: str, b: str, limit: int, block: int = 4096) -> int:
+    """Length of the common prefix of a and b (at most limit), comparing block-wise"""
+    p = 0
+    while p + block <= limit and a[p:p + block] == b[p:p + block]:
+        p += block
+    while p < limit and a[p] == b[p]:
+        p += 1
+    return p
+
+def _common_suffix(a: str, b: str, limit: int, block: int = 4096) -> int:
+    """Length of the common suffix of a and b (at most limit), comparing block-wise"""
+    q = 0
+    la, lb = len(a), len(b)
+    while q + block <= limit and a[la - q - block:la - q] == b[lb - q - block:lb - q]:
+        q += block
+    while q < limit and a[la - q - 1] == b[lb - q - 1]:
+        q += 1
+    return q
+
+class LiveChecker:
+    """
+    Palindrome check for text that is edited a little at a time
+    
+    Keeps the normalized text plus, every BLOCK source characters, how many
+    normalized characters came before that point. An edit re-normalizes
+    only the changed span and the checkpoints after it; typing at the end
+    of a long document touches one block.
+    """
+    
+    BLOCK = 4096
+    
+    def __init__(self, keep_digits: bool = True, keep_case: bool = False):
+        self.table = _TABLES[bool(keep_digits), bool(keep_case)]
+        self.text = ""
+        self.normalized = ""
+        self.marks = [0]  # marks[k]: normalized length of text[:k * BLOCK]
+    
+    def _count(self, text: str, end: int) -> int:
+        """Normalized length of text[:end], using the checkpoints"""
+        k = min(end // self.BLOCK, len(self.marks) - 1)
+        return self.marks[k] + len(text[k * self.BLOCK:end].translate(self.table))
+    
+    def update(self, text: str) -> bool:
+        """Take the new text and return whether it is a palindrome"""
+        old = self.text
+        if text != old:
+            limit = min(len(old), len(text))
+            p = _common_prefix(old, text, limit)
+            q = _common_suffix(old, text, limit - p)
+            
+            a = self._count(old, p)
+            b = self._count(old, len(old) - q)
+            middle = text[p:len(text) - q].translate(self.table)
+            self.normalized = self.normalized[:a] + middle + self.normalized[b:]
+            self.text = text
+            
+            # Checkpoints up to the edit still hold; rebuild the rest
+            block = self.BLOCK
+            k = p // block
+            del self.marks[k + 1:]
+            for k in range(k + 1, len(text) // block + 1):
+                self.marks.append(self.marks[-1] +
+                                  len(text[(k - 1) * block:k * block].translate(self.table)))
+        norm = self.normalized
+        return bool(norm) and norm == norm[::-1]
\ No newline at end of file
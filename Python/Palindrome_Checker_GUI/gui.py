@@ -5,7 +5,12 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import tkinter.font as tkfont
 from tkinter import PhotoImage
-from core import is_palindrome, explain
+from core import is_palindrome, explain, LiveChecker
+
+# Live checking waits for a pause in typing this long (ms)
+LIVE_DELAY_MS = 250
+# Substring search in the details view keeps only the longest ones
+SUBSTRING_LIMIT = 100
 
 class ModernPalindromeCheckerGUI:
     def __init__(self, root):
@@ -21,6 +26,10 @@ class ModernPalindromeCheckerGUI:
         except:
             pass
         
+        # Live checking state: pending after() job and incremental checker
+        self._live_job = None
+        self.live_checker = LiveChecker()
+        
         # Configure styles
         self.setup_styles()
         
@@ -257,11 +266,29 @@ class ModernPalindromeCheckerGUI:
             self.input_entry.bind('<KeyRelease>', self.on_key_release)
         else:
             self.input_entry.unbind('<KeyRelease>')
+            self._cancel_live_check()
     
     def on_key_release(self, event):
-        """Handle key release events for live checking"""
+        """Handle key release events for live checking (debounced)"""
         if self.live_var.get():
+            self._cancel_live_check()
+            self._live_job = self.root.after(LIVE_DELAY_MS, self.live_check)
+    
+    def _cancel_live_check(self):
+        if self._live_job is not None:
+            self.root.after_cancel(self._live_job)
+            self._live_job = None
+    
+    def live_check(self):
+        """Re-check after typing pauses, re-normalizing only the edited region"""
+        self._live_job = None
+        text = self.input_var.get()
+        if not text.strip():
             self.check_text()
+            return
+        self.show_result(self.live_checker.update(text))
+        self.hide_details()
+        self.status_var.set("Ready")
     
     def on_check(self, event=None):
         """Handle check button click"""
@@ -282,14 +309,7 @@ class ModernPalindromeCheckerGUI:
         self.root.update()
         
         is_pal = is_palindrome(text)
-        
-        # Update result label
-        if is_pal:
-            self.result_var.set("PALINDROME ✓")
-            self.result_label.configure(foreground='#27ae60')  # Green
-        else:
-            self.result_var.set("NOT A PALINDROME ✗")
-            self.result_label.configure(foreground='#e74c3c')  # Red
+        self.show_result(is_pal)
         
         # Add to history
         norm_text = explain(text).normalized
@@ -304,9 +324,18 @@ class ModernPalindromeCheckerGUI:
             
         self.status_var.set("Ready")
     
+    def show_result(self, is_pal):
+        """Update result label"""
+        if is_pal:
+            self.result_var.set("PALINDROME ✓")
+            self.result_label.configure(foreground='#27ae60')  # Green
+        else:
+            self.result_var.set("NOT A PALINDROME ✗")
+            self.result_label.configure(foreground='#e74c3c')  # Red
+    
     def show_details(self, text):
         """Show detailed analysis of the text"""
-        info = explain(text, find_substrings=True)
+        info = explain(text, find_substrings=True, max_substrings=SUBSTRING_LIMIT)
         
         details = f"Original text: {info.original}\n"
         details += f"Normalized: {info.normalized}\n"
@@ -2,7 +2,9 @@
 Extended unit tests for core palindrome functionality
 """
 import pytest
-from core import is_palindrome, normalize_text, explain, find_palindromic_substrings
+from core import (is_palindrome, normalize_text, explain, find_palindromic_substrings,
+                  normalize_with_offsets, longest_palindrome, palindrome_counts, scan_palindromes,
+                  check_batch, LiveChecker)
 
 class TestPalindromeChecker:
     # Test cases for basic palindrome functionality
@@ -103,5 +105,63 @@ class TestEdgeCases:
         long_non_palindrome = "a" * 500 + "b" + "a" * 499
         assert not is_palindrome(long_non_palindrome)
 
+class TestPalindromeEngine:
+    def test_offsets_map_to_original_text(self):
+        text = "Xx, Été! racecar?"
+        norm, offsets = normalize_with_offsets(text)
+        assert norm == normalize_text(text)
+        assert [text[i] for i in offsets[:5]] == ["X", "x", "É", "t", "é"]
+        
+        start, end, substring = find_palindromic_substrings(text, min_length=7)[0]
+        assert substring == "racecar"
+        assert text[start:end] == "racecar"
+    
+    def test_longest_palindrome(self):
+        match = longest_palindrome("Say: A man, a plan, a canal: Panama! ok")
+        assert match.text == "amanaplanacanalpanama"
+        assert match.start == 5 and match.end == 35
+        assert longest_palindrome("!!") is None
+    
+    def test_distinct_palindromes_with_counts(self):
+        counts = {m.text: m.count for m in palindrome_counts("abacaba")}
+        assert counts == {"abacaba": 1, "bacab": 1, "aca": 1, "aba": 2, "c": 1, "b": 2, "a": 4}
+        
+        # Distinct substrings, longest first, limited on request
+        result = find_palindromic_substrings("abacaba")
+        assert [s for _, _, s in result] == ["abacaba", "bacab", "aba", "aca"]
+        assert len(find_palindromic_substrings("a" * 5000, max_results=3)) == 3
+    
+    def test_streaming_matches_whole_text(self):
+        text = "xyz Step on no pets, abba! " * 3
+        chunks = [text[i:i + 4] for i in range(0, len(text), 4)]
+        scan = scan_palindromes(chunks, min_length=3, max_results=None)
+        assert scan.characters == len(text)
+        assert [(m.start, m.end, m.text) for m in scan.matches] == \
+            find_palindromic_substrings(text)
+        assert scan.longest == longest_palindrome(text)
+
+class TestBatchAndLive:
+    def test_normalization_table_handles_unicode(self):
+        assert normalize_text("ﬁne Œuvre ½") == "fineœuvre12"
+        assert normalize_text("Ångström", keep_case=True) == "Angstrom"
+        assert normalize_text("x" * 5000 + "É") == "x" * 5000 + "e"  # longer than the memo limit
+    
+    def test_check_batch_matches_single_checks(self):
+        texts = ["level", "hello", "Never odd or even", "!!", "12321"] * 50
+        serial = list(check_batch(texts, workers=1, chunk_size=7))
+        assert [r.is_palindrome for r in serial] == [is_palindrome(t) for t in texts]
+        assert [r.text for r in serial] == texts
+        pooled = list(check_batch(texts, workers=2, chunk_size=7))
+        assert pooled == serial
+    
+    def test_live_checker_follows_edits(self):
+        live = LiveChecker()
+        live.BLOCK = 4  # Small blocks exercise the checkpoints
+        edits = ["Never", "Never odd", "Never odd or even", "Never odd, or even!",
+                 "XNever odd, or even!", "Never odd, or even!", "Never odd or even ok", ""]
+        for text in edits:
+            assert live.update(text) == is_palindrome(text)
+            assert live.normalized == normalize_text(text)
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""
+Solver Benchmarks
+One timing harness for the Minesweeper, Sudoku, Hangman AI and Binary Search engines.
+"""
+from .harness import Case, compare_reports, load_report, run_cases, save_report, time_case
+from .suites import SUITES, collect_cases
+
+__version__ = "1.0.0"
+__all__ = [
+    "Case",
+    "compare_reports",
+    "load_report",
+    "run_cases",
+    "save_report",
+    "time_case",
+    "SUITES",
+    "collect_cases",
+]
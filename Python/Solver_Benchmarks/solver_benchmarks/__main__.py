@@ -0,0 +1,8 @@
+"""
+Allow the suite to be run with python -m solver_benchmarks
+"""
+import sys
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Command line for running benchmarks, saving baselines and comparing runs.
+
+Usage:
+    python -m solver_benchmarks run --save baselines/main.json
+    python -m solver_benchmarks run --compare baselines/main.json --threshold 0.1
+    python -m solver_benchmarks compare baselines/main.json results/today.json
+    python -m solver_benchmarks list
+"""
+import argparse
+from typing import List, Optional
+
+from .harness import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_ROUNDS,
+    DEFAULT_THRESHOLD,
+    STATS,
+    compare_reports,
+    load_report,
+    print_comparison,
+    print_result,
+    run_cases,
+    save_report,
+)
+from .suites import SUITES, collect_cases
+
+def _compare(baseline_path: str, current, threshold: float, stat: str,
+             include_missing: bool = True) -> int:
+    """Print the comparison; exit status 1 when anything regressed."""
+    baseline = load_report(baseline_path)
+    rows = compare_reports(baseline, current, threshold, stat, include_missing)
+    print()
+    if baseline["machine"].get("node") != current["machine"].get("node"):
+        print(f"Note: baseline was recorded on {baseline['machine'].get('node')}, "
+              f"timings may not be comparable.")
+    print_comparison(rows, threshold)
+    return 1 if any(row.status == "regression" for row in rows) else 0
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the game solvers and compare against baselines")
+    commands = parser.add_subparsers(dest="command")
+
+    run = commands.add_parser("run", help="time the benchmark cases")
+    run.add_argument("--suite", action="append", choices=list(SUITES),
+                     help="suite to run (repeatable, default: all)")
+    run.add_argument("-k", dest="match", help="only run cases whose name contains this text")
+    run.add_argument("--quick", action="store_true", help="smaller inputs only, for a fast check")
+    run.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="timed rounds per case")
+    run.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME,
+                     help="shortest round in seconds; fast calls repeat until it is reached")
+    run.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    run.add_argument("--compare", metavar="BASELINE", help="compare the results with a saved baseline")
+
+    compare = commands.add_parser("compare", help="compare two saved reports")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+
+    for sub in (run, compare):
+        sub.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="relative slowdown reported as a regression (default 0.10 = 10%%)")
+        sub.add_argument("--stat", choices=STATS, default="median", help="statistic to compare")
+
+    commands.add_parser("list", help="list the benchmark cases")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        return _compare(args.baseline, load_report(args.current), args.threshold, args.stat)
+
+    skipped = {}
+    cases = collect_cases(getattr(args, "suite", None), getattr(args, "quick", False), skipped)
+    if getattr(args, "match", None):
+        cases = [case for case in cases if args.match in case.key]
+    for name, reason in skipped.items():
+        print(f"Skipping {name}: {reason}")
+
+    if args.command != "run":
+        for case in cases:
+            print(case.key)
+        if args.command is None:
+            print("\nRun them with: python -m solver_benchmarks run")
+        return 0
+
+    print(f"{'case':<48}{'median':>13}{'stddev':>13}{'iters x rounds':>16}")
+    report = run_cases(cases, args.rounds, args.min_time, progress=print_result)
+    report["skipped"] = skipped
+    if args.save:
+        save_report(report, args.save)
+        print(f"\nSaved {len(report['results'])} results to {args.save}")
+    if args.compare:
+        # A run may cover only some suites, so cases it skipped are not reported missing
+        return _compare(args.compare, report, args.threshold, args.stat, include_missing=False)
+    return 0
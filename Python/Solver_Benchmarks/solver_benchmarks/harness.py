@@ -0,0 +1,199 @@
+"""
+Timing, JSON baselines and regression comparison for benchmark cases.
+
+A case is set up once, then its timed call is repeated for several rounds.
+Each round runs enough iterations to last at least ``min_time`` seconds, so
+fast calls are not lost in timer noise; the per-call minimum, median, mean
+and standard deviation across rounds are recorded. Reports are plain JSON,
+keyed by ``suite/name``, so a saved run becomes the baseline for the next.
+"""
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+REPORT_VERSION = 1
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.10
+STATS = ("min", "median", "mean")
+
+@dataclass
+class Case:
+    """One benchmark: ``setup()`` does the untimed work and returns the call to time."""
+    suite: str
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    params: Dict = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.suite}/{self.name}"
+
+def time_case(case: Case, rounds: int = DEFAULT_ROUNDS,
+              min_time: float = DEFAULT_MIN_TIME) -> Dict:
+    """
+    Time one case.
+
+    Args:
+        case: The case to run
+        rounds: Timed rounds (after one untimed warm-up call)
+        min_time: Shortest acceptable round, in seconds
+
+    Returns:
+        Dict with the case identity and per-call seconds statistics
+    """
+    call = case.setup()
+    start = time.perf_counter()
+    call()  # Warm-up, also used to calibrate the iteration count
+    first = time.perf_counter() - start
+    iterations = max(1, int(min_time / first) + 1) if first < min_time else 1
+
+    samples: List[float] = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        samples.append((time.perf_counter() - start) / iterations)
+
+    return {
+        "suite": case.suite,
+        "name": case.name,
+        "params": case.params,
+        "rounds": rounds,
+        "iterations": iterations,
+        "min": min(samples),
+        "max": max(samples),
+        "mean": statistics.mean(samples),
+        "median": statistics.median(samples),
+        "stddev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+def machine_info() -> Dict:
+    """Where a report was produced; timings only compare fairly on the same machine."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "node": platform.node(),
+        "cpus": os.cpu_count(),
+    }
+
+def run_cases(cases: Iterable[Case], rounds: int = DEFAULT_ROUNDS,
+              min_time: float = DEFAULT_MIN_TIME,
+              progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+    """Time every case and return a report ready for ``save_report``."""
+    results = []
+    for case in cases:
+        result = time_case(case, rounds, min_time)
+        results.append(result)
+        if progress:
+            progress(result)
+    return {
+        "version": REPORT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine_info(),
+        "results": results,
+    }
+
+def save_report(report: Dict, path: str):
+    """Write a report as JSON, creating the directory if needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+def load_report(path: str) -> Dict:
+    """Read a report written by ``save_report``; ValueError if it is not one."""
+    with open(path, "r", encoding="utf-8") as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or report.get("version") != REPORT_VERSION:
+        raise ValueError(f"{path} is not a version {REPORT_VERSION} benchmark report")
+    return report
+
+@dataclass
+class Comparison:
+    """One case in a baseline/current comparison."""
+    key: str
+    baseline: Optional[float]
+    current: Optional[float]
+    status: str  # "regression", "improvement", "ok", "new" or "missing"
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change in time per call (+0.25 means 25% slower)."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD,
+                    stat: str = "median", include_missing: bool = True) -> List[Comparison]:
+    """
+    Match cases by ``suite/name`` and flag changes beyond ``threshold``.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        threshold: Relative slowdown that counts as a regression (0.10 = 10%);
+            a speedup of the same size counts as an improvement
+        stat: Which statistic to compare ("min", "median" or "mean")
+        include_missing: Also list baseline cases the current report lacks
+            (off when the current run was filtered to a few suites)
+
+    Returns:
+        Comparisons in the current report's order, then cases that disappeared
+    """
+    if stat not in STATS:
+        raise ValueError(f"Unknown statistic: {stat}")
+    before = {f"{r['suite']}/{r['name']}": r[stat] for r in baseline["results"]}
+    rows = []
+    for result in current["results"]:
+        key = f"{result['suite']}/{result['name']}"
+        if key not in before:
+            rows.append(Comparison(key, None, result[stat], "new"))
+            continue
+        row = Comparison(key, before.pop(key), result[stat], "ok")
+        change = row.change
+        if change is not None and change > threshold:
+            row.status = "regression"
+        elif change is not None and change < -threshold:
+            row.status = "improvement"
+        rows.append(row)
+    if include_missing:
+        rows.extend(Comparison(key, seconds, None, "missing") for key, seconds in before.items())
+    return rows
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Seconds per call with a readable unit."""
+    if seconds is None:
+        return "-"
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+def print_result(result: Dict, out=sys.stdout):
+    """One line per timed case, as cases finish."""
+    print(f"{result['suite'] + '/' + result['name']:<48}{format_seconds(result['median']):>13}"
+          f"{format_seconds(result['stddev']):>13}{result['iterations']:>11}x{result['rounds']}",
+          file=out)
+
+def print_comparison(rows: List[Comparison], threshold: float, out=sys.stdout):
+    """Print a comparison table followed by a one-line verdict."""
+    print(f"{'case':<48}{'baseline':>13}{'current':>13}{'change':>9}  status", file=out)
+    for row in rows:
+        change = f"{row.change:+.1%}" if row.change is not None else "-"
+        flag = {"regression": "REGRESSION", "improvement": "faster"}.get(row.status, row.status)
+        print(f"{row.key:<48}{format_seconds(row.baseline):>13}{format_seconds(row.current):>13}"
+              f"{change:>9}  {flag}", file=out)
+    regressions = sum(row.status == "regression" for row in rows)
+    improvements = sum(row.status == "improvement" for row in rows)
+    print(f"{regressions} regression(s), {improvements} improvement(s) "
+          f"beyond {threshold:.0%} across {len(rows)} case(s)", file=out)
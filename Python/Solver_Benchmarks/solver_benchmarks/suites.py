@@ -0,0 +1,182 @@
+"""
+Benchmark cases for the solver projects that live next to this one.
+
+Each suite imports its project from the sibling directory (so nothing has
+to be installed) and scales one input the engine is sensitive to:
+
+    minesweeper    board size          AI playing seeded games to the end
+    sudoku         puzzle hardness     bitmask solver on easy .. hardest puzzles
+    hangman        dictionary size     word index build and AI play, per policy
+    binary_search  array length        scalar vs bulk queries
+
+A suite whose project (or one of its requirements) cannot be imported is
+reported as skipped instead of failing the run.
+"""
+import os
+import random
+import string
+import sys
+from typing import Callable, Dict, List
+
+from .harness import Case
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def _use_project(folder: str) -> str:
+    """Make a sibling project importable; returns its directory."""
+    path = os.path.join(PYTHON_DIR, folder)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+    return path
+
+# Minesweeper: (rows, cols, mines), the standard levels plus a large board
+BOARDS = [(9, 9, 10), (16, 16, 40), (16, 30, 99), (40, 40, 300)]
+GAMES_PER_CALL = 5
+
+def minesweeper_cases(quick: bool = False) -> List[Case]:
+    _use_project("Minesweeper_GUI")
+    from minesweeper.benchmark import play_game
+    from minesweeper.difficulty import Difficulty
+
+    def setup(rows, cols, mines):
+        difficulty = Difficulty(f"{rows}x{cols}", rows, cols, mines, 0, "benchmark")
+        return lambda: [play_game((difficulty, seed, False, 100000)) for seed in range(GAMES_PER_CALL)]
+
+    boards = BOARDS[:2] if quick else BOARDS
+    return [Case("minesweeper", f"ai_play[{r}x{c}/{m}]",
+                 lambda r=r, c=c, m=m: setup(r, c, m),
+                 {"rows": r, "cols": c, "mines": m, "games": GAMES_PER_CALL})
+            for r, c, m in boards]
+
+# Sudoku: puzzle files in the Sudoku project's tests, easiest first
+SUDOKU_PUZZLES = ["easy.sdk", "hard.sdk", "evil.sdk"]
+
+def sudoku_cases(quick: bool = False) -> List[Case]:
+    root = _use_project("Sudoku_Solver_GUI.py")
+    from sudoku.board import Board
+    from sudoku.batch import iter_puzzle_lines
+    from sudoku.solver import solve_flat
+
+    puzzles = os.path.join(root, "tests", "puzzles")
+    cases = []
+    for filename in SUDOKU_PUZZLES:
+        def setup(path=os.path.join(puzzles, filename)):
+            with open(path, "r", encoding="utf-8") as f:
+                board = Board.from_lines(f.readlines())
+            flat = [v for row in board.grid for v in row]
+            return lambda: solve_flat(flat)
+        cases.append(Case("sudoku", f"solve[{filename.split('.')[0]}]", setup,
+                          {"puzzle": filename}))
+
+    def setup_corpus():
+        corpus = [[int(ch) for ch in Board.parse_flat_string(line)]
+                  for line in iter_puzzle_lines([os.path.join(puzzles, "top_hard.txt")])]
+        return lambda: [solve_flat(flat) for flat in corpus]
+    if not quick:
+        cases.append(Case("sudoku", "solve[top_hard corpus]", setup_corpus,
+                          {"puzzle": "top_hard.txt"}))
+    return cases
+
+# Hangman: synthetic dictionaries, so runs do not depend on a word list on disk
+DICTIONARY_SIZES = [1000, 10000, 50000]
+SECRETS_PER_CALL = 50
+
+def make_dictionary(size: int, seed: int = 0) -> List[str]:
+    """Distinct pronounceable-ish words of 4-12 letters, reproducible from ``seed``."""
+    rng = random.Random(seed)
+    vowels, consonants = "aeiou", "".join(ch for ch in string.ascii_lowercase if ch not in "aeiou")
+    words = set()
+    while len(words) < size:
+        length = rng.randint(4, 12)
+        words.add("".join(rng.choice(consonants if i % 2 == 0 else vowels)
+                          if rng.random() < 0.8 else rng.choice(string.ascii_lowercase)
+                          for i in range(length)))
+    return sorted(words)
+
+def hangman_cases(quick: bool = False) -> List[Case]:
+    _use_project("Hangman_AI")
+    from hangman.ai_solver import AISolver, POLICIES
+    from hangman.benchmark import play_word
+
+    cases = []
+    for size in DICTIONARY_SIZES[:2] if quick else DICTIONARY_SIZES:
+        def setup_index(size=size):
+            words = make_dictionary(size)
+            return lambda: AISolver(words)
+        cases.append(Case("hangman", f"build_index[{size}]", setup_index, {"words": size}))
+
+        for policy in POLICIES:
+            def setup_play(size=size, policy=policy):
+                words = make_dictionary(size)
+                secrets = random.Random(1).sample(words, SECRETS_PER_CALL)
+                ai = AISolver(words, policy=policy)  # Index build is its own case
+
+                def play():
+                    # Start every call cold: the entropy memo survives reset(),
+                    # so without this later rounds would only time memo lookups
+                    ai._memo.clear()
+                    return [play_word(ai, secret) for secret in secrets]
+                return play
+            cases.append(Case("hangman", f"play[{size}, {policy}]", setup_play,
+                              {"words": size, "policy": policy, "games": SECRETS_PER_CALL}))
+    return cases
+
+# Binary search: sorted arrays with duplicates, queried QUERIES times per call
+ARRAY_SIZES = [1000, 100000, 1000000]
+QUERIES = 1000
+
+def binary_search_cases(quick: bool = False) -> List[Case]:
+    _use_project("Binary_Search_GUI")
+    from variants.core import lower_bound, first_occurrence
+    from variants.bulk import NUMPY_AVAILABLE, bulk_first_occurrence, bulk_lower_bound
+
+    def data(size):
+        rng = random.Random(size)
+        arr = sorted(rng.randrange(size * 2) for _ in range(size))
+        targets = [rng.randrange(size * 2) for _ in range(QUERIES)]
+        if NUMPY_AVAILABLE:
+            import numpy as np
+            return arr, targets, np.asarray(arr), np.asarray(targets)
+        return arr, targets, arr, targets
+
+    cases = []
+    for size in ARRAY_SIZES[:2] if quick else ARRAY_SIZES:
+        for label, scalar, bulk in (("lower_bound", lower_bound, bulk_lower_bound),
+                                    ("first_occurrence", first_occurrence, bulk_first_occurrence)):
+            def setup_scalar(size=size, scalar=scalar):
+                arr, targets, _, _ = data(size)
+                return lambda: [scalar(arr, t) for t in targets]
+
+            def setup_bulk(size=size, bulk=bulk):
+                _, _, arr, targets = data(size)
+                return lambda: bulk(arr, targets)
+
+            params = {"length": size, "queries": QUERIES}
+            cases.append(Case("binary_search", f"{label}[{size}]", setup_scalar, params))
+            cases.append(Case("binary_search", f"bulk_{label}[{size}]", setup_bulk,
+                              dict(params, numpy=NUMPY_AVAILABLE)))
+    return cases
+
+SUITES: Dict[str, Callable[[bool], List[Case]]] = {
+    "minesweeper": minesweeper_cases,
+    "sudoku": sudoku_cases,
+    "hangman": hangman_cases,
+    "binary_search": binary_search_cases,
+}
+
+def collect_cases(names: List[str] = None, quick: bool = False,
+                  skipped: Dict[str, str] = None) -> List[Case]:
+    """
+    Build the cases of the named suites (default: all).
+
+    Suites that cannot be imported are left out; their reason is stored in
+    ``skipped`` when a dict is given.
+    """
+    cases = []
+    for name in names or SUITES:
+        try:
+            cases.extend(SUITES[name](quick))
+        except ImportError as e:
+            if skipped is not None:
+                skipped[name] = str(e)
+    return cases
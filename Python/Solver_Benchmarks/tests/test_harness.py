@@ -0,0 +1,66 @@
+import json
+import pytest
+from solver_benchmarks.harness import Case, compare_reports, load_report, run_cases, save_report, time_case
+from solver_benchmarks.suites import SUITES, collect_cases, make_dictionary
+from solver_benchmarks.cli import main
+
+def _report(**medians):
+    return {
+        "version": 1,
+        "machine": {"node": "test"},
+        "results": [{"suite": "s", "name": name, "min": t, "median": t, "mean": t}
+                    for name, t in medians.items()],
+    }
+
+def test_time_case_calibrates_iterations():
+    calls = []
+    case = Case("s", "noop", lambda: (lambda: calls.append(1)), {"n": 1})
+    result = time_case(case, rounds=3, min_time=0.001)
+    assert result["iterations"] > 1
+    assert len(calls) == 1 + 3 * result["iterations"]
+    assert result["min"] <= result["median"] <= result["max"]
+    assert result["params"] == {"n": 1}
+
+def test_compare_flags_changes_beyond_threshold():
+    baseline = _report(a=1.0, b=1.0, c=1.0, gone=1.0)
+    current = _report(a=1.05, b=1.5, c=0.5, added=2.0)
+    rows = {row.key: row for row in compare_reports(baseline, current, threshold=0.10)}
+    assert rows["s/a"].status == "ok"
+    assert rows["s/b"].status == "regression" and rows["s/b"].change == pytest.approx(0.5)
+    assert rows["s/c"].status == "improvement"
+    assert rows["s/added"].status == "new"
+    assert rows["s/gone"].status == "missing"
+    assert "s/gone" not in {row.key for row in compare_reports(baseline, current, include_missing=False)}
+
+def test_report_round_trip(tmp_path):
+    report = run_cases([Case("s", "noop", lambda: (lambda: None))], rounds=2, min_time=0.0001)
+    path = str(tmp_path / "baselines" / "base.json")
+    save_report(report, path)
+    assert load_report(path)["results"] == json.loads(json.dumps(report["results"]))
+    (tmp_path / "other.json").write_text("{}")
+    with pytest.raises(ValueError):
+        load_report(str(tmp_path / "other.json"))
+
+def test_compare_command_exit_status(tmp_path):
+    base, slow = str(tmp_path / "base.json"), str(tmp_path / "slow.json")
+    save_report(_report(a=1.0), base)
+    save_report(_report(a=2.0), slow)
+    assert main(["compare", base, base]) == 0
+    assert main(["compare", base, slow]) == 1
+    assert main(["compare", base, slow, "--threshold", "1.5"]) == 0
+
+def test_dictionary_is_reproducible():
+    words = make_dictionary(500)
+    assert words == make_dictionary(500)
+    assert len(set(words)) == 500 and all(4 <= len(w) <= 12 for w in words)
+
+def test_every_suite_collects_cases():
+    skipped = {}
+    cases = collect_cases(quick=True, skipped=skipped)
+    suites = {case.suite for case in cases} | set(skipped)
+    assert suites == set(SUITES)
+    assert len({case.key for case in cases}) == len(cases)
+
+def test_smallest_sudoku_case_runs():
+    [case] = [c for c in collect_cases(["sudoku"], quick=True) if c.name == "solve[easy]"]
+    assert time_case(case, rounds=1, min_time=0)["median"] > 0
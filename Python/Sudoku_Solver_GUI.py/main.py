@@ -1,4 +1,5 @@
-from sudoku.cli import run_cli, run_cli_demo
+from sudoku.cli import run_cli, run_cli_demo, run_batch_cli, run_benchmark_cli, run_generate_cli
+from sudoku.generator import DIFFICULTIES
 from sudoku.gui import run_gui
 import argparse
 
@@ -10,15 +11,42 @@ Examples:
   GUI Mode:     python main.py --mode gui
   CLI Solve:    python main.py --solve 530070000600195000098000060800060003400803001700020006060000280000419005000080079
   CLI Demo:     python main.py --demo
+  Batch solve:  python main.py --batch puzzles.txt --out solutions.csv --unique
+  Benchmark:    python main.py --benchmark tests/puzzles/top_hard.txt --repeat 20
+  Generate:     python main.py --generate Hard --count 100 --out hard.txt
   Interactive:  python main.py
                                      """)
     parser.add_argument("--mode", choices=["cli", "gui"], help="Run in CLI or GUI mode")
     parser.add_argument("--in", dest="infile", help="Path to puzzle file (9 lines of 9 digits)")
     parser.add_argument("--solve", help="Solve a puzzle from 81-character string")
     parser.add_argument("--demo", action="store_true", help="Run CLI demo with built-in puzzle")
+    parser.add_argument("--batch", nargs="+", metavar="FILE",
+                        help="Solve files of one 81-character puzzle per line")
+    parser.add_argument("--benchmark", nargs="+", metavar="FILE",
+                        help="Measure solving throughput on puzzle files")
+    parser.add_argument("--generate", choices=DIFFICULTIES,
+                        help="Generate unique puzzles of this difficulty")
+    parser.add_argument("--count", type=int, default=10, help="Number of puzzles to generate")
+    parser.add_argument("--out", help="Batch or generator output file (default: stdout)")
+    parser.add_argument("--format", choices=["csv", "txt"], default="csv",
+                        help="Batch output: CSV with stats, or one solution per line")
+    parser.add_argument("--unique", action="store_true",
+                        help="Check uniqueness (count up to 2 solutions)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=256, help="Puzzles sent to a worker at once")
+    parser.add_argument("--method", choices=["bitmask", "dlx"], default="bitmask")
+    parser.add_argument("--repeat", type=int, default=1, help="Benchmark passes over the corpus")
     args = parser.parse_args()
+    if args.unique and args.method != "bitmask":
+        parser.error("--unique counts solutions with the bitmask method; drop --method dlx")
 
-    if args.demo:
+    if args.batch:
+        run_batch_cli(args)
+    elif args.benchmark:
+        run_benchmark_cli(args)
+    elif args.generate:
+        run_generate_cli(args)
+    elif args.demo:
         run_cli_demo()
     elif args.solve:
         # Create a simple args object with the puzzle
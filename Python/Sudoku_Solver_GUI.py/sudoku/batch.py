@@ -0,0 +1,143 @@
+from __future__ import annotations
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+from multiprocessing import Pool
+import csv
+import os
+import time
+from .board import Board
+from .solver import SolveStats, find_solutions, solve_flat
+
+CSV_FIELDS = ["index", "puzzle", "solution", "solutions", "nodes", "propagations", "ms", "error"]
+
+class PuzzleResult(NamedTuple):
+    index: int
+    puzzle: str
+    solution: str        # 81 digits, empty when unsolved
+    solutions: int       # 0, 1, or 2 (= "two or more") with uniqueness checking
+    nodes: int
+    propagations: int
+    ms: float
+    error: str = ""
+
+class BatchSummary:
+    def __init__(self):
+        self.puzzles = 0
+        self.solved = 0
+        self.unsolvable = 0
+        self.multiple = 0
+        self.invalid = 0
+        self.nodes = 0
+        self.solve_ms = 0.0
+        self.start = time.perf_counter()
+        self.end = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def puzzles_per_second(self) -> float:
+        return self.puzzles / self.elapsed if self.elapsed else 0.0
+
+    def add(self, result: PuzzleResult):
+        self.puzzles += 1
+        self.nodes += result.nodes
+        self.solve_ms += result.ms
+        if result.error:
+            self.invalid += 1
+        elif not result.solutions:
+            self.unsolvable += 1
+        else:
+            self.solved += 1
+            if result.solutions > 1:
+                self.multiple += 1
+
+def iter_puzzle_lines(paths: Iterable[str]) -> Iterator[str]:
+    """Stream puzzle lines from files, skipping blank lines and '#' comments."""
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                stripped = line.strip()
+                if stripped and not stripped.startswith("#"):
+                    yield stripped
+
+def solve_line(task: Tuple[int, str, bool, str]) -> PuzzleResult:
+    """Worker: solve one puzzle line. Kept at module level so it pickles."""
+    index, line, check_unique, method = task
+    try:
+        puzzle = Board.parse_flat_string(line)
+    except ValueError as e:
+        return PuzzleResult(index, line[:81], "", 0, 0, 0, 0.0, str(e))
+
+    flat = [int(ch) for ch in puzzle]
+    stats = SolveStats()
+    if check_unique:
+        found = find_solutions(flat, 2, stats)
+        solution = found[0] if found else None
+        count = len(found)
+    else:
+        solution = solve_flat(flat, stats, method)
+        count = 1 if solution else 0
+    return PuzzleResult(
+        index, puzzle,
+        "".join(map(str, solution)) if solution else "",
+        count, stats.nodes, stats.propagations, stats.elapsed * 1000,
+    )
+
+def solve_batch(lines: Iterable[str], workers: Optional[int] = None, chunksize: int = 256,
+                check_unique: bool = False, method: str = "bitmask") -> Iterator[PuzzleResult]:
+    """Solve a stream of puzzle lines across a process pool, yielding results in input order.
+
+    Lines are dispatched lazily in chunks of ``chunksize`` so arbitrarily large
+    files never sit in memory. ``workers=1`` solves in-process. Uniqueness
+    checking counts solutions with the bitmask search, so it cannot be
+    combined with another ``method``.
+    """
+    if check_unique and method != "bitmask":
+        raise ValueError(f"Uniqueness checking is only supported by the bitmask method, not {method!r}")
+    tasks = ((i, line, check_unique, method) for i, line in enumerate(lines))
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        yield from map(solve_line, tasks)
+        return
+    with Pool(workers) as pool:
+        yield from pool.imap(solve_line, tasks, chunksize=chunksize)
+
+def write_results(results: Iterable[PuzzleResult], out: TextIO, fmt: str = "csv",
+                  summary: Optional[BatchSummary] = None) -> BatchSummary:
+    """Write results as they arrive: CSV rows, or bare solution lines with ``fmt="txt"``."""
+    summary = summary or BatchSummary()
+    writer = None
+    if fmt == "csv":
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(CSV_FIELDS)
+    for result in results:
+        summary.add(result)
+        if writer is not None:
+            writer.writerow(result[:6] + (f"{result.ms:.3f}", result.error))
+        else:
+            out.write((result.solution or "-" * 81) + "\n")
+    summary.end = time.perf_counter()
+    return summary
+
+def run_benchmark(paths: Sequence[str], worker_counts: Sequence[int], chunksize: int = 16,
+                  check_unique: bool = False, method: str = "bitmask",
+                  repeat: int = 1) -> List[dict]:
+    """Measure puzzles/second on a corpus for each worker count."""
+    lines = list(iter_puzzle_lines(paths)) * repeat
+    rows = []
+    for workers in worker_counts:
+        summary = BatchSummary()
+        for result in solve_batch(lines, workers, chunksize, check_unique, method):
+            summary.add(result)
+        summary.end = time.perf_counter()
+        rows.append({
+            "workers": workers,
+            "puzzles": summary.puzzles,
+            "solved": summary.solved,
+            "seconds": summary.elapsed,
+            "puzzles_per_second": summary.puzzles_per_second,
+            "mean_ms": summary.solve_ms / summary.puzzles if summary.puzzles else 0.0,
+            "mean_nodes": summary.nodes / summary.puzzles if summary.puzzles else 0.0,
+        })
+    return rows
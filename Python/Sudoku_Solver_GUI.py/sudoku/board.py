@@ -1,6 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, Iterable
+from typing import List, Tuple, Optional, Iterable, Set
 
 Grid = List[List[int]]
 
@@ -22,11 +22,35 @@ class Board:
             raise ValueError("Expected 9 lines of 9 digits.")
         return Board(rows)
 
+    @staticmethod
+    def parse_flat_string(s: str) -> str:
+        """Normalize a flat puzzle to 81 digits, '0' for empty.
+
+        '.' is accepted for empty cells and other separators between cells
+        are skipped. Reading stops after the 81st cell, so ratings or
+        comments that follow the grid (as in most puzzle corpora) are ignored.
+        """
+        cells = []
+        for ch in s.strip():
+            if len(cells) == 81:
+                if ch in "0123456789.":
+                    raise ValueError("Flat puzzle has more than 81 cells.")
+                break
+            if ch in "0123456789":
+                cells.append(ch)
+            elif ch == ".":
+                cells.append("0")
+            elif ch == "#":
+                break
+            elif ch.isdigit():
+                raise ValueError(f"Unexpected digit {ch!r}; use 0-9 or '.'.")
+        if len(cells) != 81:
+            raise ValueError("Flat puzzle must be 81 digits (0 or '.' for empty).")
+        return "".join(cells)
+
     @staticmethod
     def from_flat_string(s: str) -> "Board":
-        s = ''.join(ch for ch in s.strip() if ch.isdigit())
-        if len(s) != 81:
-            raise ValueError("Flat puzzle must be 81 digits (0 for empty).")
+        s = Board.parse_flat_string(s)
         rows = [[int(s[r*9 + c]) for c in range(9)] for r in range(9)]
         return Board(rows)
 
@@ -116,4 +140,76 @@ class Board:
                 v = self.grid[r][c]
                 row.append(str(v) if v != 0 else ".")
             lines.append(" ".join(row))
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
+
+Cell = Tuple[int, int]
+
+def _peers(r: int, c: int) -> Tuple[Cell, ...]:
+    br, bc = (r // 3) * 3, (c // 3) * 3
+    cells = {(r, j) for j in range(9)} | {(i, c) for i in range(9)}
+    cells |= {(i, j) for i in range(br, br + 3) for j in range(bc, bc + 3)}
+    cells.discard((r, c))
+    return tuple(sorted(cells))
+
+PEERS = [[_peers(r, c) for c in range(9)] for r in range(9)]
+
+class ConflictTracker:
+    """Per-row, column and box digit counts, updated one edit at a time.
+
+    A filled cell is in conflict when its digit appears more than once in its
+    row, column or box. ``set`` adjusts three counters and rechecks only the
+    cell's 20 peers, so each edit costs the same however full the grid is.
+    """
+
+    def __init__(self):
+        self.grid: Grid = [[0] * 9 for _ in range(9)]
+        self.rows = [[0] * 10 for _ in range(9)]
+        self.cols = [[0] * 10 for _ in range(9)]
+        self.boxes = [[0] * 10 for _ in range(9)]
+        self.conflicts: Set[Cell] = set()
+
+    def is_conflict(self, r: int, c: int) -> bool:
+        v = self.grid[r][c]
+        return v != 0 and (self.rows[r][v] > 1 or self.cols[c][v] > 1 or
+                           self.boxes[(r // 3) * 3 + c // 3][v] > 1)
+
+    def set(self, r: int, c: int, v: int) -> Set[Cell]:
+        """Put ``v`` (0 to clear) at (r, c); returns the cells whose conflict state changed."""
+        old = self.grid[r][c]
+        if old == v:
+            return set()
+        b = (r // 3) * 3 + c // 3
+        if old:
+            self.rows[r][old] -= 1
+            self.cols[c][old] -= 1
+            self.boxes[b][old] -= 1
+        if v:
+            self.rows[r][v] += 1
+            self.cols[c][v] += 1
+            self.boxes[b][v] += 1
+        self.grid[r][c] = v
+
+        changed = set()
+        for cell in ((r, c),) + PEERS[r][c]:
+            if cell != (r, c) and self.grid[cell[0]][cell[1]] not in (old, v):
+                continue
+            if self.is_conflict(*cell):
+                if cell not in self.conflicts:
+                    self.conflicts.add(cell)
+                    changed.add(cell)
+            elif cell in self.conflicts:
+                self.conflicts.discard(cell)
+                changed.add(cell)
+        return changed
+
+    def load(self, board: Board) -> Set[Cell]:
+        """Apply every cell of ``board``; returns the cells whose conflict state changed."""
+        changed = set()
+        for r in range(9):
+            for c in range(9):
+                changed ^= self.set(r, c, board.grid[r][c])
+        return changed
+
+    @property
+    def valid(self) -> bool:
+        return not self.conflicts
\ No newline at end of file
@@ -1,6 +1,9 @@
 from __future__ import annotations
 from .board import Board
 from .solver import solve, SolveStats
+from .batch import iter_puzzle_lines, solve_batch, write_results, run_benchmark
+from .generator import generate_many
+import time
 import sys
 import os
 
@@ -43,10 +46,64 @@ def run_cli(args) -> None:
         print(solved)
         print(f"\n" + "="*50)
         print(f"Nodes explored: {stats.nodes}")
+        print(f"Propagations: {stats.propagations}")
         print(f"Time elapsed: {stats.elapsed:.4f} seconds")
         print("="*50)
         sys.exit(0)
 
+def run_batch_cli(args) -> None:
+    """Solve every puzzle in one or more one-per-line files across worker processes."""
+    for path in args.batch:
+        if not os.path.exists(path):
+            print(f"❌ File '{path}' not found.", file=sys.stderr)
+            sys.exit(1)
+
+    results = solve_batch(iter_puzzle_lines(args.batch), args.workers, args.chunksize,
+                          args.unique, args.method)
+    out = open(args.out, "w", encoding="utf-8", newline="") if args.out else sys.stdout
+    try:
+        summary = write_results(results, out, args.format)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print("\n" + "="*50, file=sys.stderr)
+    print(f"Puzzles: {summary.puzzles}  Solved: {summary.solved}  "
+          f"Unsolvable: {summary.unsolvable}  Invalid: {summary.invalid}", file=sys.stderr)
+    if args.unique:
+        print(f"Multiple solutions: {summary.multiple}", file=sys.stderr)
+    print(f"Nodes explored: {summary.nodes}", file=sys.stderr)
+    print(f"Time elapsed: {summary.elapsed:.4f} seconds "
+          f"({summary.puzzles_per_second:.1f} puzzles/s)", file=sys.stderr)
+    print("="*50, file=sys.stderr)
+    sys.exit(1 if summary.invalid or summary.unsolvable else 0)
+
+def run_benchmark_cli(args) -> None:
+    """Report solving throughput on a puzzle corpus for 1 and N workers."""
+    workers = args.workers or os.cpu_count() or 1
+    counts = [1] if workers == 1 else [1, workers]
+    print("\n" + "="*50)
+    print(f"Benchmark: {', '.join(args.benchmark)} (x{args.repeat}, method={args.method})")
+    print("="*50)
+    for row in run_benchmark(args.benchmark, counts, args.chunksize, args.unique,
+                             args.method, args.repeat):
+        print(f"{row['workers']:>3} worker(s): {row['puzzles']} puzzles in {row['seconds']:.3f}s  "
+              f"{row['puzzles_per_second']:.1f} puzzles/s  "
+              f"mean {row['mean_ms']:.2f} ms, {row['mean_nodes']:.1f} nodes")
+
+def run_generate_cli(args) -> None:
+    """Generate puzzles of one difficulty, one 81-character puzzle per line."""
+    start = time.perf_counter()
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for puzzle in generate_many(args.generate, args.count, args.workers):
+            out.write(puzzle.puzzle + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"Generated {args.count} {args.generate} puzzles in {elapsed:.2f} seconds", file=sys.stderr)
+
 def _load_board(args) -> Board:
     # If arguments were provided via command line
     if getattr(args, "puzzle", None):
@@ -146,5 +203,6 @@ def run_cli_demo():
         print(solved)
         print(f"\n" + "="*50)
         print(f"Nodes explored: {stats.nodes}")
+        print(f"Propagations: {stats.propagations}")
         print(f"Time elapsed: {stats.elapsed:.4f} seconds")
         print("="*50)
\ No newline at end of file
@@ -0,0 +1,217 @@
+from __future__ import annotations
+from collections import deque
+from multiprocessing import Pool
+from typing import Deque, Dict, Iterator, List, NamedTuple, Optional
+import os
+import random
+import threading
+from .board import Board
+from .solver import SolveStats, _BitState, find_solutions, solve_flat
+
+# Ordered easiest first. Clue targets stop carving early for the easier levels.
+DIFFICULTIES = ["Easy", "Medium", "Hard", "Expert"]
+CLUE_TARGETS = {"Easy": 36, "Medium": 30, "Hard": 26, "Expert": 24}
+# A puzzle that needs guessing is Expert once the search exceeds this many nodes
+HARD_MAX_NODES = 3
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".sudoku_solver", "pools")
+
+class Puzzle(NamedTuple):
+    puzzle: str      # 81 digits, 0 for empty
+    solution: str
+    difficulty: str
+    clues: int
+
+    def board(self) -> Board:
+        return Board.from_flat_string(self.puzzle)
+
+def grade(flat: List[int]) -> str:
+    """Grade a uniquely solvable puzzle by the techniques needed to solve it.
+
+    Easy: naked singles alone. Medium: naked plus hidden singles.
+    Hard: a little guessing on top of singles. Expert: deeper search.
+    """
+    state = _BitState(flat)
+    if not state.ok:
+        raise ValueError("Puzzle has conflicting givens.")
+    stats = SolveStats()
+
+    # Naked singles only, until stuck
+    changed = True
+    while changed:
+        changed = False
+        for i in range(81):
+            m = state.cand[i]
+            if not state.grid[i] and m and not m & (m - 1):
+                state.place(i, m)
+                changed = True
+    if all(state.grid):
+        return "Easy"
+
+    if not state.propagate(stats):
+        raise ValueError("Puzzle has no solution.")
+    if all(state.grid):
+        return "Medium"
+
+    state.search(stats)
+    return "Hard" if stats.nodes <= HARD_MAX_NODES else "Expert"
+
+def random_solution(rng: random.Random) -> List[int]:
+    """A random complete grid.
+
+    The three diagonal boxes are independent, so they are filled with random
+    permutations and the bitmask solver completes the rest; a random
+    relabelling, band/stack shuffle and transpose then spread the result
+    over the space of grids.
+    """
+    flat = [0] * 81
+    for b in (0, 4, 8):
+        digits = rng.sample(range(1, 10), 9)
+        for k in range(9):
+            flat[(b // 3) * 27 + (b % 3) * 3 + (k // 3) * 9 + k % 3] = digits[k]
+    grid = solve_flat(flat)
+
+    relabel = [0] + rng.sample(range(1, 10), 9)
+    bands = rng.sample(range(3), 3)
+    stacks = rng.sample(range(3), 3)
+    rows = [b * 3 + r for b in bands for r in rng.sample(range(3), 3)]
+    cols = [s * 3 + c for s in stacks for c in rng.sample(range(3), 3)]
+    if rng.random() < 0.5:
+        return [relabel[grid[cols[c] * 9 + rows[r]]] for r in range(9) for c in range(9)]
+    return [relabel[grid[rows[r] * 9 + cols[c]]] for r in range(9) for c in range(9)]
+
+def carve(solution: List[int], difficulty: str, rng: random.Random) -> Optional[Puzzle]:
+    """Remove clues while the solution stays unique and the grade stays in range.
+
+    Clues go in symmetric pairs first; if that stalls below the target
+    grade, single cells are tried too. Returns a puzzle of exactly
+    ``difficulty`` or None if this grid could not be carved to that level
+    (the caller retries with a new grid).
+    """
+    target = DIFFICULTIES.index(difficulty)
+    min_clues = CLUE_TARGETS[difficulty]
+    puzzle = solution[:]
+    clues = 81
+    level = 0
+
+    pairs = [(i, 80 - i) if i != 40 else (i,) for i in range(41)]
+    singles = [(i,) for i in range(81)]
+    rng.shuffle(pairs)
+    rng.shuffle(singles)
+    for pair in pairs + singles:
+        if clues <= min_clues and level == target:
+            break
+        if not puzzle[pair[0]]:
+            continue
+        saved = [puzzle[j] for j in pair]
+        for j in pair:
+            puzzle[j] = 0
+        if len(find_solutions(puzzle, 2)) == 1:
+            new_level = DIFFICULTIES.index(grade(puzzle))
+            if new_level <= target:
+                clues -= len(pair)
+                level = new_level
+                continue
+        for j, v in zip(pair, saved):
+            puzzle[j] = v
+
+    if level != target:
+        return None
+    return Puzzle("".join(map(str, puzzle)), "".join(map(str, solution)), difficulty, clues)
+
+def generate(difficulty: str = "Medium", seed: Optional[int] = None,
+             max_attempts: int = 200) -> Puzzle:
+    """Generate one puzzle with a unique solution at the given difficulty."""
+    if difficulty not in CLUE_TARGETS:
+        raise ValueError(f"Unknown difficulty: {difficulty}")
+    rng = random.Random(seed)
+    for _ in range(max_attempts):
+        puzzle = carve(random_solution(rng), difficulty, rng)
+        if puzzle is not None:
+            return puzzle
+    raise RuntimeError(f"Could not generate a {difficulty} puzzle in {max_attempts} attempts.")
+
+def _generate_task(task) -> Puzzle:
+    difficulty, seed = task
+    return generate(difficulty, seed)
+
+def generate_many(difficulty: str, count: int, workers: Optional[int] = None,
+                  seed: Optional[int] = None) -> Iterator[Puzzle]:
+    """Generate ``count`` puzzles across a process pool, yielding them as they finish."""
+    rng = random.Random(seed)
+    tasks = [(difficulty, rng.getrandbits(64)) for _ in range(count)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or count == 1:
+        yield from map(_generate_task, tasks)
+        return
+    with Pool(min(workers, count)) as pool:
+        yield from pool.imap_unordered(_generate_task, tasks)
+
+class PuzzlePool:
+    """Pre-generated puzzles per difficulty, cached on disk between runs.
+
+    Each difficulty is a text file of ``puzzle solution`` lines. ``take``
+    serves from memory and falls back to generating on the spot when a pool
+    runs dry; ``refill`` tops a pool up and is safe to run from a thread.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, size: int = 20):
+        self.cache_dir = cache_dir
+        self.size = size
+        self._pools: Dict[str, Deque[Puzzle]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, difficulty: str) -> str:
+        return os.path.join(self.cache_dir, f"{difficulty.lower()}.txt")
+
+    def _pool(self, difficulty: str) -> Deque[Puzzle]:
+        if difficulty not in self._pools:
+            pool: Deque[Puzzle] = deque()
+            try:
+                with open(self._path(difficulty), "r", encoding="utf-8") as f:
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) == 2 and len(parts[0]) == len(parts[1]) == 81:
+                            pool.append(Puzzle(parts[0], parts[1], difficulty,
+                                               81 - parts[0].count("0")))
+            except OSError:
+                pass
+            self._pools[difficulty] = pool
+        return self._pools[difficulty]
+
+    def _save(self, difficulty: str):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(difficulty), "w", encoding="utf-8") as f:
+                for p in self._pools[difficulty]:
+                    f.write(f"{p.puzzle} {p.solution}\n")
+        except OSError:
+            pass  # The cache is an optimization; generation still works without it
+
+    def available(self, difficulty: str) -> int:
+        with self._lock:
+            return len(self._pool(difficulty))
+
+    def take(self, difficulty: str) -> Puzzle:
+        """Return a fresh puzzle, generating one if the pool is empty."""
+        with self._lock:
+            pool = self._pool(difficulty)
+            if pool:
+                puzzle = pool.popleft()
+                self._save(difficulty)
+                return puzzle
+        return generate(difficulty)
+
+    def refill(self, difficulty: str, workers: Optional[int] = None) -> int:
+        """Top the pool up to ``size`` puzzles; returns how many were added."""
+        missing = self.size - self.available(difficulty)
+        if missing <= 0:
+            return 0
+        added = 0
+        for puzzle in generate_many(difficulty, missing, workers):
+            with self._lock:
+                self._pool(difficulty).append(puzzle)
+            added += 1
+        with self._lock:
+            self._save(difficulty)
+        return added
@@ -1,9 +1,12 @@
 from __future__ import annotations
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional
-from .board import Board
-from .solver import solve, SolveStats
+from typing import Optional, Set
+import queue
+import threading
+from .board import Board, ConflictTracker
+from .solver import SolveCancelled, SolveStats, solve_flat
+from .generator import DIFFICULTIES, PuzzlePool
 
 CELL_W = 2
 FONT = ("Segoe UI", 14, "bold")
@@ -24,13 +27,11 @@ BTN_TEXT = "#ffffff"
 STATUS_BG = "#e9ecef"
 STATUS_TEXT = "#495057"
 
-# Example puzzles for different difficulty levels
-EXAMPLE_PUZZLES = {
-    "Easy": "530070000600195000098000060800060003400803001700020006060000280000419005000080079",
-    "Medium": "000000907000420180000705026100904000050000040000507009920108000034059000507000000",
-    "Hard": "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
-    "Expert": "100000000000000000000000000000000000000000000000000000000000000000000000000000000"
-}
+# Background solving: how often the window checks on the worker, and how many
+# traced steps may wait for the visualizer before the solver is held back
+POLL_MS = 40
+TRACE_BUFFER = 5000
+DEFAULT_STEPS_PER_SECOND = 200
 
 def run_gui():
     app = SudokuApp()
@@ -55,7 +56,17 @@ class SudokuApp(tk.Tk):
         self.title("Sudoku Solver")
         self.configure(bg=BG_COLOR)
         self.resizable(False, False)
+        self.puzzle_pool = PuzzlePool()
+        self._refilling: Set[str] = set()
+        self.tracker = ConflictTracker()
+        self._solver: Optional[threading.Thread] = None
+        self._solve_stats: Optional[SolveStats] = None
+        self._solve_outcome = None
+        self._trace: "queue.Queue" = queue.Queue(maxsize=TRACE_BUFFER)
+        self._step_budget = 0.0
+        self._puzzle_before_solve: Optional[Board] = None
         self._build_ui()
+        self._refill_pool(self.difficulty_var.get())
 
     def _build_ui(self):
         # Main frame
@@ -76,13 +87,13 @@ class SudokuApp(tk.Tk):
         
         self.difficulty_var = tk.StringVar(value="Easy")
         difficulty_combo = ttk.Combobox(diff_frame, textvariable=self.difficulty_var, 
-                                       values=list(EXAMPLE_PUZZLES.keys()), 
+                                       values=DIFFICULTIES, 
                                        state="readonly", width=10)
         difficulty_combo.pack(side=tk.LEFT, padx=(0, 10))
         difficulty_combo.bind("<<ComboboxSelected>>", self.on_difficulty_change)
         
-        # Load example button
-        load_example_btn = HoverButton(diff_frame, text="Load Example", command=self.on_load_example,
+        # New puzzle button
+        load_example_btn = HoverButton(diff_frame, text="New Puzzle", command=self.on_load_example,
                                       font=BTN_FONT, bg="#28a745", fg=BTN_TEXT, relief="flat", 
                                       padx=10, pady=4, cursor="hand2")
         load_example_btn.pack(side=tk.LEFT)
@@ -92,6 +103,7 @@ class SudokuApp(tk.Tk):
         grid_frame.grid(row=2, column=0, pady=(0, 15))
         
         self.entries = [[None for _ in range(9)] for _ in range(9)]
+        self.cell_vars = [[tk.StringVar() for _ in range(9)] for _ in range(9)]
         vcmd = (self.register(self._validate_digit), "%P")
 
         for r in range(9):
@@ -99,13 +111,14 @@ class SudokuApp(tk.Tk):
                 # Alternate cell background for visual grouping
                 cell_bg = CELL_BG_ALT if (r // 3 + c // 3) % 2 == 0 else CELL_BG
                 e = tk.Entry(grid_frame, width=CELL_W, justify="center", 
-                            validate="key", validatecommand=vcmd, font=FONT,
+                            textvariable=self.cell_vars[r][c], validate="key", validatecommand=vcmd, font=FONT,
                             bg=cell_bg, relief="solid", borderwidth=1,
                             highlightthickness=1, highlightcolor="#3498db")
                 padx = (4, 6) if c % 3 == 2 and c != 8 else (4, 2)
                 pady = (4, 6) if r % 3 == 2 and r != 8 else (4, 2)
                 e.grid(row=r, column=c, padx=padx, pady=pady, ipady=5)
                 self.entries[r][c] = e
+                self.cell_vars[r][c].trace_add("write", lambda *_, r=r, c=c: self._on_cell_change(r, c))
 
         # Button frame
         btn_frame = tk.Frame(main_frame, bg=BG_COLOR, pady=10)
@@ -113,6 +126,7 @@ class SudokuApp(tk.Tk):
         
         buttons = [
             ("Solve", self.on_solve),
+            ("Stop", self.on_stop),
             ("Check", self.on_check),
             ("Clear", self.on_clear),
             ("Load", self.on_load),
@@ -125,9 +139,21 @@ class SudokuApp(tk.Tk):
                             cursor="hand2")
             btn.pack(side=tk.LEFT, padx=5)
 
+        # Step-through visualizer
+        viz_frame = tk.Frame(main_frame, bg=BG_COLOR)
+        viz_frame.grid(row=4, column=0, sticky="ew")
+        self.visualize_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(viz_frame, text="Step through solve", variable=self.visualize_var,
+                       font=("Segoe UI", 10), bg=BG_COLOR, activebackground=BG_COLOR).pack(side=tk.LEFT)
+        tk.Label(viz_frame, text="Steps/s:", font=("Segoe UI", 10),
+                 bg=BG_COLOR).pack(side=tk.LEFT, padx=(10, 5))
+        self.speed_var = tk.IntVar(value=DEFAULT_STEPS_PER_SECOND)
+        tk.Scale(viz_frame, from_=1, to=5000, orient=tk.HORIZONTAL, variable=self.speed_var,
+                 length=180, showvalue=True, bg=BG_COLOR, highlightthickness=0).pack(side=tk.LEFT)
+
         # Status bar
         status_frame = tk.Frame(main_frame, bg=STATUS_BG, height=22)
-        status_frame.grid(row=4, column=0, sticky="ew", pady=(10, 0))
+        status_frame.grid(row=5, column=0, sticky="ew", pady=(10, 0))
         status_frame.grid_propagate(False)
         
         self.status = tk.StringVar(value="Ready. Enter a puzzle or load from file.")
@@ -136,6 +162,7 @@ class SudokuApp(tk.Tk):
         status_label.pack(fill=tk.X)
 
     def _validate_digit(self, P: str) -> bool:
+        if self._solving(): return False  # The solver owns the grid until it finishes
         if P == "": return True
         if len(P) > 1: return False
         return P in "123456789"
@@ -144,66 +171,153 @@ class SudokuApp(tk.Tk):
         """When difficulty level is changed"""
         difficulty = self.difficulty_var.get()
         self.status.set(f"Selected difficulty: {difficulty}")
+        self._refill_pool(difficulty)
 
     def on_load_example(self):
-        """Load an example puzzle based on selected difficulty"""
+        """Load a freshly generated puzzle of the selected difficulty"""
+        if self._solving():
+            self.status.set("Stop the solver first.")
+            return
         difficulty = self.difficulty_var.get()
-        if difficulty in EXAMPLE_PUZZLES:
-            puzzle = EXAMPLE_PUZZLES[difficulty]
-            board = Board.from_flat_string(puzzle)
-            self._write_board(board)
-            self._highlight_conflicts(board)
-            self.status.set(f"Loaded {difficulty} example puzzle.")
-        else:
+        if difficulty not in DIFFICULTIES:
             messagebox.showerror("Error", "Invalid difficulty level selected.")
+            return
+        if not self.puzzle_pool.available(difficulty):
+            self.status.set(f"Generating {difficulty} puzzle...")
+            self.update()
+        puzzle = self.puzzle_pool.take(difficulty)
+        self._write_board(puzzle.board())
+        self.status.set(f"New {difficulty} puzzle ({puzzle.clues} clues).")
+        self._refill_pool(difficulty)
+
+    def _refill_pool(self, difficulty: str):
+        """Top up the on-disk pool for a difficulty in a background thread."""
+        if difficulty in self._refilling:
+            return
+        self._refilling.add(difficulty)
+
+        def work():
+            try:
+                self.puzzle_pool.refill(difficulty)
+            except Exception:
+                pass  # take() still generates on demand
+            finally:
+                self._refilling.discard(difficulty)
+
+        threading.Thread(target=work, daemon=True).start()
 
     def on_clear(self):
-        for r in range(9):
-            for c in range(9):
-                self.entries[r][c].delete(0, tk.END)
-                # Reset to original background
-                cell_bg = CELL_BG_ALT if (r // 3 + c // 3) % 2 == 0 else CELL_BG
-                self.entries[r][c].config(bg=cell_bg)
+        if self._solving():
+            self.status.set("Stop the solver first.")
+            return
+        self._write_board(Board([[0] * 9 for _ in range(9)]))
+        self._highlight_conflicts()
         self.status.set("Cleared. Ready for new puzzle.")
 
     def on_check(self):
-        try:
-            board = self._read_board()
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-            return
-        
-        self._highlight_conflicts(board)
-        if board.is_valid():
+        # Conflicts are tracked on every edit, so checking is just a lookup
+        self._highlight_conflicts()
+        if self.tracker.valid:
             self.status.set("✓ Board is valid so far.")
         else:
-            self.status.set("✗ Conflicts found in the puzzle.")
+            self.status.set(f"✗ {len(self.tracker.conflicts)} conflicting cells in the puzzle.")
 
     def on_solve(self):
-        try:
-            board = self._read_board()
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+        if self._solving():
+            self.status.set("Already solving. Press Stop to cancel.")
             return
-
-        if not board.is_valid():
+        if not self.tracker.valid:
             messagebox.showerror("Invalid Puzzle", "Board has conflicts. Please fix them first.")
             return
 
-        self.status.set("Solving...")
-        self.update()
-        
+        board = self._read_board()
+        self._puzzle_before_solve = board.clone()
+        flat = [v for row in board.grid for v in row]
         stats = SolveStats()
-        res = solve(board, stats)
-        
-        if res is None:
-            messagebox.showinfo("No Solution", "No solution found for this puzzle.")
-            self.status.set("No solution found.")
+        visualize = self.visualize_var.get()
+        self._solve_stats = stats
+        self._solve_outcome = None
+        self._step_budget = 0.0
+
+        def emit(cell: int, digit: int):
+            # Wait for the visualizer to catch up, but give up promptly on Stop
+            while True:
+                try:
+                    self._trace.put((cell, digit), timeout=0.1)
+                    return
+                except queue.Full:
+                    if stats.cancelled:
+                        raise SolveCancelled()
+
+        def work():
+            try:
+                solution = solve_flat(flat, stats, trace=emit if visualize else None)
+                self._solve_outcome = ("solved", solution)
+            except SolveCancelled:
+                self._solve_outcome = ("cancelled", None)
+            except Exception as e:
+                self._solve_outcome = ("error", str(e))
+
+        self._solver = threading.Thread(target=work, daemon=True)
+        self._solver.start()
+        self.status.set("Solving...")
+        self.after(POLL_MS, self._poll_solve)
+
+    def on_stop(self):
+        if not self._solving():
+            self.status.set("Nothing to stop.")
+            return
+        self._solve_stats.cancel()
+        self.status.set("Stopping...")
+
+    def _solving(self) -> bool:
+        return self._solver is not None
+
+    def _poll_solve(self):
+        """Show progress, replay traced steps at the chosen rate, and finish when the worker is done."""
+        stats = self._solve_stats
+        # Traced steps (only queued when stepping through) are shown at the chosen rate
+        self._step_budget += self.speed_var.get() * POLL_MS / 1000
+        while self._step_budget >= 1 and not stats.cancelled:
+            try:
+                cell, digit = self._trace.get_nowait()
+            except queue.Empty:
+                self._step_budget = min(self._step_budget, 1.0)
+                break
+            self.cell_vars[cell // 9][cell % 9].set(str(digit) if digit else "")
+            self._step_budget -= 1
+
+        if self._solver.is_alive() or (not self._trace.empty() and not stats.cancelled):
+            if not stats.cancelled:
+                self.status.set(f"Solving... {stats.elapsed:.1f}s, Nodes: {stats.nodes:,}, "
+                                f"Propagations: {stats.propagations:,}")
+            self.after(POLL_MS, self._poll_solve)
             return
+        self._finish_solve()
 
-        self._write_board(res)
-        self._highlight_conflicts(res, solved=True)
-        self.status.set(f"Solved! Time: {stats.elapsed:.3f}s, Nodes: {stats.nodes}")
+    def _finish_solve(self):
+        stats = self._solve_stats
+        outcome, result = self._solve_outcome or ("error", "Solver stopped unexpectedly.")
+        self._solver = None
+        while not self._trace.empty():
+            self._trace.get_nowait()
+
+        if outcome == "cancelled":
+            self._write_board(self._puzzle_before_solve)
+            self.status.set(f"Solve stopped after {stats.elapsed:.1f}s, Nodes: {stats.nodes:,}.")
+        elif outcome == "error":
+            self._write_board(self._puzzle_before_solve)
+            messagebox.showerror("Error", result)
+            self.status.set("Solve failed.")
+        elif result is None:
+            self._write_board(self._puzzle_before_solve)
+            messagebox.showinfo("No Solution", "No solution found for this puzzle.")
+            self.status.set("No solution found.")
+        else:
+            self._write_board(Board([result[r * 9:(r + 1) * 9] for r in range(9)]))
+            self._highlight_conflicts(solved=True)
+            self.status.set(f"Solved! Time: {stats.elapsed:.3f}s, Nodes: {stats.nodes}, "
+                            f"Propagations: {stats.propagations}")
 
     def on_load(self):
         path = filedialog.askopenfilename(
@@ -212,11 +326,13 @@ class SudokuApp(tk.Tk):
         )
         if not path:
             return
+        if self._solving():
+            self.status.set("Stop the solver first.")
+            return
         try:
             with open(path, "r", encoding="utf-8") as f:
                 board = Board.from_lines(f.readlines())
             self._write_board(board)
-            self._highlight_conflicts(board)
             self.status.set(f"Loaded: {path.split('/')[-1]}")
         except Exception as e:
             messagebox.showerror("Load Error", f"Failed to load puzzle: {str(e)}")
@@ -247,11 +363,8 @@ class SudokuApp(tk.Tk):
     def _write_board(self, board: Board):
         for r in range(9):
             for c in range(9):
-                e = self.entries[r][c]
-                e.delete(0, tk.END)
                 v = board.grid[r][c]
-                if v != 0:
-                    e.insert(0, str(v))
+                self.cell_vars[r][c].set(str(v) if v != 0 else "")
 
     def _cell_value_str(self, r: int, c: int) -> str:
         v = self.entries[r][c].get().strip()
@@ -261,28 +374,25 @@ class SudokuApp(tk.Tk):
         if d < 0 or d > 9: return "0"
         return str(d)
 
-    def _highlight_conflicts(self, board: Board, solved: bool = False):
-        # Reset all cells to original background
-        for r in range(9):
-            for c in range(9):
-                cell_bg = CELL_BG_ALT if (r // 3 + c // 3) % 2 == 0 else CELL_BG
-                self.entries[r][c].config(bg=cell_bg)
+    def _on_cell_change(self, r: int, c: int):
+        """Update the conflict counters for one edited cell and repaint what changed."""
+        v = self.cell_vars[r][c].get().strip()
+        changed = self.tracker.set(r, c, int(v) if v.isdigit() else 0)
+        changed.add((r, c))
+        for cell in changed:
+            self._paint_cell(*cell)
 
-        # Highlight conflicts
+    def _paint_cell(self, r: int, c: int, solved: bool = False):
+        if (r, c) in self.tracker.conflicts:
+            bg = CONFLICT_COLOR
+        elif solved and self.tracker.grid[r][c] != 0:
+            bg = SOLVED_COLOR
+        else:
+            bg = CELL_BG_ALT if (r // 3 + c // 3) % 2 == 0 else CELL_BG
+        self.entries[r][c].config(bg=bg)
+
+    def _highlight_conflicts(self, solved: bool = False):
+        """Repaint every cell from the conflict counters (and mark a solved grid)."""
         for r in range(9):
             for c in range(9):
-                v = board.grid[r][c]
-                if v == 0:
-                    continue
-                board.grid[r][c] = 0
-                ok = board.is_valid_move(r, c, v)
-                board.grid[r][c] = v
-                if not ok:
-                    self.entries[r][c].config(bg=CONFLICT_COLOR)
-
-        # Highlight solved cells
-        if solved:
-            for r in range(9):
-                for c in range(9):
-                    if board.grid[r][c] != 0 and self.entries[r][c]['bg'] not in [CONFLICT_COLOR]:
-                        self.entries[r][c].config(bg=SOLVED_COLOR)
\ No newline at end of file
+                self._paint_cell(r, c, solved)
\ No newline at end of file
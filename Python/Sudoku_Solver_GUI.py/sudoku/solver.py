@@ -1,11 +1,40 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 import time
 from .board import Board
 
+# Digit d is stored as bit (d - 1); a cell's candidates are a 9-bit mask.
+ALL = 0x1FF
+BIT = [0] + [1 << (d - 1) for d in range(1, 10)]
+DIGIT = {1 << (d - 1): d for d in range(1, 10)}
+POPCOUNT = [bin(m).count("1") for m in range(ALL + 1)]
+
+ROW = [i // 9 for i in range(81)]
+COL = [i % 9 for i in range(81)]
+BOX = [(i // 27) * 3 + (i % 9) // 3 for i in range(81)]
+UNITS = (
+    [tuple(r * 9 + c for c in range(9)) for r in range(9)] +
+    [tuple(r * 9 + c for r in range(9)) for c in range(9)] +
+    [tuple((b // 3) * 27 + (b % 3) * 3 + (k // 3) * 9 + k % 3 for k in range(9)) for b in range(9)]
+)
+PEERS = [
+    tuple(sorted({j for j in range(81) if j != i and
+                  (ROW[j] == ROW[i] or COL[j] == COL[i] or BOX[j] == BOX[i])}))
+    for i in range(81)
+]
+
+class SolveCancelled(Exception):
+    """Raised inside a solve when ``SolveStats.cancel`` was called."""
+
 class SolveStats:
+    """Counters for one solve; another thread may read them or call ``cancel``."""
+
     def __init__(self):
+        self.cancelled = False
         self.nodes = 0
+        self.propagations = 0
+        self.naked_singles = 0
+        self.hidden_singles = 0
         self.start = time.perf_counter()
         self.end = None
 
@@ -13,48 +42,303 @@ class SolveStats:
     def elapsed(self) -> float:
         return (self.end or time.perf_counter()) - self.start
 
-def solve(board: Board, stats: Optional[SolveStats] = None) -> Optional[Board]:
-    """Solve the Sudoku using backtracking with MRV and forward-checking.
-    Returns a solved Board or None if unsolvable.
+    def cancel(self):
+        """Ask the running solve to stop at its next search node."""
+        self.cancelled = True
+
+class _BitState:
+    """Grid plus row/col/box masks and per-cell candidate masks with an undo trail."""
+
+    def __init__(self, grid: List[int]):
+        self.grid = [0] * 81
+        self.cand = [ALL] * 81
+        self.rows = [0] * 9
+        self.cols = [0] * 9
+        self.boxes = [0] * 9
+        self.trail: List[tuple] = []
+        self.ok = True
+        for i, v in enumerate(grid):
+            if v and not self.place(i, BIT[v]):
+                self.ok = False
+                return
+        self.trail.clear()
+
+    def place(self, i: int, bit: int) -> bool:
+        """Place a digit and strike it from every peer; False on an immediate conflict."""
+        if not self.cand[i] & bit:
+            return False
+        self.trail.append((i, bit, self.cand[i]))
+        self.grid[i] = DIGIT[bit]
+        self.cand[i] = 0
+        self.rows[ROW[i]] |= bit
+        self.cols[COL[i]] |= bit
+        self.boxes[BOX[i]] |= bit
+        cand, grid, trail = self.cand, self.grid, self.trail
+        ok = True
+        for j in PEERS[i]:
+            if cand[j] & bit:
+                cand[j] ^= bit
+                trail.append((j, bit))
+                if not cand[j] and not grid[j]:
+                    ok = False
+        return ok
+
+    def undo(self, mark: int):
+        """Roll back every change made after ``mark`` (a trail length)."""
+        trail, cand = self.trail, self.cand
+        while len(trail) > mark:
+            entry = trail.pop()
+            if len(entry) == 2:
+                cand[entry[0]] |= entry[1]
+            else:
+                i, bit, old = entry
+                self.grid[i] = 0
+                cand[i] = old
+                self.rows[ROW[i]] &= ~bit
+                self.cols[COL[i]] &= ~bit
+                self.boxes[BOX[i]] &= ~bit
+
+    def propagate(self, stats: SolveStats) -> bool:
+        """Apply naked and hidden singles until nothing changes; False on contradiction."""
+        grid, cand = self.grid, self.cand
+        changed = True
+        while changed:
+            changed = False
+            # Naked singles: an empty cell with one candidate
+            for i in range(81):
+                if grid[i]:
+                    continue
+                m = cand[i]
+                if not m:
+                    return False
+                if not m & (m - 1):
+                    if not self.place(i, m):
+                        return False
+                    stats.naked_singles += 1
+                    stats.propagations += 1
+                    changed = True
+            # Hidden singles: a digit with one possible cell in a unit
+            for unit in UNITS:
+                once = twice = placed = 0
+                for i in unit:
+                    if grid[i]:
+                        placed |= BIT[grid[i]]
+                    else:
+                        m = cand[i]
+                        twice |= once & m
+                        once |= m
+                if (once | placed) != ALL:
+                    return False  # Some digit has nowhere to go
+                single = once & ~twice & ~placed
+                while single:
+                    bit = single & -single
+                    single ^= bit
+                    for i in unit:
+                        if cand[i] & bit:
+                            if not self.place(i, bit):
+                                return False
+                            stats.hidden_singles += 1
+                            stats.propagations += 1
+                            changed = True
+                            break
+        return True
+
+    def mrv_cell(self) -> int:
+        """The empty cell with the fewest candidates, or -1 when the grid is full."""
+        best, best_count = -1, 10
+        for i in range(81):
+            if not self.grid[i]:
+                n = POPCOUNT[self.cand[i]]
+                if n < best_count:
+                    best, best_count = i, n
+                    if n == 2:
+                        break
+        return best
+
+    def search(self, stats: SolveStats) -> bool:
+        mark = len(self.trail)
+        if not self.propagate(stats):
+            self.undo(mark)
+            return False
+
+        best = self.mrv_cell()
+        if best < 0:
+            return True
+
+        m = self.cand[best]
+        while m:
+            bit = m & -m
+            m ^= bit
+            stats.nodes += 1
+            if stats.cancelled:
+                raise SolveCancelled()
+            branch = len(self.trail)
+            if self.place(best, bit) and self.search(stats):
+                return True
+            self.undo(branch)
+        self.undo(mark)
+        return False
+
+    def count(self, stats: SolveStats, limit: int, solutions: List[List[int]]):
+        """Collect up to ``limit`` solutions; the state is restored afterwards."""
+        mark = len(self.trail)
+        if self.propagate(stats):
+            best = self.mrv_cell()
+            if best < 0:
+                solutions.append(self.grid[:])
+            else:
+                m = self.cand[best]
+                while m and len(solutions) < limit:
+                    bit = m & -m
+                    m ^= bit
+                    stats.nodes += 1
+                    if stats.cancelled:
+                        raise SolveCancelled()
+                    branch = len(self.trail)
+                    if self.place(best, bit):
+                        self.count(stats, limit, solutions)
+                    self.undo(branch)
+        self.undo(mark)
+
+class _TracedState(_BitState):
+    """A _BitState that reports every digit placed (cell, digit) and cleared (cell, 0).
+
+    Kept separate so untraced solves pay nothing for the hook.
     """
+
+    def __init__(self, grid: List[int], trace: Callable[[int, int], None]):
+        self.trace = None  # Givens are not reported
+        super().__init__(grid)
+        self.trace = trace
+
+    def place(self, i: int, bit: int) -> bool:
+        ok = super().place(i, bit)
+        if self.trace and self.grid[i]:
+            self.trace(i, DIGIT[bit])
+        return ok
+
+    def undo(self, mark: int):
+        if self.trace:
+            for entry in reversed(self.trail[mark:]):
+                if len(entry) == 3:
+                    self.trace(entry[0], 0)
+        super().undo(mark)
+
+def find_solutions(flat: List[int], limit: int = 2,
+                   stats: Optional[SolveStats] = None) -> List[List[int]]:
+    """Return up to ``limit`` solutions of a flat 81-cell grid (0 for empty)."""
     stats = stats or SolveStats()
+    solutions: List[List[int]] = []
+    state = _BitState(flat)
+    if state.ok:
+        state.count(stats, limit, solutions)
+    stats.end = time.perf_counter()
+    return solutions
 
-    if not board.is_valid():
-        stats.end = time.perf_counter()
+def count_solutions(board: Board, limit: int = 2, stats: Optional[SolveStats] = None) -> int:
+    """Count solutions, stopping at ``limit``; 1 means the puzzle is unique."""
+    return len(find_solutions([v for row in board.grid for v in row], limit, stats))
+
+def solve(board: Board, stats: Optional[SolveStats] = None, method: str = "bitmask",
+          trace: Optional[Callable[[int, int], None]] = None) -> Optional[Board]:
+    """Solve the Sudoku and return the solved Board (filled in place) or None if unsolvable.
+
+    ``method="bitmask"`` (default) does backtracking with MRV on bitmask
+    candidates, propagating naked and hidden singles at every node.
+    ``method="dlx"`` solves it as an exact-cover problem with Algorithm X.
+
+    ``trace(cell, digit)`` is called for every placement the bitmask search
+    makes and ``trace(cell, 0)`` when it backtracks, with cells numbered
+    0-80 row by row. Raises SolveCancelled if ``stats.cancel()`` is called.
+    """
+    solution = solve_flat([v for row in board.grid for v in row], stats, method, trace)
+    if solution is None:
         return None
+    for r in range(9):
+        board.grid[r][:] = solution[r * 9:(r + 1) * 9]
+    return board
 
-    if board.is_complete():
+def solve_flat(flat: List[int], stats: Optional[SolveStats] = None, method: str = "bitmask",
+               trace: Optional[Callable[[int, int], None]] = None) -> Optional[List[int]]:
+    """Solve a flat 81-cell grid (0 for empty); returns the solved cells or None."""
+    stats = stats or SolveStats()
+    try:
+        if method == "dlx":
+            if trace:
+                raise ValueError("Tracing is only supported by the bitmask method")
+            solution = _solve_exact_cover(flat, stats)
+        elif method == "bitmask":
+            state = _TracedState(flat, trace) if trace else _BitState(flat)
+            solution = state.grid if state.ok and state.search(stats) else None
+        else:
+            raise ValueError(f"Unknown solve method: {method}")
+    finally:
         stats.end = time.perf_counter()
-        return board
+    return solution
 
-    mrv = board.find_mrv_cell()
-    if mrv is None:
-        stats.end = time.perf_counter()
-        return board if board.is_valid() else None
+def _solve_exact_cover(flat: List[int], stats: SolveStats) -> Optional[List[int]]:
+    """Algorithm X over Sudoku's 324 constraints, with dict-of-sets links.
 
-    r, c, cand = mrv
-    if len(cand) == 0:
-        return None
+    Columns map to the set of rows covering them; covering and uncovering
+    moves whole row sets in and out, the dictionary analogue of dancing links.
+    """
+    # Candidate (cell, digit) -> the four constraints it satisfies
+    rows: Dict[Tuple[int, int], Tuple] = {}
+    for i in range(81):
+        for d in range(1, 10):
+            rows[(i, d)] = (("cell", i), ("row", ROW[i], d), ("col", COL[i], d), ("box", BOX[i], d))
+    columns: Dict[tuple, Set[Tuple[int, int]]] = {}
+    for key, constraints in rows.items():
+        for constraint in constraints:
+            columns.setdefault(constraint, set()).add(key)
+
+    def select(key) -> List[Set]:
+        removed = []
+        for constraint in rows[key]:
+            for other in columns[constraint]:
+                for other_constraint in rows[other]:
+                    if other_constraint != constraint:
+                        columns[other_constraint].discard(other)
+            removed.append(columns.pop(constraint))
+        return removed
+
+    def deselect(key, removed: List[Set]):
+        for constraint in reversed(rows[key]):
+            columns[constraint] = removed.pop()
+            for other in columns[constraint]:
+                for other_constraint in rows[other]:
+                    if other_constraint != constraint:
+                        columns[other_constraint].add(other)
+
+    solution: List[Tuple[int, int]] = []
+    for i, d in enumerate(flat):
+        if d:
+            if any(c not in columns or (i, d) not in columns[c] for c in rows[(i, d)]):
+                return None  # Conflicting givens
+            select((i, d))
+            solution.append((i, d))
 
-    for v in sorted(cand):
-        if board.is_valid_move(r, c, v):
+    def search() -> bool:
+        if not columns:
+            return True
+        constraint = min(columns, key=lambda c: len(columns[c]))
+        if len(columns[constraint]) == 1:
+            stats.propagations += 1
+        for key in list(columns[constraint]):
             stats.nodes += 1
-            board.grid[r][c] = v
-            if _forward_check(board, r, c):
-                res = solve(board, stats)
-                if res is not None:
-                    return res
-            board.grid[r][c] = 0
-
-    if stats.end is None:
-        stats.end = time.perf_counter()
-    return None
+            if stats.cancelled:
+                raise SolveCancelled()
+            solution.append(key)
+            removed = select(key)
+            if search():
+                return True
+            deselect(key, removed)
+            solution.pop()
+        return False
 
-def _forward_check(board: Board, rr: int, cc: int) -> bool:
-    """After placing at (rr,cc), ensure no other empty cell has zero candidates."""
-    for r in range(9):
-        for c in range(9):
-            if board.grid[r][c] == 0:
-                if len(board.candidates(r, c)) == 0:
-                    return False
-    return True
\ No newline at end of file
+    if not search():
+        return None
+    grid = [0] * 81
+    for i, d in solution:
+        grid[i] = d
+    return grid
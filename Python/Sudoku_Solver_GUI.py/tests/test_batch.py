@@ -0,0 +1,41 @@
+import io
+import pytest
+from sudoku.batch import solve_batch, write_results, iter_puzzle_lines
+
+EASY = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+
+def test_solve_batch_reports_uniqueness_and_errors():
+    lines = [EASY, "0" * 81, "55" + "0" * 79, "123"]
+    results = list(solve_batch(lines, workers=1, check_unique=True))
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].solutions == 1 and len(results[0].solution) == 81
+    assert results[1].solutions == 2
+    assert results[2].solutions == 0 and results[2].solution == ""
+    assert results[3].error
+
+def test_solve_batch_accepts_dotted_lines():
+    results = list(solve_batch([EASY.replace("0", ".") + "\t1.2"], workers=1))
+    assert results[0].puzzle == EASY and results[0].solutions == 1
+
+def test_unique_check_needs_bitmask_method():
+    with pytest.raises(ValueError):
+        list(solve_batch([EASY], workers=1, check_unique=True, method="dlx"))
+    dlx = list(solve_batch([EASY], workers=1, method="dlx"))
+    assert dlx[0].solution == list(solve_batch([EASY], workers=1))[0].solution
+
+def test_process_pool_matches_in_process(tmp_path):
+    path = tmp_path / "pack.txt"
+    path.write_text("# pack\n" + "\n".join([EASY] * 5) + "\n\n")
+    lines = list(iter_puzzle_lines([str(path)]))
+    assert len(lines) == 5
+    serial = [r.solution for r in solve_batch(lines, workers=1)]
+    pooled = [r.solution for r in solve_batch(lines, workers=2, chunksize=2)]
+    assert serial == pooled
+
+def test_write_results_csv():
+    out = io.StringIO()
+    summary = write_results(solve_batch([EASY, "123"], workers=1), out)
+    rows = out.getvalue().splitlines()
+    assert rows[0].startswith("index,puzzle,solution")
+    assert len(rows) == 3
+    assert summary.solved == 1 and summary.invalid == 1
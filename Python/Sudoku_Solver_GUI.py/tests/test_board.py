@@ -1,4 +1,6 @@
-from sudoku.board import Board
+import random
+import pytest
+from sudoku.board import Board, ConflictTracker
 
 def test_board_validity_and_candidates():
     b = Board.from_lines([
@@ -14,4 +16,49 @@ def test_board_validity_and_candidates():
     ])
     assert b.is_valid()
     assert len(b.candidates(0, 2)) > 0
-    assert len(b.candidates(0, 0)) == 0
\ No newline at end of file
+    assert len(b.candidates(0, 0)) == 0
+
+def _rescan_conflicts(grid):
+    b = Board([row[:] for row in grid])
+    found = set()
+    for r in range(9):
+        for c in range(9):
+            v = b.grid[r][c]
+            if v:
+                b.grid[r][c] = 0
+                if not b.is_valid_move(r, c, v):
+                    found.add((r, c))
+                b.grid[r][c] = v
+    return found
+
+def test_conflict_tracker_matches_full_rescan():
+    tracker = ConflictTracker()
+    rng = random.Random(7)
+    for _ in range(2000):
+        r, c, v = rng.randrange(9), rng.randrange(9), rng.choice([0, 0] + list(range(1, 10)))
+        before = set(tracker.conflicts)
+        changed = tracker.set(r, c, v)
+        assert tracker.conflicts == _rescan_conflicts(tracker.grid)
+        assert changed == before ^ tracker.conflicts
+
+def test_conflict_tracker_load_and_clear():
+    tracker = ConflictTracker()
+    board = Board.from_flat_string("55" + "0" * 79)
+    assert tracker.load(board) == {(0, 0), (0, 1)}
+    assert not tracker.valid
+    assert tracker.set(0, 1, 0) == {(0, 0), (0, 1)}
+    assert tracker.valid
+
+def test_flat_string_accepts_dots_and_trailing_fields():
+    easy = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+    dotted = easy.replace("0", ".")
+    assert Board.parse_flat_string(dotted + "  # rating 1.2") == easy
+    assert Board.parse_flat_string(dotted + "\t1.2") == easy
+    spaced = " ".join(easy[i:i + 9] for i in range(0, 81, 9))
+    assert Board.from_flat_string(spaced).grid == Board.from_flat_string(easy).grid
+
+def test_flat_string_rejects_bad_cells():
+    easy = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+    for bad in (easy[:80], easy + "1", "\u0663" + easy[1:]):
+        with pytest.raises(ValueError):
+            Board.from_flat_string(bad)
@@ -0,0 +1,34 @@
+from sudoku.board import Board
+from sudoku.generator import DIFFICULTIES, PuzzlePool, generate, grade, random_solution
+from sudoku.solver import count_solutions
+import random
+
+def test_random_solution_is_complete():
+    grid = random_solution(random.Random(7))
+    board = Board([grid[r * 9:(r + 1) * 9] for r in range(9)])
+    assert board.is_complete()
+
+def test_generated_puzzles_are_unique_and_graded():
+    for difficulty in DIFFICULTIES:
+        puzzle = generate(difficulty, seed=1)
+        board = puzzle.board()
+        assert count_solutions(board) == 1
+        assert grade([int(ch) for ch in puzzle.puzzle]) == difficulty
+        assert puzzle.clues == 81 - puzzle.puzzle.count("0")
+        assert all(p in ("0", s) for p, s in zip(puzzle.puzzle, puzzle.solution))
+
+def test_generate_is_reproducible():
+    assert generate("Medium", seed=3) == generate("Medium", seed=3)
+
+def test_grade_levels():
+    easy = "530070000600195000098000060800060003400803001700020006060000280000419005000080079"
+    assert grade([int(ch) for ch in easy]) == "Easy"
+
+def test_pool_persists_between_instances(tmp_path):
+    pool = PuzzlePool(str(tmp_path), size=3)
+    assert pool.refill("Easy", workers=1) == 3
+    reopened = PuzzlePool(str(tmp_path), size=3)
+    assert reopened.available("Easy") == 3
+    first = reopened.take("Easy")
+    assert PuzzlePool(str(tmp_path)).available("Easy") == 2
+    assert count_solutions(first.board()) == 1
@@ -1,5 +1,6 @@
 from sudoku.board import Board
-from sudoku.solver import solve, SolveStats
+import pytest
+from sudoku.solver import solve, solve_flat, SolveStats, SolveCancelled, count_solutions
 
 def _solve_ok(puzzle_lines):
     b = Board.from_lines(puzzle_lines)
@@ -35,3 +36,63 @@ def test_hard():
         "034059000",
         "507000000",
     ])
+
+def test_very_hard_both_methods():
+    puzzle = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+    solutions = []
+    for method in ("bitmask", "dlx"):
+        stats = SolveStats()
+        res = solve(Board.from_flat_string(puzzle), stats, method=method)
+        assert res is not None and res.is_complete()
+        assert stats.nodes > 0 and stats.propagations > 0
+        solutions.append(res.grid)
+    assert solutions[0] == solutions[1]
+
+def test_propagation_counts_singles():
+    stats = SolveStats()
+    res = solve(Board.from_flat_string(
+        "530070000600195000098000060800060003400803001700020006060000280000419005000080079"), stats)
+    assert res is not None
+    # The easy puzzle needs no guessing: every empty cell is a single
+    assert stats.nodes == 0
+    assert stats.propagations == stats.naked_singles + stats.hidden_singles == 51
+
+def test_conflicting_givens():
+    b = Board.from_flat_string("55" + "0" * 79)
+    original = b.clone()
+    assert solve(b) is None
+    assert solve(b, method="dlx") is None
+    assert b.grid == original.grid
+
+def test_count_solutions():
+    unique = Board.from_flat_string(
+        "530070000600195000098000060800060003400803001700020006060000280000419005000080079")
+    assert count_solutions(unique) == 1
+    # An empty grid has many solutions; counting stops at the limit
+    assert count_solutions(Board.from_flat_string("0" * 81)) == 2
+    assert count_solutions(Board.from_flat_string("0" * 81), limit=5) == 5
+    assert count_solutions(Board.from_flat_string("55" + "0" * 79)) == 0
+
+HARD = "800000000003600000070090200050007000000045700000100030001000068008500010090000400"
+
+def test_trace_replays_to_solution():
+    flat = [int(ch) for ch in HARD]
+    replay = flat[:]
+    def trace(cell, digit):
+        assert flat[cell] == 0, "givens are never traced"
+        replay[cell] = digit
+    solution = solve_flat(flat, SolveStats(), trace=trace)
+    assert solution is not None and replay == solution
+
+def test_cancel_stops_search():
+    stats = SolveStats()
+    def trace(cell, digit):
+        if stats.nodes >= 5:
+            stats.cancel()
+    with pytest.raises(SolveCancelled):
+        solve_flat([int(ch) for ch in HARD], stats, trace=trace)
+    assert stats.nodes == 6 and stats.end is not None  # stops at the next node
+    cancelled = SolveStats()
+    cancelled.cancel()
+    with pytest.raises(SolveCancelled):
+        solve_flat([int(ch) for ch in HARD], cancelled, method="dlx")
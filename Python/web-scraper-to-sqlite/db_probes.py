@@ -0,0 +1,201 @@
+import time
+import sqlite3
+import logging
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional
+from dataclasses import dataclass, field
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of a single database health probe."""
+    name: str
+    value: Any
+    duration_ms: float
+    ok: bool = True
+    detail: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+class DatabaseProbes:
+    """Tiered, low-cost health probes for the scraper's SQLite database.
+
+    All probes share one read-only connection, so they never take write
+    locks. Row counts come from ``sqlite_stat1`` (falling back to
+    ``MAX(rowid)``), freshness from an indexed ``MAX(<timestamp>)`` and
+    integrity from ``PRAGMA quick_check`` run inside a read snapshot, at most
+    once per interval and only during off-peak hours.
+    """
+
+    FRESHNESS_COLUMNS = ("scraped_at", "created_at", "_scrape_timestamp")
+
+    def __init__(self, db_path: Path, table_name: str = "scraped_records",
+                 integrity_interval: timedelta = timedelta(hours=6),
+                 off_peak_hours: Tuple[int, int] = (1, 5)):
+        """Initialize database probes.
+
+        Args:
+            db_path: Path to SQLite database file
+            table_name: Table used for the freshness probe
+            integrity_interval: Minimum time between integrity checks
+            off_peak_hours: Local [start, end) hour window for integrity checks
+        """
+        self.db_path = Path(db_path)
+        self.table_name = table_name
+        self.integrity_interval = integrity_interval
+        self.off_peak_hours = off_peak_hours
+        self.connection: Optional[sqlite3.Connection] = None
+        self.last_integrity_check: Optional[datetime] = None
+        self._freshness_column: Optional[str] = None
+        self._freshness_utc = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (once) a read-only connection to the live database."""
+        if self.connection is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            self.connection = sqlite3.connect(uri, uri=True, timeout=5, check_same_thread=False)
+            self.connection.execute("PRAGMA query_only = ON")
+        return self.connection
+
+    def close(self) -> None:
+        """Close the probe connection."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def _timed(self, name: str, func, *args) -> ProbeResult:
+        """Run a probe body and attach its own cost."""
+        start = time.perf_counter()
+        try:
+            value, metadata = func(*args)
+            ok, detail = True, ""
+        except (sqlite3.Error, ValueError) as e:
+            value, metadata = None, {}
+            ok, detail = False, str(e)
+            if isinstance(e, sqlite3.Error):
+                self.close()  # Reconnect on the next probe
+        duration_ms = (time.perf_counter() - start) * 1000
+        return ProbeResult(name, value, duration_ms, ok, detail, metadata)
+
+    def _tables(self, cursor: sqlite3.Cursor) -> List[str]:
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
+        return [row[0] for row in cursor.fetchall()]
+
+    def _row_counts(self) -> Tuple[Dict[str, int], Dict[str, Any]]:
+        cursor = self._connect().cursor()
+        tables = self._tables(cursor)
+
+        # sqlite_stat1 exists only after ANALYZE; its first stat value is the row count
+        stats: Dict[str, int] = {}
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='sqlite_stat1';")
+        if cursor.fetchone():
+            cursor.execute("SELECT tbl, stat FROM sqlite_stat1;")
+            for tbl, stat in cursor.fetchall():
+                if stat:
+                    stats[tbl] = max(stats.get(tbl, 0), int(stat.split()[0]))
+
+        counts, sources = {}, {}
+        for table in tables:
+            if table in stats:
+                counts[table], sources[table] = stats[table], "sqlite_stat1"
+                continue
+            try:
+                # Rowid b-tree lookup: O(log n) upper bound on the row count
+                cursor.execute(f'SELECT MAX(rowid) FROM "{table}";')
+                counts[table], sources[table] = cursor.fetchone()[0] or 0, "max_rowid"
+            except sqlite3.OperationalError:
+                sources[table] = "unavailable"  # WITHOUT ROWID table
+        return counts, {"sources": sources}
+
+    def _indexed_freshness_column(self, cursor: sqlite3.Cursor) -> Optional[str]:
+        """Find a timestamp column that leads an index on the freshness table."""
+        if self._freshness_column is None:
+            cursor.execute(f'PRAGMA index_list("{self.table_name}");')
+            for index in cursor.fetchall():
+                cursor.execute(f'PRAGMA index_info("{index[1]}");')
+                info = cursor.fetchall()
+                if info and info[0][2] in self.FRESHNESS_COLUMNS:
+                    self._freshness_column = info[0][2]
+                    break
+            if self._freshness_column is not None:
+                # CURRENT_TIMESTAMP defaults store naive UTC text
+                cursor.execute(f'PRAGMA table_info("{self.table_name}");')
+                self._freshness_utc = any(
+                    col[1] == self._freshness_column
+                    and str(col[4] or "").upper() == "CURRENT_TIMESTAMP"
+                    for col in cursor.fetchall()
+                )
+        return self._freshness_column
+
+    def _freshness(self) -> Tuple[Optional[float], Dict[str, Any]]:
+        cursor = self._connect().cursor()
+        column = self._indexed_freshness_column(cursor)
+        if column is None:
+            # Without an index MAX() is a full scan; skip rather than stall ingestion
+            return None, {"skipped": "no indexed timestamp column"}
+
+        cursor.execute(f'SELECT MAX("{column}") FROM "{self.table_name}";')
+        latest = cursor.fetchone()[0]
+        if not latest:
+            return None, {"column": column}
+
+        latest_scrape = datetime.fromisoformat(str(latest).replace('Z', '+00:00'))
+        if latest_scrape.tzinfo is None:
+            if self._freshness_utc:
+                latest_scrape = latest_scrape.replace(tzinfo=timezone.utc)
+            else:
+                latest_scrape = latest_scrape.astimezone()  # scraper wrote local time
+        hours = (datetime.now(timezone.utc) - latest_scrape).total_seconds() / 3600
+        return hours, {"column": column, "utc": self._freshness_utc}
+
+    def _integrity(self) -> Tuple[str, Dict[str, Any]]:
+        conn = self._connect()
+        # Pin a read snapshot so the check sees a consistent database while writers continue in WAL
+        conn.execute("BEGIN;")
+        try:
+            rows = conn.execute("PRAGMA quick_check(10);").fetchall()
+        finally:
+            conn.execute("COMMIT;")
+        messages = [row[0] for row in rows]
+        return messages[0] if messages == ["ok"] else "; ".join(messages), {}
+
+    def integrity_due(self, now: datetime = None) -> bool:
+        """Check whether the integrity probe should run now."""
+        now = now or datetime.now()
+        start, end = self.off_peak_hours
+        in_window = start <= now.hour < end if start <= end else (now.hour >= start or now.hour < end)
+        if not in_window:
+            return False
+        return (self.last_integrity_check is None or
+                now - self.last_integrity_check >= self.integrity_interval)
+
+    def probe_row_counts(self) -> ProbeResult:
+        """Estimate per-table row counts without scanning."""
+        return self._timed("row_counts", self._row_counts)
+
+    def probe_freshness(self) -> ProbeResult:
+        """Get hours since the newest record, using an index only."""
+        return self._timed("freshness", self._freshness)
+
+    def probe_integrity(self) -> ProbeResult:
+        """Run a quick_check on a read snapshot."""
+        self.last_integrity_check = datetime.now()
+        result = self._timed("integrity", self._integrity)
+        if result.ok and result.value != "ok":
+            result.ok = False
+            result.detail = result.value
+        return result
+
+    def run_due(self, now: datetime = None) -> List[ProbeResult]:
+        """Run the cheap probes plus any integrity check that is due.
+
+        Returns:
+            List[ProbeResult]: Results in execution order
+        """
+        results = [self.probe_row_counts(), self.probe_freshness()]
+        if self.integrity_due(now):
+            results.append(self.probe_integrity())
+        return results
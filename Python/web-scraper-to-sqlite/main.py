@@ -1,6 +1,7 @@
 import logging
 import sys
 import time
+import os
 import json
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +12,7 @@ from src.scraper import WebScraper, ScrapeResult
 from src.data_cleaner import DataCleaner
 from src.database_handler import DatabaseHandler
 from src.cli import create_parser, setup_logging
+from system_sampler import SystemSampler, lag_file_for
 
 
 class DataPipeline:
@@ -27,6 +29,8 @@ class DataPipeline:
             'records_processed': 0,
             'duration_seconds': 0
         }
+        self.pidfile = Path(self.args.pidfile) if getattr(self.args, 'pidfile', None) else None
+        self.loop_probe = SystemSampler()
         self._setup_directories()
     
     def _setup_directories(self) -> None:
@@ -35,8 +39,36 @@ class DataPipeline:
         for directory in directories:
             Path(directory).mkdir(exist_ok=True)
     
+    def _write_pidfile(self) -> None:
+        """Publish this process's pid for the out-of-process monitor."""
+        if self.pidfile is None:
+            return
+        try:
+            self.pidfile.parent.mkdir(parents=True, exist_ok=True)
+            self.pidfile.write_text(f"{os.getpid()}\n")
+        except OSError as e:
+            self.logger.warning(f"Could not write pidfile '{self.pidfile}': {e}")
+    
+    def _remove_pidfile(self) -> None:
+        """Remove the pidfile and published loop lag once the pipeline exits."""
+        if self.pidfile is None:
+            return
+        for path in (self.pidfile, lag_file_for(self.pidfile)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.debug(f"Could not remove '{path}': {e}")
+    
+    def _watch_event_loop(self, loop) -> None:
+        """Probe the scraper's event loop and publish its lag next to the pidfile."""
+        lag_file = lag_file_for(self.pidfile) if self.pidfile else None
+        self.loop_probe.watch_event_loop(loop, lag_file=lag_file)
+    
     def run(self) -> bool:
         """Execute the complete ETL pipeline."""
+        self._write_pidfile()
         try:
             self.logger.info("🚀 INITIATING DATA PIPELINE")
             self.logger.info("=" * 60)
@@ -86,6 +118,7 @@ class DataPipeline:
             
         finally:
             self._log_final_stats()
+            self._remove_pidfile()
     
     def _log_configuration(self) -> None:
         """Log pipeline configuration."""
@@ -108,6 +141,19 @@ class DataPipeline:
         
         self.logger.info("-" * 60)
     
+    def _load_scraping_config(self) -> Dict[str, Any]:
+        """Load the scraping section of the configuration file."""
+        config_path = Path(getattr(self.args, 'config', None) or 'config.yaml')
+        try:
+            import yaml
+            with open(config_path, 'r') as f:
+                return (yaml.safe_load(f) or {}).get('scraping', {})
+        except FileNotFoundError:
+            self.logger.warning(f"Configuration file '{config_path}' not found. Using defaults.")
+        except Exception as e:
+            self.logger.warning(f"Could not load configuration '{config_path}': {e}")
+        return {}
+    
     def _extract_data(self) -> Optional[ScrapeResult]:
         """Extract data from source."""
         self.logger.info("📥 PHASE 1: EXTRACTING DATA FROM SOURCE")
@@ -116,10 +162,20 @@ class DataPipeline:
         
         try:
             # Initialize scraper
+            scraping_config = self._load_scraping_config()
             scraper = WebScraper(
                 target_url=self.args.url,
                 cache_enabled=True,
-                max_concurrent=5
+                max_concurrent=scraping_config.get('concurrent_requests', 5),
+                timeout=scraping_config.get('timeout', 30),
+                fallback_urls=scraping_config.get('fallback_urls'),
+                retry_attempts=scraping_config.get('retry_attempts', 3),
+                hedge_requests=scraping_config.get('hedge_requests', False),
+                respect_robots_txt=scraping_config.get('respect_robots_txt', False),
+                rate_limit=scraping_config.get('rate_limit', 60),
+                delay_between_requests=scraping_config.get('delay_between_requests', 0.0),
+                max_pages_per_domain=scraping_config.get('max_pages_per_domain'),
+                loop_monitor=self._watch_event_loop
             )
             
             # Test selectors in verbose mode
@@ -0,0 +1,411 @@
+import re
+import json
+import struct
+import logging
+import threading
+from array import array
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple, Any, Optional, Iterator
+from dataclasses import dataclass, replace
+
+logger = logging.getLogger(__name__)
+
+
+# Block header: point count, base timestamp (ms), value column count, timestamp bytes
+_BLOCK_HEADER = struct.Struct("<IqBI")
+_DAY_MS = 86_400_000
+
+
+@dataclass
+class Rollup:
+    """Aggregated metric bucket (a raw point is a bucket with count == 1)."""
+    timestamp: datetime
+    count: int
+    min: float
+    max: float
+    sum: float
+    last: float
+
+    @property
+    def avg(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def merge(self, other: "Rollup") -> None:
+        """Fold another bucket covering the same or a later interval into this one."""
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.sum += other.sum
+        if other.timestamp >= self.timestamp:
+            self.last = other.last
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """Storage tier of the metric store."""
+    name: str
+    step_seconds: int
+    retention: timedelta
+
+    @property
+    def columns(self) -> int:
+        # Raw points store a single value, rollups store count/min/max/sum/last
+        return 1 if self.step_seconds <= 1 else 5
+
+
+def _encode_varints(values: List[int]) -> bytes:
+    """Zigzag + LEB128 encode a list of signed integers."""
+    out = bytearray()
+    for value in values:
+        value = (value << 1) ^ (value >> 63)
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return bytes(out)
+
+
+def _decode_varints(data: bytes, count: int) -> List[int]:
+    """Decode ``count`` zigzag + LEB128 integers."""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        values.append((value >> 1) ^ -(value & 1))
+        value = shift = 0
+        if len(values) == count:
+            break
+    return values
+
+
+class MetricStore:
+    """Embedded append-optimized time-series store for monitoring metrics.
+
+    Points are buffered in memory and flushed in batches as delta-encoded
+    columnar blocks, one segment file per series, resolution and UTC day.
+    Every raw point also feeds 1 minute and 1 hour rollups, and each
+    resolution is pruned on its own retention window.
+    """
+
+    def __init__(self, root_dir: Path, retention: Dict[str, timedelta] = None,
+                 flush_interval: float = 10.0, flush_size: int = 500):
+        """Initialize the metric store.
+
+        Args:
+            root_dir: Directory holding segment files
+            retention: Optional retention override per resolution name
+            flush_interval: Seconds between automatic buffer flushes
+            flush_size: Buffered point count that forces a flush
+        """
+        self.root_dir = Path(root_dir)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+
+        retention = retention or {}
+        self.resolutions = [
+            Resolution("raw", 1, retention.get("raw", timedelta(days=1))),
+            Resolution("1m", 60, retention.get("1m", timedelta(days=7))),
+            Resolution("1h", 3600, retention.get("1h", timedelta(days=90))),
+        ]
+        self._by_name = {res.name: res for res in self.resolutions}
+
+        self._lock = threading.RLock()
+        self._series: Dict[str, Dict[str, Any]] = self._load_index()
+        self._index_dirty = False
+        # (resolution, series_key) -> list of (timestamp_ms, columns)
+        self._buffer: Dict[Tuple[str, str], List[Tuple[int, Tuple[float, ...]]]] = {}
+        self._buffered = 0
+        # (resolution, series_key) -> open rollup bucket [start_ms, count, min, max, sum, last]
+        self._open_buckets: Dict[Tuple[str, str], List[float]] = {}
+        self._last_flush = datetime.now()
+
+    # ------------------------------------------------------------------
+    # Series index
+    # ------------------------------------------------------------------
+
+    @property
+    def _index_path(self) -> Path:
+        return self.root_dir / "series.json"
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load series metadata written by previous runs."""
+        try:
+            with open(self._index_path, 'r') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @staticmethod
+    def series_key(name: str, labels: Dict[str, str] = None) -> str:
+        """Build a filesystem-safe key for a metric name and label set."""
+        key = name
+        if labels:
+            key += "," + ",".join(f"{k}={v}" for k, v in sorted(labels.items()))
+        return re.sub(r"[^A-Za-z0-9_.,=-]", "_", key)
+
+    def series(self) -> List[Dict[str, Any]]:
+        """List known series with their name, unit and labels."""
+        with self._lock:
+            return [dict(meta, key=key) for key, meta in self._series.items()]
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def append(self, name: str, value: float, timestamp: datetime,
+               unit: str = "", labels: Dict[str, str] = None) -> None:
+        """Buffer a raw point and update its rollups.
+
+        Args:
+            name: Metric name
+            value: Metric value
+            timestamp: Sample time
+            unit: Unit, recorded once per series
+            labels: Optional metric labels
+        """
+        key = self.series_key(name, labels)
+        ts_ms = int(timestamp.timestamp() * 1000)
+        value = float(value)
+
+        with self._lock:
+            if key not in self._series:
+                self._series[key] = {"name": name, "unit": unit, "labels": labels or {}}
+                self._index_dirty = True
+
+            self._buffer_point("raw", key, ts_ms, (value,))
+
+            for res in self.resolutions[1:]:
+                step_ms = res.step_seconds * 1000
+                start_ms = ts_ms - ts_ms % step_ms
+                bucket = self._open_buckets.get((res.name, key))
+
+                if bucket is not None and bucket[0] != start_ms:
+                    self._buffer_point(res.name, key, int(bucket[0]), tuple(bucket[1:]))
+                    bucket = None
+
+                if bucket is None:
+                    self._open_buckets[(res.name, key)] = [start_ms, 1, value, value, value, value]
+                else:
+                    bucket[1] += 1
+                    bucket[2] = min(bucket[2], value)
+                    bucket[3] = max(bucket[3], value)
+                    bucket[4] += value
+                    bucket[5] = value
+
+            due = (datetime.now() - self._last_flush).total_seconds() >= self.flush_interval
+            if self._buffered >= self.flush_size or due:
+                self.flush()
+
+    def _buffer_point(self, resolution: str, key: str, ts_ms: int,
+                      columns: Tuple[float, ...]) -> None:
+        self._buffer.setdefault((resolution, key), []).append((ts_ms, columns))
+        self._buffered += 1
+
+    def _segment_path(self, resolution: str, key: str, day: int) -> Path:
+        day_str = datetime.fromtimestamp(day * 86_400, timezone.utc).strftime("%Y%m%d")
+        return self.root_dir / resolution / key / f"{day_str}.seg"
+
+    def flush(self, close_buckets: bool = False) -> None:
+        """Write buffered points to disk, one block per segment.
+
+        Args:
+            close_buckets: Also persist open (partial) rollup buckets
+        """
+        with self._lock:
+            if close_buckets:
+                for (resolution, key), bucket in self._open_buckets.items():
+                    self._buffer_point(resolution, key, int(bucket[0]), tuple(bucket[1:]))
+                self._open_buckets.clear()
+
+            buffer, self._buffer = self._buffer, {}
+            self._buffered = 0
+            self._last_flush = datetime.now()
+
+            for (resolution, key), points in buffer.items():
+                ncols = self._by_name[resolution].columns
+                by_day: Dict[int, List[Tuple[int, Tuple[float, ...]]]] = {}
+                for point in points:
+                    by_day.setdefault(point[0] // _DAY_MS, []).append(point)
+
+                for day, day_points in by_day.items():
+                    path = self._segment_path(resolution, key, day)
+                    try:
+                        path.parent.mkdir(parents=True, exist_ok=True)
+                        with open(path, 'ab') as f:
+                            f.write(self._encode_block(day_points, ncols))
+                    except OSError as e:
+                        logger.error(f"Failed to flush {resolution}/{key}: {e}")
+
+            if self._index_dirty:
+                try:
+                    with open(self._index_path, 'w') as f:
+                        json.dump(self._series, f, indent=2)
+                    self._index_dirty = False
+                except OSError as e:
+                    logger.error(f"Failed to write series index: {e}")
+
+    @staticmethod
+    def _encode_block(points: List[Tuple[int, Tuple[float, ...]]], ncols: int) -> bytes:
+        """Encode points as a block of timestamp deltas plus value columns."""
+        points.sort(key=lambda p: p[0])
+        base = points[0][0]
+        deltas = []
+        prev = base
+        for ts_ms, _ in points:
+            deltas.append(ts_ms - prev)
+            prev = ts_ms
+        ts_bytes = _encode_varints(deltas)
+
+        values = array('d')
+        for col in range(ncols):
+            values.extend(p[1][col] for p in points)
+
+        header = _BLOCK_HEADER.pack(len(points), base, ncols, len(ts_bytes))
+        return header + ts_bytes + values.tobytes()
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _decode_segment(data: bytes) -> Iterator[Tuple[int, Tuple[float, ...]]]:
+        """Yield (timestamp_ms, columns) from every block of a segment."""
+        offset = 0
+        while offset + _BLOCK_HEADER.size <= len(data):
+            count, base, ncols, ts_len = _BLOCK_HEADER.unpack_from(data, offset)
+            offset += _BLOCK_HEADER.size
+            deltas = _decode_varints(data[offset:offset + ts_len], count)
+            offset += ts_len
+
+            values = array('d')
+            values.frombytes(data[offset:offset + count * ncols * 8])
+            offset += count * ncols * 8
+            if len(deltas) != count or len(values) != count * ncols:
+                logger.warning("Truncated metric block, skipping remainder of segment")
+                return
+
+            ts_ms = base
+            for i, delta in enumerate(deltas):
+                ts_ms += delta
+                yield ts_ms, tuple(values[col * count + i] for col in range(ncols))
+
+    def _keys_for(self, name: str, labels: Optional[Dict[str, str]]) -> List[str]:
+        if labels is not None:
+            return [self.series_key(name, labels)]
+        return [key for key, meta in self._series.items() if meta["name"] == name]
+
+    def _pick_resolution(self, start: datetime) -> Resolution:
+        """Pick the finest resolution whose retention still covers ``start``."""
+        age = datetime.now() - start
+        for res in self.resolutions:
+            if age <= res.retention:
+                return res
+        return self.resolutions[-1]
+
+    def query_rollups(self, name: str, start: datetime, end: datetime = None,
+                      resolution: str = None, labels: Dict[str, str] = None) -> List[Rollup]:
+        """Read buckets of a metric in ``[start, end]``.
+
+        Args:
+            name: Metric name
+            start: Range start
+            end: Range end (defaults to now)
+            resolution: 'raw', '1m' or '1h' (picked from retention when omitted)
+            labels: Restrict to one label set; all series of ``name`` otherwise
+
+        Returns:
+            List[Rollup]: Buckets ordered by timestamp
+        """
+        end = end or datetime.now()
+        res = self._by_name[resolution] if resolution else self._pick_resolution(start)
+        start_ms = int(start.timestamp() * 1000)
+        end_ms = int(end.timestamp() * 1000)
+
+        rows: List[Tuple[int, Tuple[float, ...]]] = []
+        with self._lock:
+            keys = self._keys_for(name, labels)
+            for key in keys:
+                for day in range(start_ms // _DAY_MS, end_ms // _DAY_MS + 1):
+                    path = self._segment_path(res.name, key, day)
+                    if path.exists():
+                        rows.extend(self._decode_segment(path.read_bytes()))
+                rows.extend(self._buffer.get((res.name, key), []))
+                bucket = self._open_buckets.get((res.name, key))
+                if bucket is not None:
+                    rows.append((int(bucket[0]), tuple(bucket[1:])))
+
+        merged: Dict[int, Rollup] = {}
+        for ts_ms, cols in sorted(rows, key=lambda r: r[0]):
+            if not start_ms <= ts_ms <= end_ms:
+                continue
+            if len(cols) == 1:
+                cols = (1, cols[0], cols[0], cols[0], cols[0])
+            bucket = Rollup(datetime.fromtimestamp(ts_ms / 1000), int(cols[0]), *cols[1:])
+            if ts_ms in merged:
+                merged[ts_ms].merge(bucket)
+            else:
+                merged[ts_ms] = bucket
+        return list(merged.values())
+
+    def query_range(self, name: str, start: datetime, end: datetime = None,
+                    resolution: str = None, labels: Dict[str, str] = None) -> List[Tuple[datetime, float]]:
+        """Read ``(timestamp, value)`` pairs; rollup tiers report bucket averages."""
+        return [(b.timestamp, b.avg)
+                for b in self.query_rollups(name, start, end, resolution, labels)]
+
+    def aggregate(self, name: str, start: datetime, end: datetime = None,
+                  resolution: str = None, labels: Dict[str, str] = None) -> Optional[Dict[str, float]]:
+        """Aggregate a metric over a range.
+
+        Returns:
+            Optional[Dict[str, float]]: count/min/max/avg/latest, or None if no data
+        """
+        buckets = self.query_rollups(name, start, end, resolution, labels)
+        if not buckets:
+            return None
+
+        total = replace(buckets[0])
+        for bucket in buckets[1:]:
+            total.merge(bucket)
+
+        return {
+            "count": total.count,
+            "min": total.min,
+            "max": total.max,
+            "avg": total.avg,
+            "latest": total.last,
+        }
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def apply_retention(self, now: datetime = None) -> int:
+        """Delete segments that fell out of their resolution's retention window.
+
+        Returns:
+            int: Number of segment files removed
+        """
+        now = now or datetime.now()
+        removed = 0
+        with self._lock:
+            for res in self.resolutions:
+                cutoff_ts = (now - res.retention).timestamp()
+                cutoff = datetime.fromtimestamp(cutoff_ts, timezone.utc).strftime("%Y%m%d")
+                for segment in (self.root_dir / res.name).glob("*/*.seg"):
+                    if segment.stem < cutoff:
+                        try:
+                            segment.unlink()
+                            removed += 1
+                        except OSError as e:
+                            logger.warning(f"Could not remove segment {segment}: {e}")
+        return removed
+
+    def close(self) -> None:
+        """Flush everything, including partial rollup buckets."""
+        self.flush(close_buckets=True)
@@ -1,7 +1,6 @@
 import time
 import json
 import sqlite3
-import psutil
 import logging
 import threading
 import schedule
@@ -21,6 +20,9 @@ from rich import box
 from rich.live import Live
 from rich.layout import Layout
 from rich.panel import Panel
+from metric_store import MetricStore
+from db_probes import DatabaseProbes
+from system_sampler import SystemSampler
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -83,8 +85,16 @@ class Metric:
 class MonitoringSystem:
     """Production monitoring and observability system."""
     
-    def __init__(self, config_path: str = "monitoring_config.yaml", port: int = 9090):
-        """Initialize monitoring system."""
+    def __init__(self, config_path: str = "monitoring_config.yaml", port: int = 9090,
+                 pid: Optional[int] = None, pidfile: Optional[str] = None):
+        """Initialize monitoring system.
+        
+        Args:
+            config_path: Monitoring configuration file
+            port: Metrics server port
+            pid: Pipeline process to watch (overrides ``monitoring.pipeline.pid``)
+            pidfile: File holding the pipeline pid (overrides ``monitoring.pipeline.pidfile``)
+        """
         self.config = self._load_config(config_path)
         self.port = port
         
@@ -113,6 +123,19 @@ class MonitoringSystem:
             "data_freshness_hours": 24.0,  # Alert if data > 24 hours old
         }
         
+        # Time-series store (buffered, rolled up to 1m/1h)
+        self.tsdb = self._init_metric_store()
+        
+        # /proc-based resource sampler with per-family intervals; the monitor runs
+        # as its own process, so the pipeline's process tree is found by pid/pidfile and
+        # its event loop lag is read from the file main.py publishes next to the pidfile
+        pipeline_config = self.config.get("monitoring", {}).get("pipeline", {})
+        self.sampler = SystemSampler(
+            intervals=self.config.get("monitoring", {}).get("sampling_intervals"),
+            pid=pid or pipeline_config.get("pid"),
+            pidfile=pidfile or pipeline_config.get("pidfile")
+        )
+        
         # Prometheus metrics
         self._init_prometheus_metrics()
         
@@ -139,6 +162,28 @@ class MonitoringSystem:
             "monitoring": {
                 "interval_seconds": 30,
                 "retention_days": 30,
+                "tsdb": {
+                    "flush_interval_seconds": 10,
+                    "flush_size": 500,
+                    "raw_retention_hours": 24,
+                    "minute_retention_days": 7
+                },
+                "sampling_intervals": {
+                    "cpu": 5,
+                    "memory": 15,
+                    "disk": 60,
+                    "process_tree": 15,
+                    "threads": 30,
+                    "event_loop": 5
+                },
+                "pipeline": {
+                    "pid": None,
+                    "pidfile": None
+                },
+                "database_probes": {
+                    "integrity_interval_hours": 6,
+                    "off_peak_hours": [1, 5]
+                },
                 "alert_channels": {
                     "console": True,
                     "log_file": True,
@@ -166,6 +211,22 @@ class MonitoringSystem:
             ]
         )
     
+    def _init_metric_store(self) -> MetricStore:
+        """Initialize the on-disk metric store from configuration."""
+        monitoring_config = self.config.get("monitoring", {})
+        tsdb_config = monitoring_config.get("tsdb", {})
+        
+        return MetricStore(
+            self.data_dir / "tsdb",
+            retention={
+                "raw": timedelta(hours=tsdb_config.get("raw_retention_hours", 24)),
+                "1m": timedelta(days=tsdb_config.get("minute_retention_days", 7)),
+                "1h": timedelta(days=monitoring_config.get("retention_days", 30))
+            },
+            flush_interval=tsdb_config.get("flush_interval_seconds", 10),
+            flush_size=tsdb_config.get("flush_size", 500)
+        )
+    
     def _init_prometheus_metrics(self) -> None:
         """Initialize Prometheus metrics."""
         # System metrics
@@ -235,78 +296,63 @@ class MonitoringSystem:
             if thread.is_alive():
                 thread.join(timeout=5)
         
+        self.tsdb.close()
+        
         console.print("[green]✅ Monitoring system stopped[/green]")
     
     def _monitor_system_resources(self) -> None:
-        """Monitor system resources (CPU, memory, disk)."""
+        """Monitor system resources (CPU, memory, disk) and the pipeline's process tree."""
         console.print("[white]Monitoring system resources...[/white]")
         
+        sampler = self.sampler
+        gauges = {
+            "system.cpu.percent": self.cpu_usage,
+            "system.memory.percent": self.memory_usage,
+            "system.disk.percent": self.disk_usage,
+            "system.processes.count": self.process_count
+        }
+        alert_thresholds = {
+            "system.cpu.percent": ("cpu_percent", "CPU"),
+            "system.memory.percent": ("memory_percent", "memory"),
+            "system.disk.percent": ("disk_percent", "disk")
+        }
+        
         while self.running:
             try:
                 timestamp = datetime.now()
                 
-                # CPU usage
-                cpu_percent = psutil.cpu_percent(interval=1)
-                self.cpu_usage.set(cpu_percent)
-                self._record_metric("system.cpu.percent", cpu_percent, "%", timestamp)
-                
-                # Memory usage
-                memory = psutil.virtual_memory()
-                memory_percent = memory.percent
-                self.memory_usage.set(memory_percent)
-                self._record_metric("system.memory.percent", memory_percent, "%", timestamp)
-                self._record_metric("system.memory.used", memory.used / (1024**3), "GB", timestamp)
-                self._record_metric("system.memory.total", memory.total / (1024**3), "GB", timestamp)
-                
-                # Disk usage
-                disk = psutil.disk_usage('/')
-                disk_percent = disk.percent
-                self.disk_usage.set(disk_percent)
-                self._record_metric("system.disk.percent", disk_percent, "%", timestamp)
-                self._record_metric("system.disk.used", disk.used / (1024**9), "GB", timestamp)
-                self._record_metric("system.disk.total", disk.total / (1024**9), "GB", timestamp)
-                
-                # Process count
-                process_count = len(list(psutil.process_iter()))
-                self.process_count.set(process_count)
-                self._record_metric("system.processes.count", process_count, "count", timestamp)
-                
-                # Network connections
-                connections = len(psutil.net_connections())
-                self._record_metric("system.network.connections", connections, "count", timestamp)
-                
-                # Check thresholds
-                if cpu_percent > self.thresholds["cpu_percent"]:
-                    self._create_alert(
-                        severity=AlertSeverity.WARNING,
-                        message=f"High CPU usage: {cpu_percent:.1f}%",
-                        component="system"
-                    )
-                
-                if memory_percent > self.thresholds["memory_percent"]:
-                    self._create_alert(
-                        severity=AlertSeverity.WARNING,
-                        message=f"High memory usage: {memory_percent:.1f}%",
-                        component="system"
-                    )
-                
-                if disk_percent > self.thresholds["disk_percent"]:
-                    self._create_alert(
-                        severity=AlertSeverity.WARNING,
-                        message=f"High disk usage: {disk_percent:.1f}%",
-                        component="system"
-                    )
+                # Only families whose interval elapsed are read; CPU comes from counter deltas
+                for name, value, unit, labels in sampler.sample():
+                    if name in gauges:
+                        gauges[name].set(value)
+                    self._record_metric(name, value, unit, timestamp, labels)
+                    
+                    # Check thresholds
+                    if name in alert_thresholds:
+                        threshold_key, label = alert_thresholds[name]
+                        if value > self.thresholds[threshold_key]:
+                            self._create_alert(
+                                severity=AlertSeverity.WARNING,
+                                message=f"High {label} usage: {value:.1f}%",
+                                component="system"
+                            )
                 
             except Exception as e:
                 self.logger.error(f"System monitoring error: {e}")
             
-            time.sleep(self.config.get("monitoring", {}).get("interval_seconds", 30))
+            time.sleep(sampler.tick_seconds)
     
     def _monitor_database(self) -> None:
-        """Monitor database health and metrics."""
+        """Monitor database health and metrics with tiered, low-cost probes."""
         console.print("[white]Monitoring database...[/white]")
         
         db_path = Path("data/scraped_data.db")
+        probe_config = self.config.get("monitoring", {}).get("database_probes", {})
+        probes = DatabaseProbes(
+            db_path,
+            integrity_interval=timedelta(hours=probe_config.get("integrity_interval_hours", 6)),
+            off_peak_hours=tuple(probe_config.get("off_peak_hours", (1, 5)))
+        )
         
         while self.running:
             try:
@@ -316,79 +362,55 @@ class MonitoringSystem:
                 
                 timestamp = datetime.now()
                 
-                # Connect to database
-                conn = sqlite3.connect(db_path)
-                cursor = conn.cursor()
-                
-                # Get table counts
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-                tables = cursor.fetchall()
-                
-                total_records = 0
-                for table in tables:
-                    table_name = table[0]
-                    if not table_name.startswith('sqlite_'):
-                        cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-                        count = cursor.fetchone()[0]
-                        total_records += count
-                        
-                        # Record table-specific metric
-                        self._record_metric(
-                            f"database.table.{table_name}.records",
-                            count,
-                            "count",
-                            timestamp,
-                            {"table": table_name}
+                for result in probes.run_due(timestamp):
+                    # Export each probe's own cost
+                    self._record_metric(
+                        f"database.probe.{result.name}.duration",
+                        result.duration_ms,
+                        "ms",
+                        timestamp
+                    )
+                    
+                    if not result.ok:
+                        severity = AlertSeverity.CRITICAL if result.name == "integrity" else AlertSeverity.ERROR
+                        self._create_alert(
+                            severity=severity,
+                            message=f"Database {result.name} probe failed: {result.detail}",
+                            component="database"
                         )
-                
-                # Update Prometheus metric
-                self.data_records.set(total_records)
-                self._record_metric("database.records.total", total_records, "count", timestamp)
-                
-                # Check data freshness
-                if "scraped_records" in [t[0] for t in tables]:
-                    cursor.execute("""
-                        SELECT MAX(scraped_at) FROM scraped_records 
-                        WHERE scraped_at IS NOT NULL;
-                    """)
-                    result = cursor.fetchone()[0]
+                        continue
+                    
+                    if result.name == "row_counts":
+                        for table_name, count in result.value.items():
+                            self._record_metric(
+                                f"database.table.{table_name}.records",
+                                count,
+                                "count",
+                                timestamp,
+                                {"table": table_name}
+                            )
+                        
+                        total_records = sum(result.value.values())
+                        self.data_records.set(total_records)
+                        self._record_metric("database.records.total", total_records, "count", timestamp)
                     
-                    if result:
-                        try:
-                            latest_scrape = datetime.fromisoformat(result.replace('Z', '+00:00'))
-                            freshness_hours = (datetime.now() - latest_scrape).total_seconds() / 3600
-                            self.data_freshness.set(freshness_hours)
-                            self._record_metric("database.data.freshness", freshness_hours, "hours", timestamp)
-                            
-                            # Check freshness threshold
-                            if freshness_hours > self.thresholds["data_freshness_hours"]:
-                                self._create_alert(
-                                    severity=AlertSeverity.WARNING,
-                                    message=f"Data is stale: {freshness_hours:.1f} hours old",
-                                    component="database"
-                                )
-                        except:
-                            pass
+                    elif result.name == "freshness" and result.value is not None:
+                        freshness_hours = result.value
+                        self.data_freshness.set(freshness_hours)
+                        self._record_metric("database.data.freshness", freshness_hours, "hours", timestamp)
+                        
+                        # Check freshness threshold
+                        if freshness_hours > self.thresholds["data_freshness_hours"]:
+                            self._create_alert(
+                                severity=AlertSeverity.WARNING,
+                                message=f"Data is stale: {freshness_hours:.1f} hours old",
+                                component="database"
+                            )
                 
                 # Get database size
                 db_size_mb = db_path.stat().st_size / (1024 * 1024)
                 self._record_metric("database.size", db_size_mb, "MB", timestamp)
                 
-                # Check for database errors
-                try:
-                    cursor.execute("PRAGMA integrity_check;")
-                    integrity_check = cursor.fetchone()[0]
-                    if integrity_check != "ok":
-                        self._create_alert(
-                            severity=AlertSeverity.CRITICAL,
-                            message=f"Database integrity check failed: {integrity_check}",
-                            component="database"
-                        )
-                except:
-                    pass
-                
-                conn.close()
-                
             except Exception as e:
                 self.logger.error(f"Database monitoring error: {e}")
                 self._create_alert(
@@ -398,6 +420,8 @@ class MonitoringSystem:
                 )
             
             time.sleep(60)  # Check database every minute
+        
+        probes.close()
     
     def _monitor_data_quality(self) -> None:
         """Monitor data quality metrics."""
@@ -627,6 +651,9 @@ class MonitoringSystem:
                     maxlen=1000
                 )
                 
+                # Drop metric segments past their retention window
+                self.tsdb.apply_retention()
+                
                 # Save current state
                 self._save_state()
                 
@@ -703,26 +730,19 @@ class MonitoringSystem:
         
         self.metrics.append(metric)
         
-        # Save to time-series database (simplified)
+        # Save to time-series database
         self._save_metric_to_tsdb(metric)
     
     def _save_metric_to_tsdb(self, metric: Metric) -> None:
-        """Save metric to time-series database (simplified file-based)."""
+        """Buffer metric in the time-series store (flushed in batches)."""
         try:
-            # Group metrics by hour for efficiency
-            hour_key = metric.timestamp.strftime("%Y%m%d%H")
-            tsdb_file = self.data_dir / f"tsdb_{hour_key}.jsonl"
-            
-            # Append metric to file
-            with open(tsdb_file, 'a') as f:
-                f.write(json.dumps({
-                    "name": metric.name,
-                    "value": metric.value,
-                    "unit": metric.unit,
-                    "timestamp": metric.timestamp.isoformat(),
-                    "labels": metric.labels
-                }) + "\n")
-                
+            self.tsdb.append(
+                metric.name,
+                metric.value,
+                metric.timestamp,
+                unit=metric.unit,
+                labels=metric.labels
+            )
         except Exception as e:
             self.logger.error(f"Failed to save metric to TSDB: {e}")
     
@@ -838,14 +858,6 @@ class MonitoringSystem:
         try:
             # Get current metrics (last 5 minutes)
             cutoff = datetime.now() - timedelta(minutes=5)
-            recent_metrics = [m for m in self.metrics if m.timestamp > cutoff]
-            
-            # Group metrics by type
-            metrics_by_name = {}
-            for metric in recent_metrics:
-                if metric.name not in metrics_by_name:
-                    metrics_by_name[metric.name] = []
-                metrics_by_name[metric.name].append(metric.value)
             
             # Create table
             table = Table(show_header=False, box=None)
@@ -864,10 +876,10 @@ class MonitoringSystem:
             }
             
             for metric_key, display_name in key_metrics.items():
-                if metric_key in metrics_by_name:
-                    values = metrics_by_name[metric_key]
-                    current = values[-1] if values else 0
-                    avg = np.mean(values) if values else 0
+                stats = self.tsdb.aggregate(metric_key, cutoff, resolution="raw")
+                if stats:
+                    current = stats["latest"]
+                    avg = stats["avg"]
                     
                     # Format value based on metric type
                     if "percent" in metric_key:
@@ -959,41 +971,36 @@ class MonitoringSystem:
         """Get metrics summary for API."""
         # Get last hour of metrics
         cutoff = datetime.now() - timedelta(hours=1)
-        recent_metrics = [m for m in self.metrics if m.timestamp > cutoff]
         
-        # Group and aggregate
+        # Aggregate each series from the time-series store, keyed by name and
+        # labels so same-named series (one per host, table, ...) stay apart
         summary = {}
-        for metric in recent_metrics:
-            if metric.name not in summary:
-                summary[metric.name] = {
-                    "values": [],
-                    "unit": metric.unit,
-                    "labels": metric.labels
-                }
-            summary[metric.name]["values"].append(metric.value)
-        
-        # Calculate statistics
-        for name, data in summary.items():
-            values = data["values"]
-            if values:
-                data["count"] = len(values)
-                data["min"] = min(values)
-                data["max"] = max(values)
-                data["avg"] = np.mean(values)
-                data["latest"] = values[-1]
-                del data["values"]
+        metrics_count = 0
+        for series in self.tsdb.series():
+            stats = self.tsdb.aggregate(series["name"], cutoff, labels=series["labels"])
+            if not stats:
+                continue
+            
+            summary[series["key"]] = {
+                "name": series["name"],
+                "unit": series["unit"],
+                "labels": series["labels"],
+                **stats
+            }
+            metrics_count += stats["count"]
         
         return {
             "timestamp": datetime.now().isoformat(),
-            "metrics_count": len(recent_metrics),
+            "metrics_count": metrics_count,
             "summary": summary,
             "system_status": self.system_status.value
         }
 
 
-def start_monitoring(port: int = 9090) -> MonitoringSystem:
+def start_monitoring(port: int = 9090, pid: Optional[int] = None,
+                     pidfile: Optional[str] = None) -> MonitoringSystem:
     """Start the monitoring system."""
-    monitor = MonitoringSystem(port=port)
+    monitor = MonitoringSystem(port=port, pid=pid, pidfile=pidfile)
     monitor.start()
     return monitor
 
@@ -1007,6 +1014,8 @@ def main():
     parser.add_argument("--dashboard", action="store_true", help="Start dashboard")
     parser.add_argument("--health", action="store_true", help="Check system health")
     parser.add_argument("--metrics", action="store_true", help="Get metrics summary")
+    parser.add_argument("--pid", type=int, help="Pipeline process to watch")
+    parser.add_argument("--pidfile", help="File holding the pipeline process id")
     
     args = parser.parse_args()
     
@@ -1025,7 +1034,7 @@ def main():
         return
     
     # Start full monitoring system
-    monitor = start_monitoring(args.port)
+    monitor = start_monitoring(args.port, pid=args.pid, pidfile=args.pidfile)
     
     try:
         # Keep main thread alive
@@ -3,12 +3,14 @@ __author__ = "Your Name"
 __email__ = "your.email@domain.com"
 
 from .scraper import WebScraper
+from .fetcher import ResilientFetcher
 from .data_cleaner import DataCleaner
 from .database_handler import DatabaseHandler
 from .cli import create_parser, execute_pipeline
 
 __all__ = [
     "WebScraper",
+    "ResilientFetcher",
     "DataCleaner", 
     "DatabaseHandler",
     "create_parser",
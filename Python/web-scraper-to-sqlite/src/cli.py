@@ -65,6 +65,13 @@ Examples:
         help='Configuration file path (default: config.yaml)'
     )
     
+    parser.add_argument(
+        '--pidfile',
+        type=str,
+        default='logs/pipeline.pid',
+        help='Write the pipeline pid here for monitoring.py --pidfile (default: logs/pipeline.pid)'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
@@ -0,0 +1,240 @@
+import asyncio
+import random
+import time
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+class FetchError(Exception):
+    """Raised when a single fetch attempt fails."""
+
+
+class PermanentFetchError(FetchError):
+    """Raised for failures that retrying cannot fix (e.g. robots.txt denial)."""
+
+
+class CircuitOpenError(FetchError):
+    """Raised when a host's circuit breaker rejects a request."""
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter."""
+    attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+
+    def delay(self, attempt: int) -> float:
+        """Sleep time before retry number ``attempt`` (1-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker (closed -> open -> half-open)."""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds before a half-open trial request is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold or self.state == "half-open":
+            self.opened_at = time.monotonic()
+
+
+class LatencyTracker:
+    """Rolling window of response latencies for one host."""
+
+    def __init__(self, window: int = 100):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+
+class ResilientFetcher:
+    """Retry, circuit breaking and optional hedging around a single-attempt fetch.
+
+    ``fetch_once`` performs one attempt and must raise on failure. Requests
+    for a URL are retried with backoff. When the primary fails, the fallback
+    mirrors are tried in order. With hedging enabled, a fallback is started
+    as soon as the primary has been outstanding longer than its host's p95
+    latency, and the first successful response wins.
+    """
+
+    def __init__(
+        self,
+        fetch_once: Callable[[str], Awaitable[str]],
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: bool = False,
+        hedge_percentile: float = 95.0,
+        default_hedge_delay: float = 2.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0
+    ):
+        """Initialize fetcher.
+
+        Args:
+            fetch_once: Coroutine function performing one attempt for a URL
+            retry_policy: Backoff policy per URL
+            hedge: Fire fallbacks when the primary is slower than the hedge delay
+            hedge_percentile: Latency percentile used as hedge delay
+            default_hedge_delay: Hedge delay until enough samples exist
+            failure_threshold: Failures that open a host's circuit
+            reset_timeout: Seconds an open circuit waits before a trial request
+        """
+        self.fetch_once = fetch_once
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyTracker] = {}
+        self.stats = {'attempts': 0, 'retries': 0, 'hedged': 0, 'fallbacks_used': 0}
+
+    @staticmethod
+    def _host(url: str) -> str:
+        parsed = urlparse(url)
+        return parsed.netloc or parsed.scheme or 'local'
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        if host not in self.breakers:
+            self.breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return self.breakers[host]
+
+    def hedge_delay(self, url: str) -> float:
+        """Hedge delay for a URL's host: its latency percentile, or the default."""
+        tracker = self.latencies.get(self._host(url))
+        if tracker is None or len(tracker.samples) < 10:
+            return self.default_hedge_delay
+        return tracker.percentile(self.hedge_percentile)
+
+    async def fetch_with_retry(self, url: str) -> str:
+        """Fetch one URL, retrying with backoff while its circuit is closed."""
+        host = self._host(url)
+        breaker = self._breaker(host)
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, self.retry_policy.attempts + 1):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {host}")
+            if attempt > 1:
+                self.stats['retries'] += 1
+                await asyncio.sleep(self.retry_policy.delay(attempt - 1))
+
+            self.stats['attempts'] += 1
+            start = time.monotonic()
+            try:
+                content = await self.fetch_once(url)
+            except (asyncio.CancelledError, PermanentFetchError):
+                raise
+            except Exception as e:
+                breaker.record_failure()
+                last_error = e
+                logger.warning(f"Attempt {attempt}/{self.retry_policy.attempts} failed for {url}: {e}")
+                continue
+
+            breaker.record_success()
+            self.latencies.setdefault(host, LatencyTracker()).observe(time.monotonic() - start)
+            return content
+
+        raise FetchError(f"All {self.retry_policy.attempts} attempts failed for {url}: {last_error}")
+
+    async def fetch(self, url: str, fallback_urls: Optional[List[str]] = None) -> str:
+        """Fetch ``url``, falling back to (or hedging with) mirror URLs.
+
+        Raises:
+            FetchError: If the primary and every fallback failed
+        """
+        candidates = [url] + [u for u in (fallback_urls or []) if u != url]
+        if self.hedge:
+            return await self._fetch_hedged(candidates)
+
+        errors = []
+        for index, candidate in enumerate(candidates):
+            try:
+                content = await self.fetch_with_retry(candidate)
+                if index:
+                    self.stats['fallbacks_used'] += 1
+                    logger.info(f"Using fallback source {candidate}")
+                return content
+            except FetchError as e:
+                errors.append(str(e))
+        raise FetchError("; ".join(errors))
+
+    async def _fetch_hedged(self, candidates: List[str]) -> str:
+        pending: Dict[asyncio.Task, str] = {}
+        remaining = list(candidates)
+        errors = []
+
+        def launch() -> None:
+            candidate = remaining.pop(0)
+            pending[asyncio.ensure_future(self.fetch_with_retry(candidate))] = candidate
+
+        launch()
+        try:
+            while pending:
+                # Wait for a result, or hedge after the newest request's p95 latency
+                timeout = self.hedge_delay(list(pending.values())[-1]) if remaining else None
+                done, _ = await asyncio.wait(pending, timeout=timeout,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    self.stats['hedged'] += 1
+                    launch()
+                    continue
+
+                for task in done:
+                    candidate = pending.pop(task)
+                    if task.exception() is None:
+                        if candidate != candidates[0]:
+                            self.stats['fallbacks_used'] += 1
+                            logger.info(f"Using fallback source {candidate}")
+                        return task.result()
+                    errors.append(str(task.exception()))
+
+                # Every in-flight request failed; move on to the next mirror
+                if not pending and remaining:
+                    launch()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise FetchError("; ".join(errors))
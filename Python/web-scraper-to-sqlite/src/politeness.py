@@ -0,0 +1,166 @@
+import asyncio
+import time
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from .fetcher import PermanentFetchError
+
+logger = logging.getLogger(__name__)
+
+
+class RobotsDisallowedError(PermanentFetchError):
+    """Raised when robots.txt forbids fetching a URL."""
+
+
+class HostLimitReachedError(PermanentFetchError):
+    """Raised when a host's page budget is used up."""
+
+
+class TokenBucket:
+    """Token bucket that hands out future reservations instead of locking.
+
+    Tokens may go negative: each caller reserves the next free slot and
+    sleeps until it arrives, so waiters are served in arrival order without
+    an ``asyncio.Lock`` (which would bind to one event loop).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    async def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RobotsCache:
+    """Per-origin robots.txt cache with TTL."""
+
+    def __init__(self, fetch_text: Callable[[str], Awaitable[Tuple[int, str]]],
+                 user_agent: str, ttl: float = 3600.0):
+        """Initialize robots cache.
+
+        Args:
+            fetch_text: Coroutine returning (status, body) for a URL
+            user_agent: Agent string matched against robots.txt groups
+            ttl: Seconds before robots.txt is fetched again
+        """
+        self.fetch_text = fetch_text
+        self.user_agent = user_agent
+        self.ttl = ttl
+        self._parsers: Dict[str, Tuple[RobotFileParser, float]] = {}
+
+    async def get(self, url: str) -> RobotFileParser:
+        """Get the parsed robots.txt for a URL's origin."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        cached = self._parsers.get(origin)
+        if cached and time.monotonic() - cached[1] < self.ttl:
+            return cached[0]
+
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            status, body = await self.fetch_text(parser.url)
+        except Exception as e:
+            logger.warning(f"Could not fetch {parser.url}: {e}; assuming allowed")
+            status, body = 404, ""
+
+        # Same semantics as RobotFileParser.read(): auth errors deny, other errors allow
+        if status in (401, 403):
+            parser.disallow_all = True
+        elif status >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(body.splitlines())
+
+        self._parsers[origin] = (parser, time.monotonic())
+        return parser
+
+    async def can_fetch(self, url: str) -> bool:
+        return (await self.get(url)).can_fetch(self.user_agent, url)
+
+    async def crawl_delay(self, url: str) -> Optional[float]:
+        delay = (await self.get(url)).crawl_delay(self.user_agent)
+        return float(delay) if delay is not None else None
+
+
+class HostScheduler:
+    """Per-host politeness: robots.txt rules, crawl-delay and a token bucket.
+
+    Each host gets its own bucket whose rate is the strictest of
+    ``rate_limit`` (requests per minute), ``delay_between_requests`` and the
+    host's robots.txt crawl-delay. Requests to different hosts never wait on
+    each other, so throughput grows with the number of domains while every
+    single host sees at most its polite rate.
+    """
+
+    def __init__(
+        self,
+        robots: Optional[RobotsCache] = None,
+        rate_limit: float = 60.0,
+        delay_between_requests: float = 0.0,
+        max_pages_per_domain: Optional[int] = None
+    ):
+        """Initialize scheduler.
+
+        Args:
+            robots: Robots cache, or None to ignore robots.txt
+            rate_limit: Requests per minute per host
+            delay_between_requests: Minimum seconds between requests to one host
+            max_pages_per_domain: Page budget per host (None for unlimited)
+        """
+        self.robots = robots
+        self.rate_limit = rate_limit
+        self.delay_between_requests = delay_between_requests
+        self.max_pages_per_domain = max_pages_per_domain
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.pages: Dict[str, int] = {}
+
+    async def _bucket(self, url: str, host: str) -> TokenBucket:
+        if host not in self.buckets:
+            min_interval = max(self.delay_between_requests, 60.0 / self.rate_limit if self.rate_limit else 0.0)
+            if self.robots is not None:
+                min_interval = max(min_interval, await self.robots.crawl_delay(url) or 0.0)
+            rate = 1.0 / min_interval if min_interval > 0 else float("inf")
+            self.buckets.setdefault(host, TokenBucket(rate))
+        return self.buckets[host]
+
+    async def wait_turn(self, url: str) -> None:
+        """Wait until ``url`` may be fetched politely.
+
+        Raises:
+            RobotsDisallowedError: If robots.txt forbids the URL
+            HostLimitReachedError: If the host's page budget is exhausted
+        """
+        host = urlparse(url).netloc
+        if self.robots is not None and not await self.robots.can_fetch(url):
+            raise RobotsDisallowedError(f"robots.txt disallows {url}")
+
+        if self.max_pages_per_domain is not None:
+            if self.pages.get(host, 0) >= self.max_pages_per_domain:
+                raise HostLimitReachedError(f"Page limit of {self.max_pages_per_domain} reached for {host}")
+            self.pages[host] = self.pages.get(host, 0) + 1
+
+        bucket = await self._bucket(url, host)
+        if bucket.rate != float("inf"):
+            await bucket.acquire()
@@ -6,7 +6,7 @@ import time
 import logging
 import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union, Tuple
+from typing import Dict, List, Optional, Any, Union, Tuple, Callable
 from dataclasses import dataclass, asdict, field
 from urllib.parse import urlparse
 from bs4 import BeautifulSoup
@@ -15,6 +15,9 @@ from concurrent.futures import ThreadPoolExecutor
 import pickle
 from datetime import datetime, timedelta
 
+from .fetcher import ResilientFetcher, RetryPolicy, FetchError
+from .politeness import HostScheduler, RobotsCache
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -127,14 +130,28 @@ class WebScraper:
         cache_enabled: bool = True,
         max_concurrent: int = 5,
         timeout: int = 30,
-        user_agent: str = None
+        user_agent: str = None,
+        fallback_urls: Optional[List[str]] = None,
+        retry_attempts: int = 3,
+        hedge_requests: bool = False,
+        respect_robots_txt: bool = False,
+        rate_limit: float = 60.0,
+        delay_between_requests: float = 0.0,
+        max_pages_per_domain: Optional[int] = None,
+        loop_monitor: Optional[Callable[[asyncio.AbstractEventLoop], None]] = None
     ):
-        """Initialize scraper with configuration."""
+        """Initialize scraper with configuration.
+
+        ``loop_monitor`` is handed each event loop ``scrape_sync`` creates, so
+        the caller can attach a lag probe to it.
+        """
         self.target_url = target_url
+        self.fallback_urls = list(fallback_urls or [])
         self.selectors = selectors or self.DEFAULT_SELECTORS
         self.cache_enabled = cache_enabled
         self.max_concurrent = max_concurrent
         self.timeout = timeout
+        self.loop_monitor = loop_monitor
         self.user_agent = user_agent or (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -144,6 +161,17 @@ class WebScraper:
         self.cache = CacheHandler() if cache_enabled else None
         self.session = None
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.fetcher = ResilientFetcher(
+            self._fetch_once,
+            retry_policy=RetryPolicy(attempts=max(1, retry_attempts)),
+            hedge=hedge_requests
+        )
+        self.scheduler = HostScheduler(
+            robots=RobotsCache(self._fetch_robots, self.user_agent) if respect_robots_txt else None,
+            rate_limit=rate_limit,
+            delay_between_requests=delay_between_requests,
+            max_pages_per_domain=max_pages_per_domain
+        )
         
         # Statistics
         self.scrape_stats = {
@@ -186,8 +214,8 @@ class WebScraper:
             logger.error(f"Error reading local file {file_path}: {str(e)}")
             return None
     
-    async def _fetch_url(self, url: str) -> Optional[str]:
-        """Fetch content from URL (async)."""
+    async def _fetch_once(self, url: str) -> str:
+        """Make a single fetch attempt, raising FetchError on failure."""
         if self._is_local_file(url):
             # Use thread pool for file I/O
             loop = asyncio.get_event_loop()
@@ -195,6 +223,8 @@ class WebScraper:
                 content = await loop.run_in_executor(
                     pool, self._read_local_file, url
                 )
+            if content is None:
+                raise FetchError(f"Could not read local file {url}")
             return content
         
         # Check cache first
@@ -205,6 +235,9 @@ class WebScraper:
                 logger.debug(f"Cache hit for: {url}")
                 return cached
         
+        # Per-host politeness first, so a slow host never holds a global slot
+        await self.scheduler.wait_turn(url)
+        
         # Fetch from web
         async with self.semaphore:
             try:
@@ -227,13 +260,32 @@ class WebScraper:
                         return content
                         
             except asyncio.TimeoutError:
-                logger.error(f"Timeout fetching {url}")
+                raise FetchError(f"Timeout fetching {url}")
             except aiohttp.ClientError as e:
-                logger.error(f"HTTP error fetching {url}: {str(e)}")
-            except Exception as e:
-                logger.error(f"Error fetching {url}: {str(e)}")
-            
-            return None
+                raise FetchError(f"HTTP error fetching {url}: {str(e)}")
+    
+    async def _fetch_robots(self, url: str) -> Tuple[int, str]:
+        """Fetch a robots.txt file, returning (status, body)."""
+        async with aiohttp.ClientSession() as session:
+            async with session.get(
+                url,
+                headers={'User-Agent': self.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                return response.status, await response.text()
+    
+    async def _fetch_url(self, url: str) -> Optional[str]:
+        """Fetch content from URL (async) with retries and fallback sources."""
+        try:
+            # Fallback mirrors stand in for the primary target only
+            fallback_urls = self.fallback_urls if url == self.target_url else []
+            return await self.fetcher.fetch(url, fallback_urls)
+        except FetchError as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+        except Exception as e:
+            logger.error(f"Error fetching {url}: {str(e)}")
+        
+        return None
     
     def _parse_html(self, html_content: str, base_url: str = None) -> BeautifulSoup:
         """Parse HTML content."""
@@ -377,6 +429,10 @@ class WebScraper:
             'errors_count': self.scrape_stats['errors_count'],
             'cache_hits': self.scrape_stats.get('cache_hits', 0),
             'cache_misses': self.scrape_stats.get('cache_misses', 0),
+            'fetch_attempts': self.fetcher.stats['attempts'],
+            'fetch_retries': self.fetcher.stats['retries'],
+            'hedged_requests': self.fetcher.stats['hedged'],
+            'fallbacks_used': self.fetcher.stats['fallbacks_used'],
             'cache_ratio': round(
                 self.scrape_stats.get('cache_hits', 0) / 
                 max(self.scrape_stats.get('cache_hits', 0) + self.scrape_stats.get('cache_misses', 0), 1) * 100, 
@@ -387,13 +443,15 @@ class WebScraper:
             'end_time': datetime.fromtimestamp(end_time).isoformat()
         }
     
-    async def scrape_data(self, limit: Optional[int] = None, use_async: bool = True) -> ScrapeResult:
+    async def scrape_data(self, limit: Optional[int] = None, use_async: bool = True,
+                          url: Optional[str] = None) -> ScrapeResult:
         """Main method to scrape data."""
-        if not self.target_url:
+        target_url = url or self.target_url
+        if not target_url:
             logger.error("No target URL provided")
             return ScrapeResult([], {'success': False, 'error': 'No URL provided'})
         
-        logger.info(f"Starting scrape of {self.target_url} (async: {use_async})")
+        logger.info(f"Starting scrape of {target_url} (async: {use_async})")
         
         start_time = time.time()
         self.scrape_stats['start_time'] = start_time
@@ -401,11 +459,11 @@ class WebScraper:
         
         try:
             # Fetch content
-            html_content = await self._fetch_url(self.target_url)
+            html_content = await self._fetch_url(target_url)
             
             if not html_content:
                 self.scrape_stats['errors_count'] += 1
-                error_msg = f"Failed to retrieve page content from {self.target_url}"
+                error_msg = f"Failed to retrieve page content from {target_url}"
                 logger.error(error_msg)
                 return ScrapeResult([], {
                     'success': False, 
@@ -414,7 +472,7 @@ class WebScraper:
                 })
             
             # Parse HTML
-            soup = self._parse_html(html_content, self.target_url)
+            soup = self._parse_html(html_content, target_url)
             if not soup:
                 self.scrape_stats['errors_count'] += 1
                 return ScrapeResult([], {
@@ -436,7 +494,7 @@ class WebScraper:
             
             # Create metadata
             metadata = {
-                'source_url': self.target_url,
+                'source_url': target_url,
                 'selectors_used': self.selectors,
                 'limit_applied': limit if limit else None,
                 'async_mode': use_async,
@@ -466,6 +524,16 @@ class WebScraper:
                 'duration_seconds': round(time.time() - start_time, 2)
             })
     
+    async def scrape_many(self, urls: List[str], limit: Optional[int] = None) -> List[ScrapeResult]:
+        """Scrape several pages concurrently, interleaving hosts.
+        
+        Each host is throttled by its own token bucket, so pages on different
+        domains proceed in parallel while every domain stays polite.
+        """
+        return await asyncio.gather(*(
+            self.scrape_data(limit=limit, url=url) for url in urls
+        ))
+    
     def test_selectors(self) -> Dict[str, Any]:
         """Test selectors against target URL."""
         if not self.target_url:
@@ -527,6 +595,8 @@ class WebScraper:
             # Create new event loop for synchronous call
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
+            if self.loop_monitor:
+                self.loop_monitor(loop)
             
             try:
                 return loop.run_until_complete(
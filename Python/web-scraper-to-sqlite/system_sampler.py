@@ -0,0 +1,326 @@
+import os
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
+
+logger = logging.getLogger(__name__)
+
+PROC = Path("/proc")
+
+# (metric name, value, unit, labels)
+Sample = Tuple[str, float, str, Dict[str, str]]
+
+
+def lag_file_for(pidfile: str) -> Path:
+    """Status file next to the pidfile where the pipeline publishes its event loop lag."""
+    pidfile = Path(pidfile)
+    return pidfile.with_name(pidfile.name + ".lag")
+
+
+class SystemSampler:
+    """Low-overhead sampler for host resources and the pipeline's process tree.
+
+    Reads ``/proc`` directly and computes CPU usage from counter deltas
+    between calls, so sampling never blocks. Each metric family has its own
+    interval and is only read when due. On hosts without ``/proc`` it falls
+    back to non-blocking psutil calls.
+    """
+
+    DEFAULT_INTERVALS = {
+        "cpu": 5,
+        "memory": 15,
+        "disk": 60,
+        "process_tree": 15,
+        "threads": 30,
+        "event_loop": 5,
+    }
+
+    # A published lag older than this (or two event_loop intervals) is ignored
+    STALE_LAG_SECONDS = 10
+
+    def __init__(self, intervals: Dict[str, float] = None, pid: int = None,
+                 pidfile: str = None, disk_path: str = "/"):
+        """Initialize the sampler.
+
+        Args:
+            intervals: Per-family sampling interval overrides in seconds
+            pid: Root of the tracked process tree (defaults to this process)
+            pidfile: File holding the root pid, re-read on every sample so a
+                restarted pipeline is followed (takes precedence over ``pid``)
+            disk_path: Filesystem to report disk usage for
+        """
+        self.intervals = {**self.DEFAULT_INTERVALS, **(intervals or {})}
+        self._pid = pid or os.getpid()
+        self.pidfile = Path(pidfile) if pidfile else None
+        self.disk_path = disk_path
+        self.use_proc = (PROC / "stat").exists()
+
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._last_run: Dict[str, float] = {}
+        self._last_cpu: Optional[Tuple[int, int]] = None
+        self._last_thread_ticks: Dict[int, Tuple[int, float]] = {}
+        self._last_self_cpu: Optional[Tuple[float, float]] = None
+
+        self.event_loop_lag_ms: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    @property
+    def pid(self) -> int:
+        """Root of the tracked process tree; raises OSError/ValueError if the pidfile is unusable."""
+        if self.pidfile is None:
+            return self._pid
+        return int(self.pidfile.read_text().strip())
+
+    @property
+    def tick_seconds(self) -> float:
+        """Smallest family interval, i.e. how often ``sample`` should be called."""
+        return min(self.intervals.values())
+
+    def _due(self, family: str, now: float) -> bool:
+        last = self._last_run.get(family)
+        if last is None or now - last >= self.intervals[family]:
+            self._last_run[family] = now
+            return True
+        return False
+
+    def sample(self) -> List[Sample]:
+        """Read every metric family that is due.
+
+        Returns:
+            List[Sample]: (metric name, value, unit, labels) per series; a
+            name repeats when one family reports several labelled series
+        """
+        now = time.monotonic()
+        metrics: List[Sample] = []
+        readers = {
+            "cpu": self._sample_cpu,
+            "memory": self._sample_memory,
+            "disk": self._sample_disk,
+            "process_tree": self._sample_process_tree,
+            "threads": self._sample_threads,
+            "event_loop": self._sample_event_loop,
+        }
+
+        for family, reader in readers.items():
+            if not self._due(family, now):
+                continue
+            try:
+                metrics.extend(reader())
+            except (OSError, ValueError, IndexError) as e:
+                logger.debug(f"Sampling {family} failed: {e}")
+
+        metrics.extend(self._sample_self_overhead())
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Host metrics
+    # ------------------------------------------------------------------
+
+    def _sample_cpu(self) -> List[Sample]:
+        if not self.use_proc:
+            import psutil
+            return [("system.cpu.percent", psutil.cpu_percent(interval=None), "%", {})]
+
+        with open(PROC / "stat", "r") as f:
+            fields = [int(x) for x in f.readline().split()[1:9]]
+        idle = fields[3] + fields[4]  # idle + iowait
+        total = sum(fields)
+
+        metrics = []
+        if self._last_cpu is not None:
+            total_delta = total - self._last_cpu[0]
+            idle_delta = idle - self._last_cpu[1]
+            if total_delta > 0:
+                cpu_percent = 100.0 * (total_delta - idle_delta) / total_delta
+                metrics.append(("system.cpu.percent", cpu_percent, "%", {}))
+        self._last_cpu = (total, idle)
+
+        # Process count from the kernel's run-queue summary instead of enumerating processes
+        with open(PROC / "loadavg", "r") as f:
+            loadavg = f.read().split()
+        metrics.append(("system.load.1m", float(loadavg[0]), "load", {}))
+        metrics.append(("system.processes.count", int(loadavg[3].split("/")[1]), "count", {}))
+        return metrics
+
+    def _sample_memory(self) -> List[Sample]:
+        if self.use_proc:
+            meminfo = {}
+            with open(PROC / "meminfo", "r") as f:
+                for line in f:
+                    key, value = line.split(":", 1)
+                    meminfo[key] = int(value.split()[0]) * 1024
+            total = meminfo["MemTotal"]
+            used = total - meminfo.get("MemAvailable", meminfo.get("MemFree", 0))
+        else:
+            import psutil
+            memory = psutil.virtual_memory()
+            total, used = memory.total, memory.total - memory.available
+
+        return [
+            ("system.memory.percent", 100.0 * used / total if total else 0.0, "%", {}),
+            ("system.memory.used", used / (1024**3), "GB", {}),
+            ("system.memory.total", total / (1024**3), "GB", {}),
+        ]
+
+    def _sample_disk(self) -> List[Sample]:
+        stats = os.statvfs(self.disk_path)
+        total = stats.f_blocks * stats.f_frsize
+        free = stats.f_bavail * stats.f_frsize
+        used = (stats.f_blocks - stats.f_bfree) * stats.f_frsize
+        # Same definition as psutil: used / (used + space available to unprivileged users)
+        percent = 100.0 * used / (used + free) if used + free else 0.0
+        return [
+            ("system.disk.percent", percent, "%", {}),
+            ("system.disk.used", used / (1024**3), "GB", {}),
+            ("system.disk.total", total / (1024**3), "GB", {}),
+        ]
+
+    # ------------------------------------------------------------------
+    # Pipeline process tree
+    # ------------------------------------------------------------------
+
+    def _children(self, pid: int) -> List[int]:
+        """List direct children via /proc/<pid>/task/*/children."""
+        children = []
+        for task in (PROC / str(pid) / "task").iterdir():
+            try:
+                children.extend(int(c) for c in (task / "children").read_text().split())
+            except OSError:
+                continue
+        return children
+
+    def _process_tree(self) -> List[int]:
+        pids, stack = [], [self.pid]
+        while stack:
+            pid = stack.pop()
+            pids.append(pid)
+            try:
+                stack.extend(self._children(pid))
+            except OSError:
+                continue
+        return pids
+
+    def _read_stat(self, path: Path) -> List[str]:
+        # Fields after the parenthesised command name, which may itself contain spaces
+        data = path.read_text()
+        return data[data.rindex(")") + 2:].split()
+
+    def _sample_process_tree(self) -> List[Sample]:
+        if not self.use_proc:
+            import psutil
+            root = psutil.Process(self.pid)
+            procs = [root] + root.children(recursive=True)
+            rss = sum(p.memory_info().rss for p in procs)
+            fds = sum(p.num_fds() for p in procs if hasattr(p, "num_fds"))
+            threads = sum(p.num_threads() for p in procs)
+        else:
+            procs = self._process_tree()
+            rss = fds = threads = 0
+            for pid in procs:
+                try:
+                    stat = self._read_stat(PROC / str(pid) / "stat")
+                    threads += int(stat[17])
+                    rss += int(stat[21]) * self._page_size
+                    fds += len(os.listdir(PROC / str(pid) / "fd"))
+                except (OSError, ValueError, IndexError):
+                    continue  # Process exited between listing and reading
+
+        return [
+            ("pipeline.processes.count", len(procs), "count", {}),
+            ("pipeline.memory.rss", rss / (1024**2), "MB", {}),
+            ("pipeline.fds.open", fds, "count", {}),
+            ("pipeline.threads.count", threads, "count", {}),
+        ]
+
+    def _sample_threads(self) -> List[Sample]:
+        if not self.use_proc:
+            return []
+
+        # Summed per thread name: tids churn as workers come and go, names do not
+        now = time.monotonic()
+        by_name: Dict[str, float] = {}
+        seen = {}
+        for task in (PROC / str(self.pid) / "task").iterdir():
+            try:
+                tid = int(task.name)
+                stat = self._read_stat(task / "stat")
+                ticks = int(stat[11]) + int(stat[12])  # utime + stime
+                name = (task / "comm").read_text().strip()
+            except (OSError, ValueError, IndexError):
+                continue
+
+            seen[tid] = (ticks, now)
+            previous = self._last_thread_ticks.get(tid)
+            if previous is not None and now > previous[1]:
+                cpu_seconds = (ticks - previous[0]) / self._clock_ticks
+                percent = 100.0 * cpu_seconds / (now - previous[1])
+                by_name[name] = by_name.get(name, 0.0) + percent
+
+        self._last_thread_ticks = seen
+        return [("pipeline.thread.cpu_percent", percent, "%", {"thread": name})
+                for name, percent in sorted(by_name.items())]
+
+    def _sample_self_overhead(self) -> List[Sample]:
+        """CPU share of a core used by this process since the previous sample."""
+        now = (time.monotonic(), time.process_time())
+        previous, self._last_self_cpu = self._last_self_cpu, now
+        if previous is None or now[0] <= previous[0]:
+            return []
+        percent = 100.0 * (now[1] - previous[1]) / (now[0] - previous[0])
+        return [("monitoring.overhead.cpu_percent", percent, "%", {})]
+
+    # ------------------------------------------------------------------
+    # Event loop lag
+    # ------------------------------------------------------------------
+
+    def watch_event_loop(self, loop: asyncio.AbstractEventLoop, interval: float = 0.5,
+                         lag_file: str = None) -> None:
+        """Measure how late ``loop`` runs a periodic callback.
+
+        Safe to call from any thread; the probe reschedules itself on the loop.
+
+        Args:
+            loop: Event loop to probe
+            interval: Seconds between probe callbacks
+            lag_file: Where to publish each reading for a monitor running in
+                another process (see ``lag_file_for``)
+        """
+        lag_path = Path(lag_file) if lag_file else None
+
+        def tick(expected: float) -> None:
+            self.event_loop_lag_ms = max(0.0, (loop.time() - expected) * 1000)
+            if lag_path is not None:
+                try:
+                    # Write-then-rename so the monitor never reads a partial value
+                    tmp = lag_path.with_name(lag_path.name + ".tmp")
+                    tmp.write_text(f"{self.event_loop_lag_ms:.3f}\n")
+                    os.replace(tmp, lag_path)
+                except OSError as e:
+                    logger.debug(f"Publishing event loop lag failed: {e}")
+            if not loop.is_closed():
+                loop.call_later(interval, tick, loop.time() + interval)
+
+        loop.call_soon_threadsafe(lambda: loop.call_later(interval, tick, loop.time() + interval))
+
+    def _sample_event_loop(self) -> List[Sample]:
+        if self.event_loop_lag_ms is not None:
+            return [("pipeline.event_loop.lag", self.event_loop_lag_ms, "ms", {})]
+        if self.pidfile is None:
+            return []
+
+        # The loop lives in the pipeline process, which publishes its lag next to the pidfile
+        lag_path = lag_file_for(self.pidfile)
+        try:
+            age = time.time() - lag_path.stat().st_mtime
+            lag_ms = float(lag_path.read_text().strip())
+        except FileNotFoundError:
+            return []
+        if age > max(self.STALE_LAG_SECONDS, 2 * self.intervals["event_loop"]):
+            return []  # Loop stopped or pipeline exited; the last reading no longer applies
+        return [("pipeline.event_loop.lag", lag_ms, "ms", {})]
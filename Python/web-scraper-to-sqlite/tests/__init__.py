@@ -5,9 +5,19 @@ __author__ = "Your Name"
 from .test_scraper import TestWebScraper
 from .test_data_cleaner import TestDataCleaner
 from .test_database_handler import TestDatabaseHandler
+from .test_metric_store import TestMetricStore
+from .test_db_probes import TestDatabaseProbes
+from .test_system_sampler import TestSystemSampler
+from .test_fetcher import TestResilientFetcher
+from .test_politeness import TestPoliteness
 
 __all__ = [
     "TestWebScraper",
     "TestDataCleaner", 
-    "TestDatabaseHandler"
+    "TestDatabaseHandler",
+    "TestMetricStore",
+    "TestDatabaseProbes",
+    "TestSystemSampler",
+    "TestResilientFetcher",
+    "TestPoliteness"
 ]
\ No newline at end of file
@@ -0,0 +1,112 @@
+import sys
+import os
+import time
+import sqlite3
+from datetime import datetime, timedelta
+import pytest
+
+# Add project root to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from db_probes import DatabaseProbes
+from src.database_handler import DatabaseHandler
+
+
+class TestDatabaseProbes:
+    """Test suite for the tiered database health probes."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Create a small WAL database shaped like the scraper's output."""
+        path = tmp_path / "scraped_data.db"
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("""
+            CREATE TABLE scraped_records (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                scraped_at TIMESTAMP
+            )
+        """)
+        conn.execute("CREATE INDEX idx_scraped_at ON scraped_records(scraped_at)")
+        now = datetime.now()
+        conn.executemany(
+            "INSERT INTO scraped_records (title, scraped_at) VALUES (?, ?)",
+            [(f"Product {i}", (now - timedelta(hours=i)).isoformat()) for i in range(2, 52)]
+        )
+        conn.commit()
+        conn.close()
+        return path
+
+    @pytest.fixture
+    def probes(self, db_path):
+        """Create probes over the temporary database."""
+        probes = DatabaseProbes(db_path, off_peak_hours=(0, 24))
+        yield probes
+        probes.close()
+
+    def test_row_counts(self, probes):
+        """Test row counts without and with sqlite_stat1."""
+        result = probes.probe_row_counts()
+        assert result.ok
+        assert result.value == {"scraped_records": 50}
+        assert result.metadata["sources"]["scraped_records"] == "max_rowid"
+
+    def test_row_counts_prefer_stat1(self, probes, db_path):
+        """Test that ANALYZE statistics are used when present."""
+        conn = sqlite3.connect(db_path)
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.close()
+
+        result = probes.probe_row_counts()
+        assert result.value == {"scraped_records": 50}
+        assert result.metadata["sources"]["scraped_records"] == "sqlite_stat1"
+
+    def test_freshness_uses_indexed_column(self, probes):
+        """Test freshness from the indexed timestamp column."""
+        result = probes.probe_freshness()
+        assert result.ok
+        assert result.metadata["column"] == "scraped_at"
+        assert 1.9 < result.value < 2.1
+
+    def test_freshness_reads_current_timestamp_as_utc(self, tmp_path, monkeypatch):
+        """Test freshness on the handler's created_at column outside UTC."""
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            path = tmp_path / "handler.db"
+            columns = ", ".join(f"{name} {kind}" for name, kind in DatabaseHandler.DEFAULT_SCHEMA.items())
+            conn = sqlite3.connect(path)
+            conn.execute(f"CREATE TABLE scraped_data ({columns})")
+            conn.execute("CREATE INDEX idx_scraped_data_created_at ON scraped_data(created_at)")
+            conn.execute("INSERT INTO scraped_data (title) VALUES ('Product')")
+            conn.commit()
+            conn.close()
+
+            probes = DatabaseProbes(path, table_name="scraped_data", off_peak_hours=(0, 24))
+            result = probes.probe_freshness()
+            probes.close()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+
+        assert result.ok
+        assert result.metadata == {"column": "created_at", "utc": True}
+        assert 0 <= result.value < 0.1
+
+    def test_integrity_is_scheduled(self, probes):
+        """Test that quick_check runs once per interval."""
+        results = probes.run_due()
+        assert [r.name for r in results] == ["row_counts", "freshness", "integrity"]
+        assert results[-1].value == "ok"
+        assert all(r.duration_ms >= 0 for r in results)
+
+        assert not probes.integrity_due()
+
+    def test_integrity_outside_off_peak(self, db_path):
+        """Test that the integrity probe waits for the off-peak window."""
+        probes = DatabaseProbes(db_path, off_peak_hours=(1, 5))
+        assert not probes.integrity_due(datetime(2024, 1, 1, 12))
+        assert probes.integrity_due(datetime(2024, 1, 1, 3))
@@ -0,0 +1,88 @@
+import sys
+import os
+import asyncio
+import pytest
+
+# Add project root to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.fetcher import ResilientFetcher, RetryPolicy, CircuitBreaker, FetchError, CircuitOpenError
+
+
+class FakeUpstream:
+    """Scripted upstream: per-URL delays and failure counts."""
+
+    def __init__(self, delays=None, failures=None):
+        self.delays = delays or {}
+        self.failures = dict(failures or {})
+        self.calls = []
+
+    async def __call__(self, url):
+        self.calls.append(url)
+        await asyncio.sleep(self.delays.get(url, 0))
+        if self.failures.get(url, 0):
+            self.failures[url] -= 1
+            raise FetchError(f"boom {url}")
+        return f"content of {url}"
+
+
+NO_WAIT = RetryPolicy(attempts=3, base_delay=0, max_delay=0)
+
+
+class TestResilientFetcher:
+    """Test suite for retry, fallback, circuit breaking and hedging."""
+
+    def test_retry_then_success(self):
+        """Test that transient failures are retried."""
+        upstream = FakeUpstream(failures={"https://a.com/p": 2})
+        fetcher = ResilientFetcher(upstream, retry_policy=NO_WAIT)
+
+        assert asyncio.run(fetcher.fetch("https://a.com/p")) == "content of https://a.com/p"
+        assert len(upstream.calls) == 3
+        assert fetcher.stats['retries'] == 2
+
+    def test_fallback_after_primary_exhausted(self):
+        """Test that fallback URLs are used when the primary keeps failing."""
+        upstream = FakeUpstream(failures={"https://a.com/p": 10})
+        fetcher = ResilientFetcher(upstream, retry_policy=NO_WAIT)
+
+        content = asyncio.run(fetcher.fetch("https://a.com/p", ["https://b.com/p"]))
+        assert content == "content of https://b.com/p"
+        assert fetcher.stats['fallbacks_used'] == 1
+
+    def test_all_sources_fail(self):
+        """Test that an error is raised when every source fails."""
+        upstream = FakeUpstream(failures={"https://a.com/p": 10, "https://b.com/p": 10})
+        fetcher = ResilientFetcher(upstream, retry_policy=NO_WAIT)
+
+        with pytest.raises(FetchError):
+            asyncio.run(fetcher.fetch("https://a.com/p", ["https://b.com/p"]))
+
+    def test_circuit_breaker_opens(self):
+        """Test that a host's circuit opens after repeated failures."""
+        upstream = FakeUpstream(failures={"https://a.com/p": 10})
+        fetcher = ResilientFetcher(upstream, retry_policy=NO_WAIT, failure_threshold=2)
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(fetcher.fetch_with_retry("https://a.com/p"))
+        assert len(upstream.calls) == 2
+        assert fetcher.breakers["a.com"].state == "open"
+
+    def test_half_open_after_timeout(self):
+        """Test that an open circuit allows a trial request after the timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        assert breaker.state == "half-open"
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_hedged_request_wins(self):
+        """Test that a slow primary is hedged by the fallback mirror."""
+        upstream = FakeUpstream(delays={"https://slow.com/p": 1.0})
+        fetcher = ResilientFetcher(upstream, retry_policy=NO_WAIT, hedge=True,
+                                   default_hedge_delay=0.05)
+
+        content = asyncio.run(fetcher.fetch("https://slow.com/p", ["https://fast.com/p"]))
+        assert content == "content of https://fast.com/p"
+        assert fetcher.stats['hedged'] == 1
@@ -0,0 +1,75 @@
+import sys
+import os
+from datetime import datetime, timedelta
+import pytest
+
+# Add project root to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from metric_store import MetricStore
+
+
+class TestMetricStore:
+    """Test suite for the embedded monitoring metric store."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create a store that only flushes when asked to."""
+        return MetricStore(tmp_path / "tsdb", flush_interval=3600, flush_size=10_000)
+
+    @pytest.fixture
+    def base_time(self):
+        """Provide a timestamp aligned to the start of an hour."""
+        return datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(hours=2)
+
+    def test_query_reads_buffered_points(self, store, base_time):
+        """Test that unflushed points are visible to queries."""
+        store.append("system.cpu.percent", 10.0, base_time, "%")
+        store.append("system.cpu.percent", 20.0, base_time + timedelta(seconds=30), "%")
+
+        points = store.query_range("system.cpu.percent", base_time - timedelta(seconds=1),
+                                   resolution="raw")
+        assert [value for _, value in points] == [10.0, 20.0]
+
+    def test_flush_round_trip(self, store, base_time):
+        """Test that flushed blocks decode to the original points."""
+        for i in range(120):
+            store.append("database.size", float(i), base_time + timedelta(seconds=i), "MB")
+        store.flush()
+
+        reopened = MetricStore(store.root_dir)
+        points = reopened.query_range("database.size", base_time, base_time + timedelta(minutes=5),
+                                      resolution="raw")
+        assert len(points) == 120
+        assert points[0][1] == 0.0 and points[-1][1] == 119.0
+        assert reopened.series()[0]["unit"] == "MB"
+
+    def test_rollups(self, store, base_time):
+        """Test that minute rollups aggregate raw points."""
+        for i in range(120):
+            store.append("scraping.error_rate", float(i), base_time + timedelta(seconds=i))
+        store.close()
+
+        buckets = store.query_rollups("scraping.error_rate", base_time, resolution="1m")
+        assert [b.count for b in buckets] == [60, 60]
+        assert buckets[0].min == 0.0 and buckets[0].max == 59.0
+        assert buckets[1].last == 119.0
+
+    def test_aggregate(self, store, base_time):
+        """Test range aggregation across label sets."""
+        store.append("database.records", 5, base_time, labels={"table": "a"})
+        store.append("database.records", 15, base_time, labels={"table": "b"})
+
+        summary = store.aggregate("database.records", base_time - timedelta(minutes=1))
+        assert summary == {"count": 2, "min": 5.0, "max": 15.0, "avg": 10.0, "latest": 15.0}
+        assert store.aggregate("missing.metric", base_time) is None
+
+    def test_retention(self, store, base_time):
+        """Test that expired raw segments are removed."""
+        store.append("system.disk.percent", 50.0, base_time - timedelta(days=3))
+        store.flush()
+
+        assert store.apply_retention() == 1
+        assert store.query_range("system.disk.percent", base_time - timedelta(days=4),
+                                 resolution="raw") == []
@@ -0,0 +1,93 @@
+import sys
+import os
+import time
+import asyncio
+import pytest
+
+# Add project root to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.politeness import TokenBucket, RobotsCache, HostScheduler, RobotsDisallowedError, HostLimitReachedError
+
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /private/
+Crawl-delay: 2
+"""
+
+
+class FakeRobots:
+    """Serve robots.txt bodies per origin and count fetches."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    async def __call__(self, url):
+        self.calls.append(url)
+        return self.responses.get(url, (404, ""))
+
+
+class TestPoliteness:
+    """Test suite for robots.txt handling and per-host scheduling."""
+
+    def test_token_bucket_spacing(self):
+        """Test that reservations are spaced by the bucket rate."""
+        bucket = TokenBucket(rate=10.0)
+        waits = [bucket.reserve() for _ in range(3)]
+        assert waits[0] == 0.0
+        assert waits[1] == pytest.approx(0.1, abs=0.01)
+        assert waits[2] == pytest.approx(0.2, abs=0.01)
+
+    def test_robots_rules_and_cache(self):
+        """Test disallow rules, crawl-delay and per-origin caching."""
+        fetch = FakeRobots({"https://a.com/robots.txt": (200, ROBOTS_TXT)})
+        robots = RobotsCache(fetch, "test-agent")
+
+        async def run():
+            assert await robots.can_fetch("https://a.com/products")
+            assert not await robots.can_fetch("https://a.com/private/x")
+            assert await robots.crawl_delay("https://a.com/") == 2.0
+            assert await robots.can_fetch("https://b.com/private/x")  # 404 allows all
+
+        asyncio.run(run())
+        assert fetch.calls == ["https://a.com/robots.txt", "https://b.com/robots.txt"]
+
+    def test_scheduler_rejects_disallowed(self):
+        """Test that disallowed URLs are refused before any request."""
+        fetch = FakeRobots({"https://a.com/robots.txt": (200, ROBOTS_TXT)})
+        scheduler = HostScheduler(robots=RobotsCache(fetch, "test-agent"))
+
+        with pytest.raises(RobotsDisallowedError):
+            asyncio.run(scheduler.wait_turn("https://a.com/private/x"))
+
+    def test_scheduler_uses_crawl_delay(self):
+        """Test that the host bucket honours the stricter crawl-delay."""
+        fetch = FakeRobots({"https://a.com/robots.txt": (200, ROBOTS_TXT)})
+        scheduler = HostScheduler(robots=RobotsCache(fetch, "test-agent"), rate_limit=600)
+
+        asyncio.run(scheduler.wait_turn("https://a.com/p1"))
+        assert scheduler.buckets["a.com"].rate == pytest.approx(0.5)
+
+    def test_hosts_do_not_block_each_other(self):
+        """Test that different hosts are throttled independently."""
+        scheduler = HostScheduler(rate_limit=60)  # one request per second per host
+
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(scheduler.wait_turn(f"https://host{i}.com/") for i in range(5)))
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) < 0.5
+
+    def test_page_budget(self):
+        """Test max_pages_per_domain enforcement."""
+        scheduler = HostScheduler(rate_limit=0, max_pages_per_domain=1)
+
+        async def run():
+            await scheduler.wait_turn("https://a.com/1")
+            await scheduler.wait_turn("https://a.com/2")
+
+        with pytest.raises(HostLimitReachedError):
+            asyncio.run(run())
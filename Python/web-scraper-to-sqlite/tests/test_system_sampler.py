@@ -0,0 +1,107 @@
+import sys
+import os
+import time
+import asyncio
+import pytest
+
+# Add project root to Python path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from system_sampler import SystemSampler, lag_file_for
+
+pytestmark = pytest.mark.skipif(not os.path.exists("/proc/stat"), reason="requires /proc")
+
+
+def unlabelled(samples):
+    """Map metric name to (value, unit, labels) for the series without labels."""
+    return {name: (value, unit, labels) for name, value, unit, labels in samples if not labels}
+
+
+class TestSystemSampler:
+    """Test suite for the /proc-based system sampler."""
+
+    def test_cpu_needs_two_samples(self):
+        """Test that CPU usage is reported from deltas without blocking."""
+        sampler = SystemSampler(intervals={"cpu": 0})
+        start = time.perf_counter()
+        first = unlabelled(sampler.sample())
+        assert time.perf_counter() - start < 0.5
+        assert "system.cpu.percent" not in first
+
+        time.sleep(0.05)
+        value, unit, _ = unlabelled(sampler.sample())["system.cpu.percent"]
+        assert unit == "%"
+        assert 0.0 <= value <= 100.0
+
+    def test_family_intervals(self):
+        """Test that families are only read when their interval elapsed."""
+        sampler = SystemSampler(intervals={"disk": 3600})
+        assert "system.disk.percent" in unlabelled(sampler.sample())
+        assert "system.disk.percent" not in unlabelled(sampler.sample())
+
+    def test_process_tree(self):
+        """Test process tree metrics for the current process."""
+        sampler = SystemSampler(intervals={"process_tree": 0})
+        metrics = unlabelled(sampler.sample())
+        assert metrics["pipeline.processes.count"][0] >= 1
+        assert metrics["pipeline.memory.rss"][0] > 0
+        assert metrics["pipeline.fds.open"][0] > 0
+
+    def test_event_loop_lag(self):
+        """Test that event loop lag is measured once the loop runs."""
+        sampler = SystemSampler(intervals={"event_loop": 0})
+        loop = asyncio.new_event_loop()
+        try:
+            sampler.watch_event_loop(loop, interval=0.01)
+            loop.run_until_complete(asyncio.sleep(0.05))
+        finally:
+            loop.close()
+
+        value, unit, _ = unlabelled(sampler.sample())["pipeline.event_loop.lag"]
+        assert unit == "ms"
+        assert value >= 0.0
+
+    def test_event_loop_lag_from_pipeline_process(self, tmp_path):
+        """Test that lag published next to the pidfile reaches a monitor-side sampler."""
+        pidfile = tmp_path / "pipeline.pid"
+        pidfile.write_text(f"{os.getpid()}\n")
+        pipeline = SystemSampler()
+        loop = asyncio.new_event_loop()
+        try:
+            pipeline.watch_event_loop(loop, interval=0.01, lag_file=str(lag_file_for(pidfile)))
+            loop.run_until_complete(asyncio.sleep(0.05))
+        finally:
+            loop.close()
+
+        monitor = SystemSampler(intervals={"event_loop": 0}, pidfile=str(pidfile))
+        value, unit, _ = unlabelled(monitor.sample())["pipeline.event_loop.lag"]
+        assert unit == "ms"
+        assert value == pytest.approx(pipeline.event_loop_lag_ms, abs=0.001)
+
+        # A reading the pipeline stopped refreshing is dropped
+        stale = time.time() - 2 * SystemSampler.STALE_LAG_SECONDS
+        os.utime(lag_file_for(pidfile), (stale, stale))
+        assert "pipeline.event_loop.lag" not in unlabelled(monitor.sample())
+
+    def test_pidfile(self, tmp_path):
+        """Test that the process tree root is read from a pidfile on every sample."""
+        pidfile = tmp_path / "pipeline.pid"
+        sampler = SystemSampler(intervals={"process_tree": 0}, pidfile=str(pidfile))
+        assert "pipeline.processes.count" not in unlabelled(sampler.sample())
+
+        pidfile.write_text(f"{os.getpid()}\n")
+        assert sampler.pid == os.getpid()
+        assert unlabelled(sampler.sample())["pipeline.processes.count"][0] >= 1
+
+    def test_threads_labelled_by_name(self):
+        """Test that per-thread CPU is one metric name labelled by thread name."""
+        sampler = SystemSampler(intervals={"threads": 0})
+        sampler.sample()
+        time.sleep(0.05)
+        threads = [(name, labels) for name, _, _, labels in sampler.sample()
+                   if name.startswith("pipeline.thread.")]
+        assert threads
+        assert {name for name, _ in threads} == {"pipeline.thread.cpu_percent"}
+        assert all(set(labels) == {"thread"} for _, labels in threads)
+        assert len({labels["thread"] for _, labels in threads}) == len(threads)